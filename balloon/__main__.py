@@ -2,13 +2,47 @@
 """
 Entry point для запуску калькулятора аеростатів як модуля:
     python -m balloon
+    python -m balloon batch inputs.csv results.parquet
+    python -m balloon bench --compare
+    python -m balloon service --port 8765
+    python -m balloon export sphere -p radius=1.5 --formats pdf,dxf,svg -o out
+    BALLOON_PROFILE=run.prof python -m balloon batch inputs.csv results.csv
 """
 
 import sys
 import os
 
-def main():
-    """Головна функція запуску"""
+def main(argv=None):
+    """
+    Головна функція запуску (підкоманди batch - пакетний розрахунок без GUI, bench - бенчмарки,
+    service - локальний HTTP сервіс розрахунків, export - одночасний експорт викрійки)
+
+    З BALLOON_PROFILE=шлях.prof увесь запуск профілюється через cProfile.
+    """
+    from balloon.instrument import PROFILE_ENV, profile
+
+    profile_path = os.environ.get(PROFILE_ENV, '').strip()
+    if profile_path:
+        with profile(profile_path):
+            return _run(argv)
+    return _run(argv)
+
+
+def _run(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == 'batch':
+        from balloon.batch import main as batch_main
+        return batch_main(argv[1:])
+    if argv and argv[0] == 'bench':
+        from balloon.bench.__main__ import main as bench_main
+        return bench_main(argv[1:])
+    if argv and argv[0] == 'service':
+        from balloon.service.__main__ import main as service_main
+        return service_main(argv[1:])
+    if argv and argv[0] == 'export':
+        from balloon.jobs import main as export_main
+        return export_main(argv[1:])
+    
     try:
         print("="*60)
         print("Запуск калькулятора аеростатів...")
@@ -54,5 +88,5 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
 
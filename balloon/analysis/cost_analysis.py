@@ -9,10 +9,12 @@ try:
     from balloon.analysis.base import _compute_lift_state
 except ImportError:
     from balloon.analysis.base import _compute_lift_state
+from balloon.cache import persistent_cache
 
 logger = logging.getLogger(__name__)
 
 
+@persistent_cache
 def calculate_cost_analysis(material: str, thickness_um: float, gas_volume: float,
                           gas_type: str, ground_temp: float = 15, 
                           inside_temp: float = 100, height: float = 1000,
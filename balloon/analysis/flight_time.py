@@ -9,8 +9,10 @@ from balloon.model.solve import solve_volume_to_payload, calculate_gas_loss
 from balloon.model.atmosphere import air_density_at_height
 from balloon.model.gas import calculate_gas_density_at_altitude
 from balloon.model.materials import get_material_permeability
+from balloon.cache import persistent_cache
 
 
+@persistent_cache
 def calculate_max_flight_time(
     gas_type: str,
     material: str,
@@ -8,8 +8,10 @@ try:
     from balloon.analysis.base import _compute_lift_state
 except ImportError:
     from balloon.analysis.base import _compute_lift_state
+from balloon.cache import persistent_cache
 
 
+@persistent_cache
 def calculate_height_profile(gas_type: str, material: str, thickness_um: float,
                            gas_volume: float, ground_temp: float = 15,
                            inside_temp: float = 100, max_height: int = 50000,
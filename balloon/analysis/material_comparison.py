@@ -11,8 +11,10 @@ try:
 except ImportError:
     from constants import MATERIALS, GAS_CONSTANT, T0
     from balloon.analysis.base import _compute_lift_state
+from balloon.cache import persistent_cache
 
 
+@persistent_cache
 def calculate_material_comparison(gas_type: str, thickness_um: float, gas_volume: float,
                                 ground_temp: float = 15, inside_temp: float = 100,
                                 height: float = 1000,
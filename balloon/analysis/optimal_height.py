@@ -5,8 +5,10 @@
 from typing import Dict, Any
 
 from balloon.analysis.base import _compute_lift_state
+from balloon.cache import persistent_cache
 
 
+@persistent_cache
 def calculate_optimal_height(gas_type: str, material: str, thickness_um: float, 
                            gas_volume: float, ground_temp: float = 15, 
                            inside_temp: float = 100,
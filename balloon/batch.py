@@ -0,0 +1,532 @@
+"""
+Пакетний розрахунок без GUI (balloon-calculator batch)
+
+Вхідні рядки (CSV, JSON або JSONL) містять ті самі поля, що й
+validate_all_inputs: gas_type, gas_volume, material, thickness,
+start_height, work_height, ground_temp, inside_temp, duration, mode,
+shape_type, shape_params, extra_mass, seam_factor, а також payload
+(цільове навантаження в режимі 'volume') та perm_mult. Параметри форми
+можна задати окремими стовпцями (pillow_len, pear_height, ...) або
+словником/JSON-рядком shape_params.
+
+Рядки розраховуються пулом процесів пакетами; результати записуються
+в CSV, JSONL або Parquet/Feather у порядку вхідного файлу одразу, щойно
+готовий відповідний пакет, тож пам'ять не залежить від розміру файлу.
+Модуль не імпортує tkinter, ttkbootstrap та matplotlib.
+"""
+
+import argparse
+import csv
+import inspect
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Any, Iterable, Iterator, List, Optional
+
+# Поля вхідного рядка (відповідають аргументам validate_all_inputs)
+INPUT_FIELDS = (
+    'gas_type', 'gas_volume', 'material', 'thickness', 'start_height', 'work_height',
+    'ground_temp', 'inside_temp', 'duration', 'mode', 'shape_type', 'shape_params',
+    'extra_mass', 'seam_factor',
+)
+
+# Додаткові поля, яких немає у validate_all_inputs
+EXTRA_FIELDS = ('payload', 'perm_mult')
+
+SHAPE_PARAM_FIELDS = (
+    'pillow_len', 'pillow_wid', 'pear_height', 'pear_top_radius', 'pear_bottom_radius',
+    'cigar_length', 'cigar_radius',
+)
+
+INPUT_FORMATS = ('csv', 'json', 'jsonl')
+OUTPUT_FORMATS = ('csv', 'jsonl', 'parquet', 'feather')
+
+# Кількість рядків в одному завданні пулу (менше накладних витрат на IPC)
+DEFAULT_CHUNK_SIZE = 64
+
+# Кількість рядків у чанку Parquet/Feather
+STORE_CHUNK_ROWS = 4096
+
+_FORMAT_BY_EXTENSION = {
+    '.csv': 'csv',
+    '.json': 'json',
+    '.jsonl': 'jsonl',
+    '.ndjson': 'jsonl',
+    '.parquet': 'parquet',
+    '.feather': 'feather',
+    '.arrow': 'feather',
+}
+
+
+def detect_format(path: str, allowed: Iterable[str]) -> str:
+    """
+    Визначає формат файлу за розширенням
+
+    Raises:
+        ValueError: Якщо розширення не відповідає жодному з дозволених форматів
+    """
+    fmt = _FORMAT_BY_EXTENSION.get(os.path.splitext(path)[1].lower())
+    if fmt not in allowed:
+        raise ValueError(f"Не вдалося визначити формат файлу {path}; вкажіть один з: {', '.join(allowed)}")
+    return fmt
+
+
+def read_input_rows(path: str, fmt: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Читає вхідні рядки з CSV, JSON (масив об'єктів) або JSONL
+
+    CSV та JSONL читаються потоково; порожні значення CSV пропускаються
+    (діють значення за замовчуванням).
+
+    Args:
+        path: Шлях до файлу
+        fmt: 'csv', 'json', 'jsonl' або None (за розширенням)
+
+    Yields:
+        Словники вхідних полів
+    """
+    fmt = fmt or detect_format(path, INPUT_FORMATS)
+    if fmt == 'csv':
+        with open(path, newline='', encoding='utf-8-sig') as fh:
+            for record in csv.DictReader(fh):
+                yield {k.strip(): v for k, v in record.items() if k and v not in (None, '')}
+    elif fmt == 'jsonl':
+        with open(path, encoding='utf-8') as fh:
+            for line in fh:
+                if line.strip():
+                    yield json.loads(line)
+    elif fmt == 'json':
+        with open(path, encoding='utf-8') as fh:
+            data = json.load(fh)
+        if isinstance(data, dict):
+            data = data.get('rows', [data])
+        yield from data
+    else:
+        raise ValueError(f"Невідомий формат вхідного файлу: {fmt}")
+
+
+def _shape_params(row: Dict[str, Any]) -> Dict[str, Any]:
+    params = row.get('shape_params') or {}
+    if isinstance(params, str):
+        params = json.loads(params)
+    params = dict(params)
+    for key in SHAPE_PARAM_FIELDS:
+        if row.get(key) not in (None, ''):
+            params[key] = row[key]
+    return params
+
+
+@lru_cache(maxsize=None)
+def _input_defaults() -> Dict[str, Any]:
+    """Значення за замовчуванням аргументів validate_all_inputs (None - обов'язковий)"""
+    from balloon.validators import validate_all_inputs
+
+    return {
+        name: None if param.default is inspect.Parameter.empty else param.default
+        for name, param in inspect.signature(validate_all_inputs).parameters.items()
+        if name != 'shape_params'
+    }
+
+
+def _row_inputs(row: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Аргументи validate_all_inputs для вхідного рядка
+
+    Значення перетворюються на рядки, відсутні поля отримують значення
+    за замовчуванням validate_all_inputs.
+
+    Raises:
+        ValueError: Якщо рядок містить невідомі поля або не містить обов'язкових
+    """
+    unknown = set(row) - set(INPUT_FIELDS) - set(EXTRA_FIELDS) - set(SHAPE_PARAM_FIELDS)
+    if unknown:
+        raise ValueError(f"Невідомі поля: {', '.join(sorted(unknown))}")
+
+    inputs = {key: str(row[key]) for key in INPUT_FIELDS if key in row and key != 'shape_params'}
+    if inputs.get('mode') == 'volume':
+        # Об'єм розраховується з навантаження; gas_volume не потрібен
+        inputs.setdefault('gas_volume', None)
+    defaults = _input_defaults()
+    missing = [key for key, default in defaults.items() if default is None and key not in inputs]
+    if missing:
+        raise ValueError(f"Відсутні обов'язкові поля: {', '.join(missing)}")
+    for key, default in defaults.items():
+        inputs.setdefault(key, default)
+    inputs['shape_params'] = {k: str(v) for k, v in _shape_params(row).items()}
+    return inputs
+
+
+def _solve_row(row: Dict[str, Any], numbers: Dict[str, Any], strings: Dict[str, Any],
+               shape_params: Dict[str, Any]) -> Dict[str, Any]:
+    """Розраховує валідований рядок (результат як у evaluate_row)"""
+    from balloon.model.solve import solve_volume_to_payload, solve_payload_to_volume
+
+    try:
+        perm_mult = float(row.get('perm_mult', 1.0))
+        if perm_mult <= 0:
+            raise ValueError("Множник проникності має бути додатним числом")
+        validated_shape_params = {k: v for k, v in numbers.items() if k in shape_params}
+        common = dict(
+            gas_type=strings['gas_type'],
+            material=strings['material'],
+            thickness_um=numbers['thickness'],
+            start_height=numbers['start_height'],
+            work_height=numbers['work_height'],
+            ground_temp=numbers['ground_temp'],
+            inside_temp=numbers['inside_temp'],
+            duration=numbers['duration'],
+            perm_mult=perm_mult,
+            shape_type=strings['shape_type'],
+            shape_params=validated_shape_params,
+            extra_mass=numbers.get('extra_mass', 0.0),
+            seam_factor=numbers.get('seam_factor', 1.0),
+        )
+        if strings['mode'] == 'volume':
+            if row.get('payload') in (None, ''):
+                raise ValueError("В режимі 'volume' потрібно вказати payload")
+            payload = float(row['payload'])
+            results = solve_payload_to_volume(target_payload=payload, **common)
+            echo = {'gas_volume': None, 'payload': payload}
+        else:
+            results = solve_volume_to_payload(gas_volume=numbers['gas_volume'], **common)
+            echo = {'gas_volume': numbers['gas_volume'], 'payload': None}
+    except Exception as e:
+        return {'status': 'error', 'error': str(e)}
+
+    from balloon.export.result_store import flatten_record
+
+    # Усі стовпці параметрів форми присутні завжди, щоб схема не залежала від рядка
+    echo.update(common, mode=strings['mode'])
+    echo.pop('shape_params')
+    echo.update((key, validated_shape_params.get(key)) for key in SHAPE_PARAM_FIELDS)
+    return {
+        'status': 'ok',
+        'error': None,
+        **flatten_record(echo, 'input.'),
+        **flatten_record(results),
+    }
+
+
+def evaluate_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Валідує та розраховує один вхідний рядок
+
+    Помилки валідації та розрахунку не перериваються, а повертаються
+    як результат зі status='error', щоб один некоректний рядок не зупиняв
+    пакет.
+
+    Args:
+        row: Вхідні поля (див. INPUT_FIELDS, EXTRA_FIELDS)
+
+    Returns:
+        Плоский словник: status, error, стовпці 'input.*' та результати розв'язувача
+    """
+    from balloon.validators import validate_all_inputs
+
+    try:
+        inputs = _row_inputs(row)
+        numbers, strings = validate_all_inputs(**inputs)
+    except Exception as e:
+        return {'status': 'error', 'error': str(e)}
+    return _solve_row(row, numbers, strings, inputs['shape_params'])
+
+
+def _evaluate_chunk(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Розраховує пакет рядків (результати ті самі, що [evaluate_row(r) for r in rows])
+
+    Валідація виконується один раз для всього пакета стовпцями
+    (validate_columns) замість Pydantic моделі на кожен рядок.
+    """
+    from balloon.validators import validate_columns
+
+    results: List[Optional[Dict[str, Any]]] = [None] * len(rows)
+    prepared = []
+    for i, row in enumerate(rows):
+        try:
+            prepared.append((i, _row_inputs(row)))
+        except Exception as e:
+            results[i] = {'status': 'error', 'error': str(e)}
+    if prepared:
+        columns = {key: [inputs[key] for _, inputs in prepared] for key in _input_defaults()}
+        for key in SHAPE_PARAM_FIELDS:
+            if any(key in inputs['shape_params'] for _, inputs in prepared):
+                columns[key] = [inputs['shape_params'].get(key) for _, inputs in prepared]
+        checked = validate_columns(columns, num_rows=len(prepared))
+        for position, (i, inputs) in enumerate(prepared):
+            if not checked.valid[position]:
+                results[i] = {'status': 'error', 'error': checked.errors[position]}
+                continue
+            numbers, strings = checked.row(position)
+            results[i] = _solve_row(rows[i], numbers, strings, inputs['shape_params'])
+    return results
+
+
+def _chunks(rows: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    iterator = iter(rows)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def evaluate_rows(rows: Iterable[Dict[str, Any]], workers: Optional[int] = None,
+                  chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+    """
+    Розраховує рядки пулом процесів зі збереженням порядку
+
+    У черзі тримається не більше 4 пакетів на процес, тож вхідний файл
+    читається по мірі розрахунку, а не завантажується повністю.
+
+    Args:
+        rows: Ітератор вхідних рядків
+        workers: Кількість процесів (None - os.cpu_count(); 1 - у поточному процесі)
+        chunk_size: Кількість рядків в одному завданні
+
+    Yields:
+        Результати evaluate_row з полем 'row' (номер вхідного рядка з 1)
+    """
+    workers = workers or os.cpu_count() or 1
+    index = 0
+    if workers == 1:
+        for chunk in _chunks(rows, chunk_size):
+            for result in _evaluate_chunk(chunk):
+                index += 1
+                yield {'row': index, **result}
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        chunks = _chunks(rows, chunk_size)
+        for chunk in chunks:
+            pending.append(pool.submit(_evaluate_chunk, chunk))
+            if len(pending) >= workers * 4:
+                break
+        while pending:
+            results = pending.popleft().result()
+            chunk = next(chunks, None)
+            if chunk is not None:
+                pending.append(pool.submit(_evaluate_chunk, chunk))
+            for result in results:
+                index += 1
+                yield {'row': index, **result}
+
+
+class _CsvSink:
+    """CSV: заголовок визначається першим успішним рядком (рядки з помилками до нього буферизуються)"""
+
+    def __init__(self, path: str):
+        self._file = open(path, 'w', newline='', encoding='utf-8')
+        self._writer = None
+        self._pending: List[Dict[str, Any]] = []
+
+    def write(self, result: Dict[str, Any]):
+        if self._writer is None:
+            self._pending.append(result)
+            if result['status'] == 'ok':
+                self._start(result)
+            return
+        self._writer.writerow(result)
+
+    def _start(self, first: Dict[str, Any]):
+        self._writer = csv.DictWriter(self._file, fieldnames=list(first), restval='', extrasaction='ignore')
+        self._writer.writeheader()
+        self._writer.writerows(self._pending)
+        self._pending = []
+
+    def close(self):
+        if self._writer is None:
+            self._start(self._pending[0] if self._pending else {'row': None, 'status': None, 'error': None})
+        self._file.close()
+
+
+class _JsonlSink:
+    def __init__(self, path: str):
+        self._file = open(path, 'w', encoding='utf-8')
+
+    def write(self, result: Dict[str, Any]):
+        self._file.write(json.dumps(result, ensure_ascii=False))
+        self._file.write('\n')
+
+    def close(self):
+        self._file.close()
+
+
+# Рядок для визначення стовпців результату (значення не впливають на набір стовпців)
+_SCHEMA_SAMPLE_ROW = {
+    'gas_type': 'Гелій', 'gas_volume': '10', 'material': 'TPU', 'thickness': '35',
+    'start_height': '0', 'work_height': '1000',
+}
+
+
+@lru_cache(maxsize=None)
+def _output_columns() -> Dict[str, type]:
+    """
+    Стовпці файлу результатів та їх типи (str, bool або float)
+
+    Набір стовпців успішного рядка не залежить від значень, окрім
+    'shape_params.*', тож він береться з одного розрахунку, а стовпці
+    параметрів додаються для всіх форм реєстру.
+    """
+    from balloon.shapes.registry import SHAPE_REGISTRY
+
+    sample = evaluate_row(_SCHEMA_SAMPLE_ROW)
+    if sample['status'] != 'ok':
+        raise RuntimeError(f"Не вдалося визначити стовпці результатів: {sample['error']}")
+    columns: Dict[str, type] = {'status': str, 'error': str}
+    for key, value in sample.items():
+        if key not in columns and not key.startswith('shape_params.'):
+            columns[key] = type(value) if isinstance(value, (bool, str)) else float
+    for entry in SHAPE_REGISTRY.values():
+        for name in entry.param_model.model_fields:
+            columns.setdefault(f"shape_params.{name}", float)
+    return columns
+
+
+class _StoreSink:
+    """Parquet/Feather через ResultStoreWriter чанками по STORE_CHUNK_ROWS рядків"""
+
+    def __init__(self, path: str, fmt: str):
+        from balloon.export.result_store import ResultStoreWriter, store_schema
+
+        # Повна схема наперед: рядки з помилками та різні форми в будь-якому порядку
+        self._store = ResultStoreWriter(path, kind='batch', fmt=fmt, schema=store_schema(_output_columns()))
+        self._rows: List[Dict[str, Any]] = []
+
+    def write(self, result: Dict[str, Any]):
+        self._rows.append(result)
+        if len(self._rows) >= STORE_CHUNK_ROWS:
+            self._flush()
+
+    def _flush(self):
+        if self._rows:
+            # Стовпці - об'єднання ключів усіх рядків чанку (рядки з помилками коротші)
+            columns = dict.fromkeys(key for row in self._rows for key in row)
+            self._store.append({key: [row.get(key) for row in self._rows] for key in columns})
+            self._rows = []
+
+    def close(self):
+        self._flush()
+        self._store.close()
+
+
+def open_result_sink(path: str, fmt: Optional[str] = None):
+    """
+    Відкриває потоковий запис результатів
+
+    Args:
+        path: Шлях до файлу результатів
+        fmt: 'csv', 'jsonl', 'parquet', 'feather' або None (за розширенням)
+
+    Returns:
+        Об'єкт з методами write(result) та close()
+    """
+    fmt = fmt or detect_format(path, OUTPUT_FORMATS)
+    if fmt == 'csv':
+        return _CsvSink(path)
+    if fmt == 'jsonl':
+        return _JsonlSink(path)
+    if fmt in ('parquet', 'feather'):
+        return _StoreSink(path, fmt)
+    raise ValueError(f"Невідомий формат файлу результатів: {fmt}")
+
+
+def run_batch(input_path: str, output_path: str, input_format: Optional[str] = None,
+              output_format: Optional[str] = None, workers: Optional[int] = None,
+              chunk_size: int = DEFAULT_CHUNK_SIZE, progress: bool = True) -> Dict[str, int]:
+    """
+    Розраховує всі рядки вхідного файлу та записує результати
+
+    Args:
+        input_path: Вхідний файл (CSV/JSON/JSONL)
+        output_path: Файл результатів (CSV/JSONL/Parquet/Feather)
+        input_format: Формат вхідного файлу (None - за розширенням)
+        output_format: Формат результатів (None - за розширенням)
+        workers: Кількість процесів (None - всі ядра)
+        chunk_size: Рядків в одному завданні пулу
+        progress: Показувати прогрес через balloon.utils.create_progress
+
+    Returns:
+        Словник {'rows': ..., 'ok': ..., 'errors': ...}
+    """
+    from balloon.utils import create_progress
+
+    rows = read_input_rows(input_path, input_format)
+    sink = open_result_sink(output_path, output_format)
+    counts = {'rows': 0, 'ok': 0, 'errors': 0}
+    bar = create_progress() if progress else None
+    task = None
+    if bar is not None:
+        bar.start()
+        task = bar.add_task("Пакетний розрахунок...")
+    try:
+        for result in evaluate_rows(rows, workers=workers, chunk_size=chunk_size):
+            sink.write(result)
+            counts['rows'] += 1
+            counts['ok' if result['status'] == 'ok' else 'errors'] += 1
+            if bar is not None and counts['rows'] % chunk_size == 0:
+                bar.update(task, description=f"Розраховано рядків: {counts['rows']} (помилок: {counts['errors']})")
+    finally:
+        sink.close()
+        if bar is not None:
+            bar.update(task, description=f"Розраховано рядків: {counts['rows']} (помилок: {counts['errors']})")
+            bar.stop()
+    return counts
+
+
+def build_parser(parser: Optional[argparse.ArgumentParser] = None) -> argparse.ArgumentParser:
+    """Аргументи підкоманди batch"""
+    parser = parser or argparse.ArgumentParser(prog='balloon-calculator batch')
+    parser.description = "Пакетний розрахунок аеростатів з файлу вхідних рядків"
+    parser.add_argument('input', help="Вхідний файл: CSV, JSON або JSONL")
+    parser.add_argument('output', help="Файл результатів: CSV, JSONL, Parquet або Feather")
+    parser.add_argument('--input-format', choices=INPUT_FORMATS, help="Формат вхідного файлу (за замовчуванням - за розширенням)")
+    parser.add_argument('--output-format', choices=OUTPUT_FORMATS, help="Формат результатів (за замовчуванням - за розширенням)")
+    parser.add_argument('-j', '--workers', type=int, default=None, help="Кількість процесів (за замовчуванням - всі ядра)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help="Рядків в одному завданні пулу")
+    parser.add_argument('--no-progress', action='store_true', help="Не показувати прогрес")
+    parser.add_argument('--strict', action='store_true', help="Код виходу 1, якщо хоча б один рядок завершився помилкою")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Точка входу підкоманди batch
+
+    Returns:
+        Код виходу: 0 - успіх, 1 - помилки в рядках (з --strict), 2 - помилка запуску
+    """
+    from balloon.utils import print_error, print_success, print_warning
+
+    args = build_parser().parse_args(argv)
+    if args.workers is not None and args.workers < 1:
+        print_error("Кількість процесів має бути додатною")
+        return 2
+    try:
+        counts = run_batch(
+            args.input, args.output,
+            input_format=args.input_format,
+            output_format=args.output_format,
+            workers=args.workers,
+            chunk_size=max(1, args.chunk_size),
+            progress=not args.no_progress,
+        )
+    except (OSError, ValueError, ImportError) as e:
+        print_error(f"Пакетний розрахунок не виконано: {e}")
+        return 2
+
+    message = f"Розраховано {counts['ok']} з {counts['rows']} рядків → {args.output}"
+    if counts['errors']:
+        print_warning(f"{message}; помилок: {counts['errors']}")
+        return 1 if args.strict else 0
+    print_success(message)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,43 @@
+"""
+Бенчмарки розв'язувача, геометрії, викрійок та експорту
+
+Запуск:
+    python -m balloon.bench                       # усі бенчмарки
+    python -m balloon.bench -k solve -k 'export.*'
+    python -m balloon.bench --save benchmarks/baseline.json
+    python -m balloon.bench --compare benchmarks/baseline.json
+
+Навантаження зареєстровані в balloon.bench.workloads; вимірювання,
+baseline та порівняння - в balloon.bench.core.
+"""
+
+from balloon.bench.core import (
+    BENCHMARKS,
+    Benchmark,
+    BenchmarkResult,
+    Comparison,
+    benchmark,
+    compare,
+    format_report,
+    load_baseline,
+    measure,
+    run_benchmarks,
+    save_baseline,
+    select_benchmarks,
+)
+from balloon.bench import workloads  # noqa: F401  (реєстрація бенчмарків)
+
+__all__ = [
+    'BENCHMARKS',
+    'Benchmark',
+    'BenchmarkResult',
+    'Comparison',
+    'benchmark',
+    'compare',
+    'format_report',
+    'load_baseline',
+    'measure',
+    'run_benchmarks',
+    'save_baseline',
+    'select_benchmarks',
+]
@@ -0,0 +1,118 @@
+"""
+Командний рядок бенчмарків: python -m balloon.bench
+
+Код виходу: 0 - успіх, 1 - регресії відносно baseline (з --compare),
+2 - помилка запуску.
+"""
+
+import argparse
+import json
+import sys
+from typing import List, Optional
+
+from balloon.bench import (
+    compare, format_report, load_baseline, run_benchmarks, save_baseline, select_benchmarks,
+)
+from balloon.bench.core import (
+    DEFAULT_MEMORY_THRESHOLD, DEFAULT_MIN_TIME, DEFAULT_REPEATS, DEFAULT_TIME_THRESHOLD, DEFAULT_WARMUP,
+)
+
+# Baseline за замовчуванням (відносно поточного каталогу)
+DEFAULT_BASELINE = 'benchmarks/baseline.json'
+
+
+def build_parser(parser: Optional[argparse.ArgumentParser] = None) -> argparse.ArgumentParser:
+    """Аргументи командного рядка бенчмарків"""
+    parser = parser or argparse.ArgumentParser(prog='python -m balloon.bench')
+    parser.description = "Бенчмарки розв'язувача, аналізу, геометрії, викрійок та експорту"
+    parser.add_argument('-k', dest='patterns', action='append', default=[],
+                        help="Шаблон імен (glob) або група; можна вказати кілька разів")
+    parser.add_argument('--list', action='store_true', help="Показати бенчмарки без запуску")
+    parser.add_argument('-r', '--repeats', type=int, default=DEFAULT_REPEATS, help="Кількість повторів")
+    parser.add_argument('-w', '--warmup', type=int, default=DEFAULT_WARMUP, help="Викликів розігріву")
+    parser.add_argument('--min-time', type=float, default=DEFAULT_MIN_TIME,
+                        help="Мінімальна тривалість повтору, с (0 - один виклик на повтор)")
+    parser.add_argument('--no-memory', action='store_true', help="Не вимірювати пік пам'яті")
+    parser.add_argument('--cached', action='store_true',
+                        help="Не вимикати мемоізацію та постійний кеш результатів")
+    parser.add_argument('--save', nargs='?', const=DEFAULT_BASELINE, metavar='PATH',
+                        help=f"Записати результати як baseline (за замовчуванням {DEFAULT_BASELINE})")
+    parser.add_argument('--compare', nargs='?', const=DEFAULT_BASELINE, metavar='PATH',
+                        help=f"Порівняти з baseline (за замовчуванням {DEFAULT_BASELINE})")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_TIME_THRESHOLD,
+                        help="Допустиме сповільнення (частка), більше - регресія")
+    parser.add_argument('--memory-threshold', type=float, default=DEFAULT_MEMORY_THRESHOLD,
+                        help="Допустиме зростання піку пам'яті (частка)")
+    parser.add_argument('--json', dest='json_path', metavar='PATH',
+                        help="Записати результати та порівняння в JSON ('-' - stdout)")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Точка входу; повертає код виходу"""
+    from balloon.utils import print_error, print_success, print_warning
+
+    args = build_parser().parse_args(argv)
+    selected = select_benchmarks(args.patterns)
+    if not selected:
+        print_error(f"Немає бенчмарків для шаблонів: {', '.join(args.patterns)}")
+        return 2
+    if args.list:
+        for bench in selected:
+            print(f"{bench.name:<28} {bench.description}")
+        return 0
+    if args.repeats < 1 or args.warmup < 0 or args.min_time < 0:
+        print_error("Кількість повторів має бути додатною, розігрів та min-time - невід'ємними")
+        return 2
+
+    baseline = None
+    if args.compare:
+        try:
+            baseline = load_baseline(args.compare)
+        except (OSError, ValueError) as e:
+            print_error(f"Не вдалося прочитати baseline: {e}")
+            return 2
+
+    def progress(result):
+        status = result.skipped or f"{result.median * 1000:.3f} мс"
+        print(f"  {result.name}: {status}", file=sys.stderr)
+
+    results = run_benchmarks(
+        selected, warmup=args.warmup, repeats=args.repeats, min_time=args.min_time,
+        memory=not args.no_memory, cached=args.cached, progress=progress,
+    )
+    comparisons = compare(results, baseline, args.threshold, args.memory_threshold) if baseline is not None else None
+    print(format_report(results, comparisons))
+
+    settings = {'repeats': args.repeats, 'warmup': args.warmup, 'min_time': args.min_time, 'cached': args.cached}
+    if args.save:
+        try:
+            save_baseline(args.save, results, settings)
+        except OSError as e:
+            print_error(f"Не вдалося записати baseline: {e}")
+            return 2
+        print_success(f"Baseline записано: {args.save}")
+    if args.json_path:
+        data = {
+            'settings': settings,
+            'results': [result.to_dict() for result in results],
+            'comparisons': [c.__dict__ for c in comparisons or []],
+        }
+        text = json.dumps(data, ensure_ascii=False, indent=2)
+        if args.json_path == '-':
+            print(text)
+        else:
+            with open(args.json_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+
+    if comparisons:
+        regressions = [c.name for c in comparisons if c.regressed]
+        if regressions:
+            print_warning(f"Регресії відносно baseline: {', '.join(regressions)}")
+            return 1
+        print_success("Регресій відносно baseline немає")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,464 @@
+"""
+Вимірювання, базові результати (baseline) та порівняння бенчмарків
+
+Кожен бенчмарк - функція з одним аргументом (контекст, що повертає
+setup, або робочий каталог). Вимірювання, як у timeit: розігрів,
+калібрування кількості викликів на повтор (щоб повтор тривав не менше
+min_time) та кілька повторів; у результат іде час одного виклику для
+кожного повтору. Пік пам'яті вимірюється окремим викликом під
+tracemalloc, щоб трасування не впливало на час.
+
+За замовчуванням мемоізація та постійний кеш результатів вимикаються
+на час прогону: вимірюється розрахунок, а не читання з кешу.
+"""
+
+import contextlib
+import fnmatch
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from balloon.lazy_import import module_available
+
+# Версія формату файлу baseline
+BASELINE_FORMAT = 1
+
+DEFAULT_WARMUP = 1
+DEFAULT_REPEATS = 5
+
+# Мінімальна тривалість одного повтору (с)
+DEFAULT_MIN_TIME = 0.05
+
+# Максимальна кількість викликів в одному повторі
+MAX_NUMBER = 10000
+
+# Допустиме сповільнення та зростання піку пам'яті (частка) до позначення регресії
+DEFAULT_TIME_THRESHOLD = 0.25
+DEFAULT_MEMORY_THRESHOLD = 0.25
+
+STATUS_OK = 'ok'
+STATUS_REGRESSION = 'regression'
+STATUS_IMPROVEMENT = 'improvement'
+STATUS_NEW = 'new'
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """
+    Опис бенчмарку
+
+    Attributes:
+        name: Повне ім'я ('група.назва')
+        func: Функція, що вимірюється: func(context)
+        setup: Підготовка контексту setup(workdir) (не вимірюється);
+            None - контекстом є сам робочий каталог
+        requires: Модулі, без яких бенчмарк пропускається
+        description: Короткий опис навантаження
+    """
+    name: str
+    func: Callable[[Any], Any]
+    setup: Optional[Callable[[str], Any]] = None
+    requires: Sequence[str] = ()
+    description: str = ''
+
+    @property
+    def group(self) -> str:
+        return self.name.split('.', 1)[0]
+
+    @property
+    def available(self) -> bool:
+        return all(module_available(module) for module in self.requires)
+
+
+# Зареєстровані бенчмарки: ім'я -> Benchmark
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, setup: Optional[Callable[[str], Any]] = None,
+              requires: Sequence[str] = (), description: str = '',
+              registry: Optional[Dict[str, Benchmark]] = None) -> Callable:
+    """
+    Декоратор реєстрації бенчмарку
+
+    Args:
+        name: Ім'я 'група.назва'
+        setup: Підготовка контексту setup(workdir) (не входить у вимір)
+        requires: Необов'язкові модулі, без яких бенчмарк пропускається
+        description: Опис (за замовчуванням - перший рядок docstring)
+        registry: Реєстр (None - BENCHMARKS)
+
+    Raises:
+        ValueError: Якщо бенчмарк з таким ім'ям уже зареєстровано
+    """
+    def decorator(func: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        target = BENCHMARKS if registry is None else registry
+        if name in target:
+            raise ValueError(f"Бенчмарк {name} уже зареєстровано")
+        summary = description or (func.__doc__ or '').strip().split('\n', 1)[0]
+        target[name] = Benchmark(name, func, setup, tuple(requires), summary)
+        return func
+    return decorator
+
+
+def select_benchmarks(patterns: Optional[Iterable[str]] = None,
+                      registry: Optional[Dict[str, Benchmark]] = None) -> List[Benchmark]:
+    """
+    Бенчмарки за шаблонами імен
+
+    Шаблон - glob ('export.*', '*gores*') або ім'я групи ('solve').
+
+    Args:
+        patterns: Шаблони (None або порожньо - усі)
+        registry: Реєстр (None - BENCHMARKS)
+    """
+    registry = BENCHMARKS if registry is None else registry
+    patterns = list(patterns or [])
+    if not patterns:
+        return list(registry.values())
+    return [
+        bench for name, bench in registry.items()
+        if any(fnmatch.fnmatchcase(name, p) or bench.group == p for p in patterns)
+    ]
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    Результат вимірювання
+
+    Attributes:
+        name: Ім'я бенчмарку
+        times: Час одного виклику (с) для кожного повтору
+        number: Кількість викликів у повторі
+        peak_memory: Пік виділеної пам'яті за один виклик (байти, tracemalloc)
+        skipped: Причина пропуску (None - виміряно)
+    """
+    name: str
+    times: List[float] = field(default_factory=list)
+    number: int = 0
+    peak_memory: int = 0
+    skipped: Optional[str] = None
+
+    @property
+    def best(self) -> float:
+        return min(self.times) if self.times else float('nan')
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.times) if self.times else float('nan')
+
+    @property
+    def stdev(self) -> float:
+        return statistics.stdev(self.times) if len(self.times) > 1 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data.update(best=self.best, median=self.median, stdev=self.stdev)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BenchmarkResult":
+        return cls(
+            name=data['name'], times=list(data.get('times', [])), number=data.get('number', 0),
+            peak_memory=data.get('peak_memory', 0), skipped=data.get('skipped'),
+        )
+
+
+@contextlib.contextmanager
+def cold_caches() -> Iterator[None]:
+    """Вимикає мемоізацію та постійний кеш результатів (стан відновлюється)"""
+    from balloon.cache import (
+        disable_result_cache, enable_result_cache, get_result_cache,
+        memoization_enabled, set_memoization_enabled,
+    )
+    memo = memoization_enabled()
+    cache = get_result_cache()
+    set_memoization_enabled(False)
+    disable_result_cache()
+    try:
+        yield
+    finally:
+        set_memoization_enabled(memo)
+        if cache is not None:
+            enable_result_cache(cache.path, cache.max_entries)
+
+
+def _time_calls(func: Callable[[Any], Any], context: Any, number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        func(context)
+    return time.perf_counter() - start
+
+
+def calibrate(func: Callable[[Any], Any], context: Any, min_time: float) -> int:
+    """Кількість викликів, за яку повтор триває не менше min_time"""
+    number = 1
+    while number < MAX_NUMBER:
+        if _time_calls(func, context, number) >= min_time:
+            break
+        number *= 2
+    return min(number, MAX_NUMBER)
+
+
+def peak_memory(func: Callable[[Any], Any], context: Any) -> int:
+    """Пік виділеної пам'яті (байти) за один виклик"""
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        if hasattr(tracemalloc, 'reset_peak'):  # Python 3.9+
+            tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        func(context)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if started:
+            tracemalloc.stop()
+    return max(0, peak - baseline)
+
+
+def measure(bench: Benchmark, warmup: int = DEFAULT_WARMUP, repeats: int = DEFAULT_REPEATS,
+            min_time: float = DEFAULT_MIN_TIME, memory: bool = True) -> BenchmarkResult:
+    """
+    Вимірює один бенчмарк
+
+    Args:
+        bench: Бенчмарк
+        warmup: Кількість викликів розігріву (імпорти, JIT-кеші бібліотек)
+        repeats: Кількість повторів
+        min_time: Мінімальна тривалість повтору (с); 0 - один виклик на повтор
+        memory: Вимірювати пік пам'яті
+
+    Returns:
+        BenchmarkResult (skipped, якщо немає залежностей)
+    """
+    if not bench.available:
+        missing = [m for m in bench.requires if not module_available(m)]
+        return BenchmarkResult(bench.name, skipped=f"немає {', '.join(missing)}")
+
+    with tempfile.TemporaryDirectory(prefix='balloon-bench-') as workdir:
+        context = bench.setup(workdir) if bench.setup is not None else workdir
+        for _ in range(warmup):
+            bench.func(context)
+        number = calibrate(bench.func, context, min_time) if min_time > 0 else 1
+        times = [_time_calls(bench.func, context, number) / number for _ in range(max(1, repeats))]
+        peak = peak_memory(bench.func, context) if memory else 0
+    return BenchmarkResult(bench.name, times=times, number=number, peak_memory=peak)
+
+
+def run_benchmarks(benchmarks: Iterable[Benchmark], warmup: int = DEFAULT_WARMUP,
+                   repeats: int = DEFAULT_REPEATS, min_time: float = DEFAULT_MIN_TIME,
+                   memory: bool = True, cached: bool = False,
+                   progress: Optional[Callable[[BenchmarkResult], None]] = None) -> List[BenchmarkResult]:
+    """
+    Вимірює список бенчмарків
+
+    Args:
+        benchmarks: Бенчмарки (select_benchmarks)
+        warmup, repeats, min_time, memory: Див. measure
+        cached: Залишити мемоізацію та постійний кеш увімкненими
+        progress: Викликається після кожного бенчмарку
+
+    Returns:
+        Результати в порядку бенчмарків
+    """
+    results = []
+    with contextlib.nullcontext() if cached else cold_caches():
+        for bench in benchmarks:
+            result = measure(bench, warmup=warmup, repeats=repeats, min_time=min_time, memory=memory)
+            results.append(result)
+            if progress is not None:
+                progress(result)
+    return results
+
+
+# ============================================================================
+# BASELINE
+# ============================================================================
+
+def environment_info() -> Dict[str, Any]:
+    """Середовище вимірювання (записується в baseline)"""
+    import numpy as np
+    from balloon.cache import model_stamp
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__,
+        'model_stamp': model_stamp(),
+        'argv': sys.argv[1:],
+    }
+
+
+def save_baseline(path: str, results: Iterable[BenchmarkResult], settings: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Записує результати у JSON baseline
+
+    Args:
+        path: Шлях до файлу
+        results: Результати вимірювань
+        settings: Параметри прогону (repeats, warmup, ...)
+
+    Returns:
+        Шлях до файлу
+    """
+    data = {
+        'format': BASELINE_FORMAT,
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'environment': environment_info(),
+        'settings': dict(settings or {}),
+        'results': {result.name: result.to_dict() for result in results},
+    }
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+    return path
+
+
+def load_baseline(path: str) -> Dict[str, BenchmarkResult]:
+    """
+    Читає JSON baseline
+
+    Returns:
+        Словник ім'я -> BenchmarkResult
+
+    Raises:
+        ValueError: Невідомий формат файлу
+    """
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    if data.get('format') != BASELINE_FORMAT:
+        raise ValueError(f"Невідомий формат baseline {path}: {data.get('format')!r}")
+    return {name: BenchmarkResult.from_dict(item) for name, item in data.get('results', {}).items()}
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """
+    Порівняння результату з baseline
+
+    Attributes:
+        name: Ім'я бенчмарку
+        status: STATUS_OK, STATUS_REGRESSION, STATUS_IMPROVEMENT або STATUS_NEW
+        time_ratio: Поточний найкращий час / найкращий час baseline (None - немає baseline)
+        memory_ratio: Поточний пік пам'яті / пік baseline
+    """
+    name: str
+    status: str
+    time_ratio: Optional[float] = None
+    memory_ratio: Optional[float] = None
+
+    @property
+    def regressed(self) -> bool:
+        return self.status == STATUS_REGRESSION
+
+
+def _ratio(current: float, reference: float) -> Optional[float]:
+    if not reference or reference != reference:
+        return None
+    return current / reference
+
+
+def compare(results: Iterable[BenchmarkResult], baseline: Dict[str, BenchmarkResult],
+            time_threshold: float = DEFAULT_TIME_THRESHOLD,
+            memory_threshold: float = DEFAULT_MEMORY_THRESHOLD) -> List[Comparison]:
+    """
+    Порівнює результати з baseline
+
+    Час порівнюється за найкращим повтором (як timeit: менше залежить
+    від фонового навантаження, ніж медіана). Регресія - сповільнення більше
+    ніж на time_threshold або зростання піку пам'яті більше ніж на
+    memory_threshold; покращення - прискорення в (1 + time_threshold) разів.
+
+    Args:
+        results: Поточні результати (пропущені бенчмарки не порівнюються)
+        baseline: load_baseline()
+        time_threshold: Допустиме сповільнення (частка)
+        memory_threshold: Допустиме зростання піку пам'яті (частка)
+    """
+    comparisons = []
+    for result in results:
+        if result.skipped:
+            continue
+        reference = baseline.get(result.name)
+        if reference is None or reference.skipped:
+            comparisons.append(Comparison(result.name, STATUS_NEW))
+            continue
+        time_ratio = _ratio(result.best, reference.best)
+        memory_ratio = _ratio(result.peak_memory, reference.peak_memory)
+        status = STATUS_OK
+        if time_ratio is not None and time_ratio > 1 + time_threshold:
+            status = STATUS_REGRESSION
+        elif memory_ratio is not None and memory_ratio > 1 + memory_threshold:
+            status = STATUS_REGRESSION
+        elif time_ratio is not None and time_ratio < 1 / (1 + time_threshold):
+            status = STATUS_IMPROVEMENT
+        comparisons.append(Comparison(result.name, status, time_ratio, memory_ratio))
+    return comparisons
+
+
+# ============================================================================
+# ЗВІТ
+# ============================================================================
+
+def format_time(seconds: float) -> str:
+    """Час з одиницями (нс, мкс, мс, с)"""
+    if seconds != seconds:
+        return '-'
+    for unit, scale in (('с', 1.0), ('мс', 1e-3), ('мкс', 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} нс"
+
+
+def format_bytes(size: int) -> str:
+    """Розмір з одиницями (Б, КБ, МБ)"""
+    for unit, scale in (('МБ', 1 << 20), ('КБ', 1 << 10)):
+        if size >= scale:
+            return f"{size / scale:.3g} {unit}"
+    return f"{size} Б"
+
+
+def format_report(results: Iterable[BenchmarkResult], comparisons: Optional[Iterable[Comparison]] = None) -> str:
+    """Текстова таблиця результатів (та порівняння з baseline, якщо є)"""
+    by_name = {c.name: c for c in comparisons or []}
+    rows = [('Бенчмарк', 'Медіана', 'Мін.', '±', 'Пам\'ять', 'Baseline')]
+    for result in results:
+        if result.skipped:
+            rows.append((result.name, 'пропущено', result.skipped, '', '', ''))
+            continue
+        comparison = by_name.get(result.name)
+        if comparison is None:
+            versus = ''
+        elif comparison.time_ratio is None:
+            versus = comparison.status
+        else:
+            versus = f"×{comparison.time_ratio:.2f}"
+            if comparison.status != STATUS_OK:
+                versus += f" {comparison.status}"
+        rows.append((
+            result.name, format_time(result.median), format_time(result.best),
+            format_time(result.stdev), format_bytes(result.peak_memory), versus,
+        ))
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    lines = ['  '.join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip() for row in rows]
+    lines.insert(1, '  '.join('-' * width for width in widths))
+    return '\n'.join(lines)
@@ -0,0 +1,263 @@
+"""
+Типові навантаження для бенчмарків
+
+Групи:
+    solve     - прямий та обернений розв'язувач, пакетний розрахунок
+    analysis  - профіль висоти, оптимальна висота, час польоту
+    geometry  - сітки профілів форм з різною дискретизацією
+    patterns  - викрійки для кожної форми та припуск на шов
+    export    - кожен формат експорту (файли пишуться в тимчасовий каталог)
+
+Вхідні дані фіксовані, щоб результати різних прогонів були порівнянні.
+"""
+
+import os
+from typing import Any, Dict
+
+from balloon.bench.core import benchmark
+
+# Спільні вхідні дані розрахунку
+SOLVE_INPUTS: Dict[str, Any] = {
+    'gas_type': 'Гелій',
+    'material': 'TPU',
+    'thickness_um': 35,
+    'start_height': 0,
+    'work_height': 1000,
+    'ground_temp': 15,
+    'inside_temp': 100,
+}
+GAS_VOLUME = 10.0
+TARGET_PAYLOAD = 3.0
+
+SHAPE_PARAMS: Dict[str, Dict[str, float]] = {
+    'sphere': {'radius': 1.5},
+    'pillow': {'pillow_len': 3.0, 'pillow_wid': 2.0},
+    'pear': {'pear_height': 3.0, 'pear_top_radius': 1.2, 'pear_bottom_radius': 0.6},
+    'cigar': {'cigar_length': 5.0, 'cigar_radius': 1.0},
+}
+
+# Кількість рядків пакетного розрахунку
+BATCH_ROWS = 200
+
+MESH_RESOLUTIONS = (50, 100, 200)
+
+NUM_GORES = 12
+SEAM_ALLOWANCE_MM = 10.0
+
+
+def _analysis_inputs() -> Dict[str, Any]:
+    inputs = {k: v for k, v in SOLVE_INPUTS.items() if k not in ('start_height', 'work_height')}
+    return dict(inputs, gas_volume=GAS_VOLUME)
+
+
+def _pattern(shape: str, seam_allowance_mm: float = SEAM_ALLOWANCE_MM) -> Dict[str, Any]:
+    from balloon.patterns.profile_based import generate_pattern_from_shape_profile
+    return generate_pattern_from_shape_profile(shape, SHAPE_PARAMS[shape], num_segments=NUM_GORES,
+                                               seam_allowance_mm=seam_allowance_mm)
+
+
+# ============================================================================
+# SOLVE
+# ============================================================================
+
+@benchmark('solve.scalar')
+def solve_scalar(context):
+    """Прямий розрахунок: об'єм -> навантаження (сфера)"""
+    from balloon.model.solve import solve_volume_to_payload
+    solve_volume_to_payload(gas_volume=GAS_VOLUME, **SOLVE_INPUTS)
+
+
+@benchmark('solve.scalar_pear')
+def solve_scalar_pear(context):
+    """Прямий розрахунок для груші"""
+    from balloon.model.solve import solve_volume_to_payload
+    solve_volume_to_payload(gas_volume=GAS_VOLUME, shape_type='pear', shape_params=SHAPE_PARAMS['pear'],
+                            **SOLVE_INPUTS)
+
+
+@benchmark('solve.inverse')
+def solve_inverse(context):
+    """Обернений розрахунок: навантаження -> об'єм (сфера)"""
+    from balloon.model.solve import solve_payload_to_volume
+    solve_payload_to_volume(target_payload=TARGET_PAYLOAD, **SOLVE_INPUTS)
+
+
+def _batch_rows(workdir: str):
+    rows = []
+    for i in range(BATCH_ROWS):
+        rows.append({
+            'gas_type': 'Гелій' if i % 3 else 'Водень',
+            'gas_volume': str(5 + i % 40),
+            'material': 'TPU',
+            'thickness': '35',
+            'start_height': '0',
+            'work_height': str(500 + 50 * (i % 20)),
+            'mode': 'payload',
+            'shape_type': 'sphere',
+        })
+    return rows
+
+
+@benchmark('solve.batch', setup=_batch_rows)
+def solve_batch(rows):
+    """Пакетний розрахунок 200 рядків (валідація + розв'язувач, в одному процесі)"""
+    from balloon.batch import evaluate_rows
+    for _ in evaluate_rows(rows, workers=1):
+        pass
+
+
+# ============================================================================
+# ANALYSIS
+# ============================================================================
+
+@benchmark('analysis.height_profile')
+def height_profile(context):
+    """Профіль параметрів до 10 км (крок 500 м)"""
+    from balloon.analysis import calculate_height_profile
+    calculate_height_profile(max_height=10000, **_analysis_inputs())
+
+
+@benchmark('analysis.optimal_height')
+def optimal_height(context):
+    """Пошук оптимальної висоти"""
+    from balloon.analysis import calculate_optimal_height
+    calculate_optimal_height(**_analysis_inputs())
+
+
+@benchmark('analysis.flight_time')
+def flight_time(context):
+    """Максимальний час польоту"""
+    from balloon.analysis import calculate_max_flight_time
+    calculate_max_flight_time(gas_volume=GAS_VOLUME, **SOLVE_INPUTS)
+
+
+# ============================================================================
+# GEOMETRY
+# ============================================================================
+
+def _register_mesh(resolution: int):
+    def setup(workdir: str):
+        from balloon.shapes.profile import get_shape_profile
+        return get_shape_profile('pear', SHAPE_PARAMS['pear'])
+
+    def mesh(profile):
+        profile.generate_mesh(num_theta=resolution, num_z=resolution)
+
+    mesh.__doc__ = f"Сітка профілю груші {resolution}×{resolution}"
+    benchmark(f'geometry.mesh_{resolution}', setup=setup)(mesh)
+
+
+for _resolution in MESH_RESOLUTIONS:
+    _register_mesh(_resolution)
+
+
+@benchmark('geometry.profile')
+def shape_profile(context):
+    """Побудова профілів усіх форм обертання"""
+    from balloon.shapes.profile import get_shape_profile
+    for shape in ('sphere', 'pear', 'cigar'):
+        get_shape_profile(shape, SHAPE_PARAMS[shape])
+
+
+# ============================================================================
+# PATTERNS
+# ============================================================================
+
+def _register_gores(shape: str):
+    def gores(context):
+        _pattern(shape, seam_allowance_mm=0)
+
+    gores.__doc__ = f"Викрійка ({shape}, {NUM_GORES} сегментів, без припуску)"
+    benchmark(f'patterns.gores_{shape}')(gores)
+
+
+for _shape in SHAPE_PARAMS:
+    _register_gores(_shape)
+
+
+@benchmark('patterns.seam_allowance', setup=lambda workdir: _pattern('pear', seam_allowance_mm=0))
+def seam_allowance(pattern):
+    """Припуск на шов 10 мм для викрійки груші"""
+    from balloon.patterns.base import _add_seam_allowance
+    _add_seam_allowance(pattern, SEAM_ALLOWANCE_MM / 1000.0)
+
+
+# ============================================================================
+# EXPORT
+# ============================================================================
+
+def _export_context(workdir: str) -> Dict[str, Any]:
+    return {'pattern': _pattern('pear'), 'workdir': workdir}
+
+
+def _path(context: Dict[str, Any], filename: str) -> str:
+    return os.path.join(context['workdir'], filename)
+
+
+@benchmark('export.svg', setup=_export_context)
+def export_svg(context):
+    """Розкладка всіх сегментів у SVG"""
+    from balloon.export import export_gores_to_svg
+    export_gores_to_svg(context['pattern'], _path(context, 'gores.svg'))
+
+
+@benchmark('export.dxf', setup=_export_context, requires=('ezdxf',))
+def export_dxf(context):
+    """Розкладка всіх сегментів у DXF"""
+    from balloon.export import export_gores_to_dxf
+    export_gores_to_dxf(context['pattern'], _path(context, 'gores.dxf'))
+
+
+@benchmark('export.pdf', setup=_export_context, requires=('reportlab',))
+def export_pdf(context):
+    """Викрійка на аркушах A4 (PDF)"""
+    from balloon.export import export_pattern_to_pdf
+    export_pattern_to_pdf(context['pattern'], _path(context, 'pattern.pdf'), max_workers=1)
+
+
+@benchmark('export.hpgl', setup=_export_context)
+def export_hpgl(context):
+    """Програма різання HPGL"""
+    from balloon.export import export_pattern_to_hpgl
+    export_pattern_to_hpgl(context['pattern'], _path(context, 'pattern.plt'))
+
+
+@benchmark('export.gcode', setup=_export_context)
+def export_gcode(context):
+    """Програма різання G-code"""
+    from balloon.export import export_pattern_to_gcode
+    export_pattern_to_gcode(context['pattern'], _path(context, 'pattern.gcode'))
+
+
+@benchmark('export.excel_pattern', setup=_export_context)
+def export_excel_pattern(context):
+    """Викрійка в Excel"""
+    from balloon.export import export_pattern_to_excel
+    export_pattern_to_excel(context['pattern'], _path(context, 'pattern.xlsx'))
+
+
+def _report_context(workdir: str) -> Dict[str, Any]:
+    from balloon.model.solve import solve_volume_to_payload
+    inputs = dict(SOLVE_INPUTS, gas_volume=GAS_VOLUME)
+    return {'results': solve_volume_to_payload(**inputs), 'inputs': inputs, 'workdir': workdir}
+
+
+@benchmark('export.excel_results', setup=_report_context)
+def export_excel_results(context):
+    """Результати розрахунку в Excel"""
+    from balloon.export import export_results_to_excel
+    export_results_to_excel(context['results'], _path(context, 'results.xlsx'))
+
+
+@benchmark('export.html_report', setup=_report_context)
+def export_html_report(context):
+    """HTML звіт"""
+    from balloon.export import generate_html_report
+    generate_html_report(context['results'], context['inputs'], filename=_path(context, 'report.html'))
+
+
+@benchmark('export.pdf_report', setup=_report_context, requires=('reportlab',))
+def export_pdf_report(context):
+    """PDF звіт"""
+    from balloon.export import generate_pdf_report
+    generate_pdf_report(context['results'], context['inputs'], filename=_path(context, 'report.pdf'))
@@ -0,0 +1,518 @@
+"""
+Кеш результатів розрахунків
+
+Два рівні:
+    - memoize: обмежений LRU кеш у пам'яті процесу для дешевих функцій,
+      що викликаються багато разів з однаковими аргументами
+      (calculate_balloon_state);
+    - persistent_cache: постійний кеш на диску між сесіями.
+
+Постійний кеш на диску (SQLite) для розв'язувачів та функцій аналізу:
+ключ - хеш канонізованих вхідних параметрів разом з відбитком моделі
+(версія пакета + хеш balloon/constants.py), тож зміна констант
+автоматично робить старі записи недійсними. Розмір обмежений
+(витіснення LRU), статистика влучань доступна через stats().
+
+Кеш вимкнено за замовчуванням. Увімкнення:
+    - enable_result_cache(path=None, max_entries=...) з коду;
+    - змінна середовища BALLOON_RESULT_CACHE: '1' - шлях за замовчуванням,
+      інше значення - шлях до файлу, '0' - примусово вимкнено.
+
+Мемоізацію в пам'яті можна вимкнути (напр. для бенчмарків) через
+set_memoization_enabled(False) або BALLOON_MEMOIZE=0.
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Any, Callable, Hashable, List, Optional
+
+# Змінна середовища для керування постійним кешем
+RESULT_CACHE_ENV = 'BALLOON_RESULT_CACHE'
+
+# Максимальна кількість записів у кеші за замовчуванням
+DEFAULT_MAX_ENTRIES = 20000
+
+# Змінна середовища для вимкнення мемоізації в пам'яті
+MEMOIZE_ENV = 'BALLOON_MEMOIZE'
+
+# Розмір LRU кешу в пам'яті за замовчуванням (записів на функцію)
+DEFAULT_MEMO_SIZE = 4096
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    func TEXT NOT NULL,
+    stamp TEXT NOT NULL,
+    value TEXT NOT NULL,
+    created REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_last_access ON results(last_access);
+"""
+
+
+def canonicalize(value: Any) -> Any:
+    """
+    Приводить значення до канонічного JSON-сумісного вигляду для хешування
+
+    Числа приводяться до float (15 і 15.0 дають однаковий ключ),
+    рядки нормалізуються до NFC, словники сортуються за ключем,
+    кортежі та масиви стають списками.
+
+    Raises:
+        TypeError: Якщо значення не можна канонізувати
+    """
+    if value is None or isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        return unicodedata.normalize('NFC', value)
+    if isinstance(value, (int, float)):
+        number = float(value)
+        return repr(number) if not math.isfinite(number) else number
+    if hasattr(value, 'item') and getattr(value, 'ndim', None) == 0:
+        return canonicalize(value.item())
+    if isinstance(value, dict):
+        return {str(canonicalize(k)): canonicalize(v) for k, v in sorted(value.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(value, (list, tuple)) or hasattr(value, 'tolist'):
+        items = value.tolist() if hasattr(value, 'tolist') else value
+        return [canonicalize(v) for v in items]
+    raise TypeError(f"Неможливо канонізувати значення типу {type(value).__name__}")
+
+
+def input_key(func_name: str, arguments: Dict[str, Any], stamp: str = '') -> str:
+    """Хеш (sha256) функції, канонізованих аргументів та відбитка моделі"""
+    payload = json.dumps([func_name, canonicalize(arguments), stamp], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def model_stamp() -> str:
+    """
+    Відбиток моделі: версія пакета та хеш вмісту balloon/constants.py
+
+    Зміна будь-якої константи змінює відбиток, і записи кешу,
+    створені зі старими константами, більше не використовуються.
+    """
+    from balloon import __version__
+    import balloon.constants as constants_module
+
+    digest = hashlib.sha256()
+    try:
+        with open(constants_module.__file__, 'rb') as fh:
+            digest.update(fh.read())
+    except OSError:
+        # Frozen режим без вихідних файлів: хешуємо значення констант
+        public = {name: getattr(constants_module, name) for name in dir(constants_module) if name.isupper()}
+        digest.update(repr(sorted(public.items())).encode('utf-8'))
+    return f"{__version__}:{digest.hexdigest()[:16]}"
+
+
+def default_cache_path() -> str:
+    """Шлях до файлу кешу за замовчуванням (~/.cache/balloon/results.sqlite)"""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'balloon', 'results.sqlite')
+
+
+class ResultCache:
+    """
+    Постійний кеш результатів у SQLite з витісненням LRU
+
+    Значення зберігаються як JSON (кортежі повертаються списками).
+    Об'єкт потокобезпечний: одне з'єднання, доступ під блокуванням.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 stamp: Optional[str] = None):
+        """
+        Args:
+            path: Шлях до файлу SQLite (None - default_cache_path(), ':memory:' - у пам'яті)
+            max_entries: Максимальна кількість записів
+            stamp: Відбиток моделі (None - model_stamp())
+        """
+        self.path = path or default_cache_path()
+        self.max_entries = max_entries
+        self.stamp = stamp if stamp is not None else model_stamp()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        if self.path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        with self._lock:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.executescript(_SCHEMA)
+            # Записи зі старим відбитком моделі недійсні
+            self._conn.execute('DELETE FROM results WHERE stamp != ?', (self.stamp,))
+
+    def key(self, func_name: str, arguments: Dict[str, Any]) -> str:
+        return input_key(func_name, arguments, self.stamp)
+
+    def get(self, key: str) -> Any:
+        """
+        Повертає значення або KeyError, якщо запису немає
+
+        Raises:
+            KeyError: Якщо запису немає
+        """
+        with self._lock:
+            row = self._conn.execute('SELECT value FROM results WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                raise KeyError(key)
+            self._conn.execute('UPDATE results SET last_access = ? WHERE key = ?', (time.time(), key))
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key: str, func_name: str, value: Any) -> bool:
+        """
+        Зберігає значення (якщо воно серіалізується в JSON)
+
+        Returns:
+            True, якщо значення збережено
+        """
+        try:
+            encoded = json.dumps(value, ensure_ascii=False, default=_json_default)
+        except (TypeError, ValueError):
+            return False
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO results (key, func, stamp, value, created, last_access) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (key, func_name, self.stamp, encoded, now, now)
+            )
+            self._evict()
+        return True
+
+    def _evict(self):
+        (count,) = self._conn.execute('SELECT COUNT(*) FROM results').fetchone()
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                'DELETE FROM results WHERE key IN '
+                '(SELECT key FROM results ORDER BY last_access ASC LIMIT ?)',
+                (excess,)
+            )
+
+    def clear(self):
+        """Видаляє всі записи та скидає статистику"""
+        with self._lock:
+            self._conn.execute('DELETE FROM results')
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Статистика: hits, misses, hit_rate, entries, max_entries, path"""
+        with self._lock:
+            (entries,) = self._conn.execute('SELECT COUNT(*) FROM results').fetchone()
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'entries': entries,
+            'max_entries': self.max_entries,
+            'path': self.path,
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def _json_default(value: Any) -> Any:
+    if hasattr(value, 'item') and getattr(value, 'ndim', None) == 0:
+        return value.item()
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    raise TypeError(f"Тип {type(value).__name__} не серіалізується в JSON")
+
+
+_result_cache: Optional[ResultCache] = None
+_result_cache_lock = threading.Lock()
+_env_checked = False
+
+
+def enable_result_cache(path: Optional[str] = None, max_entries: int = DEFAULT_MAX_ENTRIES) -> Optional[ResultCache]:
+    """
+    Вмикає постійний кеш результатів
+
+    Якщо BALLOON_RESULT_CACHE=0, кеш не вмикається.
+
+    Args:
+        path: Шлях до файлу SQLite (None - default_cache_path())
+        max_entries: Максимальна кількість записів
+
+    Returns:
+        Активний ResultCache або None, якщо кеш вимкнено змінною середовища
+        чи файл недоступний
+    """
+    global _result_cache, _env_checked
+    if os.environ.get(RESULT_CACHE_ENV, '').strip().lower() in ('0', 'off', 'false'):
+        return None
+    with _result_cache_lock:
+        if _result_cache is not None:
+            _result_cache.close()
+        try:
+            _result_cache = ResultCache(path, max_entries=max_entries)
+        except (sqlite3.Error, OSError):
+            _result_cache = None
+        _env_checked = True
+        return _result_cache
+
+
+def disable_result_cache():
+    """Вимикає постійний кеш (файл на диску зберігається)"""
+    global _result_cache, _env_checked
+    with _result_cache_lock:
+        if _result_cache is not None:
+            _result_cache.close()
+        _result_cache = None
+        _env_checked = True
+
+
+def get_result_cache() -> Optional[ResultCache]:
+    """Активний постійний кеш (з урахуванням BALLOON_RESULT_CACHE) або None"""
+    global _env_checked
+    if not _env_checked:
+        _env_checked = True
+        value = os.environ.get(RESULT_CACHE_ENV, '').strip()
+        if value and value.lower() not in ('0', 'off', 'false'):
+            enable_result_cache(None if value.lower() in ('1', 'on', 'true') else value)
+    return _result_cache
+
+
+def persistent_cache(func: Callable) -> Callable:
+    """
+    Декоратор: кешує результат функції в постійному кеші, якщо він увімкнений
+
+    Аргументи зв'язуються з сигнатурою (позиційні, іменовані та значення
+    за замовчуванням дають один ключ). Винятки не кешуються. Якщо кеш
+    вимкнено, функція викликається напряму.
+    """
+    signature = inspect.signature(func)
+    func_name = f"{func.__module__}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        cache = get_result_cache()
+        if cache is None:
+            return func(*args, **kwargs)
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        try:
+            key = cache.key(func_name, bound.arguments)
+        except TypeError:
+            return func(*args, **kwargs)
+        try:
+            return cache.get(key)
+        except KeyError:
+            pass
+        result = func(*args, **kwargs)
+        cache.put(key, func_name, result)
+        return result
+
+    wrapper.uncached = func
+    return wrapper
+
+
+# ============================================================================
+# МЕМОІЗАЦІЯ В ПАМ'ЯТІ
+# ============================================================================
+
+# Позначка відсутнього запису (None - допустиме кешоване значення)
+MISSING = object()
+
+_memo_enabled = os.environ.get(MEMOIZE_ENV, '').strip().lower() not in ('0', 'off', 'false')
+_memo_caches: List["MemoCache"] = []
+
+
+def freeze(value: Any) -> Hashable:
+    """
+    Хешоване представлення аргументу: словники стають відсортованими кортежами пар
+
+    Порожній словник і None еквівалентні (shape_params за замовчуванням).
+    """
+    if isinstance(value, dict):
+        if not value:
+            return None
+        frozen = tuple(sorted(value.items()))
+        try:
+            hash(frozen)
+            return frozen
+        except TypeError:
+            # Вкладені словники/списки
+            return tuple(sorted((k, freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def _copy_result(value: Any) -> Any:
+    """Копія словників/списків результату (щоб виклики не змінювали кешоване значення)"""
+    value_type = type(value)
+    if value_type is dict:
+        copy = value.copy()
+        for k, v in copy.items():
+            if type(v) is dict or type(v) is list:
+                copy[k] = _copy_result(v)
+        return copy
+    if value_type is list:
+        return [_copy_result(v) if type(v) is dict or type(v) is list else v for v in value]
+    return value
+
+
+def _memo_key(args: tuple, kwargs: dict) -> Hashable:
+    """
+    Ключ мемоізації: (позиційні, імена, значення іменованих аргументів)
+
+    Словники (shape_params) канонізуються через freeze; решта значень
+    використовується як є, тож ключ будується без сортування та копій.
+    """
+    if dict in set(map(type, args)):
+        # Перевірка до hash(): виняток TypeError коштує більше за канонізацію
+        args = tuple([freeze(v) if type(v) is dict else v for v in args])
+    if kwargs:
+        values = tuple(kwargs.values())
+        if dict in set(map(type, values)):
+            values = tuple([freeze(v) if type(v) is dict else v for v in values])
+        key = (args, tuple(kwargs), values)
+    else:
+        key = args
+    try:
+        hash(key)
+    except TypeError:
+        # Словники серед позиційних аргументів або вкладені списки
+        key = (freeze(args), freeze(kwargs))
+        hash(key)
+    return key
+
+
+class MemoCache:
+    """Потокобезпечний обмежений LRU кеш результатів однієї функції"""
+
+    def __init__(self, name: str, maxsize: int = DEFAULT_MEMO_SIZE):
+        self.name = name
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, key: Hashable) -> Any:
+        """Повертає значення або MISSING, якщо запису немає"""
+        with self._lock:
+            value = self._data.get(key, MISSING)
+            if value is MISSING:
+                self.misses += 1
+            else:
+                self._data.move_to_end(key)
+                self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """Очищає кеш та скидає лічильники"""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Статистика: hits, misses, hit_rate, size, maxsize"""
+        with self._lock:
+            size = len(self._data)
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'size': size,
+            'maxsize': self.maxsize,
+        }
+
+
+def memoize(func: Optional[Callable] = None, *, maxsize: int = DEFAULT_MEMO_SIZE) -> Callable:
+    """
+    Декоратор: обмежена LRU мемоізація в пам'яті процесу
+
+    Ключ - позиційні та іменовані аргументи як є (якщо серед них є
+    словники, ключ канонізується через freeze), без зв'язування
+    з сигнатурою: функції, що кешуються, дешеві, і накладні витрати
+    мають бути значно меншими за їх розрахунок.
+    Повертається копія кешованого словника. Атрибути обгортки:
+    cache (MemoCache), cache_clear(), cache_info().
+
+    Використання:
+        @memoize
+        def f(...): ...
+
+        @memoize(maxsize=1024)
+        def g(...): ...
+    """
+    def decorator(function: Callable) -> Callable:
+        memo = MemoCache(f"{function.__module__}.{function.__qualname__}", maxsize)
+        _memo_caches.append(memo)
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _memo_enabled:
+                return function(*args, **kwargs)
+            try:
+                key = _memo_key(args, kwargs)
+            except TypeError:
+                return function(*args, **kwargs)
+            cached = memo.lookup(key)
+            if cached is not MISSING:
+                return _copy_result(cached)
+            result = function(*args, **kwargs)
+            memo.put(key, _copy_result(result))
+            return result
+
+        wrapper.cache = memo
+        wrapper.cache_clear = memo.clear
+        wrapper.cache_info = memo.stats
+        wrapper.uncached = function
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+    return decorator
+
+
+def set_memoization_enabled(enabled: bool):
+    """Вмикає/вимикає мемоізацію в пам'яті для всіх функцій (кеші очищаються)"""
+    global _memo_enabled
+    _memo_enabled = bool(enabled)
+    clear_memo_caches()
+
+
+def memoization_enabled() -> bool:
+    return _memo_enabled
+
+
+def clear_memo_caches():
+    """Очищає всі кеші мемоізації в пам'яті"""
+    for memo in _memo_caches:
+        memo.clear()
+
+
+def memo_stats() -> Dict[str, Dict[str, Any]]:
+    """Статистика всіх кешів мемоізації {ім'я функції: stats}"""
+    return {memo.name: memo.stats() for memo in _memo_caches}
@@ -1,45 +1,73 @@
 """
 Модуль для експорту результатів розрахунку та викрійок
+
+Функції експорту імпортуються при першому зверненні (PEP 562), тому
+import balloon.export або balloon.export.result_store не завантажує
+reportlab, ezdxf та інші залежності форматів, що не використовуються.
 """
 
-# Імпортуємо з export_core.py (щоб уникнути конфлікту з пакетом export/)
-from balloon.export_core import export_results_to_excel, export_pattern_to_excel, export_pattern_to_svg
-from balloon.export.nesting import estimate_fabric_requirements
-
-try:
-    from balloon.export.pdf_export import export_pattern_to_pdf
-    PDF_EXPORT_AVAILABLE = True
-except ImportError:
-    PDF_EXPORT_AVAILABLE = False
-    export_pattern_to_pdf = None
-
-try:
-    from balloon.export.dxf_export import export_pattern_to_dxf
-    DXF_EXPORT_AVAILABLE = True
-except ImportError:
-    DXF_EXPORT_AVAILABLE = False
-    export_pattern_to_dxf = None
-
-try:
-    from balloon.export.report_generator import generate_pdf_report, generate_html_report
-    REPORT_GENERATOR_AVAILABLE = True
-except ImportError:
-    REPORT_GENERATOR_AVAILABLE = False
-    generate_pdf_report = None
-    generate_html_report = None
-
-__all__ = [
-    'export_results_to_excel',
-    'export_pattern_to_excel',
-    'export_pattern_to_svg',
-    'estimate_fabric_requirements',
-]
-
-if PDF_EXPORT_AVAILABLE:
-    __all__.append('export_pattern_to_pdf')
-
-if DXF_EXPORT_AVAILABLE:
-    __all__.append('export_pattern_to_dxf')
-
-if REPORT_GENERATOR_AVAILABLE:
-    __all__.extend(['generate_pdf_report', 'generate_html_report'])
+import importlib
+
+# Назва -> модуль, з якого вона імпортується
+# (export_core.py - окремий модуль, щоб уникнути конфлікту з пакетом export/)
+_EXPORTS = {
+    'export_results_to_excel': 'balloon.export_core',
+    'export_pattern_to_excel': 'balloon.export_core',
+    'export_pattern_to_svg': 'balloon.export_core',
+    'export_pattern_file': 'balloon.export_core',
+    'export_tables_to_excel': 'balloon.export.excel_export',
+    'ResultStoreWriter': 'balloon.export.result_store',
+    'write_results': 'balloon.export.result_store',
+    'read_results': 'balloon.export.result_store',
+    'iter_result_batches': 'balloon.export.result_store',
+    'estimate_fabric_requirements': 'balloon.export.nesting',
+    'calculate_gore_layout': 'balloon.export.nesting',
+    'SvgWriter': 'balloon.export.svg_export',
+    'export_gores_to_svg': 'balloon.export.svg_export',
+    'export_pattern_to_hpgl': 'balloon.export.plotter_export',
+    'export_pattern_to_gcode': 'balloon.export.plotter_export',
+    'export_pattern_to_pdf': 'balloon.export.pdf_export',
+    'export_pattern_to_dxf': 'balloon.export.dxf_export',
+    'export_gores_to_dxf': 'balloon.export.dxf_export',
+    'generate_pdf_report': 'balloon.export.report_generator',
+    'generate_html_report': 'balloon.export.report_generator',
+}
+
+# Прапорці доступності -> модуль (False, якщо модуль не імпортується;
+# тоді відповідні функції дорівнюють None)
+_AVAILABILITY_FLAGS = {
+    'PDF_EXPORT_AVAILABLE': 'balloon.export.pdf_export',
+    'DXF_EXPORT_AVAILABLE': 'balloon.export.dxf_export',
+    'REPORT_GENERATOR_AVAILABLE': 'balloon.export.report_generator',
+}
+_OPTIONAL_MODULES = set(_AVAILABILITY_FLAGS.values())
+
+
+def _import_optional(module_name: str):
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:
+        return None
+
+
+def __getattr__(name: str):
+    if name in _AVAILABILITY_FLAGS:
+        value = _import_optional(_AVAILABILITY_FLAGS[name]) is not None
+    elif name in _EXPORTS:
+        module_name = _EXPORTS[name]
+        if module_name in _OPTIONAL_MODULES:
+            module = _import_optional(module_name)
+            value = getattr(module, name) if module is not None else None
+        else:
+            value = getattr(importlib.import_module(module_name), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS) | set(_AVAILABILITY_FLAGS))
+
+
+__all__ = list(_EXPORTS)
@@ -0,0 +1,393 @@
+"""
+Спільна геометрія контурів викрійок для експортерів
+
+Функції працюють з правою половиною контуру gore (x >= 0, y вздовж меридіану),
+як її повертає generate_pattern_from_shape_profile.
+"""
+
+import math
+from typing import Dict, Any, List, Tuple
+
+import numpy as np
+
+Point = Tuple[float, float]
+
+
+def offset_inward(points: List[Point], offset_m: float) -> List[Point]:
+    """
+    Зміщує праву половину контуру всередину по нормалі (лінія шва)
+    
+    Нормаль у вершині перпендикулярна хорді між сусідніми точками;
+    результат обмежується центральною лінією (x >= 0), тож біля полюсів
+    лінія шва не перетинає дзеркальну половину.
+    
+    Args:
+        points: Права половина контуру (м), від одного полюса до іншого
+        offset_m: Зміщення всередину (м)
+    
+    Returns:
+        Зміщені точки (м)
+    """
+    coords = np.asarray(points, dtype=float)
+    if offset_m == 0 or len(coords) < 2:
+        return [tuple(p) for p in coords.tolist()]
+    tangents = np.empty_like(coords)
+    tangents[1:-1] = coords[2:] - coords[:-2]
+    tangents[0] = coords[1] - coords[0]
+    tangents[-1] = coords[-1] - coords[-2]
+    lengths = np.hypot(tangents[:, 0], tangents[:, 1])
+    tangents /= np.where(lengths > 0, lengths, 1.0)[:, None]
+    # Для обходу знизу вгору внутрішня нормаль (-ty, tx) вказує до центральної лінії
+    direction = 1.0 if coords[-1, 1] >= coords[0, 1] else -1.0
+    normals = direction * np.column_stack([-tangents[:, 1], tangents[:, 0]])
+    shifted = coords + offset_m * normals
+    shifted[:, 0] = np.maximum(shifted[:, 0], 0.0)
+    return [tuple(p) for p in shifted.tolist()]
+
+
+def gore_outline(points: List[Point], offset_m: float = 0.0) -> List[Point]:
+    """
+    Повний замкнений контур gore: права сторона вгору, дзеркальна ліва вниз
+    
+    Args:
+        points: Права половина контуру (м)
+        offset_m: Зміщення всередину по нормалі (м), напр. припуск для лінії шва
+    
+    Returns:
+        Список точок повного контуру (м)
+    """
+    right = offset_inward(points, offset_m) if offset_m else list(points)
+    left = [(-x, y) for x, y in reversed(right)]
+    return right + left
+
+
+def contour_x_at_y(points: List[Point], y_pos: float) -> float:
+    """Лінійна інтерполяція X контуру на висоті y_pos"""
+    for i in range(len(points) - 1):
+        (x1, y1), (x2, y2) = points[i], points[i + 1]
+        if (y1 <= y_pos < y2) or (y2 <= y_pos < y1):
+            if y2 != y1:
+                return x1 + (x2 - x1) * (y_pos - y1) / (y2 - y1)
+            return x1
+    return 0.0
+
+
+def notch_y_positions(pattern: Dict[str, Any]) -> List[float]:
+    """Позиції міток по Y (м): підтримує 'notches' та 'notch_positions', числа або (x, y)"""
+    raw = pattern.get('notches') or pattern.get('notch_positions') or []
+    return [item[1] if isinstance(item, (list, tuple)) else item for item in raw]
+
+
+def pattern_bounds(points: List[Point]) -> Tuple[float, float, float]:
+    """Повертає (половина ширини, min_y, max_y) повного контуру gore (м)"""
+    half_width = max(abs(x) for x, y in points)
+    min_y = min(y for x, y in points)
+    max_y = max(y for x, y in points)
+    return half_width, min_y, max_y
+
+
+def simplify_polyline(points, tolerance: float) -> List[Point]:
+    """
+    Спрощує полілінію алгоритмом Дугласа–Пекера
+    
+    Відкидає точки, відхилення яких від спрощеної лінії не перевищує tolerance.
+    Перша та остання точки зберігаються завжди.
+    
+    Args:
+        points: Послідовність точок (x, y)
+        tolerance: Допустиме відхилення (в одиницях координат)
+    
+    Returns:
+        Спрощений список точок
+    """
+    coords = np.asarray(points, dtype=float)
+    if len(coords) <= 2 or tolerance <= 0:
+        return [tuple(p) for p in coords.tolist()]
+    
+    keep = np.zeros(len(coords), dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(coords) - 1)]
+    
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        start = coords[first]
+        chord = coords[last] - start
+        inner = coords[first + 1:last] - start
+        chord_length = math.hypot(chord[0], chord[1])
+        if chord_length > 0:
+            distances = np.abs(chord[0] * inner[:, 1] - chord[1] * inner[:, 0]) / chord_length
+        else:
+            distances = np.hypot(inner[:, 0], inner[:, 1])
+        index = int(np.argmax(distances))
+        if distances[index] > tolerance:
+            split = first + 1 + index
+            keep[split] = True
+            stack.append((first, split))
+            stack.append((split, last))
+    
+    return [tuple(p) for p in coords[keep].tolist()]
+
+
+def _segment_distances(reference: np.ndarray, polyline: np.ndarray, block: int = 256) -> np.ndarray:
+    """Відстань від кожної точки reference до найближчого сегмента polyline"""
+    a = polyline[:-1]
+    ab = polyline[1:] - a
+    ab_len2 = np.einsum('ij,ij->i', ab, ab)
+    ab_len2 = np.where(ab_len2 > 0, ab_len2, 1.0)
+    result = np.empty(len(reference))
+    for start in range(0, len(reference), block):
+        p = reference[start:start + block, None, :]
+        t = np.clip(np.einsum('nmk,mk->nm', p - a, ab) / ab_len2, 0.0, 1.0)
+        closest = a + t[..., None] * ab
+        result[start:start + block] = np.sqrt(((p - closest) ** 2).sum(axis=2)).min(axis=1)
+    return result
+
+
+def contour_deviation(reference, approximation) -> float:
+    """
+    Максимальне відхилення точного контуру від наближення
+    
+    Args:
+        reference: Точки точного контуру
+        approximation: Полілінія наближення (для кривих Безьє - дискретизована)
+    
+    Returns:
+        Максимальна відстань від точки reference до наближення
+    """
+    reference = np.asarray(reference, dtype=float)
+    approximation = np.asarray(approximation, dtype=float)
+    if len(reference) == 0:
+        return 0.0
+    if len(approximation) < 2:
+        return float(np.hypot(*(reference - approximation[:1]).T).max())
+    return float(_segment_distances(reference, approximation).max())
+
+
+def symmetric_deviation(reference, approximation) -> float:
+    """
+    Симетричне (Гаусдорфове) відхилення двох поліліній
+
+    Максимум з відстаней від точок reference до approximation і навпаки,
+    тож враховуються й ділянки наближення, що відходять від контуру між точками.
+    """
+    return max(contour_deviation(reference, approximation), contour_deviation(approximation, reference))
+
+
+def _bezier_point(segment: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """Точки кубічної кривої Безьє (4 контрольні точки) для параметрів t"""
+    t = np.asarray(t, dtype=float)[:, None]
+    mt = 1.0 - t
+    return (mt ** 3 * segment[0] + 3 * mt ** 2 * t * segment[1]
+            + 3 * mt * t ** 2 * segment[2] + t ** 3 * segment[3])
+
+
+def bezier_to_polyline(segments, samples_per_segment: int = 16) -> List[Point]:
+    """Дискретизує послідовність кубічних кривих Безьє у полілінію"""
+    if not segments:
+        return []
+    t = np.linspace(0.0, 1.0, samples_per_segment + 1)
+    parts = [np.asarray(segments[0][0], dtype=float)[None, :]]
+    for segment in segments:
+        parts.append(_bezier_point(np.asarray(segment, dtype=float), t)[1:])
+    return [tuple(p) for p in np.vstack(parts).tolist()]
+
+
+def _unit(vector: np.ndarray) -> np.ndarray:
+    length = math.hypot(vector[0], vector[1])
+    return vector / length if length > 0 else vector
+
+
+def _chord_parameters(points: np.ndarray) -> np.ndarray:
+    lengths = np.concatenate([[0.0], np.cumsum(np.hypot(*np.diff(points, axis=0).T))])
+    return lengths / lengths[-1] if lengths[-1] > 0 else np.linspace(0.0, 1.0, len(points))
+
+
+def _fit_single_bezier(points: np.ndarray, u: np.ndarray, tangent_1: np.ndarray, tangent_2: np.ndarray) -> np.ndarray:
+    """Найменші квадрати для довжин дотичних (алгоритм Шнайдера)"""
+    p0, p3 = points[0], points[-1]
+    b0 = (1 - u) ** 3
+    b1 = 3 * u * (1 - u) ** 2
+    b2 = 3 * u ** 2 * (1 - u)
+    b3 = u ** 3
+    a1 = tangent_1[None, :] * b1[:, None]
+    a2 = tangent_2[None, :] * b2[:, None]
+    c00 = np.einsum('ij,ij->', a1, a1)
+    c01 = np.einsum('ij,ij->', a1, a2)
+    c11 = np.einsum('ij,ij->', a2, a2)
+    rest = points - (np.outer(b0 + b1, p0) + np.outer(b2 + b3, p3))
+    x0 = np.einsum('ij,ij->', a1, rest)
+    x1 = np.einsum('ij,ij->', a2, rest)
+    det = c00 * c11 - c01 * c01
+    chord = math.hypot(*(p3 - p0))
+    alpha_1 = alpha_2 = 0.0
+    if abs(det) > 1e-12:
+        alpha_1 = (x0 * c11 - x1 * c01) / det
+        alpha_2 = (c00 * x1 - c01 * x0) / det
+    if alpha_1 < 1e-6 * chord or alpha_2 < 1e-6 * chord:
+        # Вироджений випадок: евристика Wu/Barsky
+        alpha_1 = alpha_2 = chord / 3.0
+    return np.array([p0, p0 + tangent_1 * alpha_1, p3 + tangent_2 * alpha_2, p3])
+
+
+def _reparameterize(segment: np.ndarray, points: np.ndarray, u: np.ndarray) -> np.ndarray:
+    """Один крок Ньютона для уточнення параметрів точок на кривій"""
+    d1 = 3 * (segment[1:] - segment[:-1])
+    d2 = 2 * (d1[1:] - d1[:-1])
+    t = u[:, None]
+    q = _bezier_point(segment, u)
+    q1 = (1 - t) ** 2 * d1[0] + 2 * (1 - t) * t * d1[1] + t ** 2 * d1[2]
+    q2 = (1 - t) * d2[0] + t * d2[1]
+    diff = q - points
+    numerator = (diff * q1).sum(axis=1)
+    denominator = (q1 * q1).sum(axis=1) + (diff * q2).sum(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        step = np.where(np.abs(denominator) > 1e-12, numerator / denominator, 0.0)
+    return np.clip(u - step, 0.0, 1.0)
+
+
+# Вибірка кривої для перевірки відхилення кривої від полілінії
+_CURVE_SAMPLES = 24
+
+
+def _curve_error(segment: np.ndarray, points: np.ndarray) -> Tuple[float, float]:
+    """Найбільша відстань від точок кривої до полілінії points та її параметр t"""
+    t = np.linspace(0.0, 1.0, _CURVE_SAMPLES + 1)[1:-1]
+    distances = _segment_distances(_bezier_point(segment, t), points)
+    worst = int(np.argmax(distances))
+    return float(distances[worst]), float(t[worst])
+
+
+def _line_segment(p0: np.ndarray, p3: np.ndarray) -> np.ndarray:
+    """Відрізок як крива Безьє (контрольні точки на хорді)"""
+    return np.array([p0, p0 + (p3 - p0) / 3.0, p3 - (p3 - p0) / 3.0, p3])
+
+
+def _fit_bezier_run(points: np.ndarray, tangent_1: np.ndarray, tangent_2: np.ndarray,
+                    tolerance: float, segments: list):
+    """
+    Апроксимує ділянку без кутів кривими, поки відхилення в обидва боки не в межах допуску
+
+    Перевіряються відстані від точок до кривої та від вибірки кривої до
+    полілінії (крива може відходити від контуру між рідкими точками).
+    Ділянки обробляються стеком у порядку обходу.
+    """
+    stack = [(points, tangent_1, tangent_2)]
+    while stack:
+        run, t1, t2 = stack.pop()
+        if len(run) == 2:
+            chord = math.hypot(*(run[1] - run[0])) / 3.0
+            segment = np.array([run[0], run[0] + t1 * chord, run[1] + t2 * chord, run[1]])
+            if _curve_error(segment, run)[0] > tolerance:
+                # Дотичні сусідніх ділянок тут вигинають криву - замість неї відрізок
+                segment = _line_segment(run[0], run[1])
+            segments.append(segment)
+            continue
+
+        u = _chord_parameters(run)
+        split = None
+        for _ in range(5):
+            segment = _fit_single_bezier(run, u, t1, t2)
+            errors = np.hypot(*(_bezier_point(segment, u) - run).T)
+            split = int(np.argmax(errors))
+            if errors[split] <= tolerance:
+                curve_error, t_worst = _curve_error(segment, run)
+                if curve_error <= tolerance:
+                    break
+                # Ділимо у точці контуру, найближчій до місця найбільшого відхилення кривої
+                split = int(np.argmin(np.abs(u - t_worst)))
+                segment = None
+                break
+            if errors[split] > 4 * tolerance:
+                segment = None
+                break
+            u = _reparameterize(segment, run, u)
+        else:
+            segment = None
+        if segment is not None:
+            segments.append(segment)
+            continue
+
+        split = min(max(split, 1), len(run) - 2)
+        center = _unit(run[split - 1] - run[split + 1])
+        # Права частина кладеться першою, щоб ліва оброблялася раніше
+        stack.append((run[split:], -center, t2))
+        stack.append((run[:split + 1], t1, center))
+
+
+def fit_cubic_beziers(points, tolerance: float, corner_angle_deg: float = 30.0) -> List[Tuple[Point, Point, Point, Point]]:
+    """
+    Апроксимує полілінію мінімальною кількістю кубічних кривих Безьє
+    
+    Алгоритм Шнайдера (Graphics Gems): найменші квадрати з параметризацією
+    за довжиною хорди, уточнення Ньютоном та поділ у точці найбільшої похибки.
+    Полілінія попередньо розбивається в кутах (полюси gore), щоб криві
+    не згладжували злами контуру.
+    
+    Args:
+        points: Послідовність точок (x, y)
+        tolerance: Допустиме відхилення (в одиницях координат)
+        corner_angle_deg: Мінімальний кут зламу, що вважається кутом
+    
+    Returns:
+        Список кривих (p0, c1, c2, p3); p3 кожної кривої = p0 наступної
+    """
+    coords = np.asarray(points, dtype=float)
+    if len(coords) > 1:
+        keep = np.concatenate([[True], np.hypot(*np.diff(coords, axis=0).T) > 0])
+        coords = coords[keep]
+    if len(coords) < 2:
+        return []
+
+    directions = np.diff(coords, axis=0)
+    headings = np.arctan2(directions[:, 1], directions[:, 0])
+    turn = np.abs((np.diff(headings) + math.pi) % (2 * math.pi) - math.pi)
+    corners = [0] + [int(i) + 1 for i in np.nonzero(turn > math.radians(corner_angle_deg))[0]] + [len(coords) - 1]
+
+    segments: list = []
+    for first, last in zip(corners, corners[1:]):
+        run = coords[first:last + 1]
+        tangent_1 = _unit(run[1] - run[0])
+        tangent_2 = _unit(run[-2] - run[-1])
+        _fit_bezier_run(run, tangent_1, tangent_2, tolerance, segments)
+
+    return [tuple(tuple(p) for p in segment.tolist()) for segment in segments]
+
+
+def simplify_contour(points, tolerance: float, method: str = 'polyline') -> Dict[str, Any]:
+    """
+    Спрощує контур для експорту та звітує про максимальне відхилення
+    
+    Args:
+        points: Точки точного контуру
+        tolerance: Допустиме відхилення (в одиницях координат, напр. мм)
+        method: 'polyline' (Дуглас–Пекер) або 'bezier' (кубічні криві Безьє)
+    
+    Returns:
+        Словник: 'method', 'points' (полілінія) або 'segments' (криві Безьє),
+        'max_deviation' (симетричне відхилення від точного контуру),
+        'input_points', 'output_points'
+    
+    Raises:
+        ValueError: Якщо метод невідомий
+    """
+    if method == 'polyline':
+        simplified = simplify_polyline(points, tolerance)
+        return {
+            'method': method,
+            'points': simplified,
+            'max_deviation': symmetric_deviation(points, simplified),
+            'input_points': len(points),
+            'output_points': len(simplified),
+        }
+    if method == 'bezier':
+        segments = fit_cubic_beziers(points, tolerance)
+        return {
+            'method': method,
+            'segments': segments,
+            'max_deviation': symmetric_deviation(points, bezier_to_polyline(segments, 32)),
+            'input_points': len(points),
+            'output_points': 3 * len(segments) + 1 if segments else 0,
+        }
+    raise ValueError(f"Невідомий метод спрощення: {method}")
@@ -7,6 +7,12 @@ DXF Export для CAD систем
 import os
 from typing import Dict, Any, Optional
 
+from balloon.export.contours import (
+    gore_outline, contour_x_at_y, notch_y_positions, pattern_bounds, simplify_contour
+)
+from balloon.export.nesting import calculate_gore_layout
+from balloon.instrument import instrument
+
 try:
     import ezdxf
     from ezdxf import colors
@@ -15,6 +21,7 @@ except ImportError:
     EZDXF_AVAILABLE = False
 
 
+@instrument('export.dxf_single')
 def export_pattern_to_dxf(
     pattern: Dict[str, Any],
     filename: str,
@@ -151,3 +158,146 @@ def export_pattern_to_dxf(
     doc.saveas(filename)
     return os.path.abspath(filename)
 
+
+# Шари DXF для повного завдання на розкрій: назва -> (колір ACI, тип лінії)
+GORE_LAYERS = {
+    'CUT': (7, 'Continuous'),     # Лінія розрізу (з припуском)
+    'SEW': (1, 'DASHED'),         # Лінія шва (без припуску)
+    'NOTCH': (6, 'Continuous'),   # Мітки суміщення
+    'LABEL': (3, 'Continuous'),   # Підписи, осьова лінія, межі тканини
+}
+
+GORE_BLOCK_NAME = 'GORE'
+
+
+@instrument('export.dxf')
+def export_gores_to_dxf(
+    pattern: Dict[str, Any],
+    filename: str,
+    scale_mm_per_m: float = 1000.0,
+    fabric_width_mm: float = 1500.0,
+    min_gap_mm: float = 10.0,
+    num_gores: Optional[int] = None,
+    add_notches: bool = True,
+    add_centerline: bool = True,
+    tolerance_mm: Optional[float] = None
+) -> str:
+    """
+    Експортує повне завдання на розкрій: усі gores, розкладені по тканині
+    
+    Геометрія однієї панелі записується один раз як DXF-блок, а кожен gore
+    на аркуші є INSERT-посиланням на цей блок з власним номером (атрибут NUM).
+    Елементи розкладено по шарах CUT, SEW, NOTCH та LABEL.
+    
+    Args:
+        pattern: Словник з даними викрійки (gores)
+        filename: Ім'я файлу для збереження
+        scale_mm_per_m: Масштаб (мм на метр) - для 1:1 використовувати 1000
+        fabric_width_mm: Ширина рулону тканини (мм)
+        min_gap_mm: Мінімальний зазор між панелями (мм)
+        num_gores: Кількість панелей (якщо None, береться з pattern)
+        add_notches: Чи додавати мітки суміщення
+        add_centerline: Чи додавати центральну лінію
+        tolerance_mm: Допуск спрощення контурів (мм, Дуглас–Пекер);
+            None - контури записуються без спрощення
+    
+    Returns:
+        Шлях до збереженого файлу
+    
+    Raises:
+        ImportError: Якщо ezdxf не встановлено
+        ValueError: Якщо pattern не містить координат
+    """
+    if not EZDXF_AVAILABLE:
+        raise ImportError(
+            "Для експорту в DXF потрібна бібліотека ezdxf. "
+            "Встановіть: pip install ezdxf"
+        )
+    
+    points = pattern.get('points', [])
+    if not points:
+        raise ValueError("Патерн не містить координат для експорту")
+    
+    layout = calculate_gore_layout(
+        pattern,
+        fabric_width_mm=fabric_width_mm,
+        min_gap_mm=min_gap_mm,
+        num_panels=num_gores,
+        scale_mm_per_m=scale_mm_per_m
+    )
+    
+    doc = ezdxf.new('R2010', setup=True)
+    for layer_name, (color, linetype) in GORE_LAYERS.items():
+        doc.layers.add(layer_name, color=color, linetype=linetype)
+    
+    # Локальні координати блоку: нижній лівий кут габариту панелі = (0, 0)
+    half_width, min_y, max_y = pattern_bounds(points)
+    
+    def to_block(x: float, y: float):
+        return ((x + half_width) * scale_mm_per_m, (y - min_y) * scale_mm_per_m)
+    
+    deviation_mm = 0.0
+    
+    def outline_mm(offset_m: float = 0.0):
+        nonlocal deviation_mm
+        outline = [to_block(x, y) for x, y in gore_outline(points, offset_m)]
+        if tolerance_mm is None:
+            return outline
+        simplified = simplify_contour(outline + outline[:1], tolerance_mm)
+        deviation_mm = max(deviation_mm, simplified['max_deviation'])
+        return simplified['points'][:-1]
+    
+    block = doc.blocks.new(name=GORE_BLOCK_NAME)
+    
+    block.add_lwpolyline(outline_mm(), close=True, dxfattribs={'layer': 'CUT'})
+    
+    allowance_m = pattern.get('seam_allowance_m', 0.0)
+    if allowance_m > 0:
+        block.add_lwpolyline(outline_mm(allowance_m), close=True, dxfattribs={'layer': 'SEW'})
+    
+    if add_notches:
+        notch_length = 5.0  # 5 мм
+        for y_pos_m in notch_y_positions(pattern):
+            x_at_y = contour_x_at_y(points, y_pos_m)
+            x_right, y_mm = to_block(x_at_y, y_pos_m)
+            x_left, _ = to_block(-x_at_y, y_pos_m)
+            block.add_line((x_right, y_mm), (x_right + notch_length, y_mm), dxfattribs={'layer': 'NOTCH'})
+            block.add_line((x_left, y_mm), (x_left - notch_length, y_mm), dxfattribs={'layer': 'NOTCH'})
+    
+    if add_centerline:
+        block.add_line(to_block(0.0, min_y), to_block(0.0, max_y), dxfattribs={'layer': 'LABEL'})
+    
+    # Номер панелі - атрибут, який заповнюється для кожного INSERT
+    center_x, center_y = to_block(0.0, (min_y + max_y) / 2)
+    block.add_attdef(
+        'NUM',
+        insert=(center_x + 2.0, center_y),
+        dxfattribs={'layer': 'LABEL', 'height': 5.0}
+    )
+    
+    msp = doc.modelspace()
+    for placement in layout['placements']:
+        blockref = msp.add_blockref(
+            GORE_BLOCK_NAME,
+            (placement['x_mm'], placement['y_mm']),
+            dxfattribs={'layer': 'CUT'}
+        )
+        blockref.add_auto_attribs({'NUM': str(placement['index'] + 1)})
+    
+    # Межі тканини та підпис аркуша
+    fabric_length_mm = layout['fabric_length_mm']
+    msp.add_lwpolyline(
+        [(0, 0), (fabric_width_mm, 0), (fabric_width_mm, fabric_length_mm), (0, fabric_length_mm)],
+        close=True,
+        dxfattribs={'layer': 'LABEL'}
+    )
+    msp.add_text(
+        f"Pattern: {pattern.get('pattern_type', 'unknown')} | "
+        f"{layout['num_panels']} gores | {fabric_width_mm:.0f} x {fabric_length_mm:.0f} mm"
+        + (f" | max deviation {deviation_mm:.3f} mm" if tolerance_mm is not None else ""),
+        height=5.0,
+        dxfattribs={'layer': 'LABEL'}
+    ).set_placement((min_gap_mm, fabric_length_mm + 5.0))
+    
+    doc.saveas(filename)
+    return os.path.abspath(filename)
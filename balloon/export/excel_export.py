@@ -0,0 +1,365 @@
+"""
+Потоковий експорт таблиць в Excel (.xlsx)
+
+Аркуші записуються безпосередньо як SpreadsheetML у zip-архів рядок
+за рядком: для кожної таблиці будується один шаблон рядка, тож запис
+рядка - це один виклик str.format без створення об'єктів комірок.
+Числа зберігаються як числа (а не текст) з форматом по стовпцях,
+кожна таблиця - окремий аркуш. 100 000 рядків записуються за секунди.
+
+Потрібна лише стандартна бібліотека; файл читається Excel, LibreOffice,
+openpyxl та pandas.
+"""
+
+import io
+import math
+import os
+import re
+import zipfile
+from typing import Dict, Any, List, Mapping, Optional, Sequence, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+import numpy as np
+
+from balloon.instrument import instrument
+
+# Формати комірок за замовчуванням
+FLOAT_NUMBER_FORMAT = '0.0000'
+INTEGER_NUMBER_FORMAT = '0'
+
+# Розмір буфера для запису аркуша (байт)
+EXCEL_BUFFER_SIZE = 1 << 16
+
+# Максимальна довжина назви аркуша та недопустимі в ній символи
+_MAX_SHEET_TITLE = 31
+_INVALID_TITLE_CHARS = re.compile(r'[\[\]:*?/\\\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+# Керівні символи, недопустимі в XML 1.0 (openpyxl на них піднімає IllegalCharacterError)
+_ILLEGAL_XML_CHARS = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+# Перший ідентифікатор користувацьких форматів чисел у styles.xml
+_FIRST_CUSTOM_NUMFMT_ID = 164
+
+_SPREADSHEET_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+_RELATIONSHIP_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+_PACKAGE_RELS_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+
+
+def _column_letter(index: int) -> str:
+    """Назва стовпця Excel за індексом від 1 (1 -> 'A', 27 -> 'AA')"""
+    letters = ''
+    while index > 0:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def _table_columns(table) -> Tuple[List[str], List[Sequence[Any]]]:
+    """
+    Приводить таблицю до стовпчикового вигляду
+
+    Підтримуються pandas.DataFrame, словник {стовпець: послідовність}
+    та список словників (рядків).
+
+    Returns:
+        (назви стовпців, список стовпців)
+    """
+    if hasattr(table, 'columns') and hasattr(table, 'to_numpy'):
+        return [str(name) for name in table.columns], [table[name].to_numpy() for name in table.columns]
+    if isinstance(table, Mapping):
+        return [str(name) for name in table], list(table.values())
+    rows = list(table)
+    headers: List[Any] = []
+    for row in rows:
+        for name in row:
+            if name not in headers:
+                headers.append(name)
+    return [str(name) for name in headers], [[row.get(name) for row in rows] for name in headers]
+
+
+def _xml_text(value: Any) -> str:
+    """Текст комірки для XML: без недопустимих керівних символів, екранований"""
+    return escape(_ILLEGAL_XML_CHARS.sub('', str(value)))
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float, np.number)) and not isinstance(value, (bool, np.bool_))
+
+
+def _prepare_column(column: Sequence[Any]) -> Tuple[List[Any], str]:
+    """
+    Переводить стовпець у список значень для шаблону комірки
+
+    Returns:
+        (значення, тип комірки): 'n' - числа (NaN/inf стають порожніми комірками),
+        'i' - цілі, 'b' - логічні, 's' - текст (вже екранований для XML),
+        'm' - змішані числа та текст (вміст комірки формується в _write_sheet)
+    """
+    array = np.asarray(column)
+    kind = array.dtype.kind
+    if kind == 'b':
+        return [int(v) for v in array.tolist()], 'b'
+    if kind in 'iu':
+        return array.tolist(), 'i'
+    if kind == 'f':
+        values = array.tolist()
+        if not np.isfinite(array).all():
+            values = [v if math.isfinite(v) else None for v in values]
+        return values, 'n'
+
+    values = list(column)
+    present = [v for v in values if v is not None]
+    if present and all(_is_number(v) for v in present):
+        values = [None if v is None or not math.isfinite(v) else v.item() if isinstance(v, np.number) else v
+                  for v in values]
+        kind = 'i' if all(isinstance(v, (int, np.integer)) for v in present) else 'n'
+        return values, kind
+    if any(_is_number(v) for v in present):
+        # Змішаний стовпець (напр. 'Значення' в таблиці параметрів): тип визначається по комірці
+        return [None if v is None or (_is_number(v) and not math.isfinite(v)) else v for v in values], 'm'
+
+    # Текст: екрануємо кожне унікальне значення один раз
+    escaped: Dict[Any, str] = {}
+    result = []
+    for value in values:
+        if value is None or (isinstance(value, float) and math.isnan(value)):
+            result.append(None)
+            continue
+        key = (type(value), value) if isinstance(value, (str, int, float)) else str(value)
+        text = escaped.get(key)
+        if text is None:
+            text = _xml_text(value)
+            escaped[key] = text
+        result.append(text)
+    return result, 's'
+
+
+def _mixed_cell_body(value: Any, style_attr: str) -> str:
+    """Атрибути та вміст комірки змішаного стовпця (після r=...)"""
+    if _is_number(value):
+        number = value.item() if isinstance(value, np.number) else value
+        return f'{style_attr}><v>{number!r}</v>'
+    return f' t="inlineStr"><is><t xml:space="preserve">{_xml_text(value)}</t></is>'
+
+
+def _cell_template(ref: str, kind: str, style: int, slot: int) -> str:
+    """Шаблон однієї комірки для str.format (slot - номер значення, {0} - номер рядка)"""
+    style_attr = f' s="{style}"' if style else ''
+    if kind == 'm':
+        return f'<c r="{ref}{{0}}"{{{slot}}}</c>'
+    if kind == 's':
+        return f'<c r="{ref}{{0}}" t="inlineStr"{style_attr}><is><t xml:space="preserve">{{{slot}}}</t></is></c>'
+    if kind == 'b':
+        return f'<c r="{ref}{{0}}" t="b"{style_attr}><v>{{{slot}}}</v></c>'
+    if kind == 'n':
+        return f'<c r="{ref}{{0}}"{style_attr}><v>{{{slot}!r}}</v></c>'
+    return f'<c r="{ref}{{0}}"{style_attr}><v>{{{slot}}}</v></c>'
+
+
+class _StyleRegistry:
+    """Реєстр форматів чисел -> індекси cellXfs (0 - типовий, 1 - заголовок)"""
+
+    def __init__(self):
+        self._formats: Dict[str, int] = {}
+
+    def style_for(self, number_format: Optional[str]) -> int:
+        if not number_format:
+            return 0
+        if number_format not in self._formats:
+            self._formats[number_format] = len(self._formats) + 2
+        return self._formats[number_format]
+
+    def xml(self) -> str:
+        formats = list(self._formats)
+        num_fmts = ''.join(
+            f'<numFmt numFmtId="{_FIRST_CUSTOM_NUMFMT_ID + i}" formatCode={quoteattr(code)}/>'
+            for i, code in enumerate(formats)
+        )
+        xfs = ''.join(
+            f'<xf numFmtId="{_FIRST_CUSTOM_NUMFMT_ID + i}" fontId="0" fillId="0" borderId="0" xfId="0" '
+            f'applyNumberFormat="1"/>'
+            for i in range(len(formats))
+        )
+        num_fmts_xml = f'<numFmts count="{len(formats)}">{num_fmts}</numFmts>' if formats else ''
+        return (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            f'<styleSheet xmlns="{_SPREADSHEET_NS}">{num_fmts_xml}'
+            '<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font>'
+            '<font><b/><sz val="11"/><name val="Calibri"/></font></fonts>'
+            '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+            '<fill><patternFill patternType="gray125"/></fill></fills>'
+            '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+            '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+            f'<cellXfs count="{len(formats) + 2}">'
+            '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+            '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/>'
+            f'{xfs}</cellXfs>'
+            '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+            '</styleSheet>'
+        )
+
+
+def _write_sheet(
+    fh,
+    table,
+    styles: _StyleRegistry,
+    number_formats: Dict[str, str],
+    column_widths: Dict[str, float]
+) -> int:
+    """Записує XML одного аркуша у відкритий текстовий потік; повертає кількість рядків даних"""
+    headers, columns = _table_columns(table)
+    prepared = [_prepare_column(column) for column in columns]
+    refs = [_column_letter(i) for i in range(1, len(headers) + 1)]
+
+    fh.write('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n')
+    fh.write(f'<worksheet xmlns="{_SPREADSHEET_NS}" xmlns:r="{_RELATIONSHIP_NS}">')
+    fh.write('<sheetViews><sheetView workbookViewId="0">'
+             '<pane ySplit="1" topLeftCell="A2" activePane="bottomLeft" state="frozen"/>'
+             '</sheetView></sheetViews>')
+    if headers:
+        fh.write('<cols>')
+        for i, name in enumerate(headers, 1):
+            width = column_widths.get(name, max(10, min(40, len(name) + 2)))
+            fh.write(f'<col min="{i}" max="{i}" width="{width}" customWidth="1"/>')
+        fh.write('</cols>')
+    fh.write('<sheetData>')
+
+    header_cells = ''.join(
+        _cell_template(ref, 's', 1, 1).format(1, _xml_text(name)) for ref, name in zip(refs, headers)
+    )
+    fh.write(f'<row r="1">{header_cells}</row>')
+
+    cell_templates = []
+    for slot, (name, ref, (values, kind)) in enumerate(zip(headers, refs, prepared), 1):
+        default_format = {'n': FLOAT_NUMBER_FORMAT, 'i': INTEGER_NUMBER_FORMAT, 'm': FLOAT_NUMBER_FORMAT}.get(kind)
+        style = styles.style_for(number_formats.get(name, default_format))
+        cell_templates.append(_cell_template(ref, kind, style, slot))
+        if kind == 'm':
+            style_attr = f' s="{style}"' if style else ''
+            values[:] = [None if v is None else _mixed_cell_body(v, style_attr) for v in values]
+    row_template = '<row r="{0}">' + ''.join(cell_templates) + '</row>'
+
+    chunk = []
+    num_rows = 0
+    for row_idx, values in enumerate(zip(*(values for values, _ in prepared)), 2):
+        if None in values:
+            # Порожні комірки пропускаються (повільніший шлях лише для таких рядків)
+            cells = ''.join(
+                template.format(row_idx, *([None] * slot), value)
+                for slot, (template, value) in enumerate(zip(cell_templates, values))
+                if value is not None
+            )
+            chunk.append(f'<row r="{row_idx}">{cells}</row>')
+        else:
+            chunk.append(row_template.format(row_idx, *values))
+        num_rows += 1
+        if len(chunk) >= 1024:
+            fh.write(''.join(chunk))
+            chunk.clear()
+    if chunk:
+        fh.write(''.join(chunk))
+
+    fh.write('</sheetData></worksheet>')
+    return num_rows
+
+
+def _sheet_titles(names) -> List[str]:
+    """Допустимі та унікальні назви аркушів"""
+    titles: List[str] = []
+    for name in names:
+        base = _INVALID_TITLE_CHARS.sub('_', str(name)).strip("'") or 'Sheet'
+        title = base[:_MAX_SHEET_TITLE]
+        counter = 1
+        while title.lower() in (t.lower() for t in titles):
+            counter += 1
+            suffix = f' ({counter})'
+            title = base[:_MAX_SHEET_TITLE - len(suffix)] + suffix
+        titles.append(title)
+    return titles
+
+
+@instrument('export.excel_tables')
+def export_tables_to_excel(
+    tables: Dict[str, Any],
+    filename: str,
+    number_formats: Optional[Dict[str, str]] = None,
+    column_widths: Optional[Dict[str, float]] = None
+) -> str:
+    """
+    Експортує кілька таблиць в один Excel файл (по аркушу на таблицю)
+
+    Числові стовпці отримують формат за типом (FLOAT_NUMBER_FORMAT,
+    INTEGER_NUMBER_FORMAT), який можна перевизначити за назвою стовпця.
+    NaN та inf записуються порожніми комірками.
+
+    Args:
+        tables: Словник {назва аркуша: таблиця}; таблиця - pandas.DataFrame,
+            словник стовпців або список рядків-словників
+        filename: Ім'я файлу для збереження
+        number_formats: Формати комірок за назвою стовпця (напр. {'Тиск (Па)': '0.00E+00'})
+        column_widths: Ширини стовпців за назвою
+
+    Returns:
+        Шлях до збереженого файлу
+
+    Raises:
+        ValueError: Якщо не передано жодної таблиці
+    """
+    if not tables:
+        raise ValueError("Немає таблиць для експорту")
+
+    number_formats = number_formats or {}
+    column_widths = column_widths or {}
+    titles = _sheet_titles(tables)
+    styles = _StyleRegistry()
+
+    with zipfile.ZipFile(filename, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for index, table in enumerate(tables.values(), 1):
+            with archive.open(f'xl/worksheets/sheet{index}.xml', 'w', force_zip64=True) as raw:
+                with io.TextIOWrapper(io.BufferedWriter(raw, EXCEL_BUFFER_SIZE), encoding='utf-8') as fh:
+                    _write_sheet(fh, table, styles, number_formats, column_widths)
+
+        sheet_overrides = ''.join(
+            f'<Override PartName="/xl/worksheets/sheet{i}.xml" '
+            f'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+            for i in range(1, len(titles) + 1)
+        )
+        archive.writestr('[Content_Types].xml', (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/xl/workbook.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+            '<Override PartName="/xl/styles.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+            f'{sheet_overrides}</Types>'
+        ))
+        archive.writestr('_rels/.rels', (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            f'<Relationships xmlns="{_PACKAGE_RELS_NS}">'
+            f'<Relationship Id="rId1" Type="{_RELATIONSHIP_NS}/officeDocument" Target="xl/workbook.xml"/>'
+            '</Relationships>'
+        ))
+        sheets = ''.join(
+            f'<sheet name={quoteattr(title)} sheetId="{i}" r:id="rId{i}"/>'
+            for i, title in enumerate(titles, 1)
+        )
+        archive.writestr('xl/workbook.xml', (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            f'<workbook xmlns="{_SPREADSHEET_NS}" xmlns:r="{_RELATIONSHIP_NS}">'
+            f'<sheets>{sheets}</sheets></workbook>'
+        ))
+        sheet_rels = ''.join(
+            f'<Relationship Id="rId{i}" Type="{_RELATIONSHIP_NS}/worksheet" Target="worksheets/sheet{i}.xml"/>'
+            for i in range(1, len(titles) + 1)
+        )
+        archive.writestr('xl/_rels/workbook.xml.rels', (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            f'<Relationships xmlns="{_PACKAGE_RELS_NS}">{sheet_rels}'
+            f'<Relationship Id="rId{len(titles) + 1}" Type="{_RELATIONSHIP_NS}/styles" Target="styles.xml"/>'
+            '</Relationships>'
+        ))
+        archive.writestr('xl/styles.xml', styles.xml())
+
+    return os.path.abspath(filename)
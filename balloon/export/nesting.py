@@ -7,6 +7,8 @@
 import math
 from typing import Dict, Any, List, Tuple, Optional
 
+from balloon.export.contours import pattern_bounds
+
 
 def estimate_fabric_requirements(
     pattern: Dict[str, Any],
@@ -114,3 +116,68 @@ def estimate_fabric_requirements(
         'num_panels': num_panels or 1
     }
 
+
+
+def calculate_gore_layout(
+    pattern: Dict[str, Any],
+    fabric_width_mm: float = 1500.0,
+    min_gap_mm: float = 10.0,
+    num_panels: Optional[int] = None,
+    scale_mm_per_m: float = 1000.0
+) -> Dict[str, Any]:
+    """
+    Розраховує розкладку gores по тканині (позиції кожної панелі)
+    
+    Використовує ту ж сітку рядків/стовпців, що й estimate_fabric_requirements,
+    але повертає координати нижнього лівого кута кожної панелі.
+    
+    Args:
+        pattern: Патерн викрійки (gores)
+        fabric_width_mm: Ширина рулону тканини (мм)
+        min_gap_mm: Мінімальний зазор між панелями (мм)
+        num_panels: Кількість панелей (якщо None, береться з pattern)
+        scale_mm_per_m: Масштаб (мм на метр)
+    
+    Returns:
+        Словник з розмірами панелі, розмірами аркуша та списком розміщень
+    
+    Raises:
+        ValueError: Якщо pattern не містить координат
+    """
+    points = pattern.get('points', [])
+    if not points:
+        raise ValueError("Патерн не містить координат для експорту")
+    
+    num_gores = num_panels or pattern.get('num_gores', 12)
+    
+    # Габарити повної панелі (права половина + дзеркальна)
+    half_width, min_y, max_y = pattern_bounds(points)
+    panel_width_mm = 2 * half_width * scale_mm_per_m
+    panel_height_mm = (max_y - min_y) * scale_mm_per_m
+    
+    gores_per_row = max(1, int((fabric_width_mm - min_gap_mm) / (panel_width_mm + min_gap_mm)))
+    num_rows = math.ceil(num_gores / gores_per_row)
+    
+    placements: List[Dict[str, Any]] = []
+    for index in range(num_gores):
+        row, col = divmod(index, gores_per_row)
+        placements.append({
+            'index': index,
+            'row': row,
+            'col': col,
+            'x_mm': min_gap_mm + col * (panel_width_mm + min_gap_mm),
+            'y_mm': min_gap_mm + row * (panel_height_mm + min_gap_mm),
+        })
+    
+    fabric_length_mm = num_rows * (panel_height_mm + min_gap_mm) + min_gap_mm
+    
+    return {
+        'panel_width_mm': panel_width_mm,
+        'panel_height_mm': panel_height_mm,
+        'fabric_width_mm': fabric_width_mm,
+        'fabric_length_mm': fabric_length_mm,
+        'gores_per_row': gores_per_row,
+        'num_rows': num_rows,
+        'num_panels': num_gores,
+        'placements': placements
+    }
@@ -7,7 +7,15 @@ PDF Export з tiling (розбиття на сторінки A4/A3)
 
 import os
 import math
-from typing import Dict, Any, Optional, Tuple, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, Optional, Tuple, List
+
+import numpy as np
+
+from balloon.export.contours import (
+    gore_outline, contour_x_at_y, notch_y_positions, pattern_bounds, simplify_polyline
+)
+from balloon.instrument import instrument
 
 try:
     from reportlab.lib.pagesizes import A4, A3
@@ -80,6 +88,163 @@ def _calculate_tiles(
     return tiles
 
 
+# Стилі шарів на сторінці: назва -> (колір, товщина лінії, штрих)
+_PDF_LAYER_STYLES = {
+    'cut': ('black', 0.5, None),
+    'sew': ('red', 0.3, [2, 2]),
+    'notch': ('red', 0.3, None),
+    'center': ('green', 0.2, [5, 5]),
+}
+
+
+def _clip_polyline_to_rect(
+    points: np.ndarray,
+    x_min: float,
+    y_min: float,
+    x_max: float,
+    y_max: float
+) -> List[np.ndarray]:
+    """
+    Обрізає полілінію прямокутником (векторизований Liang–Barsky)
+    
+    Args:
+        points: Масив точок форми (N, 2)
+        x_min, y_min, x_max, y_max: Межі прямокутника
+    
+    Returns:
+        Список неперервних фрагментів (масиви (M, 2)) всередині прямокутника
+    """
+    if len(points) < 2:
+        return []
+    
+    p0 = points[:-1]
+    p1 = points[1:]
+    dx = p1[:, 0] - p0[:, 0]
+    dy = p1[:, 1] - p0[:, 1]
+    
+    t0 = np.zeros(len(p0))
+    t1 = np.ones(len(p0))
+    rejected = np.zeros(len(p0), dtype=bool)
+    
+    for p, q in (
+        (-dx, p0[:, 0] - x_min),
+        (dx, x_max - p0[:, 0]),
+        (-dy, p0[:, 1] - y_min),
+        (dy, y_max - p0[:, 1]),
+    ):
+        parallel = p == 0
+        rejected |= parallel & (q < 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t = np.where(parallel, 0.0, q / np.where(parallel, 1.0, p))
+        t0 = np.where(~parallel & (p < 0), np.maximum(t0, t), t0)
+        t1 = np.where(~parallel & (p > 0), np.minimum(t1, t), t1)
+    
+    kept = ~rejected & (t0 <= t1)
+    if not kept.any():
+        return []
+    
+    starts = p0 + t0[:, None] * (p1 - p0)
+    ends = p0 + t1[:, None] * (p1 - p0)
+    
+    # Фрагмент переривається, якщо сегмент відкинуто або обрізано на стику
+    breaks = ~kept[1:] | (t1[:-1] < 1.0) | (t0[1:] > 0.0)
+    pieces = []
+    run_start = None
+    for i in range(len(kept)):
+        if kept[i] and run_start is None:
+            run_start = i
+        if run_start is not None and (i == len(kept) - 1 or breaks[i]):
+            if kept[i]:
+                pieces.append(np.vstack([starts[run_start:run_start + 1], ends[run_start:i + 1]]))
+            run_start = None
+    return pieces
+
+
+def _pattern_layers_mm(
+    pattern: Dict[str, Any],
+    scale_mm_per_m: float,
+    add_notches: bool,
+    add_centerline: bool,
+    tolerance_mm: Optional[float] = None
+) -> Tuple[Dict[str, List[np.ndarray]], float, float]:
+    """
+    Геометрія викрійки в мм відносно нижнього лівого кута габариту повного gore
+    
+    Контури розрізу та шва спрощуються з допуском tolerance_mm (якщо задано).
+    
+    Returns:
+        (шари {назва: [полілінії]}, ширина мм, висота мм)
+    """
+    points = pattern['points']
+    half_width, min_y, max_y = pattern_bounds(points)
+    offset = np.array([-half_width, min_y])
+    
+    def to_mm(coords) -> np.ndarray:
+        return (np.asarray(coords, dtype=float) - offset) * scale_mm_per_m
+    
+    def outline_mm(offset_m: float = 0.0) -> np.ndarray:
+        outline = gore_outline(points, offset_m)
+        contour = to_mm(outline + outline[:1])
+        if tolerance_mm is None:
+            return contour
+        return np.asarray(simplify_polyline(contour, tolerance_mm), dtype=float)
+    
+    layers: Dict[str, List[np.ndarray]] = {name: [] for name in _PDF_LAYER_STYLES}
+    layers['cut'].append(outline_mm())
+    
+    allowance_m = pattern.get('seam_allowance_m', 0.0)
+    if allowance_m > 0:
+        layers['sew'].append(outline_mm(allowance_m))
+    
+    if add_notches:
+        notch_length_m = 5.0 / scale_mm_per_m  # 5 мм
+        for y_pos_m in notch_y_positions(pattern):
+            x_at_y = contour_x_at_y(points, y_pos_m)
+            layers['notch'].append(to_mm([(x_at_y, y_pos_m), (x_at_y + notch_length_m, y_pos_m)]))
+            layers['notch'].append(to_mm([(-x_at_y, y_pos_m), (-x_at_y - notch_length_m, y_pos_m)]))
+    
+    if add_centerline:
+        layers['center'].append(to_mm([(0.0, min_y), (0.0, max_y)]))
+    
+    width_mm = 2 * half_width * scale_mm_per_m
+    height_mm = (max_y - min_y) * scale_mm_per_m
+    return layers, width_mm, height_mm
+
+
+def _clip_layers_to_tile(
+    layers: Dict[str, List[np.ndarray]],
+    tile: Dict[str, Any],
+    bounds: Optional[Dict[str, List[Tuple[float, float, float, float]]]] = None
+) -> Dict[str, List[np.ndarray]]:
+    """
+    Обрізає всі шари межами tile та переводить у локальні координати tile (мм)
+    
+    Args:
+        layers: Шари {назва: [полілінії]}
+        tile: Опис tile з _calculate_tiles
+        bounds: Габарити поліліній (x_min, y_min, x_max, y_max) для швидкого відкидання
+    """
+    x0 = tile['x_start_mm']
+    y0 = tile['y_start_mm']
+    x1 = x0 + tile['width_mm']
+    y1 = y0 + tile['height_mm']
+    origin = np.array([x0, y0])
+    
+    clipped = {}
+    for name, polylines in layers.items():
+        pieces = []
+        for i, polyline in enumerate(polylines):
+            if bounds is not None:
+                bx0, by0, bx1, by1 = bounds[name][i]
+                if bx1 < x0 or bx0 > x1 or by1 < y0 or by0 > y1:
+                    continue
+            for piece in _clip_polyline_to_rect(polyline, x0, y0, x1, y1):
+                pieces.append(piece - origin)
+        clipped[name] = pieces
+    return clipped
+
+
+@instrument('export.pdf')
 def export_pattern_to_pdf(
     pattern: Dict[str, Any],
     filename: str,
@@ -88,11 +253,20 @@ def export_pattern_to_pdf(
     overlap_mm: float = 10.0,
     add_notches: bool = True,
     add_centerline: bool = True,
-    add_grid: bool = True
+    add_grid: bool = True,
+    skip_empty_tiles: bool = True,
+    max_workers: Optional[int] = None,
+    tolerance_mm: Optional[float] = None,
+    progress: Optional[Callable[[float, str], None]] = None
 ) -> str:
     """
     Експортує викрійку в PDF з автоматичним розбиттям на сторінки
     
+    Контур обрізається межами кожної сторінки, тож на сторінку потрапляють
+    лише сегменти, що її перетинають. Сторінки без геометрії пропускаються.
+    Обрізання для сторінок виконується паралельно, сторінки записуються
+    в один PDF у порядку рядків/стовпців.
+    
     Args:
         pattern: Словник з даними викрійки
         filename: Ім'я файлу для збереження
@@ -102,6 +276,12 @@ def export_pattern_to_pdf(
         add_notches: Чи додавати мітки суміщення
         add_centerline: Чи додавати центральну лінію
         add_grid: Чи додавати сітку координат
+        skip_empty_tiles: Чи пропускати сторінки без геометрії
+        max_workers: Кількість потоків для обрізання (None - за замовчуванням)
+        tolerance_mm: Допуск спрощення контурів (мм, Дуглас–Пекер);
+            None - контури малюються без спрощення
+        progress: Функція прогресу progress(частка, повідомлення), викликається
+            після обрізання та після кожної сторінки; виняток з неї перериває експорт
     
     Returns:
         Шлях до збереженого файлу
@@ -122,15 +302,9 @@ def export_pattern_to_pdf(
     if not points:
         raise ValueError("Патерн не містить координат для експорту")
     
-    # Знаходимо розміри викрійки
-    min_x = min(x for x, y in points) if points else 0
-    max_x = max(x for x, y in points) if points else 0
-    min_y = min(y for x, y in points) if points else 0
-    max_y = max(y for x, y in points) if points else 0
-    
-    # Конвертуємо в мм
-    width_mm = (max_x - min_x) * scale_mm_per_m
-    height_mm = (max_y - min_y) * scale_mm_per_m
+    layers, width_mm, height_mm = _pattern_layers_mm(
+        pattern, scale_mm_per_m, add_notches, add_centerline, tolerance_mm
+    )
     
     # Вибір розміру сторінки
     if page_size.upper() == 'A3':
@@ -141,44 +315,47 @@ def export_pattern_to_pdf(
     # Розраховуємо tiles
     tiles = _calculate_tiles(width_mm, height_mm, page_size_pt, overlap_mm)
     
+    # Обрізаємо геометрію для кожного tile паралельно (порядок зберігається)
+    bounds = {
+        name: [(*polyline.min(axis=0).tolist(), *polyline.max(axis=0).tolist()) for polyline in polylines]
+        for name, polylines in layers.items()
+    }
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        tile_layers = list(executor.map(lambda tile: _clip_layers_to_tile(layers, tile, bounds), tiles))
+    
+    pages = [
+        (tile, clipped) for tile, clipped in zip(tiles, tile_layers)
+        if not skip_empty_tiles or any(clipped.values())
+    ]
+    
+    if progress is not None:
+        progress(0.1, f"Сторінок: {len(pages)}")
+
     # Створюємо PDF
     c = canvas.Canvas(filename, pagesize=page_size_pt)
-    
-    for tile_idx, tile in enumerate(tiles):
+    for page_idx, (tile, clipped) in enumerate(pages):
         # Нова сторінка
-        if tile_idx > 0:
+        if page_idx > 0:
             c.showPage()
         
-        # Відступ для міток
-        margin_mm = overlap_mm
-        c.translate(margin_mm * mm, margin_mm * mm)
-        
-        # Масштаб для відображення
-        scale = 1.0  # 1 mm = 1 point (через mm unit)
+        # Вміст tile малюється зі зсувом на поле для міток
+        c.saveState()
+        c.translate(tile['page_x_mm'] * mm, tile['page_y_mm'] * mm)
         
         # Малюємо сітку координат (опціонально)
         if add_grid:
-            _draw_grid(c, tile['width_mm'], tile['height_mm'], scale)
-        
-        # Малюємо контур викрійки
-        _draw_pattern_contour(
-            c, points, min_x, min_y, tile, scale_mm_per_m, scale
-        )
+            _draw_grid(c, tile['width_mm'], tile['height_mm'], 1.0)
         
-        # Малюємо мітки суміщення (notches)
-        if add_notches:
-            _draw_notches(c, pattern, min_x, min_y, tile, scale_mm_per_m, scale)
-        
-        # Малюємо центральну лінію
-        if add_centerline:
-            _draw_centerline(c, points, min_x, min_y, tile, scale_mm_per_m, scale)
+        _draw_tile_layers(c, clipped)
+        c.restoreState()
         
         # Малюємо мітки для склейки (overlap markers)
         _draw_overlap_markers(c, tile, tiles, page_size_pt, overlap_mm)
         
         # Додаємо інформацію про сторінку
-        max_cols = max(t['col'] for t in tiles) + 1
-        _draw_page_info(c, tile, len(tiles), max_cols, pattern_type, page_size_pt, margin_mm)
+        _draw_page_info(c, tile, page_idx + 1, len(pages), pattern_type, page_size_pt, overlap_mm)
+        if progress is not None:
+            progress(0.1 + 0.85 * (page_idx + 1) / len(pages), f"Сторінка {page_idx + 1} з {len(pages)}")
     
     c.save()
     return os.path.abspath(filename)
@@ -199,156 +376,29 @@ def _draw_grid(canvas_obj, width_mm: float, height_mm: float, scale: float):
         canvas_obj.line(x * mm * scale, 0, x * mm * scale, height_mm * mm * scale)
 
 
-def _draw_pattern_contour(
-    canvas_obj,
-    points: List[Tuple[float, float]],
-    min_x: float,
-    min_y: float,
-    tile: Dict[str, Any],
-    scale_mm_per_m: float,
-    scale: float
-):
-    """Малює контур викрійки"""
-    canvas_obj.setStrokeColor(black)
-    canvas_obj.setLineWidth(0.5)
-    
-    path = canvas_obj.beginPath()
-    first_point = True
-    
-    for x, y in points:
-        # Конвертуємо координати в мм відносно min_x, min_y
-        x_mm = (x - min_x) * scale_mm_per_m
-        y_mm = (y - min_y) * scale_mm_per_m
+def _draw_tile_layers(canvas_obj, clipped: Dict[str, List[np.ndarray]]):
+    """Малює обрізані шари tile (координати в мм відносно tile)"""
+    colors_by_name = {'black': black, 'red': red, 'green': green, 'blue': blue}
+    
+    for name, polylines in clipped.items():
+        if not polylines:
+            continue
+        color, line_width, dash = _PDF_LAYER_STYLES[name]
+        canvas_obj.setStrokeColor(colors_by_name[color])
+        canvas_obj.setLineWidth(line_width)
+        if dash:
+            canvas_obj.setDash(dash)
         
-        # Перевіряємо, чи точка в межах tile
-        if (tile['x_start_mm'] <= x_mm < tile['x_start_mm'] + tile['width_mm'] and
-            tile['y_start_mm'] <= y_mm < tile['y_start_mm'] + tile['height_mm']):
-            
-            # Відносні координати на сторінці
-            page_x = (x_mm - tile['x_start_mm'] + tile['page_x_mm']) * mm * scale
-            page_y = (y_mm - tile['y_start_mm'] + tile['page_y_mm']) * mm * scale
-            
-            if first_point:
-                path.moveTo(page_x, page_y)
-                first_point = False
-            else:
-                path.lineTo(page_x, page_y)
-    
-    # Закриваємо контур
-    if not first_point:
-        path.close()
+        path = canvas_obj.beginPath()
+        for polyline in polylines:
+            coords = (polyline * mm).tolist()
+            path.moveTo(*coords[0])
+            for x, y in coords[1:]:
+                path.lineTo(x, y)
         canvas_obj.drawPath(path, stroke=1, fill=0)
-    
-    # Малюємо дзеркальну сторону (для gores)
-    path_mirror = canvas_obj.beginPath()
-    first_point = True
-    
-    for x, y in points:
-        x_mm = (x - min_x) * scale_mm_per_m
-        y_mm = (y - min_y) * scale_mm_per_m
         
-        # Дзеркальна координата X
-        x_mm_mirror = -x_mm
-        
-        if (tile['x_start_mm'] <= abs(x_mm_mirror) < tile['x_start_mm'] + tile['width_mm'] and
-            tile['y_start_mm'] <= y_mm < tile['y_start_mm'] + tile['height_mm']):
-            
-            page_x = (abs(x_mm_mirror) - tile['x_start_mm'] + tile['page_x_mm']) * mm * scale
-            page_y = (y_mm - tile['y_start_mm'] + tile['page_y_mm']) * mm * scale
-            
-            if first_point:
-                path_mirror.moveTo(page_x, page_y)
-                first_point = False
-            else:
-                path_mirror.lineTo(page_x, page_y)
-    
-    if not first_point:
-        path_mirror.close()
-        canvas_obj.drawPath(path_mirror, stroke=1, fill=0)
-
-
-def _draw_notches(
-    canvas_obj,
-    pattern: Dict[str, Any],
-    min_x: float,
-    min_y: float,
-    tile: Dict[str, Any],
-    scale_mm_per_m: float,
-    scale: float
-):
-    """Малює мітки суміщення (notches)"""
-    if 'notch_positions' not in pattern or not pattern['notch_positions']:
-        return
-    
-    canvas_obj.setStrokeColor(red)
-    canvas_obj.setLineWidth(0.3)
-    
-    notch_length = 5.0  # 5 мм
-    
-    for y_pos_m in pattern['notch_positions']:
-        y_mm = (y_pos_m - min_y) * scale_mm_per_m
-        
-        # Перевіряємо, чи notch в межах tile
-        if tile['y_start_mm'] <= y_mm < tile['y_start_mm'] + tile['height_mm']:
-            page_y = (y_mm - tile['y_start_mm'] + tile['page_y_mm']) * mm * scale
-            
-            # Знаходимо X координату на контурі (спрощено)
-            # В ідеалі потрібно інтерполювати
-            points = pattern.get('points', [])
-            if points:
-                # Беремо середнє значення X для цього Y
-                x_at_y = 0.0
-                for i in range(len(points) - 1):
-                    (x1, y1), (x2, y2) = points[i], points[i+1]
-                    if (y1 <= y_pos_m < y2) or (y2 <= y_pos_m < y1):
-                        if y2 != y1:
-                            x_at_y = x1 + (x2 - x1) * (y_pos_m - y1) / (y2 - y1)
-                        else:
-                            x_at_y = x1
-                        break
-                
-                x_mm = (x_at_y - min_x) * scale_mm_per_m
-                if tile['x_start_mm'] <= x_mm < tile['x_start_mm'] + tile['width_mm']:
-                    page_x = (x_mm - tile['x_start_mm'] + tile['page_x_mm']) * mm * scale
-                    canvas_obj.line(
-                        page_x, page_y,
-                        page_x + notch_length * mm * scale, page_y
-                    )
-                    canvas_obj.line(
-                        -page_x, page_y,
-                        -page_x - notch_length * mm * scale, page_y
-                    )
-
-
-def _draw_centerline(
-    canvas_obj,
-    points: List[Tuple[float, float]],
-    min_x: float,
-    min_y: float,
-    tile: Dict[str, Any],
-    scale_mm_per_m: float,
-    scale: float
-):
-    """Малює центральну лінію"""
-    canvas_obj.setStrokeColor(green)
-    canvas_obj.setLineWidth(0.2)
-    canvas_obj.setDash([5, 5])
-    
-    # Центральна лінія: x = 0
-    x_mm = 0.0
-    y_start_mm = 0.0
-    y_end_mm = (max(y for x, y in points) - min_y) * scale_mm_per_m
-    
-    if tile['x_start_mm'] <= x_mm < tile['x_start_mm'] + tile['width_mm']:
-        page_x = (x_mm - tile['x_start_mm'] + tile['page_x_mm']) * mm * scale
-        page_y_start = max(0, (y_start_mm - tile['y_start_mm'] + tile['page_y_mm']) * mm * scale)
-        page_y_end = min(
-            tile['height_mm'] * mm * scale,
-            (y_end_mm - tile['y_start_mm'] + tile['page_y_mm']) * mm * scale
-        )
-        canvas_obj.line(page_x, page_y_start, page_x, page_y_end)
-    
-    canvas_obj.setDash()
+        if dash:
+            canvas_obj.setDash()
 
 
 def _draw_overlap_markers(
@@ -408,8 +458,8 @@ def _draw_overlap_markers(
 def _draw_page_info(
     canvas_obj,
     tile: Dict[str, Any],
+    page_num: int,
     total_pages: int,
-    max_cols: int,
     pattern_type: str,
     page_size: Tuple[float, float],
     margin_mm: float
@@ -421,8 +471,6 @@ def _draw_page_info(
     page_width_mm = page_size[0] * 25.4 / 72
     page_height_mm = page_size[1] * 25.4 / 72
     
-    page_num = tile['row'] * max_cols + tile['col'] + 1
-    
     # Номер сторінки
     text = f"Сторінка {page_num}/{total_pages} | {pattern_type}"
     canvas_obj.drawString(
@@ -0,0 +1,348 @@
+"""
+Експорт для плотерів та різаків (HPGL, G-code)
+
+Формує завдання на розкрій безпосередньо з контурів викрійки: gores
+розкладаються по тканині (calculate_gore_layout), контури спрощуються
+з допуском, а порядок обходу оптимізується (найближчий сусід + 2-opt),
+щоб мінімізувати холості переміщення з піднятим інструментом.
+"""
+
+import math
+import os
+from typing import Dict, Any, List, Optional, Tuple
+
+from balloon.export.contours import (
+    gore_outline, contour_x_at_y, notch_y_positions, pattern_bounds, simplify_polyline
+)
+from balloon.export.nesting import calculate_gore_layout
+from balloon.instrument import instrument
+
+Point = Tuple[float, float]
+
+# Одиниці HPGL: 40 одиниць плотера на 1 мм (0.025 мм)
+HPGL_UNITS_PER_MM = 40
+
+
+def _distance(a: Point, b: Point) -> float:
+    return math.hypot(a[0] - b[0], a[1] - b[1])
+
+
+def build_cut_paths(
+    pattern: Dict[str, Any],
+    scale_mm_per_m: float = 1000.0,
+    fabric_width_mm: float = 1500.0,
+    min_gap_mm: float = 10.0,
+    num_gores: Optional[int] = None,
+    add_notches: bool = True,
+    include_sew_lines: bool = False,
+    tolerance_mm: float = 0.1
+) -> List[Dict[str, Any]]:
+    """
+    Формує шляхи інструменту для всіх gores на аркуші (координати в мм)
+
+    Args:
+        pattern: Словник з даними викрійки (gores)
+        scale_mm_per_m: Масштаб (мм на метр)
+        fabric_width_mm: Ширина рулону тканини (мм)
+        min_gap_mm: Мінімальний зазор між панелями (мм)
+        num_gores: Кількість панелей (якщо None, береться з pattern)
+        add_notches: Чи додавати мітки суміщення
+        include_sew_lines: Чи додавати лінії шва (інструмент 2 - маркер)
+        tolerance_mm: Допуск спрощення контуру (мм), 0 - без спрощення
+
+    Returns:
+        Список шляхів: {'points', 'closed', 'tool', 'kind', 'gore'}
+
+    Raises:
+        ValueError: Якщо pattern не містить координат
+    """
+    points = pattern.get('points', [])
+    if not points:
+        raise ValueError("Патерн не містить координат для експорту")
+
+    layout = calculate_gore_layout(
+        pattern,
+        fabric_width_mm=fabric_width_mm,
+        min_gap_mm=min_gap_mm,
+        num_panels=num_gores,
+        scale_mm_per_m=scale_mm_per_m
+    )
+    half_width, min_y, _ = pattern_bounds(points)
+
+    def to_panel(x: float, y: float) -> Point:
+        return ((x + half_width) * scale_mm_per_m, (y - min_y) * scale_mm_per_m)
+
+    # Геометрія однієї панелі (спрощується один раз)
+    panel_paths = []
+    cut = simplify_polyline([to_panel(x, y) for x, y in gore_outline(points)], tolerance_mm)
+    panel_paths.append({'points': cut + cut[:1], 'closed': True, 'tool': 1, 'kind': 'cut'})
+
+    allowance_m = pattern.get('seam_allowance_m', 0.0)
+    if include_sew_lines and allowance_m > 0:
+        sew = simplify_polyline([to_panel(x, y) for x, y in gore_outline(points, allowance_m)], tolerance_mm)
+        panel_paths.append({'points': sew + sew[:1], 'closed': True, 'tool': 2, 'kind': 'sew'})
+
+    if add_notches:
+        notch_length = 5.0  # 5 мм
+        for y_pos_m in notch_y_positions(pattern):
+            x_at_y = contour_x_at_y(points, y_pos_m)
+            x_right, y_mm = to_panel(x_at_y, y_pos_m)
+            x_left, _ = to_panel(-x_at_y, y_pos_m)
+            panel_paths.append({'points': [(x_right, y_mm), (x_right + notch_length, y_mm)],
+                                'closed': False, 'tool': 1, 'kind': 'notch'})
+            panel_paths.append({'points': [(x_left, y_mm), (x_left - notch_length, y_mm)],
+                                'closed': False, 'tool': 1, 'kind': 'notch'})
+
+    paths = []
+    for placement in layout['placements']:
+        dx = placement['x_mm']
+        dy = placement['y_mm']
+        for path in panel_paths:
+            paths.append({
+                'points': [(x + dx, y + dy) for x, y in path['points']],
+                'closed': path['closed'],
+                'tool': path['tool'],
+                'kind': path['kind'],
+                'gore': placement['index'],
+            })
+    return paths
+
+
+def _oriented(path: Dict[str, Any], reverse: bool) -> List[Point]:
+    points = path['points']
+    return points[::-1] if reverse else points
+
+
+def travel_length(ordered: List[Tuple[Dict[str, Any], bool]], start: Point = (0.0, 0.0)) -> float:
+    """Сумарна довжина холостих переміщень (мм) для впорядкованих шляхів"""
+    total = 0.0
+    position = start
+    for path, reverse in ordered:
+        points = _oriented(path, reverse)
+        total += _distance(position, points[0])
+        position = points[-1]
+    return total
+
+
+def _rotate_closed(points: List[Point], position: Point) -> List[Point]:
+    """Починає замкнений контур з вершини, найближчої до поточної позиції"""
+    ring = points[:-1] if len(points) > 1 and points[0] == points[-1] else points
+    start = min(range(len(ring)), key=lambda i: _distance(position, ring[i]))
+    rotated = ring[start:] + ring[:start]
+    return rotated + rotated[:1]
+
+
+def optimize_path_order(
+    paths: List[Dict[str, Any]],
+    start: Point = (0.0, 0.0),
+    max_passes: int = 10
+) -> List[Tuple[Dict[str, Any], bool]]:
+    """
+    Впорядковує шляхи для мінімізації холостих переміщень
+
+    Спочатку жадібний обхід «найближчий сусід» по кінцевих точках шляхів
+    (відкриті шляхи можна проходити в будь-якому напрямку, обраний замкнений
+    контур починається з найближчої вершини), потім покращення 2-opt.
+
+    Args:
+        paths: Шляхи з build_cut_paths (одного інструменту)
+        start: Початкова позиція інструменту (мм)
+        max_passes: Максимальна кількість проходів 2-opt
+
+    Returns:
+        Список (шлях, чи_реверсувати) у порядку обходу
+    """
+    # Жадібний обхід
+    remaining = list(paths)
+    ordered: List[Tuple[Dict[str, Any], bool]] = []
+    position = start
+    while remaining:
+        best_index = 0
+        best_reverse = False
+        best_distance = math.inf
+        for index, path in enumerate(remaining):
+            points = path['points']
+            if path['closed']:
+                candidate = _distance(position, points[0])
+                reverse = False
+            else:
+                d_start = _distance(position, points[0])
+                d_end = _distance(position, points[-1])
+                candidate, reverse = (d_end, True) if d_end < d_start else (d_start, False)
+            if candidate < best_distance:
+                best_index, best_reverse, best_distance = index, reverse, candidate
+        path = remaining.pop(best_index)
+        if path['closed']:
+            path = dict(path, points=_rotate_closed(path['points'], position))
+        ordered.append((path, best_reverse))
+        position = _oriented(path, best_reverse)[-1]
+
+    # 2-opt: реверс підпослідовності змінює і порядок, і напрямок шляхів
+    def entry(item):
+        path, reverse = item
+        return path['points'][-1] if reverse else path['points'][0]
+
+    def exit_(item):
+        path, reverse = item
+        return path['points'][0] if reverse else path['points'][-1]
+
+    n = len(ordered)
+    for _ in range(max_passes):
+        improved = False
+        for i in range(n - 1):
+            before = exit_(ordered[i - 1]) if i > 0 else start
+            for j in range(i + 1, n):
+                old = _distance(before, entry(ordered[i]))
+                new = _distance(before, exit_(ordered[j]))
+                if j + 1 < n:
+                    after = entry(ordered[j + 1])
+                    old += _distance(exit_(ordered[j]), after)
+                    new += _distance(entry(ordered[i]), after)
+                if new < old - 1e-9:
+                    ordered[i:j + 1] = [(path, not reverse) for path, reverse in reversed(ordered[i:j + 1])]
+                    improved = True
+        if not improved:
+            break
+
+    return ordered
+
+
+def plan_cut_job(
+    pattern: Dict[str, Any],
+    tolerance_mm: float = 0.1,
+    include_sew_lines: bool = False,
+    **layout_kwargs
+) -> Dict[str, Any]:
+    """
+    Готує завдання для плотера: шляхи, згруповані за інструментом та впорядковані
+
+    Args:
+        pattern: Словник з даними викрійки (gores)
+        tolerance_mm: Допуск спрощення контуру (мм)
+        include_sew_lines: Чи додавати лінії шва (інструмент 2)
+        **layout_kwargs: scale_mm_per_m, fabric_width_mm, min_gap_mm, num_gores, add_notches
+
+    Returns:
+        Словник з впорядкованими шляхами ('ordered') та статистикою переміщень
+    """
+    paths = build_cut_paths(
+        pattern, tolerance_mm=tolerance_mm, include_sew_lines=include_sew_lines, **layout_kwargs
+    )
+
+    ordered = []
+    travel_before = 0.0
+    position = (0.0, 0.0)
+    # Інструмент 2 (маркер) спочатку, щоб розмітка була до вирізання деталей
+    for tool in sorted({path['tool'] for path in paths}, reverse=True):
+        tool_paths = [path for path in paths if path['tool'] == tool]
+        travel_before += travel_length([(path, False) for path in tool_paths], position)
+        tool_order = optimize_path_order(tool_paths, start=position)
+        ordered.extend(tool_order)
+        position = _oriented(*tool_order[-1])[-1]
+
+    return {
+        'ordered': ordered,
+        'num_paths': len(paths),
+        'num_points': sum(len(path['points']) for path in paths),
+        'travel_before_mm': travel_before,
+        'travel_mm': travel_length(ordered),
+    }
+
+
+@instrument('export.hpgl')
+def export_pattern_to_hpgl(
+    pattern: Dict[str, Any],
+    filename: str,
+    tolerance_mm: float = 0.1,
+    include_sew_lines: bool = False,
+    **layout_kwargs
+) -> str:
+    """
+    Експортує всі gores у HPGL файл для плотера/різака
+
+    Args:
+        pattern: Словник з даними викрійки (gores)
+        filename: Ім'я файлу для збереження
+        tolerance_mm: Допуск спрощення контуру (мм)
+        include_sew_lines: Чи малювати лінії шва пером 2
+        **layout_kwargs: scale_mm_per_m, fabric_width_mm, min_gap_mm, num_gores, add_notches
+
+    Returns:
+        Шлях до збереженого файлу
+
+    Raises:
+        ValueError: Якщо pattern не містить координат
+    """
+    job = plan_cut_job(pattern, tolerance_mm=tolerance_mm, include_sew_lines=include_sew_lines, **layout_kwargs)
+
+    def units(value: float) -> int:
+        return int(round(value * HPGL_UNITS_PER_MM))
+
+    with open(filename, 'w', encoding='ascii') as f:
+        f.write('IN;\n')
+        current_tool = None
+        for path, reverse in job['ordered']:
+            if path['tool'] != current_tool:
+                current_tool = path['tool']
+                f.write(f'SP{current_tool};\n')
+            points = _oriented(path, reverse)
+            x0, y0 = points[0]
+            f.write(f'PU{units(x0)},{units(y0)};\n')
+            coords = ','.join(f'{units(x)},{units(y)}' for x, y in points[1:])
+            f.write(f'PD{coords};\n')
+        f.write('PU;SP0;\n')
+
+    return os.path.abspath(filename)
+
+
+@instrument('export.gcode')
+def export_pattern_to_gcode(
+    pattern: Dict[str, Any],
+    filename: str,
+    tolerance_mm: float = 0.1,
+    include_sew_lines: bool = False,
+    feed_rate: float = 3000.0,
+    travel_z: float = 5.0,
+    cut_z: float = 0.0,
+    **layout_kwargs
+) -> str:
+    """
+    Експортує всі gores у простий G-code (мм, абсолютні координати)
+
+    Args:
+        pattern: Словник з даними викрійки (gores)
+        filename: Ім'я файлу для збереження
+        tolerance_mm: Допуск спрощення контуру (мм)
+        include_sew_lines: Чи додавати лінії шва (після зміни інструменту на T2)
+        feed_rate: Швидкість різання (мм/хв)
+        travel_z: Висота інструменту для холостих переміщень (мм)
+        cut_z: Робоча висота інструменту (мм)
+        **layout_kwargs: scale_mm_per_m, fabric_width_mm, min_gap_mm, num_gores, add_notches
+
+    Returns:
+        Шлях до збереженого файлу
+
+    Raises:
+        ValueError: Якщо pattern не містить координат
+    """
+    job = plan_cut_job(pattern, tolerance_mm=tolerance_mm, include_sew_lines=include_sew_lines, **layout_kwargs)
+
+    with open(filename, 'w', encoding='ascii') as f:
+        f.write(f"(balloon pattern: {pattern.get('pattern_type', 'unknown')})\n")
+        f.write(f"(travel {job['travel_mm']:.1f} mm)\n")
+        f.write('G21\nG90\n')
+        f.write(f'G0 Z{travel_z:.3f}\n')
+        current_tool = None
+        for path, reverse in job['ordered']:
+            if path['tool'] != current_tool:
+                current_tool = path['tool']
+                f.write(f'T{current_tool} M6\n')
+            points = _oriented(path, reverse)
+            x0, y0 = points[0]
+            f.write(f'G0 X{x0:.3f} Y{y0:.3f}\n')
+            f.write(f'G1 Z{cut_z:.3f} F{feed_rate:.0f}\n')
+            f.write(''.join(f'G1 X{x:.3f} Y{y:.3f}\n' for x, y in points[1:]))
+            f.write(f'G0 Z{travel_z:.3f}\n')
+        f.write('G0 X0 Y0\nM2\n')
+
+    return os.path.abspath(filename)
@@ -13,6 +13,8 @@ import os
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
+from balloon.instrument import instrument
+
 try:
     from reportlab.lib.pagesizes import A4
     from reportlab.lib.units import mm
@@ -26,6 +28,7 @@ except ImportError:
     REPORTLAB_AVAILABLE = False
 
 
+@instrument('export.pdf_report')
 def generate_pdf_report(
     results: Dict[str, Any],
     inputs: Dict[str, Any],
@@ -252,6 +255,7 @@ def generate_pdf_report(
     return os.path.abspath(filename)
 
 
+@instrument('export.html_report')
 def generate_html_report(
     results: Dict[str, Any],
     inputs: Dict[str, Any],
@@ -0,0 +1,427 @@
+"""
+Колонкове сховище результатів (Parquet / Arrow IPC)
+
+Результати розв'язувача, профілі висоти та серії (sweeps) записуються
+як таблиці з типізованими стовпцями: вхідні параметри - окремі стовпці
+з префіксом 'input.', вкладені словники розгортаються через крапку
+('mass_budget.envelope'). У метаданих файлу зберігаються версія моделі
+та припущення з balloon.model.assumptions.
+
+Запис виконується чанками (append), читання - з memory-map та пакетами,
+тож мільйони розрахованих варіантів не потрібно завантажувати повністю.
+Якщо pyarrow зібрано без Parquet, використовується Feather (Arrow IPC).
+"""
+
+import contextlib
+import json
+import os
+from datetime import datetime
+from typing import Dict, Any, Iterable, Iterator, List, Mapping, Optional
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+# Версія формату сховища (змінюється при несумісних змінах схеми/метаданих)
+RESULT_STORE_FORMAT_VERSION = 1
+
+# Ключі метаданих у схемі файлу
+METADATA_PREFIX = 'balloon.'
+
+_PARQUET_MAGIC = b'PAR1'
+_ARROW_MAGIC = b'ARROW1'
+_FEATHER_EXTENSIONS = ('.feather', '.arrow', '.ipc')
+
+
+def _require_pyarrow():
+    if not PYARROW_AVAILABLE:
+        raise ImportError(
+            "Для сховища результатів потрібна бібліотека pyarrow. "
+            "Встановіть: pip install pyarrow"
+        )
+
+
+def flatten_record(record: Mapping[str, Any], prefix: str = '') -> Dict[str, Any]:
+    """
+    Розгортає вкладений словник результату в плоский рядок таблиці
+
+    Вкладені словники отримують ключі через крапку, числа приводяться
+    до float (щоб чанки мали однакову схему), bool та рядки зберігаються
+    як є, списки та інші об'єкти пропускаються.
+
+    Args:
+        record: Словник результату (напр. з calculate_balloon_state)
+        prefix: Префікс назв стовпців
+
+    Returns:
+        Плоский словник {стовпець: скалярне значення}
+    """
+    row: Dict[str, Any] = {}
+    for key, value in record.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, Mapping):
+            row.update(flatten_record(value, f"{name}."))
+        elif value is None or isinstance(value, (bool, str)):
+            row[name] = value
+        elif isinstance(value, (int, float)):
+            row[name] = float(value)
+        elif hasattr(value, 'item') and getattr(value, 'ndim', 1) == 0:
+            item = value.item()
+            row[name] = item if isinstance(item, (bool, str)) else float(item)
+    return row
+
+
+def result_rows(inputs: Mapping[str, Any], results: Iterable[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Рядки таблиці: вхідні параметри (стовпці 'input.*') + розгорнуті результати
+
+    Args:
+        inputs: Вхідні параметри розрахунку (спільні для всіх рядків)
+        results: Результати (напр. один стан розв'язувача або точки профілю висоти)
+
+    Returns:
+        Список плоских рядків
+    """
+    input_columns = flatten_record(inputs, 'input.')
+    return [{**input_columns, **flatten_record(result)} for result in results]
+
+
+def store_metadata(kind: str, extra: Optional[Mapping[str, Any]] = None) -> Dict[str, str]:
+    """
+    Метадані сховища: версія моделі, припущення, тип результатів
+
+    Args:
+        kind: Тип результатів ('solve', 'height_profile', 'sweep', ...)
+        extra: Додаткові значення (серіалізуються в JSON)
+
+    Returns:
+        Словник {ключ: рядок} з префіксом METADATA_PREFIX
+    """
+    from balloon import __version__
+    from balloon.model.assumptions import get_assumptions_dict
+
+    metadata = {
+        'format_version': str(RESULT_STORE_FORMAT_VERSION),
+        'model_version': __version__,
+        'kind': kind,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'assumptions': json.dumps(get_assumptions_dict(), ensure_ascii=False),
+    }
+    for key, value in (extra or {}).items():
+        metadata[key] = value if isinstance(value, str) else json.dumps(value, ensure_ascii=False)
+    return {f"{METADATA_PREFIX}{key}": value for key, value in metadata.items()}
+
+
+def store_schema(columns: Mapping[str, type]) -> "pa.Schema":
+    """
+    Схема сховища з типів Python стовпців (як їх записує flatten_record)
+
+    Args:
+        columns: {стовпець: str, bool або float}
+
+    Returns:
+        pa.Schema (рядки - string, bool - bool_, числа - float64)
+    """
+    _require_pyarrow()
+    types = {str: pa.string(), bool: pa.bool_(), float: pa.float64()}
+    return pa.schema([(name, types[kind]) for name, kind in columns.items()])
+
+
+def _resolve_format(path: str, fmt: str) -> str:
+    if fmt == 'auto':
+        if path.lower().endswith(_FEATHER_EXTENSIONS) or not PARQUET_AVAILABLE:
+            return 'feather'
+        return 'parquet'
+    if fmt not in ('parquet', 'feather'):
+        raise ValueError(f"Невідомий формат сховища: {fmt}")
+    if fmt == 'parquet' and not PARQUET_AVAILABLE:
+        raise ImportError("pyarrow зібрано без підтримки Parquet; використовуйте fmt='feather'")
+    return fmt
+
+
+def _to_table(chunk) -> "pa.Table":
+    """Перетворює чанк (таблиця Arrow, DataFrame, словник стовпців або список рядків) на pa.Table"""
+    if isinstance(chunk, pa.Table):
+        return chunk
+    if isinstance(chunk, pa.RecordBatch):
+        return pa.Table.from_batches([chunk])
+    if hasattr(chunk, 'columns') and hasattr(chunk, 'to_numpy'):
+        return pa.Table.from_pandas(chunk, preserve_index=False)
+    if isinstance(chunk, Mapping):
+        return pa.Table.from_pydict(dict(chunk))
+    return pa.Table.from_pylist(list(chunk))
+
+
+class ResultStoreWriter:
+    """
+    Потоковий запис результатів у Parquet або Feather чанками
+
+    Схема задається аргументом schema або першим чанком. У наступних
+    чанках відсутні стовпці заповнюються null; нові стовпці та значення
+    у стовпцях типу null (усі значення першого чанку - None) розширюють
+    схему - вже записані рядки тоді переписуються з новою схемою, тож
+    кожен пізно доданий стовпець коштує O(рядків) перезапису; для довгих
+    записів схему краще задати наперед (schema, store_schema).
+
+    Використання:
+        with ResultStoreWriter('sweep.parquet', kind='sweep') as store:
+            for chunk in chunks:
+                store.append(chunk)
+    """
+
+    def __init__(self, path: str, kind: str = 'sweep', fmt: str = 'auto',
+                 metadata: Optional[Mapping[str, Any]] = None, compression: Optional[str] = 'snappy',
+                 schema: Optional["pa.Schema"] = None):
+        """
+        Args:
+            path: Шлях до файлу
+            kind: Тип результатів (записується в метадані)
+            fmt: 'parquet', 'feather' або 'auto' (Parquet, якщо доступний і
+                розширення не .feather/.arrow)
+            metadata: Додаткові метадані
+            compression: Стиснення Parquet (Feather пишеться без стиснення,
+                щоб читання через memory-map було без копіювання)
+            schema: Схема сховища (None - за першим чанком); файл зі схемою
+                створюється одразу
+        """
+        _require_pyarrow()
+        self.path = path
+        self.format = _resolve_format(path, fmt)
+        self.compression = compression
+        self.num_rows = 0
+        self.schema: Optional["pa.Schema"] = None
+        self._metadata = store_metadata(kind, metadata)
+        self._writer = None
+        self._sink = None
+        if schema is not None:
+            self._open(schema)
+
+    def __enter__(self) -> "ResultStoreWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _open(self, schema: "pa.Schema"):
+        self.schema = schema.with_metadata(self._metadata)
+        if self.format == 'parquet':
+            self._writer = pq.ParquetWriter(self.path, self.schema, compression=self.compression)
+        else:
+            self._sink = pa.OSFile(self.path, 'wb')
+            self._writer = pa.ipc.new_file(self._sink, self.schema)
+
+    def _evolve(self, table: "pa.Table"):
+        """Додає до схеми нові стовпці чанку та типи стовпців, що досі були null"""
+        fields = []
+        changed = False
+        for field in self.schema:
+            if field.name in table.column_names and pa.types.is_null(field.type):
+                chunk_type = table.schema.field(field.name).type
+                if not pa.types.is_null(chunk_type):
+                    field = field.with_type(chunk_type)
+                    changed = True
+            fields.append(field)
+        for field in table.schema:
+            if field.name not in self.schema.names:
+                fields.append(field)
+                changed = True
+        if not changed:
+            return
+        schema = pa.schema(fields)
+        if self.num_rows == 0:
+            self.close()
+            self._open(schema)
+        else:
+            self._rewrite(schema)
+
+    def _rewrite(self, schema: "pa.Schema"):
+        """
+        Переписує записані рядки у файл з розширеною схемою (O(рядків))
+
+        Записаний файл спершу переноситься в тимчасову копію, яка
+        видаляється лише після успішного перезапису. При помилці файл
+        відновлюється з копії, а запис закривається.
+        """
+        self.close()
+        previous_schema = self.schema
+        previous = f"{self.path}.{os.getpid()}.tmp"
+        os.replace(self.path, previous)
+        try:
+            self._open(schema)
+            for batch in iter_result_batches(previous):
+                self._writer.write_table(self._conform(pa.Table.from_batches([batch])))
+        except BaseException:
+            with contextlib.suppress(Exception):
+                self.close()
+            self._writer = self._sink = None
+            os.replace(previous, self.path)
+            self.schema = previous_schema
+            raise
+        os.remove(previous)
+
+    def _conform(self, table: "pa.Table") -> "pa.Table":
+        columns = []
+        for field in self.schema:
+            if field.name not in table.column_names:
+                columns.append(pa.nulls(table.num_rows, field.type))
+                continue
+            try:
+                columns.append(table[field.name].cast(field.type))
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError) as e:
+                raise ValueError(
+                    f"Стовпець '{field.name}' ({table.schema.field(field.name).type}) несумісний "
+                    f"з типом сховища {field.type}: {e}"
+                ) from None
+        return pa.Table.from_arrays(columns, schema=self.schema)
+
+    def append(self, chunk) -> int:
+        """
+        Додає чанк рядків
+
+        Args:
+            chunk: pa.Table, pandas.DataFrame, словник стовпців або список рядків
+
+        Returns:
+            Загальна кількість записаних рядків
+
+        Raises:
+            ValueError: Якщо значення стовпця не приводяться до типу сховища
+                або запис уже закрито
+        """
+        table = _to_table(chunk)
+        if table.num_rows == 0:
+            return self.num_rows
+        if self._writer is None and self.num_rows:
+            raise ValueError(f"Запис у {self.path} уже закрито")
+        if self._writer is None:
+            self._open(table.schema)
+        else:
+            self._evolve(table)
+        self._writer.write_table(self._conform(table))
+        self.num_rows += table.num_rows
+        return self.num_rows
+
+    def close(self):
+        """Завершує файл (записує footer); повторний виклик безпечний"""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._sink is not None:
+            self._sink.close()
+            self._sink = None
+
+
+def write_results(path: str, rows, kind: str = 'sweep', fmt: str = 'auto',
+                  metadata: Optional[Mapping[str, Any]] = None) -> str:
+    """
+    Записує результати одним викликом
+
+    Args:
+        path: Шлях до файлу
+        rows: Рядки (див. ResultStoreWriter.append)
+        kind: Тип результатів
+        fmt: 'parquet', 'feather' або 'auto'
+        metadata: Додаткові метадані
+
+    Returns:
+        Шлях до збереженого файлу
+    """
+    with ResultStoreWriter(path, kind=kind, fmt=fmt, metadata=metadata) as store:
+        store.append(rows)
+    return os.path.abspath(path)
+
+
+def _detect_format(path: str) -> str:
+    with open(path, 'rb') as fh:
+        head = fh.read(len(_ARROW_MAGIC))
+    if head.startswith(_PARQUET_MAGIC):
+        return 'parquet'
+    if head == _ARROW_MAGIC:
+        return 'feather'
+    raise ValueError(f"Файл не є сховищем результатів Parquet/Feather: {path}")
+
+
+def iter_result_batches(path: str, columns: Optional[List[str]] = None,
+                        batch_size: int = 65536) -> Iterator["pa.RecordBatch"]:
+    """
+    Ітерує файл пакетами без завантаження всієї таблиці
+
+    Args:
+        path: Шлях до файлу
+        columns: Лише ці стовпці (None - всі)
+        batch_size: Кількість рядків у пакеті (для Parquet)
+
+    Yields:
+        pa.RecordBatch
+    """
+    _require_pyarrow()
+    if _detect_format(path) == 'parquet':
+        parquet_file = pq.ParquetFile(path, memory_map=True)
+        yield from parquet_file.iter_batches(batch_size=batch_size, columns=columns)
+        return
+
+    with pa.memory_map(path, 'r') as source:
+        reader = pa.ipc.open_file(source)
+        for i in range(reader.num_record_batches):
+            batch = reader.get_batch(i)
+            yield batch.select(columns) if columns is not None else batch
+
+
+def read_results(path: str, columns: Optional[List[str]] = None) -> "pa.Table":
+    """
+    Читає сховище як pa.Table через memory-map
+
+    Для Feather дані не копіюються з файлу; для pandas використовуйте
+    read_results(...).to_pandas().
+
+    Args:
+        path: Шлях до файлу
+        columns: Лише ці стовпці (None - всі)
+
+    Returns:
+        Таблиця Arrow з метаданими сховища в schema.metadata
+    """
+    _require_pyarrow()
+    if _detect_format(path) == 'parquet':
+        return pq.read_table(path, columns=columns, memory_map=True)
+    source = pa.memory_map(path, 'r')
+    table = pa.ipc.open_file(source).read_all()
+    return table.select(columns) if columns is not None else table
+
+
+def read_store_metadata(path: str) -> Dict[str, Any]:
+    """
+    Читає метадані сховища без читання даних
+
+    Returns:
+        Словник метаданих без префікса; 'assumptions' розібрано з JSON,
+        'num_rows' - кількість рядків у файлі
+    """
+    _require_pyarrow()
+    if _detect_format(path) == 'parquet':
+        parquet_file = pq.ParquetFile(path)
+        schema = parquet_file.schema_arrow
+        num_rows = parquet_file.metadata.num_rows
+    else:
+        with pa.memory_map(path, 'r') as source:
+            reader = pa.ipc.open_file(source)
+            schema = reader.schema
+            num_rows = sum(reader.get_batch(i).num_rows for i in range(reader.num_record_batches))
+
+    result: Dict[str, Any] = {'num_rows': num_rows, 'columns': schema.names}
+    for key, value in (schema.metadata or {}).items():
+        key = key.decode('utf-8')
+        if key.startswith(METADATA_PREFIX):
+            result[key[len(METADATA_PREFIX):]] = value.decode('utf-8')
+    if 'assumptions' in result:
+        result['assumptions'] = json.loads(result['assumptions'])
+    return result
@@ -0,0 +1,361 @@
+"""
+Потоковий SVG експорт викрійок
+
+SvgWriter пише документ безпосередньо у файловий дескриптор (буферизований I/O),
+без накопичення рядків у пам'яті. Шляхи кодуються компактно: перша точка
+абсолютною командою M, далі відносні l (або c для кривих Безьє)
+з налаштовуваною точністю.
+"""
+
+import os
+from itertools import chain
+from typing import Dict, Any, Iterable, List, Optional, TextIO, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+from balloon.export.contours import (
+    gore_outline, contour_x_at_y, notch_y_positions, pattern_bounds, simplify_contour
+)
+from balloon.export.nesting import calculate_gore_layout
+from balloon.instrument import instrument
+
+# Розмір буфера файлу для потокового запису (байт)
+SVG_BUFFER_SIZE = 1 << 16
+
+# Кількість точок шляху, після якої накопичений фрагмент скидається у файл
+_PATH_CHUNK_POINTS = 1024
+
+DEFAULT_SVG_STYLES = (
+    '.pattern-line { stroke: #000; stroke-width: 0.5; fill: none; }',
+    '.seam-line { stroke: #f00; stroke-width: 0.3; stroke-dasharray: 2,2; fill: none; }',
+    '.cut-line { stroke: #00f; stroke-width: 0.5; fill: none; }',
+    '.center-line { stroke: #0a0; stroke-width: 0.2; stroke-dasharray: 5,5; fill: none; }',
+    '.notch { stroke: #f00; stroke-width: 0.3; fill: none; }',
+    '.sheet { stroke: #888; stroke-width: 0.3; fill: none; }',
+    '.text { font-family: Arial; font-size: 3mm; fill: #000; }',
+)
+
+
+def _format_number(value: float, precision: int) -> str:
+    """Форматує число з заданою точністю без зайвих нулів ('1.50' -> '1.5', '-0.00' -> '0')"""
+    text = f"{value:.{precision}f}"
+    if '.' in text:
+        text = text.rstrip('0').rstrip('.')
+    if text in ('-0', ''):
+        return '0'
+    return text
+
+
+class SvgWriter:
+    """
+    Потоковий запис SVG документа у файловий дескриптор
+
+    Використання:
+        with open(filename, 'w', encoding='utf-8', buffering=SVG_BUFFER_SIZE) as fh:
+            with SvgWriter(fh, width_mm, height_mm) as svg:
+                svg.path(points, 'cut-line', closed=True)
+
+    Координати передаються в одиницях viewBox (мм), вісь Y спрямована вниз.
+    """
+
+    def __init__(self, fh: TextIO, width_mm: float, height_mm: float,
+                 precision: int = 2, styles: Iterable[str] = DEFAULT_SVG_STYLES):
+        self.fh = fh
+        self.width_mm = width_mm
+        self.height_mm = height_mm
+        self.precision = precision
+        self.styles = tuple(styles)
+        self._factor = 10 ** precision
+        self._open_tags = []
+
+    def __enter__(self) -> "SvgWriter":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.end()
+
+    def _num(self, value: float) -> str:
+        return _format_number(value, self.precision)
+
+    def start(self):
+        """Записує заголовок документа та стилі"""
+        width = self._num(self.width_mm)
+        height = self._num(self.height_mm)
+        self.fh.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        self.fh.write(
+            f'<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" '
+            f'width="{width}mm" height="{height}mm" viewBox="0 0 {width} {height}">\n'
+        )
+        if self.styles:
+            self.fh.write('<style>\n')
+            for rule in self.styles:
+                self.fh.write(rule)
+                self.fh.write('\n')
+            self.fh.write('</style>\n')
+        self._open_tags.append('svg')
+
+    def end(self):
+        """Закриває всі відкриті елементи"""
+        while self._open_tags:
+            self.fh.write(f'</{self._open_tags.pop()}>\n')
+
+    def open_defs(self):
+        self.fh.write('<defs>\n')
+        self._open_tags.append('defs')
+
+    def open_group(self, element_id: Optional[str] = None, translate: Optional[Tuple[float, float]] = None,
+                   css_class: Optional[str] = None):
+        """Відкриває групу <g> (закривається через close())"""
+        attrs = ''
+        if element_id:
+            attrs += f' id={quoteattr(element_id)}'
+        if css_class:
+            attrs += f' class={quoteattr(css_class)}'
+        if translate:
+            attrs += f' transform="translate({self._num(translate[0])},{self._num(translate[1])})"'
+        self.fh.write(f'<g{attrs}>\n')
+        self._open_tags.append('g')
+
+    def close(self):
+        """Закриває останній відкритий елемент (<g> або <defs>)"""
+        self.fh.write(f'</{self._open_tags.pop()}>\n')
+
+    def path(self, points: Iterable[Tuple[float, float]], css_class: str, closed: bool = False):
+        """
+        Записує шлях: M для першої точки, далі відносні l
+
+        Координати квантуються до точності writer-а, а відносні кроки рахуються
+        між квантованими значеннями, тому похибка не накопичується.
+        """
+        factor = self._factor
+        iterator = iter(points)
+        try:
+            x0, y0 = next(iterator)
+        except StopIteration:
+            return
+
+        prev_x = round(x0 * factor)
+        prev_y = round(y0 * factor)
+        # Заголовок пишеться з першим ненульовим кроком: шлях з однієї точки не записується
+        head = f'<path class={quoteattr(css_class)} d="M{self._num(prev_x / factor)},{self._num(prev_y / factor)}l'
+
+        chunk = []
+        for x, y in iterator:
+            qx = round(x * factor)
+            qy = round(y * factor)
+            dx = qx - prev_x
+            dy = qy - prev_y
+            if dx == 0 and dy == 0:
+                continue
+            chunk.append(f' {self._num(dx / factor)},{self._num(dy / factor)}')
+            prev_x, prev_y = qx, qy
+            if len(chunk) >= _PATH_CHUNK_POINTS:
+                if head is not None:
+                    self.fh.write(head)
+                    head = None
+                self.fh.write(''.join(chunk))
+                chunk.clear()
+        if head is not None:
+            if not chunk:
+                return
+            self.fh.write(head)
+        if chunk:
+            self.fh.write(''.join(chunk))
+        self.fh.write('z"/>\n' if closed else '"/>\n')
+
+    def bezier_path(self, segments: Iterable[Tuple[Tuple[float, float], ...]], css_class: str,
+                    closed: bool = False):
+        """
+        Записує послідовність кубічних кривих Безьє: M для початку, далі відносні c
+
+        Args:
+            segments: Криві (p0, c1, c2, p3); p0 кожної кривої збігається з p3 попередньої
+        """
+        factor = self._factor
+        iterator = iter(segments)
+        try:
+            first = next(iterator)
+        except StopIteration:
+            return
+
+        prev_x = round(first[0][0] * factor)
+        prev_y = round(first[0][1] * factor)
+        self.fh.write(f'<path class={quoteattr(css_class)} d="M{self._num(prev_x / factor)},{self._num(prev_y / factor)}c')
+
+        chunk = []
+        for segment in chain([first], iterator):
+            coords = []
+            for x, y in segment[1:]:
+                coords.append(f'{self._num((round(x * factor) - prev_x) / factor)},'
+                              f'{self._num((round(y * factor) - prev_y) / factor)}')
+            chunk.append(' ' + ' '.join(coords))
+            prev_x = round(segment[3][0] * factor)
+            prev_y = round(segment[3][1] * factor)
+            if len(chunk) >= _PATH_CHUNK_POINTS:
+                self.fh.write(''.join(chunk))
+                chunk.clear()
+        if chunk:
+            self.fh.write(''.join(chunk))
+        self.fh.write('z"/>\n' if closed else '"/>\n')
+
+    def line(self, x1: float, y1: float, x2: float, y2: float, css_class: str):
+        self.fh.write(
+            f'<line x1="{self._num(x1)}" y1="{self._num(y1)}" x2="{self._num(x2)}" y2="{self._num(y2)}" '
+            f'class={quoteattr(css_class)}/>\n'
+        )
+
+    def rect(self, x: float, y: float, width: float, height: float, css_class: str):
+        self.fh.write(
+            f'<rect x="{self._num(x)}" y="{self._num(y)}" width="{self._num(width)}" '
+            f'height="{self._num(height)}" class={quoteattr(css_class)}/>\n'
+        )
+
+    def text(self, x: float, y: float, content: str, css_class: str = 'text'):
+        self.fh.write(
+            f'<text x="{self._num(x)}" y="{self._num(y)}" class={quoteattr(css_class)}>{escape(content)}</text>\n'
+        )
+
+    def use(self, href: str, x: float, y: float):
+        """Посилання на елемент з <defs> (аналог INSERT у DXF)"""
+        self.fh.write(f'<use xlink:href="#{href}" x="{self._num(x)}" y="{self._num(y)}"/>\n')
+
+
+def _write_outline(svg: SvgWriter, outline: List[Tuple[float, float]], to_svg, css_class: str,
+                   tolerance_mm: Optional[float]) -> float:
+    """Записує замкнений контур; з tolerance_mm - як криві Безьє. Повертає відхилення (мм)"""
+    if tolerance_mm is None:
+        svg.path((to_svg(x, y) for x, y in outline), css_class, closed=True)
+        return 0.0
+    closed = [to_svg(x, y) for x, y in outline + outline[:1]]
+    fitted = simplify_contour(closed, tolerance_mm, method='bezier')
+    svg.bezier_path(fitted['segments'], css_class, closed=True)
+    return fitted['max_deviation']
+
+
+def write_gore(svg: SvgWriter, pattern: Dict[str, Any], to_svg,
+               add_notches: bool = True, add_centerline: bool = True,
+               tolerance_mm: Optional[float] = None) -> float:
+    """
+    Записує один gore (лінія розрізу, шва, мітки, осьова лінія) у відкритий SvgWriter
+
+    Args:
+        svg: Відкритий SvgWriter
+        pattern: Патерн викрійки (gores)
+        to_svg: Функція (x_m, y_m) -> (x_mm, y_mm) у координатах документа
+        add_notches: Чи додавати мітки суміщення
+        add_centerline: Чи додавати центральну лінію
+        tolerance_mm: Допуск апроксимації контурів кривими Безьє (мм);
+            None - контури записуються полілініями без спрощення
+
+    Returns:
+        Максимальне відхилення записаних контурів від точного профілю (мм)
+    """
+    points = pattern['points']
+    half_width, min_y, max_y = pattern_bounds(points)
+
+    deviation = _write_outline(svg, gore_outline(points), to_svg, 'cut-line', tolerance_mm)
+
+    allowance_m = pattern.get('seam_allowance_m', 0.0)
+    if allowance_m > 0:
+        deviation = max(deviation, _write_outline(
+            svg, gore_outline(points, allowance_m), to_svg, 'seam-line', tolerance_mm
+        ))
+
+    if add_centerline:
+        x1, y1 = to_svg(0.0, min_y)
+        x2, y2 = to_svg(0.0, max_y)
+        svg.line(x1, y1, x2, y2, 'center-line')
+
+    if add_notches:
+        notch_length = 5.0  # 5 мм
+        for y_pos_m in notch_y_positions(pattern):
+            x_at_y = contour_x_at_y(points, y_pos_m)
+            x_right, y_mm = to_svg(x_at_y, y_pos_m)
+            x_left, _ = to_svg(-x_at_y, y_pos_m)
+            svg.line(x_right, y_mm, x_right + notch_length, y_mm, 'notch')
+            svg.line(x_left, y_mm, x_left - notch_length, y_mm, 'notch')
+
+    return deviation
+
+
+@instrument('export.svg')
+def export_gores_to_svg(
+    pattern: Dict[str, Any],
+    filename: str,
+    scale_mm_per_m: float = 1000.0,
+    fabric_width_mm: float = 1500.0,
+    min_gap_mm: float = 10.0,
+    num_gores: Optional[int] = None,
+    add_notches: bool = True,
+    add_centerline: bool = True,
+    precision: int = 2,
+    tolerance_mm: Optional[float] = None
+) -> str:
+    """
+    Експортує усі gores, розкладені по тканині, в один SVG аркуш
+
+    Геометрія панелі записується один раз у <defs>, а кожен gore на аркуші
+    є <use>-посиланням на неї з власним номером.
+
+    Args:
+        pattern: Словник з даними викрійки (gores)
+        filename: Ім'я файлу для збереження
+        scale_mm_per_m: Масштаб (мм на метр) - для 1:1 використовувати 1000
+        fabric_width_mm: Ширина рулону тканини (мм)
+        min_gap_mm: Мінімальний зазор між панелями (мм)
+        num_gores: Кількість панелей (якщо None, береться з pattern)
+        add_notches: Чи додавати мітки суміщення
+        add_centerline: Чи додавати центральну лінію
+        precision: Кількість знаків після коми для координат (мм)
+        tolerance_mm: Допуск апроксимації контурів кривими Безьє (мм)
+
+    Returns:
+        Шлях до збереженого файлу
+
+    Raises:
+        ValueError: Якщо pattern не містить координат
+    """
+    points = pattern.get('points', [])
+    if not points:
+        raise ValueError("Патерн не містить координат для експорту")
+
+    layout = calculate_gore_layout(
+        pattern,
+        fabric_width_mm=fabric_width_mm,
+        min_gap_mm=min_gap_mm,
+        num_panels=num_gores,
+        scale_mm_per_m=scale_mm_per_m
+    )
+    half_width, min_y, max_y = pattern_bounds(points)
+
+    # Локальні координати панелі: верхній лівий кут габариту = (0, 0)
+    def to_panel(x: float, y: float) -> Tuple[float, float]:
+        return ((x + half_width) * scale_mm_per_m, (y - min_y) * scale_mm_per_m)
+
+    text_margin_mm = 10.0
+    sheet_height_mm = layout['fabric_length_mm'] + text_margin_mm
+
+    with open(filename, 'w', encoding='utf-8', buffering=SVG_BUFFER_SIZE) as fh:
+        with SvgWriter(fh, fabric_width_mm, sheet_height_mm, precision=precision) as svg:
+            svg.open_defs()
+            svg.open_group(element_id='gore')
+            deviation_mm = write_gore(svg, pattern, to_panel, add_notches=add_notches,
+                                      add_centerline=add_centerline, tolerance_mm=tolerance_mm)
+            svg.close()
+            svg.close()
+
+            svg.rect(0, 0, fabric_width_mm, layout['fabric_length_mm'], 'sheet')
+            label_x = layout['panel_width_mm'] / 2 + 2.0
+            label_y = layout['panel_height_mm'] / 2
+            for placement in layout['placements']:
+                svg.use('gore', placement['x_mm'], placement['y_mm'])
+                svg.text(placement['x_mm'] + label_x, placement['y_mm'] + label_y, str(placement['index'] + 1))
+
+            svg.text(
+                min_gap_mm, layout['fabric_length_mm'] + text_margin_mm / 2,
+                f"{pattern.get('pattern_type', 'unknown')} | {layout['num_panels']} gores | "
+                f"{fabric_width_mm:.0f} x {layout['fabric_length_mm']:.0f} мм"
+                + (f" | відхилення контуру ≤ {deviation_mm:.3f} мм" if tolerance_mm is not None else "")
+            )
+
+    return os.path.abspath(filename)
@@ -2,92 +2,46 @@
 Модуль для експорту результатів розрахунку та викрійок
 """
 
+import inspect
 import os
 import math
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, List, Optional
 from datetime import datetime
 
-try:
-    import pandas as pd
-    PANDAS_AVAILABLE = True
-except ImportError:
-    PANDAS_AVAILABLE = False
+from balloon.instrument import instrument
 
+# Формат експорту викрійки -> розширення файлу (export_pattern_file)
+EXPORT_FORMATS = {
+    'svg': '.svg',
+    'dxf': '.dxf',
+    'pdf': '.pdf',
+    'hpgl': '.plt',
+    'gcode': '.gcode',
+    'xlsx': '.xlsx',
+}
 
-def export_results_to_excel(results: Dict[str, Any], filename: Optional[str] = None) -> str:
-    """
-    Експортує результати розрахунку в Excel файл
-    
-    Args:
-        results: Словник з результатами розрахунку
-        filename: Ім'я файлу (якщо None, генерується автоматично)
-    
-    Returns:
-        Шлях до збереженого файлу
-    
-    Raises:
-        ImportError: Якщо pandas не встановлено
-    """
-    if not PANDAS_AVAILABLE:
-        raise ImportError("Для експорту в Excel потрібна бібліотека pandas. Встановіть: pip install pandas openpyxl")
-    
-    if filename is None:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"balloon_results_{timestamp}.xlsx"
+
+def _results_rows(results: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Рядки 'Параметр / Значення / Одиниця' для аркуша результатів (значення - числа)"""
+    rows = []
     
-    # Підготовка даних для експорту
-    data = []
+    def add(name: str, value: float, unit: str):
+        rows.append({'Параметр': name, 'Значення': float(value), 'Одиниця': unit})
     
     # Основні параметри
-    data.append({
-        'Параметр': 'Об\'єм кулі',
-        'Значення': f"{results.get('required_volume', 0):.4f}",
-        'Одиниця': 'м³'
-    })
-    data.append({
-        'Параметр': 'Площа поверхні',
-        'Значення': f"{results.get('surface_area', 0):.4f}",
-        'Одиниця': 'м²'
-    })
-    data.append({
-        'Параметр': 'Маса оболонки',
-        'Значення': f"{results.get('envelope_mass', 0):.4f}",
-        'Одиниця': 'кг'
-    })
-    data.append({
-        'Параметр': 'Загальна маса',
-        'Значення': f"{results.get('total_mass', 0):.4f}",
-        'Одиниця': 'кг'
-    })
-    data.append({
-        'Параметр': 'Підйомна сила (початок)',
-        'Значення': f"{results.get('lift', 0):.4f}",
-        'Одиниця': 'Н'
-    })
-    data.append({
-        'Параметр': 'Підйомна сила (кінець)',
-        'Значення': f"{results.get('lift_end', 0):.4f}",
-        'Одиниця': 'Н'
-    })
+    add('Об\'єм кулі', results.get('required_volume', 0), 'м³')
+    add('Площа поверхні', results.get('surface_area', 0), 'м²')
+    add('Маса оболонки', results.get('envelope_mass', 0), 'кг')
+    add('Загальна маса', results.get('total_mass', 0), 'кг')
+    add('Підйомна сила (початок)', results.get('lift', 0), 'Н')
+    add('Підйомна сила (кінець)', results.get('lift_end', 0), 'Н')
     
     if 'payload' in results:
-        data.append({
-            'Параметр': 'Корисне навантаження',
-            'Значення': f"{results.get('payload', 0):.4f}",
-            'Одиниця': 'кг'
-        })
+        add('Корисне навантаження', results.get('payload', 0), 'кг')
     
     if 'stress' in results:
-        data.append({
-            'Параметр': 'Напруга в оболонці',
-            'Значення': f"{results.get('stress', 0):.2e}",
-            'Одиниця': 'Па'
-        })
-        data.append({
-            'Параметр': 'Гранична напруга',
-            'Значення': f"{results.get('stress_limit', 0):.2e}",
-            'Одиниця': 'Па'
-        })
+        add('Напруга в оболонці', results.get('stress', 0), 'Па')
+        add('Гранична напруга', results.get('stress_limit', 0), 'Па')
     
     # Параметри форми - використовуємо реєстр для отримання інформації про параметри
     from balloon.shapes.registry import get_shape_entry
@@ -99,112 +53,92 @@ def export_results_to_excel(results: Dict[str, Any], filename: Optional[str] = N
     entry = get_shape_entry(shape_type)
     if entry:
         # Використовуємо Pydantic модель для отримання назв полів
-        param_model = entry.param_model
-        param_fields = param_model.model_fields
+        param_fields = entry.param_model.model_fields
         
         # Додаємо параметри форми до експорту
         for param_name, field_info in param_fields.items():
             if param_name in shape_params:
                 # Отримуємо опис з field_info або використовуємо param_name
                 description = field_info.description or param_name.replace('_', ' ').title()
-                data.append({
-                    'Параметр': description,
-                    'Значення': f"{shape_params[param_name]:.4f}",
-                    'Одиниця': 'м'
-                })
+                add(description, shape_params[param_name], 'м')
         
         # Для сфери також перевіряємо results на наявність radius
         if shape_type == 'sphere' and 'radius' in results and 'radius' not in shape_params:
-            data.append({
-                'Параметр': 'Радіус сфери',
-                'Значення': f"{results.get('radius', 0):.4f}",
-                'Одиниця': 'м'
-            })
+            add('Радіус сфери', results.get('radius', 0), 'м')
     else:
         # Fallback на старий спосіб, якщо форма не знайдена в реєстрі
         if shape_type == 'sphere' and 'radius' in results:
-            data.append({
-                'Параметр': 'Радіус сфери',
-                'Значення': f"{results.get('radius', 0):.4f}",
-                'Одиниця': 'м'
-            })
+            add('Радіус сфери', results.get('radius', 0), 'м')
         elif shape_type == 'pillow':
-            data.append({
-                'Параметр': 'Довжина подушки',
-                'Значення': f"{shape_params.get('pillow_len', 0):.4f}",
-                'Одиниця': 'м'
-            })
-            data.append({
-                'Параметр': 'Ширина подушки',
-                'Значення': f"{shape_params.get('pillow_wid', 0):.4f}",
-                'Одиниця': 'м'
-            })
+            add('Довжина подушки', shape_params.get('pillow_len', 0), 'м')
+            add('Ширина подушки', shape_params.get('pillow_wid', 0), 'м')
         elif shape_type == 'pear':
-            data.append({
-                'Параметр': 'Висота груші',
-                'Значення': f"{shape_params.get('pear_height', 0):.4f}",
-                'Одиниця': 'м'
-            })
-            data.append({
-                'Параметр': 'Радіус верхньої частини',
-                'Значення': f"{shape_params.get('pear_top_radius', 0):.4f}",
-                'Одиниця': 'м'
-            })
-            data.append({
-                'Параметр': 'Радіус нижньої частини',
-                'Значення': f"{shape_params.get('pear_bottom_radius', 0):.4f}",
-                'Одиниця': 'м'
-            })
+            add('Висота груші', shape_params.get('pear_height', 0), 'м')
+            add('Радіус верхньої частини', shape_params.get('pear_top_radius', 0), 'м')
+            add('Радіус нижньої частини', shape_params.get('pear_bottom_radius', 0), 'м')
         elif shape_type == 'cigar':
-            data.append({
-                'Параметр': 'Довжина сигари',
-                'Значення': f"{shape_params.get('cigar_length', 0):.4f}",
-                'Одиниця': 'м'
-            })
-            data.append({
-                'Параметр': 'Радіус сигари',
-                'Значення': f"{shape_params.get('cigar_radius', 0):.4f}",
-                'Одиниця': 'м'
-            })
-    
-    # Створюємо DataFrame
-    df = pd.DataFrame(data)
-    
-    # Створюємо Excel writer
-    with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-        # Основні результати
-        df.to_excel(writer, sheet_name='Результати', index=False)
-        
-        # Додаємо інформацію про розрахунок
-        info_data = [
-            ['Дата розрахунку', datetime.now().strftime("%Y-%m-%d %H:%M:%S")],
-            ['Тип газу', results.get('gas_type', 'Невідомо')],
-            ['Матеріал', results.get('material', 'Невідомо')],
-            ['Форма', shape_type],
-            ['Режим', results.get('mode', 'Невідомо')],
-        ]
-        info_df = pd.DataFrame(info_data, columns=['Параметр', 'Значення'])
-        info_df.to_excel(writer, sheet_name='Інформація', index=False)
-        
-        # Якщо є профіль висоти
-        if 'height_profile' in results:
-            profile = results['height_profile']
-            if isinstance(profile, list) and len(profile) > 0:
-                profile_data = []
-                for item in profile:
-                    if isinstance(item, dict):
-                        profile_data.append({
-                            'Висота (м)': item.get('height', 0),
-                            'Підйомна сила (Н)': item.get('lift', 0),
-                            'Тиск (Па)': item.get('pressure', 0),
-                        })
-                if profile_data:
-                    profile_df = pd.DataFrame(profile_data)
-                    profile_df.to_excel(writer, sheet_name='Профіль висоти', index=False)
+            add('Довжина сигари', shape_params.get('cigar_length', 0), 'м')
+            add('Радіус сигари', shape_params.get('cigar_radius', 0), 'м')
     
-    return os.path.abspath(filename)
+    return rows
+
+
+@instrument('export.excel_results')
+def export_results_to_excel(results: Dict[str, Any], filename: Optional[str] = None) -> str:
+    """
+    Експортує результати розрахунку в Excel файл
+    
+    Значення зберігаються як числа з форматом комірок (а не як текст).
+    Для серій розрахунків див. balloon.export.excel_export.export_tables_to_excel.
+    
+    Args:
+        results: Словник з результатами розрахунку
+        filename: Ім'я файлу (якщо None, генерується автоматично)
+    
+    Returns:
+        Шлях до збереженого файлу
+    """
+    from balloon.export.excel_export import export_tables_to_excel
+    
+    if filename is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"balloon_results_{timestamp}.xlsx"
+    
+    tables = {
+        'Результати': _results_rows(results),
+        # Інформація про розрахунок
+        'Інформація': {
+            'Параметр': ['Дата розрахунку', 'Тип газу', 'Матеріал', 'Форма', 'Режим'],
+            'Значення': [
+                datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                results.get('gas_type', 'Невідомо'),
+                results.get('material', 'Невідомо'),
+                results.get('shape_type', 'sphere'),
+                results.get('mode', 'Невідомо'),
+            ],
+        },
+    }
+    
+    # Якщо є профіль висоти
+    profile = results.get('height_profile')
+    if isinstance(profile, list):
+        items = [item for item in profile if isinstance(item, dict)]
+        if items:
+            tables['Профіль висоти'] = {
+                'Висота (м)': [float(item.get('height', 0)) for item in items],
+                'Підйомна сила (Н)': [float(item.get('lift', 0)) for item in items],
+                'Тиск (Па)': [float(item.get('pressure', 0)) for item in items],
+            }
+    
+    return export_tables_to_excel(
+        tables,
+        filename,
+        number_formats={'Значення': '#,##0.0000', 'Висота (м)': '0.0', 'Тиск (Па)': '0.0'},
+        column_widths={'Параметр': 32, 'Значення': 20}
+    )
 
 
+@instrument('export.excel_pattern')
 def export_pattern_to_excel(pattern: Dict[str, Any], filename: Optional[str] = None) -> str:
     """
     Експортує викрійку в Excel файл
@@ -216,82 +150,91 @@ def export_pattern_to_excel(pattern: Dict[str, Any], filename: Optional[str] = N
     Returns:
         Шлях до збереженого файлу
     """
-    if not PANDAS_AVAILABLE:
-        raise ImportError("Для експорту в Excel потрібна бібліотека pandas. Встановіть: pip install pandas openpyxl")
+    from balloon.export.excel_export import export_tables_to_excel
     
+    pattern_type = pattern.get('pattern_type', 'unknown')
     if filename is None:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        pattern_type = pattern.get('pattern_type', 'unknown')
         filename = f"balloon_pattern_{pattern_type}_{timestamp}.xlsx"
     
-    pattern_type = pattern.get('pattern_type', 'unknown')
-    
-    with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-        # Інформація про викрійку
-        info_data = [
-            ['Тип викрійки', pattern_type],
-            ['Кількість сегментів', pattern.get('num_gores', pattern.get('num_segments', 0))],
-            ['Загальна площа', f"{pattern.get('total_area', 0):.4f} м²"],
-            ['Довжина швів', f"{pattern.get('seam_length', 0):.4f} м"],
-        ]
-        if 'seam_allowance_m' in pattern:
-            info_data.append(['Припуск на шов', f"{pattern['seam_allowance_m'] * 1000:.1f} мм"])
-        info_df = pd.DataFrame(info_data, columns=['Параметр', 'Значення'])
-        info_df.to_excel(writer, sheet_name='Інформація', index=False)
-        
-        # Координати точок
-        if 'points' in pattern:
-            points = pattern['points']
-            if isinstance(points, list) and len(points) > 0:
-                points_data = []
-                for i, point in enumerate(points):
-                    if isinstance(point, (list, tuple)) and len(point) >= 2:
-                        points_data.append({
-                            'Точка': i + 1,
-                            'X (м)': point[0],
-                            'Y (м)': point[1],
-                        })
-                    elif isinstance(point, dict):
-                        points_data.append({
-                            'Точка': i + 1,
-                            'X (м)': point.get('x', point.get('X', 0)),
-                            'Y (м)': point.get('y', point.get('Y', 0)),
-                        })
-                
-                if points_data:
-                    points_df = pd.DataFrame(points_data)
-                    points_df.to_excel(writer, sheet_name='Координати', index=False)
-    
-    return os.path.abspath(filename)
+    # Інформація про викрійку
+    info = [
+        {'Параметр': 'Тип викрійки', 'Значення': pattern_type},
+        {'Параметр': 'Кількість сегментів', 'Значення': pattern.get('num_gores', pattern.get('num_segments', 0))},
+        {'Параметр': 'Загальна площа', 'Значення': float(pattern.get('total_area', 0)), 'Одиниця': 'м²'},
+        {'Параметр': 'Довжина швів', 'Значення': float(pattern.get('seam_length', 0)), 'Одиниця': 'м'},
+    ]
+    if 'seam_allowance_m' in pattern:
+        info.append({'Параметр': 'Припуск на шов', 'Значення': pattern['seam_allowance_m'] * 1000, 'Одиниця': 'мм'})
+    tables = {
+        'Інформація': {
+            'Параметр': [row['Параметр'] for row in info],
+            'Значення': [row['Значення'] for row in info],
+            'Одиниця': [row.get('Одиниця') for row in info],
+        }
+    }
+    
+    # Координати точок
+    points = pattern.get('points')
+    if isinstance(points, list) and len(points) > 0:
+        coords = []
+        for point in points:
+            if isinstance(point, (list, tuple)) and len(point) >= 2:
+                coords.append((float(point[0]), float(point[1])))
+            elif isinstance(point, dict):
+                coords.append((float(point.get('x', point.get('X', 0))), float(point.get('y', point.get('Y', 0)))))
+        if coords:
+            tables['Координати'] = {
+                'Точка': list(range(1, len(coords) + 1)),
+                'X (м)': [x for x, _ in coords],
+                'Y (м)': [y for _, y in coords],
+            }
+    
+    return export_tables_to_excel(
+        tables,
+        filename,
+        number_formats={'X (м)': '0.000000', 'Y (м)': '0.000000'},
+        column_widths={'Параметр': 24}
+    )
 
 
+@instrument('export.svg_single')
 def export_pattern_to_svg(pattern: Dict[str, Any], filename: str, scale_mm_per_m: float = 1000.0, 
                           seam_allowance_mm: float = 10.0, add_notches: bool = True, 
-                          add_centerline: bool = True) -> str:
+                          add_centerline: bool = True, precision: int = 2,
+                          tolerance_mm: Optional[float] = None) -> str:
     """
     Експортує викрійку в SVG файл (масштаб 1:1)
     
+    Документ пишеться потоково через SvgWriter (буферизований запис у файл,
+    компактні відносні шляхи). Для аркуша з усіма gores див.
+    balloon.export.svg_export.export_gores_to_svg.
+    
     Args:
         pattern: Словник з даними викрійки
         filename: Ім'я файлу для збереження
         scale_mm_per_m: Масштаб (мм на метр) - для 1:1 використовувати 1000
         seam_allowance_mm: Припуск на шов (мм) - вже додано в pattern, але може бути корисним для відображення
+        precision: Кількість знаків після коми для координат (мм)
+        tolerance_mm: Допуск апроксимації контурів кривими Безьє (мм);
+            None - контури записуються полілініями без спрощення
     
     Returns:
         Шлях до збереженого файлу
     """
+    from balloon.export.svg_export import SvgWriter, SVG_BUFFER_SIZE, write_gore
+    from balloon.export.contours import notch_y_positions, pattern_bounds
+    
     pattern_type = pattern.get('pattern_type', 'unknown')
     points = pattern.get('points', [])
     
     if not points:
         raise ValueError("Патерн не містить координат для експорту")
     
-    # Знаходимо розміри для viewBox
-    max_x = max(x for x, y in points) if points else 0
-    max_y = max(y for x, y in points) if points else 0
+    half_width, min_y, max_y = pattern_bounds(points)
     
     # Конвертуємо в мм
-    width_mm = max_x * scale_mm_per_m
+    width_mm = 2 * half_width * scale_mm_per_m
     height_mm = max_y * scale_mm_per_m
     
     # Додаємо відступи для припуску та міток
@@ -299,104 +242,90 @@ def export_pattern_to_svg(pattern: Dict[str, Any], filename: str, scale_mm_per_m
     total_width = width_mm + 2 * padding_mm
     total_height = height_mm + 2 * padding_mm
     
-    # Створюємо SVG
-    svg_lines = [
-        '<?xml version="1.0" encoding="UTF-8"?>',
-        f'<svg xmlns="http://www.w3.org/2000/svg" width="{total_width:.2f}mm" height="{total_height:.2f}mm"',
-        f'     viewBox="0 0 {total_width:.2f} {total_height:.2f}">',
-        '  <defs>',
-        '    <style>',
-        '      .pattern-line { stroke: #000; stroke-width: 0.5; fill: none; }',
-        '      .seam-line { stroke: #f00; stroke-width: 0.3; stroke-dasharray: 2,2; fill: none; }',
-        '      .cut-line { stroke: #00f; stroke-width: 0.5; fill: none; }',
-        '      .center-line { stroke: #0a0; stroke-width: 0.2; stroke-dasharray: 5,5; fill: none; }',
-        '      .notch { stroke: #f00; stroke-width: 0.3; fill: none; }',
-        '      .text { font-family: Arial; font-size: 3mm; fill: #000; }',
-        '    </style>',
-        '  </defs>',
-        '  <g transform="translate(20, 20)">',  # Відступ для міток
-    ]
-    
-    # Малюємо викрійку
-    if len(points) > 1:
-        # Для gores: малюємо повний контур (одна половина + дзеркальна)
-        # Лінія викрійки (з припуском) - від центру вправо, потім вниз, потім дзеркально вліво
-        path_data = f'M 0,{points[0][1] * scale_mm_per_m:.2f}'  # Початок від центру
-        # Права сторона (з припуском)
-        for x, y in points:
-            path_data += f' L {x * scale_mm_per_m:.2f},{y * scale_mm_per_m:.2f}'
-        # Нижня точка (якщо потрібно)
-        if points[-1][0] > 0:
-            path_data += f' L {points[-1][0] * scale_mm_per_m:.2f},{points[-1][1] * scale_mm_per_m:.2f}'
-        # Ліва сторона (дзеркально, з припуском)
-        for x, y in reversed(points):
-            path_data += f' L {-x * scale_mm_per_m:.2f},{y * scale_mm_per_m:.2f}'
-        path_data += ' Z'
-        
-        svg_lines.append(f'    <path class="cut-line" d="{path_data}"/>')
-        
-        # Осьова лінія (центральна лінія gore) - якщо потрібно
-        if add_centerline:
-            y_start = points[0][1] * scale_mm_per_m
-            y_end = points[-1][1] * scale_mm_per_m
-            svg_lines.append(f'    <line x1="0" y1="{y_start:.2f}" x2="0" y2="{y_end:.2f}" class="center-line"/>')
-        
-        # Мітки суміщення (notches) - якщо потрібно
-        if add_notches and len(points) > 4:
-            # Використовуємо notches з pattern, якщо вони є, інакше обчислюємо
-            notch_y_positions = pattern.get('notches', [])
-            if not notch_y_positions:
-                # Fallback: обчислюємо позиції по довжині меридіану
-                meridian_length = pattern.get('meridian_length', 0)
-                if meridian_length > 0:
-                    notch_positions = [0.1, 0.3, 0.5, 0.7, 0.9]
-                    notch_y_positions = [pos * meridian_length for pos in notch_positions]
-            
-            # Знаходимо точки на контурі, найближчі до позицій notches
-            for notch_y in notch_y_positions:
-                # Знаходимо найближчу точку по Y
-                closest_idx = min(range(len(points)), key=lambda i: abs(points[i][1] - notch_y))
-                if 0 <= closest_idx < len(points):
-                    x, y = points[closest_idx]
-                    y_mm = y * scale_mm_per_m
-                    # Мітка: коротка лінія перпендикулярна до контуру (назовні)
-                    notch_length = 5.0  # 5 мм
-                    # Права сторона
-                    svg_lines.append(f'    <line x1="{x * scale_mm_per_m:.2f}" y1="{y_mm:.2f}" '
-                                   f'x2="{(x + notch_length) * scale_mm_per_m:.2f}" y2="{y_mm:.2f}" class="notch"/>')
-                    # Ліва сторона (дзеркально)
-                    svg_lines.append(f'    <line x1="{-x * scale_mm_per_m:.2f}" y1="{y_mm:.2f}" '
-                                   f'x2="{(-x - notch_length) * scale_mm_per_m:.2f}" y2="{y_mm:.2f}" class="notch"/>')
-        
-        # Лінія шва (без припуску) - якщо є seam_allowance
-        if 'seam_allowance_m' in pattern and pattern['seam_allowance_m'] > 0:
-            allowance_m = pattern['seam_allowance_m']
-            seam_path_data = f'M 0,{points[0][1] * scale_mm_per_m:.2f}'  # Початок від центру
-            # Права сторона (без припуску)
-            for x, y in points:
-                seam_path_data += f' L {(x - allowance_m) * scale_mm_per_m:.2f},{y * scale_mm_per_m:.2f}'
-            # Ліва сторона (дзеркально, без припуску)
-            for x, y in reversed(points):
-                seam_path_data += f' L {(-x + allowance_m) * scale_mm_per_m:.2f},{y * scale_mm_per_m:.2f}'
-            seam_path_data += ' Z'
-            svg_lines.append(f'    <path class="seam-line" d="{seam_path_data}"/>')
-    
-    # Додаємо мітки та інформацію
-    svg_lines.extend([
-        f'    <text x="0" y="-5" class="text">{pattern_type}</text>',
-        f'    <text x="0" y="{height_mm + 10:.2f}" class="text">Масштаб 1:1 ({scale_mm_per_m} мм/м)</text>',
-    ])
-    
-    if 'seam_allowance_m' in pattern:
-        svg_lines.append(f'    <text x="0" y="{height_mm + 15:.2f}" class="text">Припуск на шов: {pattern["seam_allowance_m"] * 1000:.1f} мм</text>')
+    # Осьова лінія gore посередині аркуша
+    def to_svg(x: float, y: float):
+        return (x * scale_mm_per_m, y * scale_mm_per_m)
     
-    svg_lines.extend([
-        '  </g>',
-        '</svg>',
-    ])
+    gore = pattern
+    if add_notches and len(points) > 4 and not notch_y_positions(pattern):
+        # Fallback: обчислюємо позиції по довжині меридіану
+        meridian_length = pattern.get('meridian_length', 0)
+        if meridian_length > 0:
+            gore = dict(pattern, notches=[pos * meridian_length for pos in [0.1, 0.3, 0.5, 0.7, 0.9]])
     
-    # Зберігаємо файл
-    with open(filename, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(svg_lines))
+    with open(filename, 'w', encoding='utf-8', buffering=SVG_BUFFER_SIZE) as fh:
+        with SvgWriter(fh, total_width, total_height, precision=precision) as svg:
+            svg.open_group(translate=(padding_mm + width_mm / 2, padding_mm))
+            
+            if len(points) > 1:
+                deviation_mm = write_gore(
+                    svg, gore, to_svg,
+                    add_notches=add_notches and len(points) > 4,
+                    add_centerline=add_centerline,
+                    tolerance_mm=tolerance_mm
+                )
+            
+            # Мітки та інформація
+            svg.text(-width_mm / 2, -5, pattern_type)
+            svg.text(-width_mm / 2, height_mm + 10, f"Масштаб 1:1 ({scale_mm_per_m} мм/м)")
+            if 'seam_allowance_m' in pattern:
+                svg.text(-width_mm / 2, height_mm + 15,
+                         f"Припуск на шов: {pattern['seam_allowance_m'] * 1000:.1f} мм")
+            if tolerance_mm is not None and len(points) > 1:
+                svg.text(-width_mm / 2, height_mm + 20,
+                         f"Допуск {tolerance_mm:g} мм, макс. відхилення контуру {deviation_mm:.3f} мм")
     
     return os.path.abspath(filename)
+
+
+def _pattern_exporter(fmt: str, full_job: bool) -> Callable:
+    import balloon.export as export
+
+    names = {
+        'svg': 'export_gores_to_svg' if full_job else 'export_pattern_to_svg',
+        'dxf': 'export_gores_to_dxf' if full_job else 'export_pattern_to_dxf',
+        'pdf': 'export_pattern_to_pdf',
+        'hpgl': 'export_pattern_to_hpgl',
+        'gcode': 'export_pattern_to_gcode',
+        'xlsx': 'export_pattern_to_excel',
+    }
+    func = getattr(export, names[fmt])
+    if func is None:
+        raise ImportError(f"Експорт у {fmt.upper()} недоступний: не встановлено потрібну бібліотеку")
+    return func
+
+
+def export_pattern_file(pattern: Dict[str, Any], fmt: str, filename: str, full_job: bool = True,
+                        progress: Optional[Callable[[float, str], None]] = None, **options) -> str:
+    """
+    Експортує викрійку у файл обраного формату
+
+    Args:
+        pattern: Словник з даними викрійки
+        fmt: Формат з EXPORT_FORMATS
+        filename: Шлях до файлу
+        full_job: Для SVG/DXF - усі gores на одному аркуші (False - один сегмент)
+        progress: Функція прогресу progress(частка, повідомлення) для форматів,
+            що її підтримують (PDF - по сторінках)
+        **options: Додаткові аргументи функції експорту (scale_mm_per_m, page_size, ...)
+
+    Returns:
+        Шлях до створеного файлу
+
+    Raises:
+        ValueError: Якщо формат невідомий або options не відповідають функції експорту
+        ImportError: Якщо для формату не встановлено бібліотеку
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Невідомий формат експорту: {fmt}; доступні: {', '.join(EXPORT_FORMATS)}")
+    full_job = full_job and 'gore' in pattern.get('pattern_type', '')
+    func = _pattern_exporter(fmt, full_job)
+    signature = inspect.signature(func)
+    if progress is not None and 'progress' in signature.parameters:
+        options['progress'] = progress
+    try:
+        signature.bind(pattern, filename, **options)
+    except TypeError as e:
+        raise ValueError(f"Некоректні параметри експорту {fmt}: {e}") from None
+    return func(pattern, filename, **options) or filename
+
@@ -0,0 +1,314 @@
+"""
+Графіки залежності параметрів аеростата від висоти
+
+HeightGraph будує 2×2 осі та лінії один раз; при зміні вхідних даних
+лініям лише передаються нові масиви NumPy (set_data), а межі осей
+перераховуються. Курсор висоти (вертикальні лінії, точки на кривих та
+підпис зі значеннями) малюється блітингом: фон фігури зберігається
+після кожного повного перемальовування, а при русі миші відновлюється
+і поверх нього малюються лише анімовані артисти курсора.
+
+Модуль не залежить від Tk: працює з будь-якою фігурою matplotlib,
+canvas якої підтримує copy_from_bbox/restore_region/blit.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+# Серії профілю, що показуються на графіках
+PROFILE_SERIES = ('height', 'payload', 'lift', 'net_lift_per_m3', 'required_volume')
+
+# Орієнтир підйомної сили на одиницю об'єму (кг/м³)
+TARGET_NET_LIFT = 0.5
+
+CURSOR_COLOR = '#555555'
+
+
+def profile_arrays(profile: Sequence[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """
+    Стовпці профілю висоти як масиви NumPy
+
+    Args:
+        profile: Результат calculate_height_profile (список словників)
+
+    Returns:
+        Словник серія -> масив float (відсутні значення - 0)
+    """
+    return {
+        name: np.fromiter((point.get(name, 0) or 0 for point in profile), dtype=float, count=len(profile))
+        for name in PROFILE_SERIES
+    }
+
+
+def key_points(arrays: Dict[str, np.ndarray]) -> Dict[str, Optional[float]]:
+    """
+    Ключові точки профілю: максимум навантаження та висота нульового навантаження
+
+    Returns:
+        Словник з payload_max, payload_max_height, zero_payload_height (None, якщо немає)
+    """
+    heights, payloads = arrays['height'], arrays['payload']
+    points: Dict[str, Optional[float]] = {'payload_max': None, 'payload_max_height': None, 'zero_payload_height': None}
+    if len(payloads):
+        index = int(np.argmax(payloads))
+        points['payload_max'] = float(payloads[index])
+        points['payload_max_height'] = float(heights[index])
+        zero = np.flatnonzero(payloads <= 0)
+        if len(zero):
+            points['zero_payload_height'] = float(heights[zero[0]])
+    return points
+
+
+class HeightCursor:
+    """
+    Курсор висоти з блітингом
+
+    Args:
+        fig: Фігура matplotlib
+        axes: Осі, над якими реагує курсор (включно з twinx)
+        targets: Лінії даних, на яких курсор ставить точку
+            (у найближчій за висотою вершині)
+    """
+
+    def __init__(self, fig, axes: Sequence[Any], targets: Sequence[Any]):
+        self.fig = fig
+        self.canvas = fig.canvas
+        self.axes = list(axes)
+        self.use_blit = bool(getattr(self.canvas, 'supports_blit', False))
+        self.heights = np.empty(0)
+        self.index: Optional[int] = None
+        self._values: Dict[str, np.ndarray] = {}
+        self._background = None
+
+        animated = {'animated': self.use_blit, 'visible': False}
+        hosts = []
+        for ax in self.axes:
+            # twinx ділить вісь x з основними осями - одна вертикальна лінія на пару
+            if not any(host.get_shared_x_axes().joined(ax, host) for host in hosts):
+                hosts.append(ax)
+        self.vlines = [ax.axvline(0, color=CURSOR_COLOR, linewidth=0.8, linestyle=':', **animated) for ax in hosts]
+        self.markers = []
+        for line in targets:
+            marker, = line.axes.plot([], [], 'o', color=line.get_color(), markersize=5, **animated)
+            self.markers.append((line, marker))
+        self.readout = fig.text(0.5, 0.005, '', ha='center', va='bottom', fontsize=9,
+                                bbox=dict(boxstyle='round', facecolor='#ffffe0', alpha=0.9), **animated)
+
+        self._cids = [
+            self.canvas.mpl_connect('draw_event', self._on_draw),
+            self.canvas.mpl_connect('motion_notify_event', self._on_move),
+            self.canvas.mpl_connect('axes_leave_event', self._on_leave),
+        ]
+
+    @property
+    def artists(self) -> List[Any]:
+        return self.vlines + [marker for _, marker in self.markers] + [self.readout]
+
+    @property
+    def visible(self) -> bool:
+        return self.index is not None
+
+    def set_data(self, arrays: Dict[str, np.ndarray]):
+        """Нові дані профілю (курсор ховається до наступного руху миші)"""
+        self.heights = arrays['height']
+        self._values = arrays
+        self.hide(redraw=False)
+
+    def move_to(self, height: float):
+        """Ставить курсор на найближчу до height точку профілю"""
+        if not len(self.heights):
+            return
+        index = int(np.argmin(np.abs(self.heights - height)))
+        if index == self.index:
+            return
+        self.index = index
+
+        h = self.heights[index]
+        for vline in self.vlines:
+            vline.set_xdata([h, h])
+        for line, marker in self.markers:
+            x, y = line.get_data()
+            marker.set_data([x[index]], [y[index]])
+        values = self._values
+        self.readout.set_text(
+            f"Висота: {h:.0f} м   Навантаження: {values['payload'][index]:.1f} кг   "
+            f"Підйомна сила: {values['lift'][index]:.1f} кг   "
+            f"На м³: {values['net_lift_per_m3'][index]:.3f} кг/м³   "
+            f"Об'єм: {values['required_volume'][index]:.1f} м³"
+        )
+        for artist in self.artists:
+            artist.set_visible(True)
+        self._refresh()
+
+    def hide(self, redraw: bool = True):
+        """Ховає курсор"""
+        if self.index is None:
+            return
+        self.index = None
+        for artist in self.artists:
+            artist.set_visible(False)
+        if redraw:
+            self._refresh()
+
+    def disconnect(self):
+        for cid in self._cids:
+            self.canvas.mpl_disconnect(cid)
+        self._cids = []
+
+    def _on_draw(self, event):
+        if self.use_blit:
+            # Анімовані артисти не входять у повне перемальовування - це чистий фон
+            self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+            self._draw_artists()
+
+    def _on_move(self, event):
+        if event.inaxes in self.axes and event.xdata is not None:
+            self.move_to(event.xdata)
+        else:
+            self.hide()
+
+    def _on_leave(self, event):
+        self.hide()
+
+    def _refresh(self):
+        if not self.use_blit:
+            self.canvas.draw_idle()
+            return
+        if self._background is None:
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_artists()
+        self.canvas.blit(self.fig.bbox)
+
+    def _draw_artists(self):
+        for artist in self.artists:
+            if artist.get_visible():
+                self.fig.draw_artist(artist)
+
+
+class HeightGraph:
+    """
+    Постійне вікно графіків залежності параметрів від висоти
+
+    Args:
+        fig: Порожня фігура matplotlib
+    """
+
+    def __init__(self, fig):
+        self.fig = fig
+        self.canvas = fig.canvas
+        self.arrays: Dict[str, np.ndarray] = {}
+        self._annotations: List[Any] = []
+
+        fig.suptitle('Залежність параметрів аеростата від висоти', fontsize=14, fontweight='bold')
+        axes = fig.subplots(2, 2)
+        ax1, ax2, ax3, ax4 = axes[0, 0], axes[0, 1], axes[1, 0], axes[1, 1]
+        ax4_twin = ax4.twinx()
+        self.axes = [ax1, ax2, ax3, ax4, ax4_twin]
+
+        # Графік 1: Навантаження та підйомна сила
+        self.payload_line, = ax1.plot([], [], 'b-', label='Корисне навантаження (кг)', linewidth=2)
+        self.lift_line, = ax1.plot([], [], 'g-', label='Підйомна сила (кг)', linewidth=2)
+        ax1.axhline(y=0, color='r', linestyle='--', alpha=0.5, label='Нульове навантаження')
+        self.payload_max_marker, = ax1.plot([], [], 'bo')
+        self.zero_payload_marker, = ax1.plot([], [], 'ro')
+        ax1.set_xlabel('Висота, м')
+        ax1.set_ylabel('Маса, кг')
+        ax1.set_title('Навантаження та підйомна сила')
+        ax1.legend(loc='upper right')
+        ax1.grid(True, alpha=0.3)
+
+        # Графік 2: Підйомна сила на м³
+        self.net_lift_line, = ax2.plot([], [], 'm-', label='Підйомна сила на м³', linewidth=2)
+        ax2.axhline(y=TARGET_NET_LIFT, color='orange', linestyle='--', alpha=0.6,
+                    label=f'Орієнтир {TARGET_NET_LIFT} кг/м³')
+        ax2.set_xlabel('Висота, м')
+        ax2.set_ylabel('Підйомна сила, кг/м³')
+        ax2.set_title('Підйомна сила на одиницю об\'єму')
+        ax2.legend()
+        ax2.grid(True, alpha=0.3)
+
+        # Графік 3: Об'єм кулі
+        self.volume_line, = ax3.plot([], [], 'c-', label='Об\'єм кулі', linewidth=2)
+        ax3.set_xlabel('Висота, м')
+        ax3.set_ylabel('Об\'єм, м³')
+        ax3.set_title('Зміна об\'єму кулі з висотою')
+        ax3.legend()
+        ax3.grid(True, alpha=0.3)
+
+        # Графік 4: Комбінований
+        self.combined_payload_line, = ax4.plot([], [], 'b-', label='Навантаження (кг)', linewidth=2)
+        self.combined_volume_line, = ax4_twin.plot([], [], 'r-', label='Об\'єм (м³)', linewidth=2)
+        ax4.set_xlabel('Висота, м')
+        ax4.set_ylabel('Навантаження, кг', color='b')
+        ax4_twin.set_ylabel('Об\'єм, м³', color='r')
+        ax4.set_title('Навантаження та об\'єм')
+        ax4.tick_params(axis='y', labelcolor='b')
+        ax4_twin.tick_params(axis='y', labelcolor='r')
+        ax4.spines['left'].set_color('b')
+        ax4.spines['right'].set_color('r')
+        lines = [self.combined_payload_line, self.combined_volume_line]
+        ax4.legend(lines, [line.get_label() for line in lines], loc='upper left', framealpha=0.9)
+        ax4.grid(True, alpha=0.3)
+
+        self.cursor = HeightCursor(fig, self.axes, [
+            self.payload_line, self.lift_line, self.net_lift_line, self.volume_line, self.combined_volume_line,
+        ])
+
+    def update(self, profile: Sequence[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        """
+        Показує новий профіль висоти
+
+        Args:
+            profile: Результат calculate_height_profile
+
+        Returns:
+            Масиви профілю (profile_arrays)
+        """
+        arrays = profile_arrays(profile)
+        self.arrays = arrays
+        heights = arrays['height']
+
+        self.payload_line.set_data(heights, arrays['payload'])
+        self.lift_line.set_data(heights, arrays['lift'])
+        self.net_lift_line.set_data(heights, arrays['net_lift_per_m3'])
+        self.volume_line.set_data(heights, arrays['required_volume'])
+        self.combined_payload_line.set_data(heights, arrays['payload'])
+        self.combined_volume_line.set_data(heights, arrays['required_volume'])
+        self._update_key_points(arrays)
+
+        self.cursor.set_data(arrays)
+        for ax in self.axes:
+            ax.relim(visible_only=True)
+            ax.autoscale_view()
+        self.canvas.draw_idle()
+        return arrays
+
+    def _update_key_points(self, arrays: Dict[str, np.ndarray]):
+        """Маркери та підписи максимуму навантаження і нульового навантаження"""
+        for annotation in self._annotations:
+            annotation.remove()
+        self._annotations = []
+        ax1 = self.axes[0]
+        points = key_points(arrays)
+
+        payload_max, payload_max_h = points['payload_max'], points['payload_max_height']
+        if payload_max is not None:
+            self.payload_max_marker.set_data([payload_max_h], [payload_max])
+            self._annotations.append(ax1.annotate(
+                f"max {payload_max:.1f} кг", xy=(payload_max_h, payload_max),
+                xytext=(payload_max_h, payload_max + 1),
+                arrowprops=dict(arrowstyle="->", color='blue'), color='blue'))
+        else:
+            self.payload_max_marker.set_data([], [])
+
+        zero_h = points['zero_payload_height']
+        if zero_h is not None:
+            self.zero_payload_marker.set_data([zero_h], [0])
+            self._annotations.append(ax1.annotate(
+                f"0 кг @ {zero_h:.0f} м", xy=(zero_h, 0),
+                xytext=(zero_h, payload_max * 0.1 if payload_max else 1),
+                arrowprops=dict(arrowstyle="->", color='red'), color='red'))
+        else:
+            self.zero_payload_marker.set_data([], [])
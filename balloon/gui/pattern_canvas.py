@@ -0,0 +1,417 @@
+"""
+Відображення 2D викрійки на Tk canvas
+
+Для кожної викрійки один раз будується сцена (PatternScene): контур
+сегмента в метрах (права половина + дзеркальна ліва як одна замкнена
+лінія), мітки суміщення, розмірні лінії та правило вписування в
+canvas. Малювання - одне афінне перетворення NumPy на набір точок і
+один create_line на контур.
+
+При зміні розміру canvas елементи, прив'язані до викрійки, не
+перемальовуються: вони масштабуються canvas.scale і зсуваються
+canvas.move з попереднього перетворення в нове. Заново малюється лише
+оверлей, прив'язаний до рамки canvas (сітка, заголовок, підписи
+внизу), - кілька десятків елементів незалежно від кількості точок.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+# Розмір за замовчуванням, поки canvas ще не показано
+DEFAULT_WIDTH = 400
+DEFAULT_HEIGHT = 500
+
+# Теги елементів canvas
+SCENE_TAG = 'pattern'
+SCALABLE_TAG = 'pattern-scalable'
+OVERLAY_TAG = 'pattern-overlay'
+
+OUTLINE_COLOR = "#4a90e2"
+DIMENSION_COLOR = "#66d17c"
+NOTCH_COLOR = "#ff6b6b"
+NOTCH_LENGTH_PX = 5
+
+
+class Affine(NamedTuple):
+    """Перетворення світ (м) -> екран (пікселі): x' = sx*x + tx, y' = sy*y + ty"""
+    sx: float
+    sy: float
+    tx: float
+    ty: float
+
+    def apply(self, xy: np.ndarray) -> np.ndarray:
+        return xy * (self.sx, self.sy) + (self.tx, self.ty)
+
+
+@dataclass
+class CanvasItem:
+    """
+    Елемент canvas у світових координатах
+
+    offsets - зсув вершин у пікселях (мітки, підписи біля розмірних
+    ліній); такі елементи не масштабуються, а переставляються.
+    """
+    kind: str
+    coords: np.ndarray
+    options: Dict[str, Any] = field(default_factory=dict)
+    offsets: Optional[np.ndarray] = None
+
+    def screen_coords(self, affine: Affine) -> List[float]:
+        xy = affine.apply(self.coords)
+        if self.offsets is not None:
+            xy = xy + self.offsets
+        return xy.ravel().tolist()
+
+
+@dataclass
+class PatternScene:
+    """
+    Підготовлена до малювання викрійка
+
+    Args:
+        items: Елементи, прив'язані до викрійки
+        fit: fit(width, height) -> Affine
+        overlay: overlay(width, height) -> елементи в екранних координатах
+    """
+    items: List[CanvasItem]
+    fit: Callable[[int, int], Affine]
+    overlay: Callable[[int, int], List[CanvasItem]]
+
+
+def _screen(kind: str, coords: Sequence[float], **options) -> CanvasItem:
+    """Елемент оверлею (координати вже екранні)"""
+    return CanvasItem(kind, np.asarray(coords, dtype=float).reshape(-1, 2), options)
+
+
+def _gore_outline(points: np.ndarray) -> np.ndarray:
+    """Замкнений контур сегмента: права половина та дзеркальна ліва у зворотному порядку"""
+    mirrored = points[::-1] * (-1.0, 1.0)
+    return np.concatenate([points, mirrored, points[:1]])
+
+
+def _notch_items(points: np.ndarray, notches: Sequence[float]) -> List[CanvasItem]:
+    """Мітки суміщення на обох краях сегмента біля найближчих за висотою точок"""
+    if not len(notches) or not len(points):
+        return []
+    nearest = np.abs(points[:, 1][:, None] - np.asarray(notches, dtype=float)[None, :]).argmin(axis=0)
+    items = []
+    for x, y in points[nearest]:
+        for sign in (1.0, -1.0):
+            items.append(CanvasItem(
+                'line', np.array([[sign * x, y], [sign * x, y]]),
+                {'fill': NOTCH_COLOR, 'width': 2},
+                offsets=np.array([[0.0, 0.0], [sign * NOTCH_LENGTH_PX, 0.0]]),
+            ))
+    return items
+
+
+def _centerline(points: np.ndarray) -> CanvasItem:
+    return CanvasItem('line', np.array([[0.0, points[0, 1]], [0.0, points[-1, 1]]]),
+                      {'fill': "#ffffff", 'width': 1, 'dash': (5, 5)})
+
+
+def _grid_overlay(width: int, height: int, pattern: Dict[str, Any]) -> List[CanvasItem]:
+    """Координатна сітка, осі та мітки масштабу"""
+    items = []
+    grid_spacing = 50
+    for x in range(0, width, grid_spacing):
+        items.append(_screen('line', (x, 0, x, height), fill="#333333", width=1))
+    for y in range(0, height, grid_spacing):
+        items.append(_screen('line', (0, y, width, y), fill="#333333", width=1))
+
+    center_x = width / 2
+    center_y = height / 2
+    items.append(_screen('line', (center_x, 0, center_x, height), fill="#444444", width=1, dash=(2, 2)))
+    items.append(_screen('line', (0, center_y, width, center_y), fill="#444444", width=1, dash=(2, 2)))
+
+    max_width = pattern.get('max_width', 0)
+    meridian_length = pattern.get('meridian_length', 0)
+    if max_width > 0:
+        scale = (width * 0.75) / (2 * max_width)
+        for i in range(5):
+            x_mark = center_x + (max_width * i / 4) * scale
+            items.append(_screen('line', (x_mark, center_y - 5, x_mark, center_y + 5), fill="#666666", width=1))
+            if i > 0:
+                items.append(_screen('text', (x_mark, center_y + 15), text=f"{max_width * i / 4:.2f}м",
+                                     fill="#888888", font=("Arial", 7)))
+    if meridian_length > 0:
+        scale = (height * 0.75) / meridian_length
+        for i in range(5):
+            y_mark = center_y - (meridian_length * i / 4) * scale
+            items.append(_screen('line', (center_x - 5, y_mark, center_x + 5, y_mark), fill="#666666", width=1))
+            if i > 0:
+                items.append(_screen('text', (center_x - 15, y_mark), text=f"{meridian_length * i / 4:.2f}м",
+                                     fill="#888888", font=("Arial", 7), anchor="e"))
+
+    if pattern.get('seam_allowance_method', 'simple') == 'shapely_normal_offset':
+        items.append(_screen('text', (width - 10, height - 10), text="Припуск: нормальний offset",
+                             fill="#66d17c", font=("Arial", 8), anchor="se"))
+    return items
+
+
+def _sphere_scene(pattern: Dict[str, Any], points: np.ndarray) -> PatternScene:
+    max_x = float(np.abs(points[:, 0]).max())
+    max_y = float(np.abs(points[:, 1]).max())
+
+    def fit(width, height):
+        scale_x = (width * 0.75) / (2 * max_x) if max_x > 0 else 1
+        scale_y = (height * 0.75) / (2 * max_y) if max_y > 0 else 1
+        scale = min(scale_x, scale_y)
+        return Affine(scale, -scale, width / 2, height / 2)
+
+    items = [
+        CanvasItem('line', _gore_outline(points),
+                   {'fill': OUTLINE_COLOR, 'width': 3, 'capstyle': "round", 'joinstyle': "round"}),
+        _centerline(points),
+    ]
+
+    # Розмірні лінії: прив'язані до масштабу викрійки, підписи - з відступом у пікселях
+    max_width = pattern.get('max_width', 0)
+    if max_width > 0:
+        half = max_width / 2
+        items.append(CanvasItem('line', np.array([[0.0, half], [half, half]]),
+                                {'fill': DIMENSION_COLOR, 'width': 1, 'dash': (3, 3)}))
+        items.append(CanvasItem('text', np.array([[half / 2, half]]),
+                                {'text': f"Макс. ширина: {max_width:.2f} м", 'fill': DIMENSION_COLOR,
+                                 'font': ("Arial", 8)},
+                                offsets=np.array([[0.0, -10.0]])))
+    meridian_length = pattern.get('meridian_length', 0)
+    if meridian_length > 0:
+        half = meridian_length / 2
+        items.append(CanvasItem('line', np.array([[max_x, half], [max_x, -half]]),
+                                {'fill': DIMENSION_COLOR, 'width': 1, 'dash': (3, 3)},
+                                offsets=np.array([[10.0, 0.0], [10.0, 0.0]])))
+        items.append(CanvasItem('text', np.array([[max_x, 0.0]]),
+                                {'text': f"Довжина (по шву): {meridian_length:.2f} м", 'fill': DIMENSION_COLOR,
+                                 'font': ("Arial", 8), 'anchor': "w"},
+                                offsets=np.array([[15.0, 0.0]])))
+    items.extend(_notch_items(points, pattern.get('notches', [])))
+
+    def overlay(width, height):
+        overlay_items = _grid_overlay(width, height, pattern)
+        overlay_items.append(_screen('text', (width / 2, 20),
+                                     text=f"Сегмент (1 з {pattern.get('num_gores', 12)})",
+                                     fill="#ffffff", font=("Arial", 11, "bold")))
+        radius = pattern.get('radius', 0)
+        if radius > 0:
+            overlay_items.append(_screen('text', (width / 2, height - 30), text=f"Радіус сфери: {radius:.2f} м",
+                                         fill="#888888", font=("Arial", 9)))
+        return overlay_items
+
+    return PatternScene(items, fit, overlay)
+
+
+def _gore_caption(title: str, caption: str) -> Callable[[int, int], List[CanvasItem]]:
+    def overlay(width, height):
+        return [
+            _screen('text', (width / 2, 20), text=title, fill="#ffffff", font=("Arial", 12, "bold")),
+            _screen('text', (width / 2, height - 40), text=caption, fill="#cccccc",
+                    font=("Arial", 9), justify="center"),
+        ]
+    return overlay
+
+
+def _pear_scene(pattern: Dict[str, Any], points: np.ndarray) -> PatternScene:
+    # y - меридіанна довжина, x - півширина; по висоті викрійка розтягується на 80% canvas
+    min_y = float(points[:, 1].min())
+    max_y = float(points[:, 1].max())
+    max_x = float(np.abs(points[:, 0]).max())
+    y_range = (max_y - min_y if max_y > min_y else max_y) or 1.0
+
+    def fit(width, height):
+        scale_x = (width * 0.75) / (2 * max_x) if max_x > 0 else 1
+        scale = min(scale_x, (height * 0.75) / y_range)
+        padding = height * 0.1
+        available_height = height - 2 * padding
+        sy = -available_height / y_range
+        return Affine(scale, sy, width / 2, padding + available_height - sy * min_y)
+
+    items = [
+        CanvasItem('line', _gore_outline(points), {'fill': OUTLINE_COLOR, 'width': 2}),
+        _centerline(points),
+    ]
+    items.extend(_notch_items(points, pattern.get('notches', [])))
+    overlay = _gore_caption(
+        f"Сегмент груші ({pattern.get('num_gores', 12)} сегментів)",
+        f"Висота: {pattern.get('height', 3.0):.2f} м\n"
+        f"Верхній радіус: {pattern.get('top_radius', 1.2):.2f} м\n"
+        f"Нижній радіус: {pattern.get('bottom_radius', 0.6):.2f} м",
+    )
+    return PatternScene(items, fit, overlay)
+
+
+def _cigar_scene(pattern: Dict[str, Any], points: np.ndarray) -> PatternScene:
+    max_y = float(points[:, 1].max()) or 1.0
+    max_x = float(points[:, 0].max()) or 1.0
+
+    def fit(width, height):
+        scale = min((width * 0.8) / (2 * max_x), (height * 0.8) / max_y)
+        return Affine(scale, scale, width / 2, height / 2 - scale * max_y / 2)
+
+    items = [CanvasItem('line', _gore_outline(points), {'fill': OUTLINE_COLOR, 'width': 2})]
+    items.extend(_notch_items(points, pattern.get('notches', [])))
+    overlay = _gore_caption(
+        f"Сегмент сигари ({pattern.get('num_gores', 12)} сегментів)",
+        f"Довжина: {pattern.get('length', 5.0):.2f} м\nРадіус: {pattern.get('radius', 1.0):.2f} м",
+    )
+    return PatternScene(items, fit, overlay)
+
+
+def _pillow_overlay(pattern: Dict[str, Any]) -> Optional[Callable[[int, int], List[CanvasItem]]]:
+    """Подушка - дві панелі з фіксованим відступом у пікселях, тому вся малюється як оверлей"""
+    panels = pattern.get('panels', [])
+    if not panels:
+        return None
+    panel_w = panels[0].get('width', 0)
+    panel_h = panels[0].get('height', 0)
+    if panel_w <= 0 or panel_h <= 0:
+        return None
+    max_dim = max(panel_w, panel_h)
+    opening_side = pattern.get('opening_side', 'width')
+
+    def overlay(width, height):
+        scale = min((width * 0.7) / max_dim, (height * 0.35) / max_dim)
+        w, h = panel_w * scale, panel_h * scale
+        center_x = width / 2
+        x1 = center_x - w / 2
+        x2 = x1 + w
+        top1 = height * 0.15
+        top2 = top1 + h + 20
+        bottom2 = top2 + h
+        seam = {'fill': DIMENSION_COLOR, 'width': 2, 'dash': (5, 3)}
+        items = [
+            _screen('rectangle', (x1, top1, x2, top1 + h), outline=OUTLINE_COLOR, width=2),
+            _screen('text', (center_x, top1 - 15), text="Панель 1", fill="#ffffff", font=("Arial", 10, "bold")),
+            _screen('rectangle', (x1, top2, x2, bottom2), outline=OUTLINE_COLOR, width=2),
+            _screen('text', (center_x, top2 - 15), text="Панель 2", fill="#ffffff", font=("Arial", 10, "bold")),
+        ]
+        if opening_side == 'width':
+            # Отвір на лівій (короткій) стороні: шви зверху, знизу та справа
+            items += [
+                _screen('line', (x1, top2, x2, top2), **seam),
+                _screen('line', (x1, bottom2, x2, bottom2), **seam),
+                _screen('line', (x2, top2, x2, bottom2), **seam),
+                _screen('line', (x1, top2, x1, bottom2), fill=NOTCH_COLOR, width=3, dash=(10, 5)),
+                _screen('text', (x1 - 15, top2 + h / 2), text="НЕ ЗШИВАТИ\n(отвір)", fill=NOTCH_COLOR,
+                        font=("Arial", 9, "bold"), anchor="e", justify="center"),
+            ]
+        else:
+            # Отвір на верхній (довгій) стороні: шви зліва, справа та знизу
+            items += [
+                _screen('line', (x1, top2, x1, bottom2), **seam),
+                _screen('line', (x2, top2, x2, bottom2), **seam),
+                _screen('line', (x1, bottom2, x2, bottom2), **seam),
+                _screen('line', (x1, top2, x2, top2), fill=NOTCH_COLOR, width=3, dash=(10, 5)),
+                _screen('text', (center_x, top2 - 20), text="НЕ ЗШИВАТИ (отвір)", fill=NOTCH_COLOR,
+                        font=("Arial", 9, "bold"), anchor="s"),
+            ]
+        return items
+
+    return overlay
+
+
+_GORE_SCENES = {
+    'sphere_gore': _sphere_scene,
+    'pear_gore': _pear_scene,
+    'cigar_gore': _cigar_scene,
+}
+
+
+def build_pattern_scene(pattern: Dict[str, Any]) -> Optional[PatternScene]:
+    """
+    Будує сцену для викрійки
+
+    Args:
+        pattern: Результат generate_pattern_from_shape(_profile)
+
+    Returns:
+        PatternScene або None, якщо малювати нічого
+    """
+    pattern_type = pattern.get('pattern_type')
+    if pattern_type == 'pillow':
+        overlay = _pillow_overlay(pattern)
+        if overlay is None:
+            return None
+        return PatternScene([], lambda width, height: Affine(1.0, 1.0, 0.0, 0.0), overlay)
+
+    builder = _GORE_SCENES.get(pattern_type)
+    points = np.asarray(pattern.get('points', []), dtype=float).reshape(-1, 2)
+    if builder is None or not len(points):
+        return None
+    return builder(pattern, points)
+
+
+class PatternRenderer:
+    """
+    Малювання викрійки на canvas з кешуванням сцени
+
+    render() з новою викрійкою будує сцену і малює її повністю; з тією
+    самою викрійкою (зміна розміру canvas) - масштабує вже намальовані
+    елементи і перемальовує лише оверлей.
+
+    Args:
+        canvas: tk.Canvas
+    """
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self._pattern: Optional[Dict[str, Any]] = None
+        self._scene: Optional[PatternScene] = None
+        self._affine: Optional[Affine] = None
+        self._size = None
+        self._repositioned: List[tuple] = []
+
+    def render(self, pattern: Dict[str, Any], width: int, height: int):
+        """Малює викрійку для розміру canvas width x height"""
+        if width <= 1 or height <= 1:
+            width, height = DEFAULT_WIDTH, DEFAULT_HEIGHT
+        if pattern is self._pattern and self._scene is not None:
+            if (width, height) != self._size:
+                self._rescale(width, height)
+            return
+        self._draw(pattern, width, height)
+
+    def _draw(self, pattern, width, height):
+        self.canvas.delete("all")
+        self._pattern = pattern
+        self._scene = build_pattern_scene(pattern)
+        self._repositioned = []
+        self._size = (width, height)
+        if self._scene is None:
+            return
+        self._affine = self._scene.fit(width, height)
+        self._draw_overlay(width, height)
+        for item in self._scene.items:
+            tags = (SCENE_TAG, SCALABLE_TAG) if item.offsets is None else (SCENE_TAG,)
+            item_id = self._create(item, self._affine, tags)
+            if item.offsets is not None:
+                self._repositioned.append((item_id, item))
+
+    def _rescale(self, width, height):
+        """Перехід від попереднього перетворення до нового без перестворення контурів"""
+        old, new = self._affine, self._scene.fit(width, height)
+        self.canvas.scale(SCALABLE_TAG, old.tx, old.ty, new.sx / old.sx, new.sy / old.sy)
+        self.canvas.move(SCALABLE_TAG, new.tx - old.tx, new.ty - old.ty)
+        for item_id, item in self._repositioned:
+            self.canvas.coords(item_id, *item.screen_coords(new))
+        self._affine = new
+        self._size = (width, height)
+        self.canvas.delete(OVERLAY_TAG)
+        self._draw_overlay(width, height)
+
+    def _draw_overlay(self, width, height):
+        identity = Affine(1.0, 1.0, 0.0, 0.0)
+        for item in self._scene.overlay(width, height):
+            self._create(item, identity, (SCENE_TAG, OVERLAY_TAG))
+        # Сітка та підписи рамки - під контуром викрійки
+        self.canvas.tag_lower(OVERLAY_TAG)
+
+    def _create(self, item: CanvasItem, affine: Affine, tags):
+        coords = item.screen_coords(affine)
+        if item.kind == 'line':
+            return self.canvas.create_line(*coords, tags=tags, **item.options)
+        if item.kind == 'rectangle':
+            return self.canvas.create_rectangle(*coords, tags=tags, **item.options)
+        return self.canvas.create_text(*coords, tags=tags, **item.options)
@@ -1,30 +1,86 @@
 """
 Модуль для інтерактивної 3D візуалізації через Plotly
+
+Фігури кешуються в пам'яті як JSON (ключ - форма, параметри, дискретизація та
+ті значення результатів, що показуються на фігурі); кожен виклик отримує
+новий go.Figure, тож зміни фігури не потрапляють у кеш. HTML для
+перегляду зберігається в каталозі кешу під іменем-хешем тих самих
+параметрів: повторне відкриття незміненої моделі лише відкриває вже
+записаний файл. Усі HTML у каталозі посилаються на одну спільну копію
+plotly.min.js (include_plotlyjs='directory') замість ~3 МБ у кожному
+файлі. Координати сітки зберігаються як float32, округлені до
+MESH_DECIMALS знаків.
 """
 
+import json
+import logging
+import os
+import tempfile
+import webbrowser
+from pathlib import Path
+
 import numpy as np
 from typing import Optional
 
-try:
-    import plotly.graph_objects as go
-    import plotly.offline as pyo
-    PLOTLY_AVAILABLE = True
-except ImportError:
-    PLOTLY_AVAILABLE = False
+from balloon import perf_log
+from balloon.cache import default_cache_path, input_key, memoize, model_stamp
+from balloon.lazy_import import lazy_import, module_available
+
+# plotly імпортується при побудові першої фігури
+PLOTLY_AVAILABLE = module_available('plotly')
+go = lazy_import('plotly.graph_objects')
+pyo = lazy_import('plotly.offline')
+
+# Кількість фігур у кеші в пам'яті
+FIGURE_CACHE_SIZE = 16
+
+# Округлення координат сітки (м): 4 знаки = 0.1 мм
+MESH_DECIMALS = 4
+
+# Кількість HTML файлів, що зберігаються в каталозі кешу
+MAX_CACHED_HTML = 64
+
+# Змінна середовища з каталогом для HTML моделей
+HTML_DIR_ENV = 'BALLOON_PLOTLY_DIR'
 
 
-def create_3d_plotly(shape_code: str, shape_params: dict, results: dict = None, num_segments: int = 50) -> Optional[str]:
+def compact_mesh(*arrays):
+    """
+    Координати для JSON фігури: округлення до MESH_DECIMALS та float32
+
+    Plotly кодує масиви NumPy як типізовані (base64), тож float32
+    вдвічі зменшує обсяг даних сітки; округлення зменшує обсяг для
+    старих версій Plotly, що записують масиви як списки чисел.
+    """
+    compacted = tuple(np.round(np.asarray(a, dtype=float), MESH_DECIMALS).astype(np.float32) for a in arrays)
+    return compacted if len(compacted) != 1 else compacted[0]
+
+
+def _results_info(results: Optional[dict]) -> Optional[tuple]:
+    """Значення результатів, що впливають на фігуру (об'єм та площа)"""
+    if not results:
+        return None
+    return (results.get('required_volume', 0), results.get('surface_area', 0))
+
+
+def create_3d_plotly(shape_code: str, shape_params: dict, results: dict = None, num_segments: int = 50,
+                     overlay: Optional[dict] = None):
     """
     Створює інтерактивну 3D візуалізацію через Plotly
     
+    Фігура кешується як JSON: повторний виклик з тими самими параметрами
+    не будує сітку заново, а повертає новий go.Figure, який можна змінювати.
+    
     Args:
         shape_code: Код форми ('sphere', 'pillow', 'pear', 'cigar')
         shape_params: Параметри форми
         results: Результати розрахунку (опціонально)
         num_segments: Параметр дискретизації (той самий що використовується в patterns)
+        overlay: Межі сегментів на моделі (див. gore_overlay_from_pattern):
+            num_gores, notches (позиції по меридіану, м), seam_allowance_m
     
     Returns:
-        HTML рядок або None, якщо Plotly недоступний
+        plotly Figure або None, якщо Plotly недоступний
     """
     if not PLOTLY_AVAILABLE:
         return None
@@ -33,10 +89,27 @@ def create_3d_plotly(shape_code: str, shape_params: dict, results: dict = None,
     if shape_code is None:
         shape_code = 'sphere'
     shape_code = str(shape_code).lower().strip()
-    
-    # Логування для діагностики
-    import logging
-    logging.info(f"create_3d_plotly: shape_code={shape_code}, shape_params={shape_params}")
+    with perf_log.span('plotly.figure', shape=shape_code, params=shape_params, segments=num_segments,
+                       overlay=overlay is not None):
+        figure_json = _figure_json(shape_code, dict(shape_params or {}), _results_info(results), num_segments,
+                                   dict(overlay) if overlay else None)
+        # JSON уже перевіреної фігури: без повторної валідації (~10 мс для сітки)
+        return go.Figure(json.loads(figure_json), _validate=False)
+
+
+@memoize(maxsize=FIGURE_CACHE_SIZE)
+def _figure_json(shape_code: str, shape_params: dict, info: Optional[tuple], num_segments: int,
+                 overlay: Optional[dict] = None) -> str:
+    """JSON фігури (кешується: рядок незмінний, тож виклики не ділять спільний об'єкт)"""
+    return _build_figure(shape_code, shape_params, info, num_segments, overlay).to_json()
+
+
+def _build_figure(shape_code: str, shape_params: dict, info: Optional[tuple], num_segments: int,
+                  overlay: Optional[dict] = None):
+    """Побудова фігури за формою, параметрами, info та overlay"""
+    results = None
+    if info is not None:
+        results = {'required_volume': info[0], 'surface_area': info[1]}
     
     fig = None
     
@@ -61,14 +134,14 @@ def create_3d_plotly(shape_code: str, shape_params: dict, results: dict = None,
     # Всі rotational shapes використовують profile-based mesh з однаковим параметром дискретизації
     try:
         if shape_code == 'sphere':
-            fig = _create_sphere_plotly(shape_params, results, num_segments)
+            fig = _create_sphere_plotly(shape_params, results, num_segments, overlay)
         elif shape_code == 'pillow':
             # Pillow не є rotational shape, тому не використовує profile
             fig = _create_pillow_plotly(shape_params, results)
         elif shape_code == 'pear':
-            fig = _create_pear_plotly(shape_params, results, num_segments)
+            fig = _create_pear_plotly(shape_params, results, num_segments, overlay)
         elif shape_code == 'cigar':
-            fig = _create_cigar_plotly(shape_params, results, num_segments)
+            fig = _create_cigar_plotly(shape_params, results, num_segments, overlay)
         else:
             # Це не повинно статися, якщо реєстр працює правильно
             logging.error(f"Форма '{shape_code}' є в реєстрі, але не має 3D візуалізації")
@@ -144,7 +217,8 @@ def create_3d_plotly(shape_code: str, shape_params: dict, results: dict = None,
     return fig
 
 
-def _create_sphere_plotly(shape_params: dict, results: dict = None, num_segments: int = 50):
+def _create_sphere_plotly(shape_params: dict, results: dict = None, num_segments: int = 50,
+                         overlay: Optional[dict] = None):
     """Створює 3D сферу через Plotly з profile-based mesh (центр у 0)"""
     from balloon.shapes.profile import get_shape_profile
     
@@ -157,7 +231,9 @@ def _create_sphere_plotly(shape_params: dict, results: dict = None, num_segments
     
     # Покращена якість mesh: більше точок для кращої візуалізації
     enhanced_num_segments = max(num_segments, 60)  # Мінімум 60 для кращої якості
-    x, y, z = profile.generate_mesh(num_theta=enhanced_num_segments, num_z=enhanced_num_segments, center_at_origin=True)
+    x, y, z = compact_mesh(*profile.generate_mesh(
+        num_theta=enhanced_num_segments, num_z=enhanced_num_segments, center_at_origin=True
+    ))
     
     fig = go.Figure(data=[go.Surface(
         x=x, y=y, z=z,
@@ -174,6 +250,10 @@ def _create_sphere_plotly(shape_params: dict, results: dict = None, num_segments
         lightposition=dict(x=100, y=100, z=100)
     )])
     
+    # Межі сегментів для сфери - лише для згенерованої викрійки
+    if overlay:
+        _add_gore_overlay_to_fig(fig, x, y, z, **_overlay_options(shape_params, overlay))
+    
     radius = shape_params.get('radius', 1.0)
     fig.update_layout(
         title=f'Сферична куля<br>Радіус: {radius:.2f} м'
@@ -262,7 +342,8 @@ def _create_pillow_plotly(shape_params: dict, results: dict = None):
     return fig
 
 
-def _create_pear_plotly(shape_params: dict, results: dict = None, num_segments: int = 50):
+def _create_pear_plotly(shape_params: dict, results: dict = None, num_segments: int = 50,
+                         overlay: Optional[dict] = None):
     """Створює 3D грушу через Plotly з profile-based mesh"""
     from balloon.shapes.profile import get_shape_profile
     
@@ -275,7 +356,9 @@ def _create_pear_plotly(shape_params: dict, results: dict = None, num_segments:
     
     # Покращена якість mesh: більше точок для кращої візуалізації
     enhanced_num_segments = max(num_segments, 60)  # Мінімум 60 для кращої якості
-    x, y, z = profile.generate_mesh(num_theta=enhanced_num_segments, num_z=enhanced_num_segments, center_at_origin=True)
+    x, y, z = compact_mesh(*profile.generate_mesh(
+        num_theta=enhanced_num_segments, num_z=enhanced_num_segments, center_at_origin=True
+    ))
     
     fig = go.Figure(data=[go.Surface(
         x=x, y=y, z=z,
@@ -294,9 +377,7 @@ def _create_pear_plotly(shape_params: dict, results: dict = None, num_segments:
     
     # Додаємо gore overlay (межі сегментів) якщо є інформація про кількість сегментів
     # Це допомагає візуалізувати, як викрійка відповідає 3D моделі
-    num_gores = shape_params.get('num_gores', 12)
-    if num_gores > 0:
-        _add_gore_overlay_to_fig(fig, x, y, z, num_gores)
+    _add_gore_overlay_to_fig(fig, x, y, z, **_overlay_options(shape_params, overlay))
     
     height = shape_params.get('pear_height', 3.0)
     top_radius = shape_params.get('pear_top_radius', 1.2)
@@ -308,7 +389,8 @@ def _create_pear_plotly(shape_params: dict, results: dict = None, num_segments:
     return fig
 
 
-def _create_cigar_plotly(shape_params: dict, results: dict = None, num_segments: int = 50):
+def _create_cigar_plotly(shape_params: dict, results: dict = None, num_segments: int = 50,
+                         overlay: Optional[dict] = None):
     """Створює 3D сигару через Plotly з profile-based mesh"""
     from balloon.shapes.profile import get_shape_profile
     
@@ -321,7 +403,9 @@ def _create_cigar_plotly(shape_params: dict, results: dict = None, num_segments:
     
     # Покращена якість mesh: більше точок для кращої візуалізації
     enhanced_num_segments = max(num_segments, 60)  # Мінімум 60 для кращої якості
-    x, y, z = profile.generate_mesh(num_theta=enhanced_num_segments, num_z=enhanced_num_segments, center_at_origin=True)
+    x, y, z = compact_mesh(*profile.generate_mesh(
+        num_theta=enhanced_num_segments, num_z=enhanced_num_segments, center_at_origin=True
+    ))
     
     fig = go.Figure(data=[go.Surface(
         x=x, y=y, z=z,
@@ -339,9 +423,7 @@ def _create_cigar_plotly(shape_params: dict, results: dict = None, num_segments:
     )])
     
     # Додаємо gore overlay (межі сегментів)
-    num_gores = shape_params.get('num_gores', 12)
-    if num_gores > 0:
-        _add_gore_overlay_to_fig(fig, x, y, z, num_gores)
+    _add_gore_overlay_to_fig(fig, x, y, z, **_overlay_options(shape_params, overlay))
     
     length = shape_params.get('cigar_length', 5.0)
     radius = shape_params.get('cigar_radius', 1.0)
@@ -352,20 +434,116 @@ def _create_cigar_plotly(shape_params: dict, results: dict = None, num_segments:
     return fig
 
 
+def plotly_html_dir() -> Path:
+    """Каталог HTML моделей (BALLOON_PLOTLY_DIR або ~/.cache/balloon/plotly)"""
+    path = os.environ.get(HTML_DIR_ENV) or os.path.join(os.path.dirname(default_cache_path()), 'plotly')
+    return Path(path)
+
+
+def write_plotly_html(fig, filename, include_plotlyjs='directory') -> Path:
+    """
+    Записує фігуру в HTML
+    
+    За замовчуванням plotly.min.js копіюється в каталог файлу один раз
+    і використовується всіма HTML у цьому каталозі. Файл записується
+    через тимчасовий, тож перерваний запис не залишає битого HTML.
+    
+    Args:
+        fig: Plotly Figure
+        filename: Шлях до HTML
+        include_plotlyjs: Як підключати plotly.js (див. plotly write_html):
+            'directory', True (вбудувати), 'cdn'
+    
+    Returns:
+        Path до записаного файлу
+    """
+    path = Path(filename)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Тимчасовий файл у тому самому каталозі: бандл копіюється туди ж
+    fd, tmp_name = tempfile.mkstemp(suffix='.html', dir=str(path.parent))
+    os.close(fd)
+    try:
+        fig.write_html(tmp_name, include_plotlyjs=include_plotlyjs, full_html=True)
+        os.replace(tmp_name, path)
+    finally:
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
+    return path
+
+
+def _prune_html_cache(directory: Path, keep: Optional[int] = None):
+    """Видаляє найстаріші HTML моделі понад keep (MAX_CACHED_HTML; plotly.min.js залишається)"""
+    keep = MAX_CACHED_HTML if keep is None else keep
+    files = sorted(directory.glob('model-*.html'), key=lambda p: p.stat().st_mtime, reverse=True)
+    for stale in files[keep:]:
+        try:
+            stale.unlink()
+        except OSError as e:
+            logging.debug(f"Не вдалося видалити {stale}: {e}")
+
+
+def model_html_path(shape_code: str, shape_params: dict, results: dict = None, num_segments: int = 50,
+                    overlay: Optional[dict] = None) -> Path:
+    """
+    Шлях до HTML моделі в каталозі кешу
+    
+    Ім'я - хеш параметрів фігури, відбитка моделі та версії Plotly,
+    тож оновлення пакета не показує застарілих файлів.
+    """
+    import plotly
+    
+    arguments = {
+        'shape_code': str(shape_code or 'sphere').lower().strip(),
+        'shape_params': dict(shape_params or {}),
+        'info': _results_info(results),
+        'num_segments': num_segments,
+        'overlay': overlay,
+    }
+    key = input_key('plotly_3d', arguments, stamp=f"{model_stamp()}:{plotly.__version__}")
+    return plotly_html_dir() / f"model-{key[:24]}.html"
+
+
+def open_3d_model(shape_code: str, shape_params: dict, results: dict = None, num_segments: int = 50,
+                  overlay: Optional[dict] = None) -> Optional[Path]:
+    """
+    Відкриває 3D модель у браузері
+    
+    Якщо HTML для тих самих параметрів уже записано, фігура не
+    будується повторно.
+    
+    Returns:
+        Path до HTML або None, якщо Plotly недоступний
+    """
+    if not PLOTLY_AVAILABLE:
+        return None
+    with perf_log.span('plotly.open', shape=shape_code) as perf:
+        path = model_html_path(shape_code, shape_params, results, num_segments, overlay)
+        perf['cached_html'] = path.exists()
+        if path.exists():
+            os.utime(path)
+        else:
+            fig = create_3d_plotly(shape_code, shape_params, results, num_segments, overlay)
+            perf.mark('figure')
+            write_plotly_html(fig, path)
+            _prune_html_cache(path.parent)
+    webbrowser.open(path.resolve().as_uri())
+    return path
+
+
 def show_plotly_3d(fig, save_html: bool = False, filename: str = None):
     """
     Показує або зберігає Plotly фігуру
     
     Args:
         fig: Plotly Figure об'єкт
-        save_html: Чи зберігати як HTML файл
+        save_html: Чи зберігати як HTML файл (plotly.min.js - спільний файл поруч)
         filename: Ім'я файлу для збереження
     """
     if not PLOTLY_AVAILABLE:
         return
     
     if save_html and filename:
-        fig.write_html(filename)
+        write_plotly_html(fig, filename)
     else:
         # Відкриваємо в браузері
         fig.show()
@@ -408,47 +586,151 @@ def is_plotly_available():
     return PLOTLY_AVAILABLE
 
 
-def _add_gore_overlay_to_fig(fig, x, y, z, num_gores):
+def gore_overlay_from_pattern(pattern: Optional[dict]) -> Optional[dict]:
+    """
+    Параметри overlay з викрійки: кількість сегментів, мітки суміщення, припуск
+    
+    Returns:
+        dict(num_gores, notches, seam_allowance_m) або None для подушки/порожньої викрійки
+    """
+    if not pattern or 'num_gores' not in pattern:
+        return None
+    return {
+        'num_gores': int(pattern['num_gores']),
+        'notches': [float(n) for n in pattern.get('notches', [])],
+        'seam_allowance_m': float(pattern.get('seam_allowance_m', 0.0) or 0.0),
+    }
+
+
+def _overlay_options(shape_params: dict, overlay: Optional[dict]) -> dict:
+    overlay = overlay or {}
+    return {
+        'num_gores': overlay.get('num_gores', shape_params.get('num_gores', 12)),
+        'notches': overlay.get('notches'),
+        'seam_allowance_m': overlay.get('seam_allowance_m', 0.0),
+    }
+
+
+def _nan_joined(lines: np.ndarray) -> np.ndarray:
+    """Лінії (n_lines, n_points) -> один масив з NaN між лініями"""
+    separated = np.concatenate([lines, np.full((lines.shape[0], 1), np.nan)], axis=1)
+    return separated.ravel()
+
+
+def _meridian(x, y, z):
+    """Профіль r(z) з першого меридіана сітки (theta = 0)"""
+    return np.hypot(x[0], y[0]), np.asarray(z[0], dtype=float)
+
+
+def gore_seam_lines(x, y, z, num_gores: int):
+    """
+    Лінії швів між сегментами одним набором координат
+    
+    Шов i лежить на куті 2*pi*i/num_gores; лінії розділені NaN,
+    тож усі шви малюються одним trace.
+    
+    Args:
+        x, y, z: Сітка поверхні обертання (рядки - theta, стовпці - z)
+        num_gores: Кількість сегментів
+    
+    Returns:
+        (xs, ys, zs) - одновимірні масиви
+    """
+    r, zs = _meridian(x, y, z)
+    theta = 2 * np.pi * np.arange(num_gores) / num_gores
+    return (
+        _nan_joined(np.outer(np.cos(theta), r)),
+        _nan_joined(np.outer(np.sin(theta), r)),
+        _nan_joined(np.broadcast_to(zs, (num_gores, zs.size))),
+    )
+
+
+def seam_allowance_lines(x, y, z, num_gores: int, seam_allowance_m: float):
+    """
+    Межі припуску на шов по обидва боки кожного шва
+    
+    Припуск відкладається по колу паралелі: кутовий зсув
+    seam_allowance_m / r(z), не більше чверті кута сегмента (біля полюсів).
+    
+    Returns:
+        (xs, ys, zs) - одновимірні масиви з NaN між лініями
+    """
+    r, zs = _meridian(x, y, z)
+    max_shift = np.pi / (2 * num_gores)
+    with np.errstate(divide='ignore'):
+        shift = np.minimum(np.where(r > 0, seam_allowance_m / r, np.inf), max_shift)
+    theta = 2 * np.pi * np.arange(num_gores) / num_gores
+    angles = np.concatenate([theta[:, None] - shift, theta[:, None] + shift])
+    return (
+        _nan_joined(r * np.cos(angles)),
+        _nan_joined(r * np.sin(angles)),
+        _nan_joined(np.broadcast_to(zs, angles.shape)),
+    )
+
+
+def notch_points(x, y, z, num_gores: int, notches):
+    """
+    Мітки суміщення на швах
+    
+    Позиції міток у викрійці задано довжиною вздовж меридіана від
+    нижнього полюса; тут вони переводяться в точки (r, z) інтерполяцією
+    по довжині дуги меридіана сітки.
+    
+    Returns:
+        (xs, ys, zs) - по точці на кожну пару (шов, мітка)
+    """
+    r, zs = _meridian(x, y, z)
+    arc = np.concatenate([[0.0], np.cumsum(np.hypot(np.diff(r), np.diff(zs)))])
+    positions = np.asarray(notches, dtype=float)
+    r_notch = np.interp(positions, arc, r)
+    z_notch = np.interp(positions, arc, zs)
+    theta = 2 * np.pi * np.arange(num_gores) / num_gores
+    return (
+        np.outer(np.cos(theta), r_notch).ravel(),
+        np.outer(np.sin(theta), r_notch).ravel(),
+        np.tile(z_notch, num_gores),
+    )
+
+
+def _add_gore_overlay_to_fig(fig, x, y, z, num_gores, notches=None, seam_allowance_m: float = 0.0):
     """
     Додає overlay з межами сегментів (gores) на 3D модель
     
-    Це допомагає візуалізувати, як викрійка відповідає 3D моделі
+    Це допомагає візуалізувати, як викрійка відповідає 3D моделі.
+    Усі шви - один Scatter3d (лінії розділені NaN), межі припуску та
+    мітки суміщення - ще по одному trace, незалежно від кількості сегментів.
     """
-    if not PLOTLY_AVAILABLE:
+    if not PLOTLY_AVAILABLE or not num_gores or num_gores <= 0:
         return
     
-    # Обчислюємо кути для меж сегментів
-    theta_step = 2 * np.pi / num_gores
-    
-    # Для кожної межі сегмента малюємо лінію від низу до верху
-    num_z_points = z.shape[1]
-    
-    for i in range(num_gores):
-        theta = i * theta_step
-        
-        # Знаходимо найближчі точки по theta
-        theta_idx = int(theta / (2 * np.pi) * x.shape[0])
-        if theta_idx >= x.shape[0]:
-            theta_idx = x.shape[0] - 1
-        
-        # Створюємо лінію вздовж меридіану
-        x_line = []
-        y_line = []
-        z_line = []
-        
-        for j in range(num_z_points):
-            x_line.append(x[theta_idx, j])
-            y_line.append(y[theta_idx, j])
-            z_line.append(z[theta_idx, j])
-        
-        # Додаємо лінію до фігури
+    xs, ys, zs = compact_mesh(*gore_seam_lines(x, y, z, num_gores))
+    fig.add_trace(go.Scatter3d(
+        x=xs, y=ys, z=zs,
+        mode='lines',
+        line=dict(color='rgba(255, 100, 100, 0.6)', width=2),
+        name='Шви',
+        showlegend=False,
+        hoverinfo='skip'
+    ))
+    
+    if seam_allowance_m and seam_allowance_m > 0:
+        xs, ys, zs = compact_mesh(*seam_allowance_lines(x, y, z, num_gores, seam_allowance_m))
         fig.add_trace(go.Scatter3d(
-            x=x_line,
-            y=y_line,
-            z=z_line,
+            x=xs, y=ys, z=zs,
             mode='lines',
-            line=dict(color='rgba(255, 100, 100, 0.6)', width=2),
+            line=dict(color='rgba(102, 209, 124, 0.5)', width=1, dash='dot'),
+            name='Припуск на шов',
+            showlegend=False,
+            hoverinfo='skip'
+        ))
+    
+    if notches:
+        xs, ys, zs = compact_mesh(*notch_points(x, y, z, num_gores, notches))
+        fig.add_trace(go.Scatter3d(
+            x=xs, y=ys, z=zs,
+            mode='markers',
+            marker=dict(color='rgb(255, 107, 107)', size=3, symbol='diamond'),
+            name='Мітки суміщення',
             showlegend=False,
             hoverinfo='skip'
         ))
-
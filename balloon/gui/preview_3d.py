@@ -0,0 +1,344 @@
+"""
+Швидке 3D прев'ю форми на matplotlib
+
+PreviewRenderer тримає одну поверхню (Poly3DCollection) на осях і при
+зміні параметрів лише оновлює її вершини та кольори граней, замість
+ax.clear() та нового plot_surface на кожне оновлення. Оформлення осей
+(темна тема, сітка, підписи) налаштовується один раз, межі осей
+змінюються лише коли змінюються, а перемальовування відкладається до
+простою циклу подій через canvas.draw_idle().
+
+Сітки для різних розмірів (рівнів деталізації) мають окремі поверхні:
+при зміні розміру сітки видима поверхня підміняється, а не створюється
+заново. Самі сітки кешуються (memoize) за формою та параметрами.
+"""
+
+import logging
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from balloon.cache import memoize
+from balloon.lazy_import import lazy_import
+
+art3d = lazy_import('mpl_toolkits.mplot3d.art3d')
+mcolors = lazy_import('matplotlib.colors')
+
+# Дискретизація сітки прев'ю (точок по азимуту та по висоті)
+PREVIEW_RESOLUTION = 20
+
+# Кількість сіток у кеші
+MESH_CACHE_SIZE = 32
+
+# Оформлення (темна тема)
+BACKGROUND_COLOR = '#1e1e1e'
+PANE_EDGE_COLOR = '#333333'
+TEXT_COLOR = '#ffffff'
+GRID_COLOR = '#444444'
+SURFACE_STYLE = {
+    'color': '#4a90e2',
+    'alpha': 0.7,
+    'edgecolor': '#2a5a9a',
+    'linewidth': 0.3,
+}
+
+# Джерело світла для затінення граней (як у plot_surface)
+LIGHT_AZIMUTH = 225
+LIGHT_ALTITUDE = 19.4712
+
+Limits = Tuple[Tuple[float, float], Tuple[float, float], Tuple[float, float], Tuple[float, float, float]]
+
+
+def style_axes_3d(ax, labelsize: Optional[int] = 6, hide_ticklabels: bool = True):
+    """
+    Темна тема для 3D осей
+
+    Викликається один раз при створенні осей: PreviewRenderer не очищує
+    осі, тож оформлення зберігається між оновленнями.
+
+    Args:
+        ax: Axes3D
+        labelsize: Розмір шрифту поділок (None - не змінювати)
+        hide_ticklabels: Прибрати підписи поділок
+    """
+    ax.figure.patch.set_facecolor(BACKGROUND_COLOR)
+    ax.set_facecolor(BACKGROUND_COLOR)
+    for axis in (ax.xaxis, ax.yaxis, ax.zaxis):
+        axis.pane.fill = False
+        axis.pane.set_edgecolor(PANE_EDGE_COLOR)
+        axis.label.set_color(TEXT_COLOR)
+    if labelsize is None:
+        ax.tick_params(colors=TEXT_COLOR)
+    else:
+        ax.tick_params(colors=TEXT_COLOR, labelsize=labelsize)
+    ax.grid(True, color=GRID_COLOR, linestyle='--', alpha=0.3)
+    if hide_ticklabels:
+        ax.set_xticklabels([])
+        ax.set_yticklabels([])
+        ax.set_zticklabels([])
+
+
+def _revolve(r: np.ndarray, z: np.ndarray, num_theta: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Поверхня обертання профілю r(z) навколо осі Z"""
+    theta = np.linspace(0, 2 * np.pi, num_theta)[:, np.newaxis]
+    return r * np.cos(theta), r * np.sin(theta), np.broadcast_to(z, (num_theta, len(z))).copy()
+
+
+def _approximate_profile(shape_code: str, shape_params: dict, num_z: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Профіль r(z) для форм, для яких не вдалося побудувати ShapeProfile"""
+    if shape_code == 'sphere':
+        radius = shape_params.get('radius', 1.0)
+        v = np.linspace(0, np.pi, num_z)
+        return radius * np.sin(v), radius * np.cos(v)
+    if shape_code == 'pear':
+        height = shape_params.get('pear_height', 3.0)
+        top_radius = shape_params.get('pear_top_radius', 1.2)
+        bottom_radius = shape_params.get('pear_bottom_radius', 0.6)
+        v = np.linspace(0, 1, num_z)
+        return top_radius * (1 - v) + bottom_radius * v, height * v
+    if shape_code == 'cigar':
+        length = shape_params.get('cigar_length', 5.0)
+        radius = shape_params.get('cigar_radius', 1.0)
+        # Півсфера - циліндр - півсфера одним профілем
+        cap = max(2, num_z // 3)
+        v = np.linspace(0, np.pi / 2, cap)
+        r_bottom, z_bottom = radius * np.sin(v), radius * (1 - np.cos(v))
+        z_body = np.linspace(radius, max(radius, length - radius), max(2, num_z - 2 * cap) + 2)[1:-1]
+        r_top, z_top = r_bottom[::-1], (length - radius) + radius * np.cos(v[::-1])
+        return (np.concatenate([r_bottom, np.full(len(z_body), radius), r_top]),
+                np.concatenate([z_bottom, z_body, z_top]))
+    raise ValueError(f"Невідома форма: {shape_code}")
+
+
+@memoize(maxsize=MESH_CACHE_SIZE)
+def preview_mesh(shape_code: str, shape_params: dict,
+                 num_theta: int = PREVIEW_RESOLUTION,
+                 num_z: int = PREVIEW_RESOLUTION) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Сітка поверхні для прев'ю
+
+    Для сфери, груші та сигари використовується профіль форми
+    (balloon.shapes.profile), як і в Plotly моделі; якщо профіль
+    побудувати не вдалося - проста апроксимація. Подушка - еліпсоїд
+    з товщиною shape_params['thickness'] (за замовчуванням 0.3 ширини).
+
+    Результат кешується і спільний для всіх викликів, тому масиви лише
+    для читання: зміна на місці піднімає ValueError (для змін - копія).
+
+    Args:
+        shape_code: Код форми
+        shape_params: Параметри форми
+        num_theta: Точок по азимуту
+        num_z: Точок по висоті (профіль може додати точки адаптивно)
+
+    Returns:
+        Tuple (x, y, z) - масиви однакової форми
+
+    Raises:
+        ValueError: Невідома форма
+    """
+    arrays = _surface_mesh(shape_code, shape_params, num_theta, num_z)
+    for array in arrays:
+        array.setflags(write=False)
+    return arrays
+
+
+def _surface_mesh(shape_code: str, shape_params: dict, num_theta: int,
+                  num_z: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Сітка поверхні (див. preview_mesh)"""
+    if shape_code == 'pillow':
+        length = shape_params.get('pillow_len', 3.0)
+        width = shape_params.get('pillow_wid', 2.0)
+        thickness = shape_params.get('thickness', width * 0.3)
+        u, v = np.meshgrid(np.linspace(0, 2 * np.pi, num_theta), np.linspace(0, np.pi, num_z))
+        x = length / 2 * (1 + np.cos(u) * np.sin(v))
+        y = width / 2 * (1 + np.sin(u) * np.sin(v))
+        z = thickness / 2 * (1 + np.cos(v))
+        return x, y, z
+
+    try:
+        from balloon.shapes.profile import get_shape_profile
+        profile = get_shape_profile(shape_code, shape_params)
+        if profile:
+            return profile.generate_mesh(num_theta=num_theta, num_z=num_z, center_at_origin=False)
+        raise ValueError("Не вдалося створити профіль")
+    except Exception as e:
+        if shape_code not in ('sphere', 'pear', 'cigar'):
+            raise ValueError(f"Невідома форма: {shape_code}") from e
+        logging.debug(f"Прев'ю {shape_code}: апроксимація замість профілю ({e})")
+    r, z = _approximate_profile(shape_code, shape_params, num_z)
+    return _revolve(r, z, num_theta)
+
+
+def preview_limits(shape_code: str, shape_params: dict) -> Limits:
+    """
+    Межі осей та співвідношення сторін для прев'ю
+
+    Returns:
+        Tuple (xlim, ylim, zlim, box_aspect)
+    """
+    if shape_code == 'sphere':
+        max_dim = shape_params.get('radius', 1.0) * 1.5
+        return (-max_dim, max_dim), (-max_dim, max_dim), (-max_dim, max_dim), (1, 1, 1)
+    if shape_code == 'pillow':
+        length = shape_params.get('pillow_len', 3.0)
+        width = shape_params.get('pillow_wid', 2.0)
+        thickness = shape_params.get('thickness', width * 0.3)
+        max_dim = max(length, width, thickness) * 1.2
+        return (0, max_dim), (0, max_dim), (0, max_dim), (length, width, thickness)
+    if shape_code == 'pear':
+        height = shape_params.get('pear_height', 3.0)
+        max_radius = max(shape_params.get('pear_top_radius', 1.2), shape_params.get('pear_bottom_radius', 0.6))
+        max_dim = max(height, max_radius * 2) * 1.2
+        return (-max_dim / 2, max_dim / 2), (-max_dim / 2, max_dim / 2), (0, max_dim), (max_radius * 2, max_radius * 2, height)
+    if shape_code == 'cigar':
+        length = shape_params.get('cigar_length', 5.0)
+        radius = shape_params.get('cigar_radius', 1.0)
+        max_dim = max(length, radius * 2) * 1.2
+        return (-max_dim / 2, max_dim / 2), (-max_dim / 2, max_dim / 2), (0, max_dim), (radius * 2, radius * 2, length)
+    raise ValueError(f"Невідома форма: {shape_code}")
+
+
+def surface_polygons(x: np.ndarray, y: np.ndarray, z: np.ndarray) -> np.ndarray:
+    """
+    Чотирикутні грані сітки (як plot_surface з кроком 1)
+
+    Returns:
+        Масив (N, 4, 3) вершин граней
+    """
+    points = np.stack([x, y, z], axis=-1)
+    # Обхід грані як у plot_surface: (i, j) -> (i, j+1) -> (i+1, j+1) -> (i+1, j)
+    quads = np.stack([points[:-1, :-1], points[:-1, 1:], points[1:, 1:], points[1:, :-1]], axis=2)
+    return quads.reshape(-1, 4, 3)
+
+
+def shade_faces(polygons: np.ndarray, color, lightsource=None) -> np.ndarray:
+    """
+    Кольори граней з затіненням за нормалями (як shade=True у plot_surface)
+
+    Args:
+        polygons: Вершини граней (N, M, 3)
+        color: Базовий колір
+        lightsource: matplotlib.colors.LightSource (None - як у plot_surface)
+
+    Returns:
+        Масив (N, 4) RGBA
+    """
+    if lightsource is None:
+        lightsource = mcolors.LightSource(azdeg=LIGHT_AZIMUTH, altdeg=LIGHT_ALTITUDE)
+    n = polygons.shape[-2]
+    v1 = polygons[:, 0] - polygons[:, n // 3]
+    v2 = polygons[:, n // 3] - polygons[:, 2 * n // 3]
+    normals = np.cross(v1, v2)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        shade = (normals / np.linalg.norm(normals, axis=1, keepdims=True)) @ lightsource.direction
+    # Вироджені грані (полюси) - середнє затінення
+    shade = np.where(np.isnan(shade), 0.0, shade)
+    rgba = np.tile(mcolors.to_rgba(color), (len(polygons), 1))
+    rgba[:, :3] *= (0.3 + 0.7 * (shade + 1) / 2)[:, np.newaxis]
+    return rgba
+
+
+class PreviewRenderer:
+    """
+    Оновлення 3D прев'ю без перестворення поверхні
+
+    Args:
+        ax: Axes3D (оформлення налаштовується викликом style_axes_3d окремо)
+        canvas: Canvas фігури (None - ax.figure.canvas)
+        resolution: Дискретизація сітки (точок по азимуту та висоті)
+        surface_style: Колір, прозорість, колір та товщина ребер
+        limits: Функція limits(shape_code, shape_params) -> (xlim, ylim, zlim, box_aspect)
+    """
+
+    def __init__(self, ax, canvas=None, resolution: int = PREVIEW_RESOLUTION,
+                 surface_style: Optional[dict] = None,
+                 limits: Callable[[str, dict], Limits] = preview_limits):
+        self.ax = ax
+        self.canvas = canvas
+        self.resolution = resolution
+        self.style = dict(SURFACE_STYLE, **(surface_style or {}))
+        self.limits = limits
+        self._surfaces: Dict[Tuple[int, int], object] = {}
+        self._visible: Optional[Tuple[int, int]] = None
+        self._limits: Optional[Limits] = None
+        self._lightsource = None
+        self.key = None
+
+    @property
+    def surface(self):
+        """Видима поверхня (Poly3DCollection) або None"""
+        return self._surfaces.get(self._visible)
+
+    def render(self, shape_code: str, shape_params: dict, resolution: Optional[int] = None) -> bool:
+        """
+        Показує форму з параметрами
+
+        Args:
+            shape_code: Код форми
+            shape_params: Параметри форми
+            resolution: Дискретизація (None - self.resolution)
+
+        Returns:
+            True, якщо зображення змінилось (False - ті самі форма та параметри)
+
+        Raises:
+            ValueError: Невідома форма
+        """
+        resolution = resolution or self.resolution
+        key = (shape_code, tuple(sorted(shape_params.items())), resolution)
+        if key == self.key:
+            return False
+
+        x, y, z = preview_mesh(shape_code, shape_params, num_theta=resolution, num_z=resolution)
+        polygons = surface_polygons(x, y, z)
+        if self._lightsource is None:
+            self._lightsource = mcolors.LightSource(azdeg=LIGHT_AZIMUTH, altdeg=LIGHT_ALTITUDE)
+        facecolors = shade_faces(polygons, self.style['color'], self._lightsource)
+
+        grid = x.shape
+        surface = self._surfaces.get(grid)
+        if surface is None:
+            surface = art3d.Poly3DCollection(
+                polygons, facecolors=facecolors, edgecolors=self.style['edgecolor'],
+                linewidths=self.style['linewidth'], alpha=self.style['alpha'])
+            self.ax.add_collection3d(surface, autolim=False)
+            self._surfaces[grid] = surface
+        else:
+            surface.set_verts(polygons)
+            surface.set_facecolor(facecolors)
+            surface.set_alpha(self.style['alpha'])
+        if self._visible != grid:
+            for other_grid, other in self._surfaces.items():
+                other.set_visible(other_grid == grid)
+            self._visible = grid
+
+        self._set_limits(self.limits(shape_code, shape_params))
+        self.key = key
+        self.draw_idle()
+        return True
+
+    def clear(self):
+        """Прибирає поверхні з осей"""
+        for surface in self._surfaces.values():
+            surface.remove()
+        self._surfaces.clear()
+        self._visible = None
+        self._limits = None
+        self.key = None
+        self.draw_idle()
+
+    def draw_idle(self):
+        """Відкладене перемальовування canvas"""
+        canvas = self.canvas if self.canvas is not None else self.ax.figure.canvas
+        canvas.draw_idle()
+
+    def _set_limits(self, limits: Limits):
+        if limits == self._limits:
+            return
+        xlim, ylim, zlim, aspect = limits
+        self.ax.set_xlim(xlim)
+        self.ax.set_ylim(ylim)
+        self.ax.set_zlim(zlim)
+        self.ax.set_box_aspect(aspect)
+        self._limits = limits
@@ -0,0 +1,302 @@
+"""
+Модель представлення результатів розрахунку
+
+build_results_view перетворює словник результатів на список рядків
+таблиці (ResultRow) зі стабільними ключами, а ResultsTable показує їх
+у ttk.Treeview. При кожному перерахунку обчислюється різниця з
+попереднім набором рядків: змінені рядки оновлюються на місці,
+нові вставляються, зайві видаляються - таблиця не перебудовується
+і не блимає під час живого перерахунку.
+
+Модуль не імпортує tkinter: ResultsTable працює з уже створеним
+Treeview (або будь-яким об'єктом з тим самим інтерфейсом).
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Стилі рядків (теги Treeview) та їх кольори
+STYLE_COLORS = {
+    'normal': "#ffffff",
+    'success': "#44ff44",
+    'warning': "#ffaa00",
+    'error': "#ff4444",
+    'header': "#4a9eff",
+}
+
+STATUS_OK = 'ok'
+STATUS_WARNING = 'warning'
+STATUS_ERROR = 'error'
+
+LIFTING_GASES = ("Гелій", "Водень")
+HOT_AIR = "Гаряче повітря"
+
+
+@dataclass(frozen=True)
+class ResultRow:
+    """Рядок таблиці результатів"""
+    key: str
+    label: str
+    value: str = ""
+    unit: str = ""
+    style: str = 'normal'
+    bold: bool = False
+
+    @property
+    def values(self) -> Tuple[str, str, str]:
+        """Значення колонок (підпис, значення, одиниця)"""
+        return (self.label, self.value, self.unit)
+
+    @property
+    def tags(self) -> Tuple[str, ...]:
+        return (self.style, 'bold') if self.bold else (self.style,)
+
+
+@dataclass
+class ResultsView:
+    """Рядки таблиці та загальна оцінка (ok / warning / error)"""
+    rows: List[ResultRow]
+    status: str = STATUS_OK
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+
+
+@dataclass
+class RowDiff:
+    """Різниця між двома наборами рядків"""
+    removed: List[str] = field(default_factory=list)
+    added: List[Tuple[int, ResultRow]] = field(default_factory=list)
+    changed: List[ResultRow] = field(default_factory=list)
+
+    @property
+    def empty(self) -> bool:
+        return not (self.removed or self.added or self.changed)
+
+
+def build_results_view(results: Dict[str, Any], mode: str, gas: str,
+                       shape_display: Optional[str] = None) -> ResultsView:
+    """
+    Формує рядки таблиці результатів
+
+    Args:
+        results: Результати solve_volume_to_payload / solve_payload_to_volume
+        mode: Режим розрахунку ('volume' або 'payload')
+        gas: Назва газу, як у GUI ("Гелій", "Водень", "Гаряче повітря")
+        shape_display: Назва форми для показу (за замовчуванням - код форми)
+
+    Returns:
+        ResultsView
+    """
+    rows: List[ResultRow] = []
+
+    def header(key, text):
+        rows.append(ResultRow(f'section:{key}', text, style='header', bold=True))
+
+    def value(key, label, number, fmt, unit, style='normal'):
+        rows.append(ResultRow(key, label, format(number, fmt), unit, style))
+
+    def message(key, text, style='normal', bold=False):
+        rows.append(ResultRow(key, text, style=style, bold=bold))
+
+    header('main', "РЕЗУЛЬТАТИ РОЗРАХУНКУ")
+
+    # Форма
+    shape_code = results.get('shape_type', 'sphere')
+    rows.append(ResultRow('shape_type', "Форма оболонки:", shape_display or shape_code))
+    shape_params = results.get('shape_params', {}) or {}
+    if shape_code == "pillow":
+        value('pillow_len', "Довжина подушки:", shape_params.get('pillow_len', 0), '.2f', "м")
+        value('pillow_wid', "Ширина подушки:", shape_params.get('pillow_wid', 0), '.2f', "м")
+    elif shape_code == "pear":
+        value('pear_height', "Висота груші:", shape_params.get('pear_height', 0), '.2f', "м")
+        value('pear_top_radius', "Радіус верхньої частини:", shape_params.get('pear_top_radius', 0), '.2f', "м")
+        value('pear_bottom_radius', "Радіус нижньої частини:", shape_params.get('pear_bottom_radius', 0), '.2f', "м")
+    elif shape_code == "cigar":
+        value('cigar_length', "Довжина сигари:", shape_params.get('cigar_length', 0), '.2f', "м")
+        value('cigar_radius', "Радіус сигари:", shape_params.get('cigar_radius', 0), '.2f', "м")
+
+    # Основні параметри
+    if mode == "volume":
+        value('gas_volume', "Потрібний обʼєм газу:", results['gas_volume'], '.2f', "м³")
+    value('required_volume', "Необхідний обʼєм кулі:", results['required_volume'], '.2f', "м³")
+    value('payload', "Корисне навантаження (старт):", results['payload'], '.2f', "кг",
+          'success' if results['payload'] > 0 else 'error')
+    value('mass_shell', "Маса оболонки:", results['mass_shell'], '.2f', "кг")
+    if results.get('extra_mass', 0) > 0:
+        value('extra_mass', "Додаткова маса обладнання:", results['extra_mass'], '.2f', "кг")
+    value('lift', "Підйомна сила (старт):", results['lift'], '.2f', "кг")
+    value('radius', "Радіус кулі:", results['radius'], '.2f', "м")
+    value('surface_area', "Площа поверхні:", results['surface_area'], '.2f', "м²")
+    effective_area = results.get('effective_surface_area', 0)
+    if effective_area > 0 and effective_area != results.get('surface_area', 0):
+        value('effective_surface_area', "Ефективна площа (з урахуванням швів):", effective_area, '.2f', "м²")
+    value('rho_air', "Щільність повітря:", results['rho_air'], '.4f', "кг/м³")
+    value('net_lift_per_m3', "Підйомна сила на м³:", results['net_lift_per_m3'], '.4f', "кг/м³")
+
+    # Втрати газу для гелію/водню
+    if gas in LIFTING_GASES:
+        header('gas_loss', "АНАЛІЗ ВТРАТ ГАЗУ")
+        value('gas_loss', "Втрати газу за політ:", results['gas_loss'], '.6f', "м³",
+              'warning' if results['gas_loss'] > 0.1 else 'normal')
+        if results['gas_loss'] < 0.01:
+            message('gas_loss_note', "Втрати газу дуже малі для цих параметрів (менше 0.01 м³)")
+        value('final_gas_volume', "Обʼєм газу в кінці:", results['final_gas_volume'], '.2f', "м³")
+        value('lift_end', "Підйомна сила (кінець):", results['lift_end'], '.2f', "кг")
+        value('payload_end', "Корисне навантаження (кінець):", results['payload_end'], '.2f', "кг",
+              'success' if results['payload_end'] > 0 else 'error')
+        if results['payload_end'] < 0:
+            message('payload_end_note', "⚠️  УВАГА: Куля втратить підйомну силу до кінця польоту!", 'error', True)
+
+        flight_info = results.get('flight_time_info')
+        if flight_info:
+            header('flight_time', "ЧАС ПОЛЬОТУ")
+            if flight_info.get('max_time_hours') == float('inf'):
+                message('flight_time_unlimited', "Час польоту не обмежений втратами газу", 'success')
+            else:
+                max_time = flight_info.get('max_time_hours', 0)
+                time_to_zero = flight_info.get('time_to_zero_payload', 0)
+                loss_rate = flight_info.get('gas_loss_rate_per_hour', 0)
+                if max_time > 0:
+                    style = 'success' if max_time >= 24 else 'warning'
+                    value('max_time_hours', "Макс. час польоту:", max_time, '.1f', "год", style)
+                    value('max_time_days', "Макс. час польоту:", max_time / 24, '.1f', "днів", style)
+                if time_to_zero > 0 and time_to_zero != float('inf'):
+                    value('time_to_zero_hours', "Час до нульового навантаження:", time_to_zero, '.1f', "год", 'warning')
+                    value('time_to_zero_days', "Час до нульового навантаження:", time_to_zero / 24, '.1f', "днів", 'warning')
+                if loss_rate > 0:
+                    value('gas_loss_rate', "Втрати газу за годину:", loss_rate, '.6f', "м³/год")
+
+    # Аналіз безпеки для гарячого повітря
+    safety_factor = None
+    if gas == HOT_AIR:
+        header('safety', "АНАЛІЗ БЕЗПЕКИ")
+        value('T_outside_C', "T зовні:", results['T_outside_C'], '.1f', "°C")
+        value('stress', "Макс. напруга:", results['stress'] / 1e6, '.2f', "МПа")
+        value('stress_limit', "Допустима напруга:", results['stress_limit'] / 1e6, '.1f', "МПа")
+        if results['stress'] > 0:
+            safety_factor = results['stress_limit'] / results['stress']
+            if safety_factor < 1.5:
+                style, note = 'error', " ⚠️ КРИТИЧНО НИЗЬКИЙ!"
+            elif safety_factor < 2:
+                style, note = 'warning', " ⚠️ Низький (рекомендується ≥ 2)"
+            else:
+                style, note = 'success', " ✅ Безпечний"
+            message('safety_factor', f"Коефіцієнт безпеки: {safety_factor:.2f}{note}", style, True)
+        else:
+            message('safety_factor', "✅ Коефіцієнт безпеки: ∞ (дуже високий, напруга ≈ 0)", 'success', True)
+
+    # Загальна оцінка
+    warnings: List[str] = []
+    errors: List[str] = []
+    if results['payload'] <= 0:
+        errors.append("Корисне навантаження від'ємне або нульове")
+    elif results['payload'] < 0.1:
+        warnings.append("Дуже мале навантаження (< 0.1 кг)")
+    if gas in LIFTING_GASES and results['payload_end'] < 0:
+        errors.append("Втрата підйомної сили до кінця польоту")
+    if safety_factor is not None:
+        if safety_factor < 1.5:
+            errors.append(f"Критично низький коефіцієнт безпеки ({safety_factor:.2f})")
+        elif safety_factor < 2:
+            warnings.append(f"Низький коефіцієнт безпеки ({safety_factor:.2f})")
+
+    header('summary', "ЗАГАЛЬНА ОЦІНКА")
+    for i, error in enumerate(errors):
+        message(f'error:{i}', f"❌ ПОМИЛКА: {error}", 'error', True)
+    for i, warning in enumerate(warnings):
+        message(f'warning:{i}', f"⚠️  ПОПЕРЕДЖЕННЯ: {warning}", 'warning')
+    if not errors and not warnings:
+        message('all_ok', "✅ Всі параметри в межах безпеки", 'success', True)
+
+    status = STATUS_ERROR if errors else (STATUS_WARNING if warnings else STATUS_OK)
+    return ResultsView(rows, status, errors, warnings)
+
+
+def diff_rows(old: Sequence[ResultRow], new: Sequence[ResultRow]) -> RowDiff:
+    """
+    Різниця між попереднім і новим набором рядків
+
+    Рядки спільних ключів завжди йдуть у тому самому відносному порядку
+    (порядок секцій фіксований), тому після видалення зайвих рядків
+    достатньо вставити нові на їхні позиції в порядку зростання індексу.
+    Якщо порядок спільних ключів все ж змінився, спільні рядки
+    перевставляються.
+
+    Args:
+        old: Поточні рядки таблиці
+        new: Нові рядки
+
+    Returns:
+        RowDiff: removed - ключі для видалення, added - (індекс, рядок)
+        для вставки, changed - рядки, які треба оновити на місці
+    """
+    old_by_key = {row.key: row for row in old}
+    new_keys = {row.key for row in new}
+
+    common_old_order = [row.key for row in old if row.key in new_keys]
+    common_new_order = [row.key for row in new if row.key in old_by_key]
+    reordered = common_old_order != common_new_order
+
+    diff = RowDiff()
+    diff.removed = [row.key for row in old if row.key not in new_keys or reordered]
+    for index, row in enumerate(new):
+        previous = old_by_key.get(row.key)
+        if previous is None or reordered:
+            diff.added.append((index, row))
+        elif previous != row:
+            diff.changed.append(row)
+    return diff
+
+
+class ResultsTable:
+    """
+    Таблиця результатів на основі ttk.Treeview з інкрементальним оновленням
+
+    Treeview має бути створений з колонками COLUMNS; ключ рядка
+    використовується як iid елемента.
+
+    Args:
+        tree: ttk.Treeview
+    """
+
+    COLUMNS = ('label', 'value', 'unit')
+
+    def __init__(self, tree):
+        self.tree = tree
+        self.rows: List[ResultRow] = []
+        for style, color in STYLE_COLORS.items():
+            tree.tag_configure(style, foreground=color)
+        tree.tag_configure('bold', font=("Courier New", 10, "bold"))
+
+    def update(self, rows: Sequence[ResultRow]) -> RowDiff:
+        """
+        Застосовує новий набір рядків, змінюючи лише відмінні
+
+        Returns:
+            RowDiff: Виконані зміни
+        """
+        diff = diff_rows(self.rows, rows)
+        if diff.removed:
+            self.tree.delete(*diff.removed)
+        for index, row in diff.added:
+            self.tree.insert('', index, iid=row.key, values=row.values, tags=row.tags)
+        for row in diff.changed:
+            self.tree.item(row.key, values=row.values, tags=row.tags)
+        self.rows = list(rows)
+        return diff
+
+    def clear(self):
+        """Видаляє всі рядки"""
+        if self.rows:
+            self.tree.delete(*[row.key for row in self.rows])
+        self.rows = []
+
+    def as_text(self) -> str:
+        """Вміст таблиці як текст (для копіювання)"""
+        lines = []
+        for row in self.rows:
+            if row.value or row.unit:
+                lines.append(f"{row.label:<32} {row.value:>10} {row.unit}".rstrip())
+            else:
+                lines.append(row.label)
+        return "\n".join(lines)
@@ -0,0 +1,354 @@
+"""
+Фонове виконання довгих розрахунків для GUI
+
+Розрахунки (оптимізація висоти, профілі, порівняння матеріалів,
+генерація викрійок) та експорт файлів виконуються в пулі потоків, а результати та прогрес
+передаються в головний потік Tk через чергу, яку опитує root.after -
+віджети Tk не можна змінювати з інших потоків.
+
+Кожне завдання має ключ: нове завдання з тим самим ключем витісняє
+попереднє (його результат відкидається). Скасування кооперативне:
+функція завдання може викликати task.check() між кроками, а результат
+скасованого завдання у будь-якому разі не потрапляє в інтерфейс.
+
+Використання:
+    runner = TaskRunner(root, on_status=update_progress_bar)
+
+    def work(task):
+        task.report(0.1, "Розрахунок профілю...")
+        return calculate_height_profile(...)
+
+    runner.submit('graph', work, on_success=draw_graph)
+
+Debouncer об'єднує часті події (введення в полях, оновлення прев'ю)
+в один виклик через root.after.
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+# Період опитування черги результатів (мс)
+POLL_INTERVAL_MS = 40
+
+# Кількість потоків: розрахунок + одне довге завдання (викрійка, профіль) паралельно
+DEFAULT_MAX_WORKERS = 2
+
+
+class TaskCancelled(Exception):
+    """Завдання скасовано або витіснене новішим"""
+
+
+class Task:
+    """
+    Дескриптор фонового завдання
+
+    Методи report() та check() викликаються з робочого потоку,
+    решта атрибутів читається в головному потоці.
+    """
+
+    PENDING = 'pending'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+    CANCELLED = 'cancelled'
+
+    def __init__(self, key: str, description: str, runner: "TaskRunner"):
+        self.key = key
+        self.description = description
+        self.state = Task.PENDING
+        self.progress: Optional[float] = None
+        self.message = description
+        self.started = time.perf_counter()
+        self._runner = runner
+        self._cancel_event = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    @property
+    def active(self) -> bool:
+        return self.state in (Task.PENDING, Task.RUNNING)
+
+    @property
+    def elapsed(self) -> float:
+        """Час від запуску (с)"""
+        return time.perf_counter() - self.started
+
+    def cancel(self):
+        """Позначає завдання скасованим (результат буде відкинуто)"""
+        self._cancel_event.set()
+
+    def check(self):
+        """
+        Перевірка скасування між кроками розрахунку
+
+        Raises:
+            TaskCancelled: Якщо завдання скасовано
+        """
+        if self._cancel_event.is_set():
+            raise TaskCancelled(self.key)
+
+    def report(self, fraction: Optional[float] = None, message: Optional[str] = None):
+        """
+        Повідомляє прогрес (з робочого потоку)
+
+        Args:
+            fraction: Частка виконання 0..1 (None - невизначений прогрес)
+            message: Текст статусу
+        """
+        self.check()
+        self._runner._post(self, 'progress', (fraction, message))
+
+    def __repr__(self) -> str:
+        return f"<Task {self.key!r} {self.state}>"
+
+
+class TaskRunner:
+    """
+    Черга фонових завдань з доставкою результатів у головний потік Tk
+
+    Args:
+        root: Корінь Tk (або будь-який об'єкт з методом after(ms, callback))
+        on_status: Викликається в головному потоці при зміні стану/прогресу
+            будь-якого завдання: on_status(task)
+        max_workers: Кількість робочих потоків
+        poll_ms: Період опитування черги
+    """
+
+    def __init__(self, root, on_status: Optional[Callable[[Task], None]] = None,
+                 max_workers: int = DEFAULT_MAX_WORKERS, poll_ms: int = POLL_INTERVAL_MS):
+        self.root = root
+        self.on_status = on_status
+        self.poll_ms = poll_ms
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='balloon-task')
+        self._queue: "queue.Queue" = queue.Queue()
+        self._active: Dict[str, Task] = {}
+        self._callbacks: Dict[Task, tuple] = {}
+        self._polling = False
+        self._closed = False
+
+    @property
+    def busy(self) -> bool:
+        """Чи є завдання, що виконуються"""
+        return bool(self._active)
+
+    def active_tasks(self) -> List[Task]:
+        return list(self._active.values())
+
+    def submit(self, key: str, func: Callable[[Task], Any],
+               on_success: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[BaseException], None]] = None,
+               description: str = "") -> Task:
+        """
+        Запускає завдання у фоновому потоці
+
+        Завдання з тим самим ключем, що ще виконується, скасовується
+        (витісняється): його результат не буде доставлено.
+
+        Args:
+            key: Ключ завдання ('calculate', 'graph', 'pattern', ...)
+            func: Функція func(task) -> результат, виконується в робочому потоці
+            on_success: Обробник результату (головний потік)
+            on_error: Обробник винятку (головний потік); за замовчуванням - запис у лог
+            description: Текст статусу під час виконання
+
+        Returns:
+            Task
+        """
+        if self._closed:
+            raise RuntimeError("TaskRunner закрито")
+        previous = self._active.get(key)
+        if previous is not None:
+            previous.cancel()
+            previous.state = Task.CANCELLED
+            self._notify(previous)
+
+        task = Task(key, description, self)
+        self._active[key] = task
+        self._callbacks[task] = (on_success, on_error)
+        self._executor.submit(self._run, task, func)
+        self._notify(task)
+        self._schedule_poll()
+        return task
+
+    def cancel(self, key: Optional[str] = None):
+        """
+        Скасовує завдання за ключем або всі завдання (key=None)
+
+        Інтерфейс звільняється одразу; робочий потік завершиться
+        на найближчому task.check() або після завершення поточного кроку.
+        """
+        keys = [key] if key is not None else list(self._active)
+        for k in keys:
+            task = self._active.pop(k, None)
+            if task is None:
+                continue
+            task.cancel()
+            task.state = Task.CANCELLED
+            self._callbacks.pop(task, None)
+            self._notify(task)
+
+    def shutdown(self):
+        """Скасовує всі завдання та зупиняє пул (без очікування потоків)"""
+        self.cancel()
+        self._closed = True
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _post(self, task: Task, kind: str, payload: Any):
+        self._queue.put((task, kind, payload))
+
+    def _run(self, task: Task, func: Callable[[Task], Any]):
+        if task.cancelled:
+            self._post(task, 'cancelled', None)
+            return
+        self._post(task, 'running', None)
+        try:
+            result = func(task)
+            task.check()
+        except TaskCancelled:
+            self._post(task, 'cancelled', None)
+        except BaseException as e:
+            self._post(task, 'error', e)
+        else:
+            self._post(task, 'done', result)
+
+    def _schedule_poll(self):
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.poll_ms, self._poll)
+
+    def _poll(self):
+        """Обробляє події робочих потоків (головний потік)"""
+        self._polling = False
+        while True:
+            try:
+                task, kind, payload = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            self._dispatch(task, kind, payload)
+        if self._active and not self._closed:
+            self._schedule_poll()
+
+    def _is_current(self, task: Task) -> bool:
+        return self._active.get(task.key) is task and not task.cancelled
+
+    def _dispatch(self, task: Task, kind: str, payload: Any):
+        if not self._is_current(task):
+            # Скасоване або витіснене завдання: результат застарів
+            self._callbacks.pop(task, None)
+            return
+
+        if kind == 'running':
+            task.state = Task.RUNNING
+            self._notify(task)
+            return
+        if kind == 'progress':
+            task.progress, message = payload
+            if message:
+                task.message = message
+            self._notify(task)
+            return
+
+        del self._active[task.key]
+        on_success, on_error = self._callbacks.pop(task, (None, None))
+        if kind == 'done':
+            task.state = Task.DONE
+            self._notify(task)
+            if on_success is not None:
+                on_success(payload)
+        elif kind == 'error':
+            task.state = Task.FAILED
+            self._notify(task)
+            if on_error is not None:
+                on_error(payload)
+            else:
+                logging.error("Помилка фонового завдання %s: %s", task.key, payload,
+                              exc_info=(type(payload), payload, payload.__traceback__))
+        else:
+            task.state = Task.CANCELLED
+            self._notify(task)
+
+    def _notify(self, task: Task):
+        if self.on_status is not None:
+            try:
+                self.on_status(task)
+            except Exception as e:
+                logging.debug(f"Помилка оновлення статусу завдання: {e}")
+
+
+class Debouncer:
+    """
+    Об'єднання частих подій в один виклик через root.after
+
+    За замовчуванням (trailing) callback викликається через delay_ms після
+    останнього trigger() - кожна нова подія переносить виклик. З leading=True
+    перша подія виконується одразу, а події протягом наступних delay_ms
+    об'єднуються в один виклик у кінці інтервалу (не частіше ніж раз на
+    delay_ms і без втрати останнього стану).
+
+    Args:
+        root: Корінь Tk (методи after та after_cancel)
+        delay_ms: Інтервал (мс)
+        callback: Функція, що викликається з аргументами останнього trigger()
+        leading: Виконувати першу подію одразу
+    """
+
+    def __init__(self, root, delay_ms: int, callback: Callable[..., Any], leading: bool = False):
+        self.root = root
+        self.delay_ms = delay_ms
+        self.callback = callback
+        self.leading = leading
+        self._after_id = None
+        self._pending = False
+        self._args: tuple = ()
+
+    @property
+    def pending(self) -> bool:
+        """Чи очікує виклик"""
+        return self._pending
+
+    def trigger(self, *args):
+        """Реєструє подію (аргументи останньої події передаються в callback)"""
+        self._args = args
+        if self.leading:
+            if self._after_id is None:
+                self._start_window()
+                self.callback(*args)
+            else:
+                self._pending = True
+            return
+        self._pending = True
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+        self._after_id = self.root.after(self.delay_ms, self._expire)
+
+    def flush(self):
+        """Виконує відкладений виклик негайно"""
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+        self._expire()
+
+    def cancel(self):
+        """Скасовує відкладений виклик"""
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+        self._after_id = None
+        self._pending = False
+
+    def _start_window(self):
+        self._after_id = self.root.after(self.delay_ms, self._expire)
+
+    def _expire(self):
+        self._after_id = None
+        if not self._pending:
+            return
+        self._pending = False
+        if self.leading:
+            # Новий інтервал, щоб наступна подія не виконалась раніше ніж через delay_ms
+            self._start_window()
+        self.callback(*self._args)
@@ -15,7 +15,7 @@ except ImportError:
     SUCCESS = INFO = WARNING = DANGER = PRIMARY = SECONDARY = ""
     TTKBOOTSTRAP_AVAILABLE = False
 from tkinter import messagebox
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import json
 import os
 
@@ -50,15 +50,22 @@ from balloon.constants import (
 from balloon.model.solve import solve_volume_to_payload, solve_payload_to_volume
 from balloon.validators import validate_all_inputs, ValidationError
 from balloon.labels import FIELD_LABELS, FIELD_TOOLTIPS, FIELD_DEFAULTS, COMBOBOX_VALUES, ABOUT_TEXT, BUTTON_LABELS, SECTION_LABELS, PERM_MULT_HINT
-from balloon.help_texts import HELP_FORMULAS, HELP_PARAMETERS, HELP_SAFETY, HELP_EXAMPLES, HELP_FAQ, ABOUT_TEXT_EXTENDED
-from balloon.patterns import generate_pattern_from_shape, calculate_seam_length
-from balloon.patterns.profile_based import generate_pattern_from_shape_profile
 from balloon.gui.shape_params_helper import get_shape_params_from_sources, get_shape_code_from_sources
-from balloon.gui.matplotlib_3d_fallback import create_matplotlib_3d_fallback
+from balloon.gui.task_runner import TaskRunner, Task, Debouncer
+from balloon.gui.pattern_canvas import PatternRenderer
+from balloon.gui.preview_3d import PreviewRenderer, style_axes_3d
+from balloon.gui.height_graph import HeightGraph
+from balloon.gui.results_view import ResultsTable, build_results_view, STATUS_ERROR, STATUS_WARNING
+from balloon import perf_log
+# Довідка, генерація викрійок та matplotlib 3D імпортуються в методах, що їх використовують,
+# щоб вікно з'являлося без очікування на SciPy/shapely/matplotlib
 
 import logging
 import sys
 
+# Затримка живого перерахунку після останнього редагування поля (мс)
+LIVE_RECALC_DELAY_MS = 400
+
 # Визначаємо шлях для логів (в exe режимі використовуємо тимчасову папку)
 if getattr(sys, 'frozen', False):
     # PyInstaller створює тимчасову папку в sys._MEIPASS
@@ -73,6 +80,53 @@ logging.basicConfig(
     encoding='utf-8'
 )
 
+# Розширення файлу -> формат export_pattern_file (решта - PNG через matplotlib)
+PATTERN_EXPORT_EXTENSIONS = {
+    '.svg': 'svg', '.pdf': 'pdf', '.dxf': 'dxf',
+    '.plt': 'hpgl', '.hpgl': 'hpgl', '.gcode': 'gcode', '.nc': 'gcode',
+}
+
+
+def render_pattern_png(pattern: Dict[str, Any], filename: str) -> str:
+    """
+    Зберігає контур викрійки в PNG
+
+    Використовує Figure без pyplot (Agg), тож викликається з робочого потоку.
+
+    Returns:
+        Шлях до файлу
+    """
+    from matplotlib.figure import Figure
+    
+    fig = Figure(figsize=(10, 12))
+    ax = fig.add_subplot()
+    ax.set_aspect('equal')
+    ax.axis('off')
+    ax.set_facecolor('#1e1e1e')
+    fig.patch.set_facecolor('#1e1e1e')
+    
+    if pattern.get('pattern_type') in ['sphere_gore', 'pear_gore', 'cigar_gore']:
+        points = pattern.get('points', [])
+        if points:
+            xs = [x for x, y in points]
+            ys = [y for x, y in points]
+            # Малюємо лінію викрійки (з припуском)
+            ax.plot(xs, ys, 'b-', linewidth=2, label='Лінія розкрою')
+            ax.plot([-x for x in xs], ys, 'b-', linewidth=2)
+            # Малюємо лінію шва (без припуску), якщо є
+            if 'seam_allowance_m' in pattern and pattern['seam_allowance_m'] > 0:
+                allowance = pattern['seam_allowance_m']
+                seam_xs = [x - allowance for x in xs]
+                seam_ys = ys
+                ax.plot(seam_xs, seam_ys, 'r--', linewidth=1, alpha=0.7, label='Лінія шва')
+                ax.plot([-x for x in seam_xs], seam_ys, 'r--', linewidth=1, alpha=0.7)
+            ax.axvline(0, color='white', linestyle='--', alpha=0.5)
+            ax.legend(loc='upper right')
+    
+    fig.savefig(filename, dpi=150, bbox_inches='tight', facecolor='#1e1e1e')
+    return filename
+
+
 class BalloonCalculatorGUI:
     """Головний клас GUI для калькулятора аеростатів"""
     
@@ -93,6 +147,20 @@ class BalloonCalculatorGUI:
         
         # Змінна для теми
         self.dark_mode = True
+        
+        # Постійний кеш результатів між сесіями (BALLOON_RESULT_CACHE=0 вимикає)
+        from balloon.cache import enable_result_cache
+        enable_result_cache()
+        
+        # Фонові розрахунки: результати повертаються в головний потік через root.after
+        self.tasks = TaskRunner(self.root, on_status=self._on_task_status)
+        # Живий перерахунок: редагування полів об'єднуються, виконується останній стан
+        self.live_recalc_var = tk.BooleanVar(value=False)
+        self._live_debouncer = Debouncer(self.root, LIVE_RECALC_DELAY_MS, lambda: self.calculate(live=True))
+        self._live_values: Dict[str, str] = {}
+        # 3D прев'ю: не частіше ніж раз на 300 мс, останній запит не втрачається
+        self._preview_debouncer = Debouncer(self.root, 300, self._refresh_3d_preview, leading=True)
+        
         # Змінні
         self.mode_var = tk.StringVar(value="payload")
         self.advanced_mode_var = tk.BooleanVar(value=False)  # False = Basic mode, True = Advanced mode
@@ -110,7 +178,6 @@ class BalloonCalculatorGUI:
         # Віджети
         self.entries = {}
         self.labels = {}
-        self.preview_update_pending = False  # Для обмеження частоти оновлення
         self.setup_ui()
         self.setup_bindings()
         self.load_settings()
@@ -484,11 +551,69 @@ class BalloonCalculatorGUI:
         if TTKBOOTSTRAP_AVAILABLE:
             save_btn.configure(bootstyle=PRIMARY)
         save_btn.pack(side="left", padx=(0, 10))
+        
+        live_check = ttk.Checkbutton(
+            row2_frame, text="Живий перерахунок",
+            variable=self.live_recalc_var, command=self._on_live_toggle
+        )
+        live_check.pack(side="left", padx=(0, 10))
+        self.create_tooltip(live_check, "Перераховувати результати автоматично після зміни полів")
         # about/help винесені у хедер
         
+        # Прогрес фонових розрахунків (показується лише під час виконання)
+        self.task_frame = ttk.Frame(button_frame)
+        self.task_progress = ttk.Progressbar(self.task_frame, mode='indeterminate', length=160)
+        self.task_progress.pack(side="left", padx=(0, 10))
+        self.task_label = ttk.Label(self.task_frame, text="")
+        self.task_label.pack(side="left", fill="x", expand=True)
+        self.task_cancel_btn = ttk.Button(self.task_frame, text="Скасувати", command=self.cancel_tasks)
+        if TTKBOOTSTRAP_AVAILABLE:
+            self.task_cancel_btn.configure(bootstyle=DANGER)
+        self.task_cancel_btn.pack(side="right")
+        
         row += 1
         return row
     
+    def cancel_tasks(self):
+        """Скасовує всі фонові розрахунки"""
+        self.tasks.cancel()
+    
+    def _on_task_status(self, task: Task):
+        """Оновлює індикатор прогресу за станом фонових завдань"""
+        if not hasattr(self, 'task_frame'):
+            return
+        active = self.tasks.active_tasks()
+        if not active:
+            self.task_progress.stop()
+            self.task_frame.pack_forget()
+            if task.state == Task.CANCELLED:
+                self.status_label.config(text="Статус: розрахунок скасовано", foreground="#ffcc66")
+            return
+        
+        current = active[-1]
+        if not self.task_frame.winfo_ismapped():
+            self.task_frame.pack(fill="x", pady=(5, 0))
+        if current.progress is None:
+            if str(self.task_progress.cget('mode')) != 'indeterminate':
+                self.task_progress.configure(mode='indeterminate', value=0)
+            self.task_progress.start(15)
+        else:
+            self.task_progress.stop()
+            self.task_progress.configure(mode='determinate', maximum=1.0, value=current.progress)
+        suffix = f" (+{len(active) - 1})" if len(active) > 1 else ""
+        self.task_label.config(text=f"{current.message}{suffix}")
+    
+    def _task_error_handler(self, title: str, prefix: str = ""):
+        """Обробник помилок фонового завдання: лог та повідомлення користувачу"""
+        def handle(error: BaseException):
+            if isinstance(error, ValidationError):
+                logging.warning("Помилка валідації: %s", str(error))
+                messagebox.showerror("Помилка валідації", str(error))
+                return
+            logging.error("%s: %s", title, str(error), exc_info=(type(error), error, error.__traceback__))
+            messagebox.showerror(title, f"{prefix}{error}")
+        return handle
+    
     def create_3d_preview_section(self, parent):
         """Створення секції з 3D прев'ю моделі"""
         # Заголовок
@@ -502,30 +627,12 @@ class BalloonCalculatorGUI:
         try:
             from matplotlib.figure import Figure
             from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-            import numpy as np
             
             # Створюємо невелику фігуру
             self.preview_fig = Figure(figsize=(4, 3), facecolor='#1e1e1e', dpi=80)
             self.preview_ax = self.preview_fig.add_subplot(111, projection='3d')
-            self.preview_ax.set_facecolor('#1e1e1e')
-            
-            # Налаштування темної теми
-            self.preview_ax.xaxis.pane.fill = False
-            self.preview_ax.yaxis.pane.fill = False
-            self.preview_ax.zaxis.pane.fill = False
-            self.preview_ax.xaxis.pane.set_edgecolor('#333333')
-            self.preview_ax.yaxis.pane.set_edgecolor('#333333')
-            self.preview_ax.zaxis.pane.set_edgecolor('#333333')
-            self.preview_ax.xaxis.label.set_color('#ffffff')
-            self.preview_ax.yaxis.label.set_color('#ffffff')
-            self.preview_ax.zaxis.label.set_color('#ffffff')
-            self.preview_ax.tick_params(colors='#ffffff', labelsize=6)
-            self.preview_ax.grid(True, color='#444444', linestyle='--', alpha=0.3)
-            
-            # Прибираємо підписи осей для компактності
-            self.preview_ax.set_xticklabels([])
-            self.preview_ax.set_yticklabels([])
-            self.preview_ax.set_zticklabels([])
+            # Темна тема налаштовується один раз: прев'ю не очищує осі
+            style_axes_3d(self.preview_ax)
             
             # Canvas для відображення
             self.preview_canvas = FigureCanvasTkAgg(self.preview_fig, canvas_frame)
@@ -534,6 +641,7 @@ class BalloonCalculatorGUI:
             
             # Зберігаємо посилання для оновлення
             self.preview_canvas_widget = self.preview_canvas.get_tk_widget()
+            self.preview_renderer = PreviewRenderer(self.preview_ax, self.preview_canvas)
             
         except Exception as e:
             logging.warning(f"Не вдалося створити 3D прев'ю: {e}")
@@ -541,6 +649,7 @@ class BalloonCalculatorGUI:
             self.preview_fig = None
             self.preview_ax = None
             self.preview_canvas = None
+            self.preview_renderer = None
         
         # Початкове відображення
         self.update_3d_preview()
@@ -549,24 +658,16 @@ class BalloonCalculatorGUI:
         """Оновлює 3D прев'ю моделі на основі поточної форми (з розділу викрійок)"""
         if not hasattr(self, 'preview_ax') or self.preview_ax is None:
             return
-        
-        # Обмежуємо частоту оновлення (не більше раз на 300мс)
-        if hasattr(self, 'preview_update_pending') and self.preview_update_pending:
-            return
-        
-        self.preview_update_pending = True
-        self.root.after(300, lambda: setattr(self, 'preview_update_pending', False))
-        
+        self._preview_debouncer.trigger()
+    
+    def _refresh_3d_preview(self):
+        """Перемальовує 3D прев'ю (викликається через _preview_debouncer)"""
         try:
-            # Очищаємо попередній графік
-            self.preview_ax.clear()
-            
             # Отримуємо поточну форму з розділу викрійок
             shape_display = self.pattern_shape_var.get()
             # Використовуємо shape_code_map для перетворення
             shape_code = self.shape_code_map.get(shape_display, 'sphere')
-            # Логування для діагностики
-            logging.info(f"update_3d_preview: shape_display={shape_display}, shape_code={shape_code}")
+            perf = perf_log.span('gui.preview_3d', every=perf_log.HIGH_FREQUENCY_EVERY, shape=shape_code)
             
             # Отримуємо параметри форми через допоміжну функцію
             shape_params = get_shape_params_from_sources(
@@ -576,175 +677,15 @@ class BalloonCalculatorGUI:
                 current_pattern=getattr(self, 'current_pattern', None)
             )
             
-            # Малюємо модель
-            import numpy as np
-            self._draw_preview_3d(shape_code, shape_params)
+            perf.mark('params')
             
-            # Оновлюємо canvas
-            if self.preview_canvas:
-                self.preview_canvas.draw()
+            # Оновлюємо вершини поверхні; canvas перемальовується через draw_idle
+            changed = self.preview_renderer.render(shape_code, shape_params)
+            perf.finish(status='ok', changed=changed, params=shape_params)
                 
         except Exception as e:
             logging.warning(f"Помилка оновлення 3D прев'ю: {e}")
     
-    def _draw_preview_3d(self, shape_code: str, shape_params: dict):
-        """Малює 3D модель в прев'ю"""
-        import numpy as np
-        
-        # Логування для діагностики
-        logging.info(f"_draw_preview_3d: shape_code={shape_code}, shape_params={shape_params}")
-        
-        # Налаштування темної теми
-        self.preview_ax.set_facecolor('#1e1e1e')
-        self.preview_ax.xaxis.pane.fill = False
-        self.preview_ax.yaxis.pane.fill = False
-        self.preview_ax.zaxis.pane.fill = False
-        self.preview_ax.xaxis.pane.set_edgecolor('#333333')
-        self.preview_ax.yaxis.pane.set_edgecolor('#333333')
-        self.preview_ax.zaxis.pane.set_edgecolor('#333333')
-        self.preview_ax.tick_params(colors='#ffffff', labelsize=6)
-        self.preview_ax.grid(True, color='#444444', linestyle='--', alpha=0.3)
-        self.preview_ax.set_xticklabels([])
-        self.preview_ax.set_yticklabels([])
-        self.preview_ax.set_zticklabels([])
-        
-        if shape_code == 'sphere':
-            # Використовуємо profile-based mesh для узгодженості
-            try:
-                from balloon.shapes.profile import get_shape_profile
-                profile = get_shape_profile('sphere', shape_params)
-                if profile:
-                    x, y, z = profile.generate_mesh(num_theta=20, num_z=20, center_at_origin=False)
-                    self.preview_ax.plot_surface(x, y, z, color='#4a90e2', alpha=0.7, edgecolor='#2a5a9a', linewidth=0.3)
-                else:
-                    raise ValueError("Не вдалося створити профіль")
-            except Exception:
-                # Fallback на просту апроксимацію
-                radius = shape_params.get('radius', 1.0)
-                u = np.linspace(0, 2 * np.pi, 20)
-                v = np.linspace(0, np.pi, 20)
-                x = radius * np.outer(np.cos(u), np.sin(v))
-                y = radius * np.outer(np.sin(u), np.sin(v))
-                z = radius * np.outer(np.ones(np.size(u)), np.cos(v))
-                self.preview_ax.plot_surface(x, y, z, color='#4a90e2', alpha=0.7, edgecolor='#2a5a9a', linewidth=0.3)
-            
-        elif shape_code == 'pillow':
-            length = shape_params.get('pillow_len', 3.0)
-            width = shape_params.get('pillow_wid', 2.0)
-            thickness = width * 0.3
-            
-            # Еліпсоїд
-            u = np.linspace(0, 2 * np.pi, 20)
-            v = np.linspace(0, np.pi, 20)
-            u_grid, v_grid = np.meshgrid(u, v)
-            
-            a = length / 2
-            b = width / 2
-            c = thickness / 2
-            
-            x = a * np.cos(u_grid) * np.sin(v_grid)
-            y = b * np.sin(u_grid) * np.sin(v_grid)
-            z = c * np.cos(v_grid)
-            
-            x = x - a + length / 2
-            y = y - b + width / 2
-            z = z - c + thickness / 2
-            
-            self.preview_ax.plot_surface(x, y, z, color='#4a90e2', alpha=0.7, edgecolor='#2a5a9a', linewidth=0.3)
-            
-        elif shape_code == 'pear':
-            # Використовуємо profile-based mesh для узгодженості
-            try:
-                from balloon.shapes.profile import get_shape_profile
-                profile = get_shape_profile('pear', shape_params)
-                if profile:
-                    x, y, z = profile.generate_mesh(num_theta=20, num_z=20, center_at_origin=False)
-                    self.preview_ax.plot_surface(x, y, z, color='#4a90e2', alpha=0.7, edgecolor='#2a5a9a', linewidth=0.3)
-                else:
-                    raise ValueError("Не вдалося створити профіль")
-            except Exception:
-                # Fallback на просту апроксимацію (лінійна інтерполяція)
-                height = shape_params.get('pear_height', 3.0)
-                top_radius = shape_params.get('pear_top_radius', 1.2)
-                bottom_radius = shape_params.get('pear_bottom_radius', 0.6)
-                u = np.linspace(0, 2 * np.pi, 20)
-                v = np.linspace(0, 1, 20)
-                u_grid, v_grid = np.meshgrid(u, v)
-                r_at_height = top_radius * (1 - v_grid) + bottom_radius * v_grid
-                x = r_at_height * np.cos(u_grid)
-                y = r_at_height * np.sin(u_grid)
-                z = height * v_grid
-                self.preview_ax.plot_surface(x, y, z, color='#4a90e2', alpha=0.7, edgecolor='#2a5a9a', linewidth=0.3)
-            
-        elif shape_code == 'cigar':
-            # Використовуємо profile-based mesh для узгодженості
-            try:
-                from balloon.shapes.profile import get_shape_profile
-                profile = get_shape_profile('cigar', shape_params)
-                if profile:
-                    x, y, z = profile.generate_mesh(num_theta=20, num_z=20, center_at_origin=False)
-                    self.preview_ax.plot_surface(x, y, z, color='#4a90e2', alpha=0.7, edgecolor='#2a5a9a', linewidth=0.3)
-                else:
-                    raise ValueError("Не вдалося створити профіль")
-            except Exception:
-                # Fallback на просту апроксимацію
-                length = shape_params.get('cigar_length', 5.0)
-                radius = shape_params.get('cigar_radius', 1.0)
-                cylinder_length = max(0, length - 2 * radius)
-                if cylinder_length > 0:
-                    u_cyl = np.linspace(0, 2 * np.pi, 20)
-                    z_cyl = np.linspace(radius, length - radius, 10)
-                    u_grid_cyl, z_grid_cyl = np.meshgrid(u_cyl, z_cyl)
-                    x_cyl = radius * np.cos(u_grid_cyl)
-                    y_cyl = radius * np.sin(u_grid_cyl)
-                    z_cyl = z_grid_cyl
-                    self.preview_ax.plot_surface(x_cyl, y_cyl, z_cyl, color='#4a90e2', alpha=0.7, edgecolor='#2a5a9a', linewidth=0.3)
-                u = np.linspace(0, 2 * np.pi, 20)
-                v = np.linspace(0, np.pi / 2, 10)
-                u_grid, v_grid = np.meshgrid(u, v)
-                x1 = radius * np.cos(u_grid) * np.sin(v_grid)
-                y1 = radius * np.sin(u_grid) * np.sin(v_grid)
-                z1 = radius * (1 - np.cos(v_grid))
-                self.preview_ax.plot_surface(x1, y1, z1, color='#4a90e2', alpha=0.7, edgecolor='#2a5a9a', linewidth=0.3)
-                x2 = radius * np.cos(u_grid) * np.sin(v_grid)
-                y2 = radius * np.sin(u_grid) * np.sin(v_grid)
-                z2 = (length - radius) + radius * np.cos(v_grid)
-                self.preview_ax.plot_surface(x2, y2, z2, color='#4a90e2', alpha=0.7, edgecolor='#2a5a9a', linewidth=0.3)
-        
-        # Налаштування масштабу в залежності від форми
-        if shape_code == 'sphere':
-            radius = shape_params.get('radius', 1.0)
-            max_dim = radius * 1.5
-            self.preview_ax.set_xlim([-max_dim, max_dim])
-            self.preview_ax.set_ylim([-max_dim, max_dim])
-            self.preview_ax.set_zlim([-max_dim, max_dim])
-            self.preview_ax.set_box_aspect([1, 1, 1])
-        elif shape_code == 'pillow':
-            length = shape_params.get('pillow_len', 3.0)
-            width = shape_params.get('pillow_wid', 2.0)
-            thickness = width * 0.3
-            max_dim = max(length, width, thickness) * 1.2
-            self.preview_ax.set_xlim([0, max_dim])
-            self.preview_ax.set_ylim([0, max_dim])
-            self.preview_ax.set_zlim([0, max_dim])
-            self.preview_ax.set_box_aspect([length, width, thickness])
-        elif shape_code == 'pear':
-            height = shape_params.get('pear_height', 3.0)
-            max_radius = max(shape_params.get('pear_top_radius', 1.2), shape_params.get('pear_bottom_radius', 0.6))
-            max_dim = max(height, max_radius * 2) * 1.2
-            self.preview_ax.set_xlim([-max_dim/2, max_dim/2])
-            self.preview_ax.set_ylim([-max_dim/2, max_dim/2])
-            self.preview_ax.set_zlim([0, max_dim])
-            self.preview_ax.set_box_aspect([max_radius*2, max_radius*2, height])
-        elif shape_code == 'cigar':
-            length = shape_params.get('cigar_length', 5.0)
-            radius = shape_params.get('cigar_radius', 1.0)
-            max_dim = max(length, radius * 2) * 1.2
-            self.preview_ax.set_xlim([-max_dim/2, max_dim/2])
-            self.preview_ax.set_ylim([-max_dim/2, max_dim/2])
-            self.preview_ax.set_zlim([0, max_dim])
-            self.preview_ax.set_box_aspect([radius*2, radius*2, length])
-        
     def create_result_section(self, parent, row):
         """Створення секції результатів"""
         ttk.Label(parent, text=SECTION_LABELS['results'], font=("Arial", 12, "bold")).grid(
@@ -761,28 +702,36 @@ class BalloonCalculatorGUI:
         result_frame.grid(row=row, column=0, columnspan=2, sticky="nsew", pady=5)
         parent.rowconfigure(row, weight=1, minsize=260)
         
-        # Text widget для результатів з можливістю кольорового форматування
-        result_text = tk.Text(
-            result_frame, 
-            wrap="word",
-            font=("Courier New", 11),
-            bg="#1e1e1e",
-            fg="#ffffff",
-            relief="sunken",
-            borderwidth=2,
-            padx=10,
-            pady=10,
-            state="disabled"
+        # Таблиця результатів: рядки оновлюються на місці при перерахунку
+        style = ttk.Style()
+        style.configure('Results.Treeview', background="#1e1e1e", fieldbackground="#1e1e1e",
+                        foreground="#ffffff", font=("Courier New", 11), rowheight=22)
+        result_tree = ttk.Treeview(
+            result_frame,
+            columns=ResultsTable.COLUMNS,
+            show="",
+            style='Results.Treeview',
+            selectmode="browse",
         )
-        result_text.pack(fill="both", expand=True)
+        result_tree.column('label', width=330, stretch=True)
+        result_tree.column('value', width=110, anchor="e", stretch=False)
+        result_tree.column('unit', width=70, stretch=False)
+        result_tree.pack(side="left", fill="both", expand=True)
         
         # Scrollbar
-        scrollbar = ttk.Scrollbar(result_frame, orient="vertical", command=result_text.yview)
+        scrollbar = ttk.Scrollbar(result_frame, orient="vertical", command=result_tree.yview)
         scrollbar.pack(side="right", fill="y")
-        result_text.configure(yscrollcommand=scrollbar.set)
+        result_tree.configure(yscrollcommand=scrollbar.set)
+        
+        self.results_table = ResultsTable(result_tree)
+        result_tree.bind("<Control-c>", self.copy_results)
         
-        # Зберігаємо посилання на text widget
-        self.result_text_widget = result_text
+    def copy_results(self, event=None):
+        """Копіювання таблиці результатів у буфер обміну"""
+        text = self.results_table.as_text()
+        if text:
+            self.root.clipboard_clear()
+            self.root.clipboard_append(text)
         
     def setup_bindings(self):
         """Налаштування прив'язок подій"""
@@ -791,8 +740,10 @@ class BalloonCalculatorGUI:
         self.gas_var.trace_add("write", self.update_fields)
         self.mode_var.trace_add("write", self.update_fields)
         self.shape_var.trace_add("write", self.update_fields)
+        for var in (self.material_var, self.gas_var, self.mode_var, self.shape_var):
+            var.trace_add("write", self.schedule_live_recalculation)
         if 'shape_type' in self.entries:
-            self.entries['shape_type'].bind("<<ComboboxSelected>>", lambda e: self.update_fields())
+            self.entries['shape_type'].bind("<<ComboboxSelected>>", lambda e: (self.update_fields(), self.schedule_live_recalculation()))
         
         # Валідація в реальному часі для числових полів
         numeric_fields = ['thickness', 'start_height', 'work_height', 'ground_temp', 
@@ -876,6 +827,11 @@ class BalloonCalculatorGUI:
             # Не критично, якщо не вдалося налаштувати стиль
             logging.debug(f"Не вдалося налаштувати стиль Invalid.TEntry: {e}")
         
+        # Живий перерахунок лише для валідного значення, що змінилось
+        if error_msg is None and self._live_values.get(field_name) != value:
+            self._live_values[field_name] = value
+            self.schedule_live_recalculation()
+        
     def update_density(self, *args):
         """Оновлення щільності при зміні матеріалу"""
         mat = self.material_var.get()
@@ -973,10 +929,20 @@ class BalloonCalculatorGUI:
             for hint in getattr(self, 'advanced_hints', {}).values():
                 hint.grid_remove()
             
-    def calculate(self):
-        """Виконання розрахунків"""
+    def calculate(self, live: bool = False):
+        """
+        Виконання розрахунків
+        
+        Args:
+            live: Живий перерахунок після редагування поля - помилки
+                показуються в статусі без діалогів, поля розмірів не
+                перезаписуються, а незмінені результати не перемальовуються
+        """
         try:
-            logging.info("Початок розрахунку. Вхідні дані: %s", {k: v.get() if hasattr(v, 'get') else v for k, v in self.entries.items()})
+            perf = perf_log.span(
+                'gui.calculate', every=perf_log.HIGH_FREQUENCY_EVERY if live else 1, live=live,
+                inputs=lambda: {k: v.get() if hasattr(v, 'get') else v for k, v in self.entries.items()},
+            )
             # Збір даних з полів
             # Отримуємо gas_volume залежно від режиму
             if self.mode_var.get() == "payload":
@@ -1034,6 +1000,9 @@ class BalloonCalculatorGUI:
             # Валідація
             validated_numbers, validated_strings = validate_all_inputs(**inputs)
             validated_shape_params = {k: v for k, v in validated_numbers.items() if k in shape_params_raw}
+            perf.mark('validate')
+            perf['mode'] = validated_strings['mode']
+            perf['shape'] = shape_code
             # Розрахунки
             # В режимі "volume" gas_volume розраховується з payload
             # В режимі "payload" gas_volume береться з поля gas_volume
@@ -1049,306 +1018,196 @@ class BalloonCalculatorGUI:
                 # В режимі "payload" використовуємо gas_volume
                 gas_volume_for_calc = validated_numbers.get('gas_volume', 0)
             
-            # Використовуємо model.solve для розрахунків
-            if validated_strings['mode'] == "payload":
-                results = solve_volume_to_payload(
-                    gas_type=validated_strings['gas_type'],
-                    gas_volume=gas_volume_for_calc,
-                    material=validated_strings['material'],
-                    thickness_um=validated_numbers['thickness'],
-                    start_height=validated_numbers['start_height'],
-                    work_height=validated_numbers['work_height'],
-                    ground_temp=validated_numbers['ground_temp'],
-                    inside_temp=validated_numbers['inside_temp'],
-                    duration=validated_numbers['duration'],
-                    perm_mult=perm_mult,
-                    shape_type=shape_code,
-                    shape_params=validated_shape_params,
-                    extra_mass=validated_numbers.get('extra_mass', 0.0),
-                    seam_factor=validated_numbers.get('seam_factor', 1.0),
-                )
-            else:
-                results = solve_payload_to_volume(
-                    gas_type=validated_strings['gas_type'],
-                    target_payload=validated_numbers.get('payload', 0.0),
-                    material=validated_strings['material'],
-                    thickness_um=validated_numbers['thickness'],
-                    start_height=validated_numbers['start_height'],
-                    work_height=validated_numbers['work_height'],
-                    ground_temp=validated_numbers['ground_temp'],
-                    inside_temp=validated_numbers['inside_temp'],
-                    duration=validated_numbers['duration'],
-                    perm_mult=perm_mult,
-                    shape_type=shape_code,
-                    shape_params=validated_shape_params,
-                    extra_mass=validated_numbers.get('extra_mass', 0.0),
-                    seam_factor=validated_numbers.get('seam_factor', 1.0),
-                )
-            
-            # Розрахунок максимального часу польоту для гелію/водню
-            if validated_strings['gas_type'] in ("Гелій", "Водень"):
-                try:
-                    flight_time_info = calculate_max_flight_time(
+            def work(task):
+                """Розв'язання у фоновому потоці"""
+                perf.mark('queue')
+                task.report(None, "Розв'язання...")
+                # Використовуємо model.solve для розрахунків
+                if validated_strings['mode'] == "payload":
+                    results = solve_volume_to_payload(
                         gas_type=validated_strings['gas_type'],
+                        gas_volume=gas_volume_for_calc,
                         material=validated_strings['material'],
                         thickness_um=validated_numbers['thickness'],
-                        gas_volume=validated_numbers['gas_volume'],
                         start_height=validated_numbers['start_height'],
                         work_height=validated_numbers['work_height'],
                         ground_temp=validated_numbers['ground_temp'],
                         inside_temp=validated_numbers['inside_temp'],
+                        duration=validated_numbers['duration'],
                         perm_mult=perm_mult,
                         shape_type=shape_code,
                         shape_params=validated_shape_params,
                         extra_mass=validated_numbers.get('extra_mass', 0.0),
                         seam_factor=validated_numbers.get('seam_factor', 1.0),
                     )
-                    results['flight_time_info'] = flight_time_info
+                else:
+                    results = solve_payload_to_volume(
+                        gas_type=validated_strings['gas_type'],
+                        target_payload=validated_numbers.get('payload', 0.0),
+                        material=validated_strings['material'],
+                        thickness_um=validated_numbers['thickness'],
+                        start_height=validated_numbers['start_height'],
+                        work_height=validated_numbers['work_height'],
+                        ground_temp=validated_numbers['ground_temp'],
+                        inside_temp=validated_numbers['inside_temp'],
+                        duration=validated_numbers['duration'],
+                        perm_mult=perm_mult,
+                        shape_type=shape_code,
+                        shape_params=validated_shape_params,
+                        extra_mass=validated_numbers.get('extra_mass', 0.0),
+                        seam_factor=validated_numbers.get('seam_factor', 1.0),
+                    )
+            
+                task.report(None, "Розрахунок часу польоту...")
+                # Розрахунок максимального часу польоту для гелію/водню
+                if validated_strings['gas_type'] in ("Гелій", "Водень"):
+                    try:
+                        flight_time_info = calculate_max_flight_time(
+                            gas_type=validated_strings['gas_type'],
+                            material=validated_strings['material'],
+                            thickness_um=validated_numbers['thickness'],
+                            gas_volume=validated_numbers['gas_volume'],
+                            start_height=validated_numbers['start_height'],
+                            work_height=validated_numbers['work_height'],
+                            ground_temp=validated_numbers['ground_temp'],
+                            inside_temp=validated_numbers['inside_temp'],
+                            perm_mult=perm_mult,
+                            shape_type=shape_code,
+                            shape_params=validated_shape_params,
+                            extra_mass=validated_numbers.get('extra_mass', 0.0),
+                            seam_factor=validated_numbers.get('seam_factor', 1.0),
+                        )
+                        results['flight_time_info'] = flight_time_info
+                    except Exception as e:
+                        logging.warning(f"Помилка розрахунку часу польоту: {e}")
+                        results['flight_time_info'] = None
+                perf.mark('solve')
+                return results
+            
+            def apply(results):
+                """Оновлення інтерфейсу результатами (головний потік)"""
+                try:
+                    previous = getattr(self, 'last_calculation_results', None)
+                    if live and previous == results:
+                        # Введення змінилось, а результат - ні (напр. "10" -> "10.0")
+                        self._show_live_status(None)
+                        perf.finish(status='unchanged')
+                        return
+                    
+                    # Оновлюємо поля з розрахованими розмірами (не під час введення користувача)
+                    calculated_shape_params = results.get('shape_params', {})
+                    if calculated_shape_params and not live:
+                        shape_code = validated_strings.get('shape_type', 'sphere')
+                        if shape_code == "pillow":
+                            if 'pillow_len' in calculated_shape_params and 'pillow_len' in self.entries:
+                                self.entries['pillow_len'].delete(0, tk.END)
+                                self.entries['pillow_len'].insert(0, f"{calculated_shape_params['pillow_len']:.2f}")
+                            if 'pillow_wid' in calculated_shape_params and 'pillow_wid' in self.entries:
+                                self.entries['pillow_wid'].delete(0, tk.END)
+                                self.entries['pillow_wid'].insert(0, f"{calculated_shape_params['pillow_wid']:.2f}")
+                        elif shape_code == "pear":
+                            if 'pear_height' in calculated_shape_params and 'pear_height' in self.entries:
+                                self.entries['pear_height'].delete(0, tk.END)
+                                self.entries['pear_height'].insert(0, f"{calculated_shape_params['pear_height']:.2f}")
+                            if 'pear_top_radius' in calculated_shape_params and 'pear_top_radius' in self.entries:
+                                self.entries['pear_top_radius'].delete(0, tk.END)
+                                self.entries['pear_top_radius'].insert(0, f"{calculated_shape_params['pear_top_radius']:.2f}")
+                            if 'pear_bottom_radius' in calculated_shape_params and 'pear_bottom_radius' in self.entries:
+                                self.entries['pear_bottom_radius'].delete(0, tk.END)
+                                self.entries['pear_bottom_radius'].insert(0, f"{calculated_shape_params['pear_bottom_radius']:.2f}")
+                        elif shape_code == "cigar":
+                            if 'cigar_length' in calculated_shape_params and 'cigar_length' in self.entries:
+                                self.entries['cigar_length'].delete(0, tk.END)
+                                self.entries['cigar_length'].insert(0, f"{calculated_shape_params['cigar_length']:.2f}")
+                            if 'cigar_radius' in calculated_shape_params and 'cigar_radius' in self.entries:
+                                self.entries['cigar_radius'].delete(0, tk.END)
+                                self.entries['cigar_radius'].insert(0, f"{calculated_shape_params['cigar_radius']:.2f}")
+            
+                    # Зберігаємо результати для використання в викрійках
+                    self.last_calculation_results = results
+            
+                    self.format_results(results, validated_strings['mode'])
+            
+                    # Оновлюємо 3D прев'ю в розділі викрійок, якщо форма збігається і розміри змінились
+                    shape_changed = previous is None or any(
+                        previous.get(key) != results.get(key) for key in ('shape_params', 'radius', 'required_volume')
+                    )
+                    if shape_changed and hasattr(self, 'preview_ax') and self.preview_ax is not None:
+                        pattern_shape = self.pattern_shape_var.get()
+                        calc_shape = self.shape_display_to_code.get(self.entries['shape_type'].get(), 'sphere')
+                        if self.shape_display_to_code.get(pattern_shape, 'sphere') == calc_shape:
+                            self.update_3d_preview()
+                    
+                    # Відкритий графік висоти оновлюється для нових вхідних даних
+                    self.show_graph(refresh=True)
+                    perf.mark('display')
+                    perf.finish(status='ok')
                 except Exception as e:
-                    logging.warning(f"Помилка розрахунку часу польоту: {e}")
-                    results['flight_time_info'] = None
-            
-            # Оновлюємо поля з розрахованими розмірами
-            calculated_shape_params = results.get('shape_params', {})
-            if calculated_shape_params:
-                shape_code = validated_strings.get('shape_type', 'sphere')
-                if shape_code == "pillow":
-                    if 'pillow_len' in calculated_shape_params and 'pillow_len' in self.entries:
-                        self.entries['pillow_len'].delete(0, tk.END)
-                        self.entries['pillow_len'].insert(0, f"{calculated_shape_params['pillow_len']:.2f}")
-                    if 'pillow_wid' in calculated_shape_params and 'pillow_wid' in self.entries:
-                        self.entries['pillow_wid'].delete(0, tk.END)
-                        self.entries['pillow_wid'].insert(0, f"{calculated_shape_params['pillow_wid']:.2f}")
-                elif shape_code == "pear":
-                    if 'pear_height' in calculated_shape_params and 'pear_height' in self.entries:
-                        self.entries['pear_height'].delete(0, tk.END)
-                        self.entries['pear_height'].insert(0, f"{calculated_shape_params['pear_height']:.2f}")
-                    if 'pear_top_radius' in calculated_shape_params and 'pear_top_radius' in self.entries:
-                        self.entries['pear_top_radius'].delete(0, tk.END)
-                        self.entries['pear_top_radius'].insert(0, f"{calculated_shape_params['pear_top_radius']:.2f}")
-                    if 'pear_bottom_radius' in calculated_shape_params and 'pear_bottom_radius' in self.entries:
-                        self.entries['pear_bottom_radius'].delete(0, tk.END)
-                        self.entries['pear_bottom_radius'].insert(0, f"{calculated_shape_params['pear_bottom_radius']:.2f}")
-                elif shape_code == "cigar":
-                    if 'cigar_length' in calculated_shape_params and 'cigar_length' in self.entries:
-                        self.entries['cigar_length'].delete(0, tk.END)
-                        self.entries['cigar_length'].insert(0, f"{calculated_shape_params['cigar_length']:.2f}")
-                    if 'cigar_radius' in calculated_shape_params and 'cigar_radius' in self.entries:
-                        self.entries['cigar_radius'].delete(0, tk.END)
-                        self.entries['cigar_radius'].insert(0, f"{calculated_shape_params['cigar_radius']:.2f}")
-            
-            # Зберігаємо результати для використання в викрійках
-            self.last_calculation_results = results
-            
-            self.format_results(results, validated_strings['mode'])
-            
-            # Оновлюємо 3D прев'ю в розділі викрійок, якщо форма збігається
-            if hasattr(self, 'preview_ax') and self.preview_ax is not None:
-                pattern_shape = self.pattern_shape_var.get()
-                calc_shape = self.shape_display_to_code.get(self.entries['shape_type'].get(), 'sphere')
-                if self.shape_display_to_code.get(pattern_shape, 'sphere') == calc_shape:
-                    self.update_3d_preview()
-            logging.info("Розрахунок успішно завершено.")
+                    perf.finish(status='error', error=str(e))
+                    logging.error("Помилка відображення результатів: %s", str(e), exc_info=True)
+                    messagebox.showerror("Помилка розрахунку", str(e))
+            
+            show_error = self._show_live_status if live else self._task_error_handler("Помилка розрахунку")
+            
+            def failed(error):
+                perf.finish(status='error', error=str(error))
+                show_error(error)
+            
+            self.tasks.submit(
+                'calculate', work, on_success=apply, on_error=failed,
+                description="Перерахунок..." if live else "Розрахунок...",
+            )
         except ValidationError as e:
+            perf.finish(status='invalid')
             logging.warning("Помилка валідації: %s", str(e))
-            messagebox.showerror("Помилка валідації", str(e))
+            if live:
+                self._show_live_status(e)
+            else:
+                messagebox.showerror("Помилка валідації", str(e))
         except Exception as e:
+            perf.finish(status='error', error=str(e))
             logging.error("Помилка розрахунку: %s", str(e), exc_info=True)
-            messagebox.showerror("Помилка розрахунку", str(e))
+            if live:
+                self._show_live_status(e)
+            else:
+                messagebox.showerror("Помилка розрахунку", str(e))
+    
+    def schedule_live_recalculation(self, *args):
+        """Запланувати живий перерахунок (події за LIVE_RECALC_DELAY_MS об'єднуються)"""
+        if hasattr(self, 'live_recalc_var') and self.live_recalc_var.get():
+            self._live_debouncer.trigger()
+    
+    def _on_live_toggle(self):
+        """Вмикання живого режиму одразу перераховує поточні дані"""
+        if self.live_recalc_var.get():
+            self._live_debouncer.trigger()
+        else:
+            self._live_debouncer.cancel()
+            self.tasks.cancel('calculate')
+    
+    def _show_live_status(self, error: Optional[BaseException]):
+        """Помилка живого перерахунку показується в статусі, без діалогу"""
+        if error is not None and hasattr(self, 'status_label'):
+            self.status_label.config(text=f"Помилка: {error}", foreground="#ff6b6b")
             
     def format_results(self, results: Dict[str, Any], mode: str):
-        """Форматування результатів для відображення з кольоровим кодуванням"""
-        # Налаштування кольорів
-        normal_color = "#ffffff"
-        warning_color = "#ffaa00"
-        error_color = "#ff4444"
-        success_color = "#44ff44"
-        header_color = "#4a9eff"
-        
-        # Очищаємо попередні результати
-        self.result_text_widget.config(state="normal")
-        self.result_text_widget.delete(1.0, tk.END)
-        
-        # Встановлюємо ширину для підпису та значення
-        label_width = 32
-        value_width = 10
-        def fmt(label, value, unit=""):
-            return f"{label:<{label_width}} {value:>{value_width}} {unit}".rstrip()
-
-        def add_line(text, color=normal_color, bold=False):
-            """Додає рядок з кольором"""
-            self.result_text_widget.insert(tk.END, text + "\n", color)
-            if bold:
-                # Встановлюємо жирний шрифт для останнього рядка
-                start = self.result_text_widget.index(f"end-{len(text)+2}c")
-                end = self.result_text_widget.index("end-1c")
-                self.result_text_widget.tag_add("bold", start, end)
-        
-        # Налаштування тегів для кольорів
-        self.result_text_widget.tag_config(normal_color, foreground=normal_color)
-        self.result_text_widget.tag_config(warning_color, foreground=warning_color)
-        self.result_text_widget.tag_config(error_color, foreground=error_color)
-        self.result_text_widget.tag_config(success_color, foreground=success_color)
-        self.result_text_widget.tag_config(header_color, foreground=header_color)
-        self.result_text_widget.tag_config("bold", font=("Courier New", 10, "bold"))
-        
-        # Заголовок
-        add_line("=" * 60, header_color, True)
-        add_line("РЕЗУЛЬТАТИ РОЗРАХУНКУ", header_color, True)
-        add_line("=" * 60, header_color, True)
-        add_line("", normal_color)
-        
-        # Форма
+        """Відображення результатів у таблиці (оновлюються лише змінені рядки)"""
         shape_code = results.get('shape_type', 'sphere')
-        shape_display = self.shape_code_to_display.get(shape_code, shape_code)
-        add_line(fmt("Форма оболонки:", shape_display, ""), normal_color)
-        shape_params = results.get('shape_params', {}) or {}
-        if shape_code == "pillow":
-            add_line(fmt("Довжина подушки:", f"{shape_params.get('pillow_len', 0):.2f}", "м"), normal_color)
-            add_line(fmt("Ширина подушки:", f"{shape_params.get('pillow_wid', 0):.2f}", "м"), normal_color)
-            # Товщина розраховується з об'єму, але для викрійки не потрібна
-        elif shape_code == "pear":
-            add_line(fmt("Висота груші:", f"{shape_params.get('pear_height', 0):.2f}", "м"), normal_color)
-            add_line(fmt("Радіус верхньої частини:", f"{shape_params.get('pear_top_radius', 0):.2f}", "м"), normal_color)
-            add_line(fmt("Радіус нижньої частини:", f"{shape_params.get('pear_bottom_radius', 0):.2f}", "м"), normal_color)
-        elif shape_code == "cigar":
-            add_line(fmt("Довжина сигари:", f"{shape_params.get('cigar_length', 0):.2f}", "м"), normal_color)
-            add_line(fmt("Радіус сигари:", f"{shape_params.get('cigar_radius', 0):.2f}", "м"), normal_color)
-        add_line("", normal_color)
-        
-        # Основні параметри
-        if mode == "volume":
-            add_line(fmt("Потрібний обʼєм газу:", f"{results['gas_volume']:.2f}", "м³"), normal_color)
-        
-        add_line(fmt("Необхідний обʼєм кулі:", f"{results['required_volume']:.2f}", "м³"), normal_color)
-        add_line(fmt("Корисне навантаження (старт):", f"{results['payload']:.2f}", "кг"), 
-                success_color if results['payload'] > 0 else error_color)
-        add_line(fmt("Маса оболонки:", f"{results['mass_shell']:.2f}", "кг"), normal_color)
-        if results.get('extra_mass', 0) > 0:
-            add_line(fmt("Додаткова маса обладнання:", f"{results['extra_mass']:.2f}", "кг"), normal_color)
-        add_line(fmt("Підйомна сила (старт):", f"{results['lift']:.2f}", "кг"), normal_color)
-        add_line(fmt("Радіус кулі:", f"{results['radius']:.2f}", "м"), normal_color)
-        add_line(fmt("Площа поверхні:", f"{results['surface_area']:.2f}", "м²"), normal_color)
-        if results.get('effective_surface_area', 0) > 0 and results.get('effective_surface_area', 0) != results.get('surface_area', 0):
-            add_line(fmt("Ефективна площа (з урахуванням швів):", f"{results['effective_surface_area']:.2f}", "м²"), normal_color)
-        add_line(fmt("Щільність повітря:", f"{results['rho_air']:.4f}", "кг/м³"), normal_color)
-        add_line(fmt("Підйомна сила на м³:", f"{results['net_lift_per_m3']:.4f}", "кг/м³"), normal_color)
-        
-        # Втрати газу для гелію/водню
-        if self.gas_var.get() in ("Гелій", "Водень"):
-            add_line("", normal_color)
-            add_line("─" * 60, header_color)
-            add_line("АНАЛІЗ ВТРАТ ГАЗУ", header_color, True)
-            add_line("─" * 60, header_color)
-            add_line(fmt("Втрати газу за політ:", f"{results['gas_loss']:.6f}", "м³"), 
-                    warning_color if results['gas_loss'] > 0.1 else normal_color)
-            if results['gas_loss'] < 0.01:
-                add_line("Втрати газу дуже малі для цих параметрів (менше 0.01 м³)", normal_color)
-            add_line(fmt("Обʼєм газу в кінці:", f"{results['final_gas_volume']:.2f}", "м³"), normal_color)
-            add_line(fmt("Підйомна сила (кінець):", f"{results['lift_end']:.2f}", "кг"), normal_color)
-            payload_end_color = success_color if results['payload_end'] > 0 else error_color
-            add_line(fmt("Корисне навантаження (кінець):", f"{results['payload_end']:.2f}", "кг"), payload_end_color)
-            if results['payload_end'] < 0:
-                add_line("⚠️  УВАГА: Куля втратить підйомну силу до кінця польоту!", error_color, True)
-            
-            # Інформація про максимальний час польоту
-            if 'flight_time_info' in results and results['flight_time_info']:
-                flight_info = results['flight_time_info']
-                add_line("", normal_color)
-                add_line("─" * 60, header_color)
-                add_line("ЧАС ПОЛЬОТУ", header_color, True)
-                add_line("─" * 60, header_color)
-                if flight_info.get('max_time_hours') == float('inf'):
-                    add_line("Час польоту не обмежений втратами газу", success_color)
-                else:
-                    max_time = flight_info.get('max_time_hours', 0)
-                    time_to_zero = flight_info.get('time_to_zero_payload', 0)
-                    loss_rate = flight_info.get('gas_loss_rate_per_hour', 0)
-                    
-                    if max_time > 0:
-                        add_line(fmt("Макс. час польоту:", f"{max_time:.1f}", "год"), 
-                                success_color if max_time >= 24 else warning_color)
-                        add_line(fmt("Макс. час польоту:", f"{max_time/24:.1f}", "днів"), 
-                                success_color if max_time >= 24 else warning_color)
-                    
-                    if time_to_zero > 0 and time_to_zero != float('inf'):
-                        add_line(fmt("Час до нульового навантаження:", f"{time_to_zero:.1f}", "год"), warning_color)
-                        add_line(fmt("Час до нульового навантаження:", f"{time_to_zero/24:.1f}", "днів"), warning_color)
-                    
-                    if loss_rate > 0:
-                        add_line(fmt("Втрати газу за годину:", f"{loss_rate:.6f}", "м³/год"), normal_color)
-        
-        # Аналіз безпеки для гарячого повітря
-        if self.gas_var.get() == "Гаряче повітря":
-            add_line("", normal_color)
-            add_line("─" * 60, header_color)
-            add_line("АНАЛІЗ БЕЗПЕКИ", header_color, True)
-            add_line("─" * 60, header_color)
-            add_line(fmt("T зовні:", f"{results['T_outside_C']:.1f}", "°C"), normal_color)
-            add_line(fmt("Макс. напруга:", f"{results['stress'] / 1e6:.2f}", "МПа"), normal_color)
-            add_line(fmt("Допустима напруга:", f"{results['stress_limit'] / 1e6:.1f}", "МПа"), normal_color)
-            
-            # Розрахунок коефіцієнта безпеки
-            if results['stress'] > 0:
-                safety_factor = results['stress_limit'] / results['stress']
-                safety_color = success_color if safety_factor >= 2 else (warning_color if safety_factor >= 1.5 else error_color)
-                safety_text = f"Коефіцієнт безпеки: {safety_factor:.2f}"
-                if safety_factor < 1.5:
-                    safety_text += " ⚠️ КРИТИЧНО НИЗЬКИЙ!"
-                elif safety_factor < 2:
-                    safety_text += " ⚠️ Низький (рекомендується ≥ 2)"
-                else:
-                    safety_text += " ✅ Безпечний"
-                add_line(safety_text, safety_color, True)
-            else:
-                add_line("✅ Коефіцієнт безпеки: ∞ (дуже високий, напруга ≈ 0)", success_color, True)
-        
-        # Загальний аналіз безпеки
-        add_line("", normal_color)
-        add_line("─" * 60, header_color)
-        add_line("ЗАГАЛЬНА ОЦІНКА", header_color, True)
-        add_line("─" * 60, header_color)
-        
-        # Перевірка критичних параметрів
-        warnings = []
-        errors = []
-        
-        if results['payload'] <= 0:
-            errors.append("Корисне навантаження від'ємне або нульове")
-        elif results['payload'] < 0.1:
-            warnings.append("Дуже мале навантаження (< 0.1 кг)")
-        
-        if self.gas_var.get() in ("Гелій", "Водень") and results['payload_end'] < 0:
-            errors.append("Втрата підйомної сили до кінця польоту")
-        
-        if self.gas_var.get() == "Гаряче повітря" and results['stress'] > 0:
-            safety_factor = results['stress_limit'] / results['stress']
-            if safety_factor < 1.5:
-                errors.append(f"Критично низький коефіцієнт безпеки ({safety_factor:.2f})")
-            elif safety_factor < 2:
-                warnings.append(f"Низький коефіцієнт безпеки ({safety_factor:.2f})")
-        
-        if errors:
-            for error in errors:
-                add_line(f"❌ ПОМИЛКА: {error}", error_color, True)
-        if warnings:
-            for warning in warnings:
-                add_line(f"⚠️  ПОПЕРЕДЖЕННЯ: {warning}", warning_color)
-        
-        if not errors and not warnings:
-            add_line("✅ Всі параметри в межах безпеки", success_color, True)
+        view = build_results_view(
+            results, mode, self.gas_var.get(),
+            shape_display=self.shape_code_to_display.get(shape_code, shape_code),
+        )
+        self.results_table.update(view.rows)
         
         # Оновити статус-бейдж
         if hasattr(self, 'status_label'):
-            if errors:
+            if view.status == STATUS_ERROR:
                 self.status_label.config(text="Статус: критично", foreground="#ff6b6b")
-            elif warnings:
+            elif view.status == STATUS_WARNING:
                 self.status_label.config(text="Статус: попередження", foreground="#ffcc66")
             else:
                 self.status_label.config(text="Статус: все ок", foreground="#66d17c")
         
-        self.result_text_widget.config(state="disabled")
-        
     def save_settings(self):
         """Збереження налаштувань"""
         try:
@@ -1485,13 +1344,12 @@ class BalloonCalculatorGUI:
                 self.entries[key].insert(0, FIELD_DEFAULTS.get(key, ""))
         
         # Очищаємо результати
-        if hasattr(self, 'result_text_widget'):
-            self.result_text_widget.config(state="normal")
-            self.result_text_widget.delete(1.0, tk.END)
-            self.result_text_widget.config(state="disabled")
+        if hasattr(self, 'results_table'):
+            self.results_table.clear()
         
     def on_close(self):
         """Обробник закриття вікна - зберігає налаштування"""
+        self.tasks.shutdown()
         try:
             self.save_settings(silent=True)  # Зберігаємо без повідомлення
         except Exception as e:
@@ -1503,8 +1361,18 @@ class BalloonCalculatorGUI:
         """Запуск додатку"""
         self.root.mainloop()
 
-    def show_graph(self):
-        """Показати покращений графік залежності параметрів від висоти"""
+    def show_graph(self, refresh: bool = False):
+        """
+        Показати покращений графік залежності параметрів від висоти
+        
+        Вікно графіка одне: повторний виклик оновлює лінії у вже відкритому вікні.
+        
+        Args:
+            refresh: Оновлення відкритого вікна після перерахунку - помилки
+                лише записуються в лог, закрите вікно не відкривається знову
+        """
+        if refresh and not self._height_graph_open():
+            return
         try:
             # Валідація перед побудовою графіка
             inputs = {
@@ -1540,86 +1408,52 @@ class BalloonCalculatorGUI:
                 'extra_mass': validated_numbers.get('extra_mass', 0.0),
                 'seam_factor': validated_numbers.get('seam_factor', 1.0),
             }
-            profile = calculate_height_profile(**graph_inputs)
-            heights = [p['height'] for p in profile]
-            payloads = [p['payload'] for p in profile]
-            lifts = [p['lift'] for p in profile]
-            net_lifts = [p['net_lift_per_m3'] for p in profile]
-            volumes = [p.get('required_volume', 0) for p in profile]
-            # Пошук ключових точок
-            zero_payload_height = next((h for h, p in zip(heights, payloads) if p <= 0), None)
-            payload_max = max(payloads) if payloads else None
-            payload_max_h = heights[payloads.index(payload_max)] if payload_max is not None else None
-
-            # Створюємо subplots для кращої візуалізації
-            plt = get_plt()
-            fig, axes = plt.subplots(2, 2, figsize=(14, 10))
-            fig.suptitle('Залежність параметрів аеростата від висоти', fontsize=14, fontweight='bold')
-            
-            # Графік 1: Навантаження та підйомна сила
-            ax1 = axes[0, 0]
-            ax1.plot(heights, payloads, 'b-', label='Корисне навантаження (кг)', linewidth=2)
-            ax1.plot(heights, lifts, 'g-', label='Підйомна сила (кг)', linewidth=2)
-            ax1.axhline(y=0, color='r', linestyle='--', alpha=0.5, label='Нульове навантаження')
-            # Маркери ключових точок
-            if payload_max is not None:
-                ax1.plot(payload_max_h, payload_max, 'bo')
-                ax1.annotate(f"max {payload_max:.1f} кг", xy=(payload_max_h, payload_max),
-                             xytext=(payload_max_h, payload_max + 1),
-                             arrowprops=dict(arrowstyle="->", color='blue'), color='blue')
-            if zero_payload_height is not None:
-                ax1.plot(zero_payload_height, 0, 'ro')
-                ax1.annotate(f"0 кг @ {zero_payload_height} м", xy=(zero_payload_height, 0),
-                             xytext=(zero_payload_height, max(payloads)*0.1 if payloads else 1),
-                             arrowprops=dict(arrowstyle="->", color='red'), color='red')
-            ax1.set_xlabel('Висота, м')
-            ax1.set_ylabel('Маса, кг')
-            ax1.set_title('Навантаження та підйомна сила')
-            ax1.legend()
-            ax1.grid(True, alpha=0.3)
-            
-            # Графік 2: Підйомна сила на м³
-            ax2 = axes[0, 1]
-            ax2.plot(heights, net_lifts, 'm-', label='Підйомна сила на м³', linewidth=2)
-            target_net = 0.5
-            ax2.axhline(y=target_net, color='orange', linestyle='--', alpha=0.6, label='Орієнтир 0.5 кг/м³')
-            ax2.set_xlabel('Висота, м')
-            ax2.set_ylabel('Підйомна сила, кг/м³')
-            ax2.set_title('Підйомна сила на одиницю об\'єму')
-            ax2.legend()
-            ax2.grid(True, alpha=0.3)
-            
-            # Графік 3: Об'єм кулі
-            ax3 = axes[1, 0]
-            ax3.plot(heights, volumes, 'c-', label='Об\'єм кулі', linewidth=2)
-            ax3.set_xlabel('Висота, м')
-            ax3.set_ylabel('Об\'єм, м³')
-            ax3.set_title('Зміна об\'єму кулі з висотою')
-            ax3.legend()
-            ax3.grid(True, alpha=0.3)
-            
-            # Графік 4: Комбінований
-            ax4 = axes[1, 1]
-            ax4_twin = ax4.twinx()
-            line1 = ax4.plot(heights, payloads, 'b-', label='Навантаження (кг)', linewidth=2)
-            line2 = ax4_twin.plot(heights, volumes, 'r-', label='Об\'єм (м³)', linewidth=2)
-            ax4.set_xlabel('Висота, м')
-            ax4.set_ylabel('Навантаження, кг', color='b')
-            ax4_twin.set_ylabel('Об\'єм, м³', color='r')
-            ax4.set_title('Навантаження та об\'єм')
-            ax4.tick_params(axis='y', labelcolor='b')
-            ax4_twin.tick_params(axis='y', labelcolor='r')
-            ax4.spines['left'].set_color('b')
-            ax4.spines['right'].set_color('r')
-            lines = line1 + line2
-            labels = [l.get_label() for l in lines]
-            ax4.legend(lines, labels, loc='upper left', framealpha=0.9)
-            ax4.grid(True, alpha=0.3)
-            
-            plt.tight_layout()
-            plt.show()
+            def work(task):
+                """Розрахунок у фоновому потоці"""
+                return calculate_height_profile(**graph_inputs)
+            
+            def show(profile):
+                """Відображення результату (головний потік)"""
+                try:
+                    self._show_height_graph(profile, raise_window=not refresh)
+                except Exception as e:
+                    if refresh:
+                        logging.warning(f"Помилка оновлення графіка: {e}")
+                    else:
+                        messagebox.showerror("Помилка графіка", str(e))
+            
+            self.tasks.submit(
+                'graph', work, on_success=show,
+                on_error=(lambda e: logging.warning(f"Помилка оновлення графіка: {e}")) if refresh
+                else self._task_error_handler("Помилка графіка"),
+                description="Розрахунок профілю висоти...",
+            )
         except Exception as e:
-            messagebox.showerror("Помилка графіка", str(e))
+            if refresh:
+                logging.warning(f"Помилка оновлення графіка: {e}")
+            else:
+                messagebox.showerror("Помилка графіка", str(e))
+    
+    def _height_graph_open(self) -> bool:
+        """Чи відкрите вікно графіка висоти"""
+        graph = getattr(self, 'height_graph', None)
+        return graph is not None and get_plt().fignum_exists(graph.fig.number)
+    
+    def _show_height_graph(self, profile, raise_window: bool = True):
+        """Показує профіль у вікні графіка (створює вікно, якщо його немає)"""
+        if self._height_graph_open():
+            self.height_graph.update(profile)
+            manager = self.height_graph.fig.canvas.manager
+            # Під час живого перерахунку вікно не перехоплює фокус у полів введення
+            if raise_window and manager is not None:
+                manager.show()
+            return
+        plt = get_plt()
+        fig = plt.figure(figsize=(14, 10))
+        self.height_graph = HeightGraph(fig)
+        self.height_graph.update(profile)
+        fig.tight_layout(rect=(0, 0.03, 1, 1))
+        plt.show()
 
     def show_material_comparison(self):
         """Показати порівняння матеріалів"""
@@ -1708,72 +1542,87 @@ class BalloonCalculatorGUI:
             total_height = validated_numbers['start_height'] + validated_numbers['work_height']
             
             logging.info(f"Порівняння матеріалів: виклик calculate_material_comparison з gas_volume={validated_numbers['gas_volume']}, height={total_height}")
-            comparison = calculate_material_comparison(
-                gas_type=validated_strings['gas_type'],
-                thickness_um=validated_numbers['thickness'],
-                gas_volume=validated_numbers['gas_volume'],
-                ground_temp=validated_numbers['ground_temp'],
-                inside_temp=validated_numbers['inside_temp'],
-                height=total_height,
-                extra_mass=validated_numbers.get('extra_mass', 0.0),
-                seam_factor=validated_numbers.get('seam_factor', 1.0),
+            
+            def work(task):
+                """Розрахунок у фоновому потоці"""
+                return calculate_material_comparison(
+                    gas_type=validated_strings['gas_type'],
+                    thickness_um=validated_numbers['thickness'],
+                    gas_volume=validated_numbers['gas_volume'],
+                    ground_temp=validated_numbers['ground_temp'],
+                    inside_temp=validated_numbers['inside_temp'],
+                    height=total_height,
+                    extra_mass=validated_numbers.get('extra_mass', 0.0),
+                    seam_factor=validated_numbers.get('seam_factor', 1.0),
+                )
+            
+            def show(comparison):
+                """Відображення результату (головний потік)"""
+                try:
+                    logging.info(f"Порівняння матеріалів: отримано результатів: {len(comparison)}")
+            
+                    # Закриваємо попереднє вікно, якщо воно існує
+                    if hasattr(self, '_material_comparison_window') and self._material_comparison_window.winfo_exists():
+                        self._material_comparison_window.destroy()
+            
+                    # Створюємо нове вікно з результатами
+                    comp_window = tk.Toplevel(self.root)
+                    self._material_comparison_window = comp_window  # Зберігаємо посилання
+                    comp_window.title("Порівняння матеріалів")
+                    comp_window.geometry("800x600")
+            
+                    # Створюємо Treeview для таблиці
+                    tree = ttk.Treeview(comp_window, columns=('Матеріал', 'Навантаження', 'Маса оболонки', 'Підйомна сила', 'Коеф. безпеки'), show='headings')
+                    tree.heading('Матеріал', text='Матеріал')
+                    tree.heading('Навантаження', text='Навантаження (кг)')
+                    tree.heading('Маса оболонки', text='Маса оболонки (кг)')
+                    tree.heading('Підйомна сила', text='Підйомна сила (кг)')
+                    tree.heading('Коеф. безпеки', text='Коеф. безпеки')
+            
+                    tree.column('Матеріал', width=120)
+                    tree.column('Навантаження', width=120)
+                    tree.column('Маса оболонки', width=120)
+                    tree.column('Підйомна сила', width=120)
+                    tree.column('Коеф. безпеки', width=120)
+            
+                    # Сортуємо за навантаженням
+                    sorted_materials = sorted(comparison.items(), key=lambda x: x[1]['payload'], reverse=True)
+            
+                    for material, data in sorted_materials:
+                        safety = f"{data['safety_factor']:.1f}" if data['safety_factor'] != float('inf') else "∞"
+                        tree.insert('', 'end', values=(
+                            material,
+                            f"{data['payload']:.2f}",
+                            f"{data['mass_shell']:.3f}",
+                            f"{data['lift']:.2f}",
+                            safety
+                        ))
+            
+                    tree.pack(fill='both', expand=True, padx=10, pady=10)
+            
+                    # Додаємо графік
+                    plt = get_plt()
+                    fig, ax = plt.subplots(figsize=(10, 6))
+                    materials = [m[0] for m in sorted_materials]
+                    payloads = [m[1]['payload'] for m in sorted_materials]
+                    colors = plt.cm.viridis(range(len(materials)))
+            
+                    bars = ax.bar(materials, payloads, color=colors)
+                    ax.set_xlabel('Матеріал')
+                    ax.set_ylabel('Корисне навантаження (кг)')
+                    ax.set_title('Порівняння матеріалів за навантаженням')
+                    ax.grid(True, alpha=0.3, axis='y')
+                    plt.xticks(rotation=45, ha='right')
+                    plt.tight_layout()
+                    plt.show()
+                except Exception as e:
+                    messagebox.showerror("Помилка порівняння", str(e))
+            
+            self.tasks.submit(
+                'material_comparison', work, on_success=show,
+                on_error=self._task_error_handler("Помилка порівняння"),
+                description="Порівняння матеріалів...",
             )
-            logging.info(f"Порівняння матеріалів: отримано результатів: {len(comparison)}")
-            
-            # Закриваємо попереднє вікно, якщо воно існує
-            if hasattr(self, '_material_comparison_window') and self._material_comparison_window.winfo_exists():
-                self._material_comparison_window.destroy()
-            
-            # Створюємо нове вікно з результатами
-            comp_window = tk.Toplevel(self.root)
-            self._material_comparison_window = comp_window  # Зберігаємо посилання
-            comp_window.title("Порівняння матеріалів")
-            comp_window.geometry("800x600")
-            
-            # Створюємо Treeview для таблиці
-            tree = ttk.Treeview(comp_window, columns=('Матеріал', 'Навантаження', 'Маса оболонки', 'Підйомна сила', 'Коеф. безпеки'), show='headings')
-            tree.heading('Матеріал', text='Матеріал')
-            tree.heading('Навантаження', text='Навантаження (кг)')
-            tree.heading('Маса оболонки', text='Маса оболонки (кг)')
-            tree.heading('Підйомна сила', text='Підйомна сила (кг)')
-            tree.heading('Коеф. безпеки', text='Коеф. безпеки')
-            
-            tree.column('Матеріал', width=120)
-            tree.column('Навантаження', width=120)
-            tree.column('Маса оболонки', width=120)
-            tree.column('Підйомна сила', width=120)
-            tree.column('Коеф. безпеки', width=120)
-            
-            # Сортуємо за навантаженням
-            sorted_materials = sorted(comparison.items(), key=lambda x: x[1]['payload'], reverse=True)
-            
-            for material, data in sorted_materials:
-                safety = f"{data['safety_factor']:.1f}" if data['safety_factor'] != float('inf') else "∞"
-                tree.insert('', 'end', values=(
-                    material,
-                    f"{data['payload']:.2f}",
-                    f"{data['mass_shell']:.3f}",
-                    f"{data['lift']:.2f}",
-                    safety
-                ))
-            
-            tree.pack(fill='both', expand=True, padx=10, pady=10)
-            
-            # Додаємо графік
-            plt = get_plt()
-            fig, ax = plt.subplots(figsize=(10, 6))
-            materials = [m[0] for m in sorted_materials]
-            payloads = [m[1]['payload'] for m in sorted_materials]
-            colors = plt.cm.viridis(range(len(materials)))
-            
-            bars = ax.bar(materials, payloads, color=colors)
-            ax.set_xlabel('Матеріал')
-            ax.set_ylabel('Корисне навантаження (кг)')
-            ax.set_title('Порівняння матеріалів за навантаженням')
-            ax.grid(True, alpha=0.3, axis='y')
-            plt.xticks(rotation=45, ha='right')
-            plt.tight_layout()
-            plt.show()
             
         except Exception as e:
             messagebox.showerror("Помилка порівняння", str(e))
@@ -1848,34 +1697,47 @@ class BalloonCalculatorGUI:
             }
             validated_numbers, validated_strings = validate_all_inputs(**inputs)
             
-            optimal = calculate_optimal_height(
-                gas_type=validated_strings['gas_type'],
-                material=validated_strings['material'],
-                thickness_um=validated_numbers['thickness'],
-                gas_volume=validated_numbers['gas_volume'],
-                ground_temp=validated_numbers['ground_temp'],
-                inside_temp=validated_numbers['inside_temp'],
-                extra_mass=validated_numbers.get('extra_mass', 0.0),
-                seam_factor=validated_numbers.get('seam_factor', 1.0),
-            )
+            def work(task):
+                """Розрахунок у фоновому потоці"""
+                return calculate_optimal_height(
+                    gas_type=validated_strings['gas_type'],
+                    material=validated_strings['material'],
+                    thickness_um=validated_numbers['thickness'],
+                    gas_volume=validated_numbers['gas_volume'],
+                    ground_temp=validated_numbers['ground_temp'],
+                    inside_temp=validated_numbers['inside_temp'],
+                    extra_mass=validated_numbers.get('extra_mass', 0.0),
+                    seam_factor=validated_numbers.get('seam_factor', 1.0),
+                )
             
-            if not optimal or 'height' not in optimal:
-                messagebox.showinfo("Результат", "Не вдалося знайти оптимальну висоту")
-                return
+            def show(optimal):
+                """Відображення результату (головний потік)"""
+                try:
+                    if not optimal or 'height' not in optimal:
+                        messagebox.showinfo("Результат", "Не вдалося знайти оптимальну висоту")
+                        return
             
-            result_text = (
-                f"Оптимальна висота польоту: {optimal['height']:.0f} м\n\n"
-                f"Параметри на оптимальній висоті:\n"
-                f"• Корисне навантаження: {optimal['payload']:.2f} кг\n"
-                f"• Підйомна сила: {optimal['lift']:.2f} кг\n"
-                f"• Маса оболонки: {optimal['mass_shell']:.3f} кг\n"
-                f"• Щільність повітря: {optimal['rho_air']:.4f} кг/м³\n"
-                f"• Підйомна сила на м³: {optimal['net_lift_per_m3']:.4f} кг/м³\n"
-                f"• Температура: {optimal['T_outside_C']:.1f} °C\n"
-                f"• Тиск: {optimal['P_outside']/1000:.1f} кПа"
-            )
+                    result_text = (
+                        f"Оптимальна висота польоту: {optimal['height']:.0f} м\n\n"
+                        f"Параметри на оптимальній висоті:\n"
+                        f"• Корисне навантаження: {optimal['payload']:.2f} кг\n"
+                        f"• Підйомна сила: {optimal['lift']:.2f} кг\n"
+                        f"• Маса оболонки: {optimal['mass_shell']:.3f} кг\n"
+                        f"• Щільність повітря: {optimal['rho_air']:.4f} кг/м³\n"
+                        f"• Підйомна сила на м³: {optimal['net_lift_per_m3']:.4f} кг/м³\n"
+                        f"• Температура: {optimal['T_outside_C']:.1f} °C\n"
+                        f"• Тиск: {optimal['P_outside']/1000:.1f} кПа"
+                    )
+            
+                    messagebox.showinfo("Оптимальна висота", result_text)
+                except Exception as e:
+                    messagebox.showerror("Помилка розрахунку", str(e))
             
-            messagebox.showinfo("Оптимальна висота", result_text)
+            self.tasks.submit(
+                'optimal_height', work, on_success=show,
+                on_error=self._task_error_handler("Помилка розрахунку"),
+                description="Пошук оптимальної висоти...",
+            )
             
         except Exception as e:
             messagebox.showerror("Помилка розрахунку", str(e))
@@ -1917,36 +1779,51 @@ class BalloonCalculatorGUI:
                 logging.debug(f"Не вдалося конвертувати perm_mult '{perm_mult_str}': {e}, використовуємо 1.0")
                 perm_mult = 1.0
             
-            flight_time = calculate_max_flight_time(
-                gas_type=validated_strings['gas_type'],
-                material=validated_strings['material'],
-                thickness_um=validated_numbers['thickness'],
-                gas_volume=validated_numbers['gas_volume'],
-                start_height=validated_numbers['start_height'],
-                work_height=validated_numbers['work_height'],
-                ground_temp=validated_numbers['ground_temp'],
-                inside_temp=validated_numbers['inside_temp'],
-                perm_mult=perm_mult
-            )
-            
-            if flight_time['max_time_hours'] == float('inf'):
-                result_text = flight_time.get('message', 'Час польоту не обмежений')
-            else:
-                result_text = (
-                    f"{flight_time.get('message', '')}\n\n"
-                    f"Деталі:\n"
-                    f"• Початкове навантаження: {flight_time.get('initial_payload', 0):.2f} кг\n"
-                    f"• Втрати газу за годину: {flight_time.get('gas_loss_rate_per_hour', 0):.6f} м³/год\n"
-                    f"• Час до нульового навантаження: {flight_time.get('time_to_zero_payload', 0):.2f} год ({flight_time.get('time_to_zero_payload', 0)/24:.2f} днів)"
+            def work(task):
+                """Розрахунок у фоновому потоці"""
+                return calculate_max_flight_time(
+                    gas_type=validated_strings['gas_type'],
+                    material=validated_strings['material'],
+                    thickness_um=validated_numbers['thickness'],
+                    gas_volume=validated_numbers['gas_volume'],
+                    start_height=validated_numbers['start_height'],
+                    work_height=validated_numbers['work_height'],
+                    ground_temp=validated_numbers['ground_temp'],
+                    inside_temp=validated_numbers['inside_temp'],
+                    perm_mult=perm_mult
                 )
             
-            messagebox.showinfo("Час польоту", result_text)
+            def show(flight_time):
+                """Відображення результату (головний потік)"""
+                try:
+                    if flight_time['max_time_hours'] == float('inf'):
+                        result_text = flight_time.get('message', 'Час польоту не обмежений')
+                    else:
+                        result_text = (
+                            f"{flight_time.get('message', '')}\n\n"
+                            f"Деталі:\n"
+                            f"• Початкове навантаження: {flight_time.get('initial_payload', 0):.2f} кг\n"
+                            f"• Втрати газу за годину: {flight_time.get('gas_loss_rate_per_hour', 0):.6f} м³/год\n"
+                            f"• Час до нульового навантаження: {flight_time.get('time_to_zero_payload', 0):.2f} год ({flight_time.get('time_to_zero_payload', 0)/24:.2f} днів)"
+                        )
+            
+                    messagebox.showinfo("Час польоту", result_text)
+                except Exception as e:
+                    messagebox.showerror("Помилка розрахунку", str(e))
+            
+            self.tasks.submit(
+                'flight_time', work, on_success=show,
+                on_error=self._task_error_handler("Помилка розрахунку"),
+                description="Розрахунок часу польоту...",
+            )
             
         except Exception as e:
             messagebox.showerror("Помилка розрахунку", str(e))
 
     def show_help(self):
         """Показати довідку"""
+        from balloon.help_texts import HELP_FORMULAS, HELP_PARAMETERS, HELP_SAFETY, HELP_EXAMPLES, HELP_FAQ
+        
         help_window = tk.Toplevel(self.root)
         help_window.title("Довідка")
         help_window.geometry("800x600")
@@ -2035,9 +1912,71 @@ class BalloonCalculatorGUI:
         faq_text.config(state="disabled")
         faq_text.pack(fill="both", expand=True)
         notebook.add(faq_frame, text="FAQ")
+        
+        # Вкладка "Продуктивність"
+        notebook.add(self._create_performance_tab(notebook), text="Продуктивність")
+    
+    def _create_performance_tab(self, notebook):
+        """Статистика етапів моделі (balloon.instrument): виклики, сума, p50/p99"""
+        from balloon import instrument
+        
+        frame = tk.Frame(notebook, bg="#2b2b2b")
+        toolbar = ttk.Frame(frame)
+        toolbar.pack(fill="x", padx=5, pady=5)
+        stats_text = tk.Text(
+            frame,
+            wrap="none",
+            bg="#1e1e1e",
+            fg="#ffffff",
+            font=("Courier New", 9),
+            padx=10,
+            pady=10
+        )
+        stats_text.pack(fill="both", expand=True)
+        
+        def refresh():
+            stats_text.config(state="normal")
+            stats_text.delete(1.0, "end")
+            stats_text.insert(1.0, instrument.format_stats())
+            stats_text.config(state="disabled")
+        
+        def toggle():
+            if enabled_var.get():
+                instrument.enable_instrumentation()
+            else:
+                instrument.disable_instrumentation()
+            refresh()
+        
+        def reset():
+            instrument.reset_stats()
+            refresh()
+        
+        def save_json():
+            from tkinter import filedialog
+            filename = filedialog.asksaveasfilename(
+                defaultextension=".json",
+                filetypes=[("JSON файли", "*.json"), ("Всі файли", "*.*")],
+                title="Зберегти статистику продуктивності"
+            )
+            if filename:
+                try:
+                    instrument.dump_stats(filename)
+                except OSError as e:
+                    messagebox.showerror("Помилка", f"Не вдалося зберегти статистику:\n{e}")
+        
+        enabled_var = tk.BooleanVar(value=instrument.instrumentation_enabled())
+        ttk.Checkbutton(
+            toolbar, text="Збирати статистику", variable=enabled_var, command=toggle
+        ).pack(side="left", padx=(0, 10))
+        ttk.Button(toolbar, text="Оновити", command=refresh).pack(side="left", padx=(0, 5))
+        ttk.Button(toolbar, text="Скинути", command=reset).pack(side="left", padx=(0, 5))
+        ttk.Button(toolbar, text="Зберегти JSON", command=save_json).pack(side="left")
+        refresh()
+        return frame
     
     def show_about(self):
         """Показати інформацію про програму"""
+        from balloon.help_texts import ABOUT_TEXT_EXTENDED
         messagebox.showinfo(BUTTON_LABELS['about'], ABOUT_TEXT_EXTENDED)
 
     def add_tooltips(self):
@@ -2165,6 +2104,7 @@ class BalloonCalculatorGUI:
             highlightbackground="#555555"
         )
         self.pattern_canvas.grid(row=1, column=0, sticky="nsew")
+        self.pattern_renderer = PatternRenderer(self.pattern_canvas)
         
         # Обробка зміни розміру canvas
         def on_canvas_configure(event):
@@ -2223,6 +2163,8 @@ class BalloonCalculatorGUI:
     
     def generate_pattern(self):
         """Генерує викрійку на основі параметрів"""
+        from balloon.patterns import generate_pattern_from_shape, generate_pattern_from_shape_profile
+        
         try:
             # Отримуємо параметри з полів розрахунків або з полів викрійок
             shape_display = self.pattern_shape_var.get()
@@ -2311,25 +2253,39 @@ class BalloonCalculatorGUI:
                 except (ValueError, AttributeError):
                     seam_allowance_mm = 10.0
             
-            # Для sphere/pear/cigar використовуємо profile_based (узгоджено з 3D та розрахунками)
-            # Для pillow - окремий метод (подушка не поверхня обертання, тому не має профілю)
-            if shape_code in ['sphere', 'pear', 'cigar']:
-                pattern = generate_pattern_from_shape_profile(
-                    shape_code, shape_params, num_segments, seam_allowance_mm
-                )
-            else:
+            def work(task):
+                """Генерація у фоновому потоці"""
+                # Для sphere/pear/cigar використовуємо profile_based (узгоджено з 3D та розрахунками)
+                # Для pillow - окремий метод (подушка не поверхня обертання, тому не має профілю)
+                if shape_code in ['sphere', 'pear', 'cigar']:
+                    return generate_pattern_from_shape_profile(
+                        shape_code, shape_params, num_segments, seam_allowance_mm
+                    )
                 # Pillow - окремий метод, оскільки не є поверхнею обертання
-                pattern = generate_pattern_from_shape(shape_code, shape_params, num_segments, seam_allowance_mm)
-            self.current_pattern = pattern
+                return generate_pattern_from_shape(shape_code, shape_params, num_segments, seam_allowance_mm)
             
-            # Візуалізуємо
-            self.visualize_pattern(pattern)
-            
-            # Оновлюємо 3D прев'ю
-            self.update_3d_preview()
+            def show(pattern):
+                """Відображення викрійки (головний потік)"""
+                try:
+                    self.current_pattern = pattern
+                    
+                    # Візуалізуємо
+                    self.visualize_pattern(pattern)
+                    
+                    # Оновлюємо 3D прев'ю
+                    self.update_3d_preview()
+                    
+                    # Показуємо інформацію
+                    self.show_pattern_info(pattern)
+                except Exception as e:
+                    logging.error(f"Помилка відображення викрійки: {e}", exc_info=True)
+                    messagebox.showerror("Помилка", f"Не вдалося відобразити викрійку: {e}")
             
-            # Показуємо інформацію
-            self.show_pattern_info(pattern)
+            self.tasks.submit(
+                'pattern', work, on_success=show,
+                on_error=self._task_error_handler("Помилка", "Не вдалося згенерувати викрійку: "),
+                description="Генерація викрійки...",
+            )
             
         except Exception as e:
             import logging
@@ -2337,474 +2293,15 @@ class BalloonCalculatorGUI:
             messagebox.showerror("Помилка", f"Не вдалося згенерувати викрійку: {e}")
     
     def visualize_pattern(self, pattern):
-        """Візуалізує патерн на canvas з покращеною візуалізацією"""
-        self.pattern_canvas.delete("all")
-        
-        canvas_width = self.pattern_canvas.winfo_width()
-        canvas_height = self.pattern_canvas.winfo_height()
-        
-        if canvas_width <= 1 or canvas_height <= 1:
-            canvas_width = 400
-            canvas_height = 500
-        
-        pattern_type = pattern.get('pattern_type')
-        
-        if pattern_type == 'sphere_gore':
-            self._draw_sphere_gore(pattern, canvas_width, canvas_height)
-        elif pattern_type == 'pillow':
-            self._draw_pillow_pattern(pattern, canvas_width, canvas_height)
-        elif pattern_type == 'pear_gore':
-            self._draw_pear_pattern(pattern, canvas_width, canvas_height)
-        elif pattern_type == 'cigar_gore':
-            self._draw_cigar_pattern(pattern, canvas_width, canvas_height)
-    
-    def _draw_grid_and_labels(self, width, height, pattern):
-        """Малює координатну сітку та мітки для розкрою з покращеною візуалізацією"""
-        # Легка сітка на фоні
-        grid_spacing = 50  # пікселів
-        grid_color = "#333333"
-        
-        # Вертикальні лінії
-        for x in range(0, width, grid_spacing):
-            self.pattern_canvas.create_line(x, 0, x, height, fill=grid_color, width=1)
-        
-        # Горизонтальні лінії
-        for y in range(0, height, grid_spacing):
-            self.pattern_canvas.create_line(0, y, width, y, fill=grid_color, width=1)
-        
-        # Центральні лінії (товстіші)
-        center_x = width / 2
-        center_y = height / 2
-        self.pattern_canvas.create_line(center_x, 0, center_x, height, fill="#444444", width=1, dash=(2, 2))
-        self.pattern_canvas.create_line(0, center_y, width, center_y, fill="#444444", width=1, dash=(2, 2))
-        
-        # Мітки на осях (якщо є інформація про масштаб)
-        max_width = pattern.get('max_width', 0)
-        meridian_length = pattern.get('meridian_length', 0)
-        
-        if max_width > 0:
-            # Мітки по X (ширина)
-            scale = (width * 0.75) / (2 * max_width) if max_width > 0 else 1
-            for i in range(5):
-                x_mark = center_x + (max_width * i / 4) * scale
-                self.pattern_canvas.create_line(x_mark, center_y - 5, x_mark, center_y + 5, fill="#666666", width=1)
-                if i > 0:
-                    self.pattern_canvas.create_text(x_mark, center_y + 15, text=f"{max_width * i / 4:.2f}м", 
-                                                   fill="#888888", font=("Arial", 7))
-        
-        if meridian_length > 0:
-            # Мітки по Y (довжина)
-            scale = (height * 0.75) / meridian_length if meridian_length > 0 else 1
-            for i in range(5):
-                y_mark = center_y - (meridian_length * i / 4) * scale
-                self.pattern_canvas.create_line(center_x - 5, y_mark, center_x + 5, y_mark, fill="#666666", width=1)
-                if i > 0:
-                    self.pattern_canvas.create_text(center_x - 15, y_mark, text=f"{meridian_length * i / 4:.2f}м", 
-                                                   fill="#888888", font=("Arial", 7), anchor="e")
-        
-        # Додаємо інформацію про метод припуску на шов
-        seam_method = pattern.get('seam_allowance_method', 'simple')
-        if seam_method == 'shapely_normal_offset':
-            self.pattern_canvas.create_text(
-                width - 10, height - 10,
-                text="Припуск: нормальний offset",
-                fill="#66d17c", font=("Arial", 8), anchor="se"
-            )
-    
-    def _draw_sphere_gore(self, pattern, width, height):
-        """Малює гобеновий сегмент для сфери з покращеною візуалізацією"""
-        points = pattern.get('points', [])
-        if not points:
-            return
-        
-        # Додаємо координатну сітку та розміри
-        self._draw_grid_and_labels(width, height, pattern)
-        
-        max_y = max(abs(y) for x, y in points)
-        max_x = max(abs(x) for x, y in points)
-        
-        scale_x = (width * 0.75) / (2 * max_x) if max_x > 0 else 1
-        scale_y = (height * 0.75) / (2 * max_y) if max_y > 0 else 1
-        scale = min(scale_x, scale_y)
-        
-        center_x = width / 2
-        center_y = height / 2
-        
-        path = []
-        for x, y in points:
-            px = center_x + x * scale
-            py = center_y - y * scale
-            path.append((px, py))
-        
-        # Малюємо контур з покращеними стилями
-        for i in range(len(path) - 1):
-            x1, y1 = path[i]
-            x2, y2 = path[i + 1]
-            # Основна лінія контуру (товстіша, більш яскрава)
-            self.pattern_canvas.create_line(x1, y1, x2, y2, fill="#4a90e2", width=3, capstyle="round", joinstyle="round")
-        
-        # Дзеркальна половина
-        for i in range(len(path) - 1):
-            x1, y1 = path[i]
-            x2, y2 = path[i + 1]
-            self.pattern_canvas.create_line(
-                center_x - (x1 - center_x), y1,
-                center_x - (x2 - center_x), y2,
-                fill="#4a90e2", width=3, capstyle="round", joinstyle="round"
-            )
-        
-        if path:
-            first_x, first_y = path[0]
-            last_x, last_y = path[-1]
-            self.pattern_canvas.create_line(
-                center_x, first_y, center_x, last_y,
-                fill="#ffffff", width=1, dash=(5, 5)
-            )
-        
-        # Додаємо розміри та анотації
-        radius = pattern.get('radius', 0)
-        max_width = pattern.get('max_width', 0)
-        # Використовуємо meridian_length (довжина по меридіану)
-        meridian_length = pattern.get('meridian_length', 0)
-        
-        self.pattern_canvas.create_text(
-            center_x, 20, text=f"Сегмент (1 з {pattern.get('num_gores', 12)})",
-            fill="#ffffff", font=("Arial", 11, "bold")
-        )
-        
-        # Показуємо розміри
-        if max_width > 0:
-            # Максимальна ширина
-            max_width_x = center_x + max_width * scale / 2
-            self.pattern_canvas.create_line(
-                center_x, center_y - max_width * scale / 2,
-                max_width_x, center_y - max_width * scale / 2,
-                fill="#66d17c", width=1, dash=(3, 3)
-            )
-            self.pattern_canvas.create_text(
-                (center_x + max_width_x) / 2, center_y - max_width * scale / 2 - 10,
-                text=f"Макс. ширина: {max_width:.2f} м",
-                fill="#66d17c", font=("Arial", 8)
-            )
-        
-        # Використовуємо meridian_length для відображення
-        meridian_length = pattern.get('meridian_length', 0)
-        if meridian_length > 0:
-            # Довжина по меридіану
-            self.pattern_canvas.create_line(
-                center_x + max_x * scale + 10, center_y - meridian_length * scale / 2,
-                center_x + max_x * scale + 10, center_y + meridian_length * scale / 2,
-                fill="#66d17c", width=1, dash=(3, 3)
-            )
-            self.pattern_canvas.create_text(
-                center_x + max_x * scale + 15, center_y,
-                text=f"Довжина (по шву): {meridian_length:.2f} м",
-                fill="#66d17c", font=("Arial", 8), anchor="w"
-            )
-        
-        # Додаємо notches (мітки суміщення) на візуалізацію
-        notches = pattern.get('notches', [])
-        if notches and len(points) > 0:
-            for notch_y in notches:
-                # Знаходимо найближчу точку по Y
-                closest_idx = min(range(len(points)), key=lambda i: abs(points[i][1] - notch_y))
-                if 0 <= closest_idx < len(points):
-                    x, y = points[closest_idx]
-                    px = center_x + x * scale
-                    py = center_y - y * scale
-                    # Малюємо мітку: коротка лінія перпендикулярна до контуру
-                    notch_length = 5  # 5 пікселів
-                    self.pattern_canvas.create_line(
-                        px, py, px + notch_length, py,
-                        fill="#ff6b6b", width=2
-                    )
-                    self.pattern_canvas.create_line(
-                        center_x - (px - center_x), py,
-                        center_x - (px - center_x) - notch_length, py,
-                        fill="#ff6b6b", width=2
-                    )
-        
-        if radius > 0:
-            self.pattern_canvas.create_text(
-                center_x, height - 30,
-                text=f"Радіус сфери: {radius:.2f} м",
-                fill="#888888", font=("Arial", 9)
-            )
-    
-    def _draw_pillow_pattern(self, pattern, width, height):
-        """Малює патерн для подушки - два прямокутники з позначенням отвору"""
-        panels = pattern.get('panels', [])
-        if not panels:
-            return
-        
-        # Малюємо два прямокутники однакового розміру
-        panel_w = panels[0].get('width', 0) if panels else 0
-        panel_h = panels[0].get('height', 0) if panels else 0
-        
-        if panel_w <= 0 or panel_h <= 0:
-            return
-        
-        # Масштабування для обох панелей
-        max_dim = max(panel_w, panel_h)
-        scale_w = (width * 0.7) / max_dim if max_dim > 0 else 1
-        scale_h = (height * 0.35) / max_dim if max_dim > 0 else 1
-        scale = min(scale_w, scale_h)
-        
-        w = panel_w * scale
-        h = panel_h * scale
-        
-        # Центруємо
-        center_x = width / 2
-        spacing = 20  # Відстань між панелями
-        
-        # Перша панель (верхня)
-        x1_1 = center_x - w / 2
-        y1_1 = height * 0.15
-        x2_1 = x1_1 + w
-        y2_1 = y1_1 + h
-        
-        self.pattern_canvas.create_rectangle(x1_1, y1_1, x2_1, y2_1, outline="#4a90e2", width=2)
-        self.pattern_canvas.create_text(
-            center_x, y1_1 - 15, text="Панель 1",
-            fill="#ffffff", font=("Arial", 10, "bold")
-        )
-        
-        # Друга панель (нижня)
-        x1_2 = center_x - w / 2
-        y1_2 = y2_1 + spacing
-        x2_2 = x1_2 + w
-        y2_2 = y1_2 + h
-        
-        self.pattern_canvas.create_rectangle(x1_2, y1_2, x2_2, y2_2, outline="#4a90e2", width=2)
-        self.pattern_canvas.create_text(
-            center_x, y1_2 - 15, text="Панель 2",
-            fill="#ffffff", font=("Arial", 10, "bold")
-        )
-        
-        # Позначаємо отвір (незакрита ділянка кромки)
-        opening_side = pattern.get('opening_side', 'width')
-        opening_size = pattern.get('opening_size', 0)
-        
-        # Позначаємо лінії з'єднання (шви) - зеленою пунктирною лінією
-        seam_color = "#66d17c"
-        
-        if opening_side == 'width':
-            # Отвір на коротшій стороні (ширина) - ліва сторона не зшивається
-            # Шви: верх, низ, права сторона
-            self.pattern_canvas.create_line(x1_2, y1_2, x2_2, y1_2, fill=seam_color, width=2, dash=(5, 3))  # Верх
-            self.pattern_canvas.create_line(x1_2, y2_2, x2_2, y2_2, fill=seam_color, width=2, dash=(5, 3))  # Низ
-            self.pattern_canvas.create_line(x2_2, y1_2, x2_2, y2_2, fill=seam_color, width=2, dash=(5, 3))  # Права
-            
-            # Позначаємо незакриту кромку (отвір) - ліва сторона
-            opening_y = y1_2 + h / 2
-            self.pattern_canvas.create_line(
-                x1_2, y1_2,
-                x1_2, y2_2,
-                fill="#ff6b6b", width=3, dash=(10, 5)
-            )
-            self.pattern_canvas.create_text(
-                x1_2 - 15, opening_y, text="НЕ ЗШИВАТИ\n(отвір)",
-                fill="#ff6b6b", font=("Arial", 9, "bold"), anchor="e", justify="center"
-            )
-        else:
-            # Отвір на довгій стороні (довжина) - верхня сторона не зшивається
-            # Шви: ліва, права, низ
-            self.pattern_canvas.create_line(x1_2, y1_2, x1_2, y2_2, fill=seam_color, width=2, dash=(5, 3))  # Ліва
-            self.pattern_canvas.create_line(x2_2, y1_2, x2_2, y2_2, fill=seam_color, width=2, dash=(5, 3))  # Права
-            self.pattern_canvas.create_line(x1_2, y2_2, x2_2, y2_2, fill=seam_color, width=2, dash=(5, 3))  # Низ
-            
-            # Позначаємо незакриту кромку (отвір) - верхня сторона
-            opening_x = center_x
-            self.pattern_canvas.create_line(
-                x1_2, y1_2,
-                x2_2, y1_2,
-                fill="#ff6b6b", width=3, dash=(10, 5)
-            )
-            self.pattern_canvas.create_text(
-                opening_x, y1_2 - 20, text="НЕ ЗШИВАТИ (отвір)",
-                fill="#ff6b6b", font=("Arial", 9, "bold"), anchor="s"
-            )
-    
-    def _draw_pear_pattern(self, pattern, width, height):
-        """Малює гобеновий сегмент для груші"""
-        points = pattern.get('points', [])
-        if not points:
-            return
-        
-        # Для груші y - це меридіанна довжина (може бути більше геометричної висоти)
-        # x - це півширина сегмента
-        min_y = min(y for x, y in points) if points else 0
-        max_y = max(y for x, y in points) if points else 1
-        max_x = max(abs(x) for x, y in points) if points else 1
-        
-        # Масштабування з урахуванням відступів
-        y_range = max_y - min_y if max_y > min_y else max_y
-        scale_x = (width * 0.75) / (2 * max_x) if max_x > 0 else 1
-        scale_y = (height * 0.75) / y_range if y_range > 0 else 1
-        scale = min(scale_x, scale_y)
-        
-        center_x = width / 2
-        # Центруємо по Y: нижня точка має бути знизу з відступом
-        padding_top = height * 0.1
-        padding_bottom = height * 0.1
-        available_height = height - padding_top - padding_bottom
-        center_y = padding_bottom + available_height / 2
-        
-        # Малюємо сегмент
-        coords = []
-        for x, y in points:
-            # Y починається з 0 (низ) і йде до max_y (верх)
-            # Перетворюємо: нижня точка (y=0) -> знизу, верхня (y=max_y) -> зверху
-            screen_x = center_x + x * scale
-            # Інвертуємо Y: y=0 -> знизу, y=max_y -> зверху
-            normalized_y = (y - min_y) / y_range if y_range > 0 else 0
-            screen_y = padding_bottom + available_height * (1 - normalized_y)
-            coords.append((screen_x, screen_y))
-        
-        # Малюємо ліву половину сегмента
-        if len(coords) > 1:
-            for i in range(len(coords) - 1):
-                x1, y1 = coords[i]
-                x2, y2 = coords[i + 1]
-                self.pattern_canvas.create_line(x1, y1, x2, y2, fill="#4a90e2", width=2)
-        
-        # Малюємо праву половину (дзеркально)
-        for i in range(len(coords) - 1):
-            x1, y1 = coords[i]
-            x2, y2 = coords[i + 1]
-            # Дзеркалюємо відносно центру
-            x1_mirror = center_x - (x1 - center_x)
-            x2_mirror = center_x - (x2 - center_x)
-            self.pattern_canvas.create_line(x1_mirror, y1, x2_mirror, y2, fill="#4a90e2", width=2)
-        
-        # Додаємо підписи
-        num_gores = pattern.get('num_gores', 12)
-        pear_height = pattern.get('height', 3.0)
-        top_radius = pattern.get('top_radius', 1.2)
-        bottom_radius = pattern.get('bottom_radius', 0.6)
-        
-        self.pattern_canvas.create_text(
-            center_x, 20, text=f"Сегмент груші ({num_gores} сегментів)",
-            fill="#ffffff", font=("Arial", 12, "bold")
-        )
-        self.pattern_canvas.create_text(
-            center_x, height - 40, 
-            text=f"Висота: {pear_height:.2f} м\nВерхній радіус: {top_radius:.2f} м\nНижній радіус: {bottom_radius:.2f} м",
-            fill="#cccccc", font=("Arial", 9), justify="center"
+        """Візуалізує патерн на canvas (при зміні розміру лише масштабує намальоване)"""
+        self.pattern_renderer.render(
+            pattern, self.pattern_canvas.winfo_width(), self.pattern_canvas.winfo_height()
         )
-        
-        # Додаємо центральну лінію
-        if coords:
-            first_y = coords[0][1]
-            last_y = coords[-1][1]
-            self.pattern_canvas.create_line(
-                center_x, first_y, center_x, last_y,
-                fill="#ffffff", width=1, dash=(5, 5)
-            )
-        
-        # Додаємо notches (мітки суміщення)
-        notches = pattern.get('notches', [])
-        if notches and len(points) > 0:
-            for notch_y in notches:
-                # Знаходимо найближчу точку по Y
-                closest_idx = min(range(len(points)), key=lambda i: abs(points[i][1] - notch_y))
-                if 0 <= closest_idx < len(points):
-                    x, y = points[closest_idx]
-                    screen_x = center_x + x * scale
-                    # Використовуємо ту саму логіку перетворення координат
-                    normalized_y = (y - min_y) / y_range if y_range > 0 else 0
-                    screen_y = padding_bottom + available_height * (1 - normalized_y)
-                    # Малюємо мітку: коротка лінія перпендикулярна до контуру
-                    notch_length = 5  # 5 пікселів
-                    self.pattern_canvas.create_line(
-                        screen_x, screen_y, screen_x + notch_length, screen_y,
-                        fill="#ff6b6b", width=2
-                    )
-                    self.pattern_canvas.create_line(
-                        center_x - (screen_x - center_x), screen_y,
-                        center_x - (screen_x - center_x) - notch_length, screen_y,
-                        fill="#ff6b6b", width=2
-                    )
-    
-    def _draw_cigar_pattern(self, pattern, width, height):
-        """Малює гобеновий сегмент для сигари"""
-        points = pattern.get('points', [])
-        if not points:
-            return
-        
-        max_y = max(y for x, y in points) if points else 1
-        max_x = max(x for x, y in points) if points else 1
-        
-        scale_x = (width * 0.8) / (2 * max_x) if max_x > 0 else 1
-        scale_y = (height * 0.8) / max_y if max_y > 0 else 1
-        scale = min(scale_x, scale_y)
-        
-        center_x = width / 2
-        center_y = height / 2
-        
-        # Малюємо сегмент
-        coords = []
-        for x, y in points:
-            # Для сигари y йде вздовж осі (від 0 до length)
-            screen_x = center_x + x * scale
-            screen_y = center_y + (y - max_y / 2) * scale  # Y від низу до верху
-            coords.append((screen_x, screen_y))
-        
-        # Малюємо ліву половину сегмента
-        if len(coords) > 1:
-            for i in range(len(coords) - 1):
-                x1, y1 = coords[i]
-                x2, y2 = coords[i + 1]
-                self.pattern_canvas.create_line(x1, y1, x2, y2, fill="#4a90e2", width=2)
-        
-        # Малюємо праву половину (дзеркально)
-        for i in range(len(coords) - 1):
-            x1, y1 = coords[i]
-            x2, y2 = coords[i + 1]
-            # Дзеркалюємо відносно центру
-            x1_mirror = center_x - (x1 - center_x)
-            x2_mirror = center_x - (x2 - center_x)
-            self.pattern_canvas.create_line(x1_mirror, y1, x2_mirror, y2, fill="#4a90e2", width=2)
-        
-        # Додаємо підписи
-        num_gores = pattern.get('num_gores', 12)
-        cigar_length = pattern.get('length', 5.0)
-        radius = pattern.get('radius', 1.0)
-        
-        self.pattern_canvas.create_text(
-            center_x, 20, text=f"Сегмент сигари ({num_gores} сегментів)",
-            fill="#ffffff", font=("Arial", 12, "bold")
-        )
-        self.pattern_canvas.create_text(
-            center_x, height - 40,
-            text=f"Довжина: {cigar_length:.2f} м\nРадіус: {radius:.2f} м",
-            fill="#cccccc", font=("Arial", 9), justify="center"
-        )
-        
-        # Додаємо notches (мітки суміщення)
-        notches = pattern.get('notches', [])
-        if notches and len(points) > 0:
-            for notch_y in notches:
-                # Знаходимо найближчу точку по Y
-                closest_idx = min(range(len(points)), key=lambda i: abs(points[i][1] - notch_y))
-                if 0 <= closest_idx < len(points):
-                    x, y = points[closest_idx]
-                    screen_x = center_x + x * scale
-                    screen_y = center_y + (y - max_y / 2) * scale
-                    # Малюємо мітку: коротка лінія перпендикулярна до контуру
-                    notch_length = 5  # 5 пікселів
-                    self.pattern_canvas.create_line(
-                        screen_x, screen_y, screen_x + notch_length, screen_y,
-                        fill="#ff6b6b", width=2
-                    )
-                    self.pattern_canvas.create_line(
-                        center_x - (screen_x - center_x), screen_y,
-                        center_x - (screen_x - center_x) - notch_length, screen_y,
-                        fill="#ff6b6b", width=2
-                    )
     
     def show_pattern_info(self, pattern):
         """Показує інформацію про патерн"""
+        from balloon.patterns import calculate_seam_length
+        
         self.pattern_info_text.config(state="normal")
         self.pattern_info_text.delete(1.0, tk.END)
         
@@ -2920,177 +2417,164 @@ class BalloonCalculatorGUI:
         self.pattern_info_text.insert(1.0, "\n".join(info))
         self.pattern_info_text.config(state="disabled")
     
+    def _submit_export(self, filename: str, work, success: str, error_prefix: str,
+                       missing_library: Optional[str] = None):
+        """
+        Запускає експорт у фоновому потоці (діалоги вже пройдено в головному)
+
+        Повторний експорт у той самий файл витісняє попередній; експорти
+        різних файлів виконуються паралельно.
+
+        Args:
+            filename: Шлях до файлу
+            work: Функція work(task) -> шлях до створеного файлу
+            success: Текст повідомлення про успіх ({path} - шлях до файлу)
+            error_prefix: Префікс повідомлення про помилку
+            missing_library: Підказка, якщо не встановлено бібліотеку (ImportError)
+        """
+        report_error = self._task_error_handler("Помилка", error_prefix)
+
+        def on_error(error: BaseException):
+            if missing_library and isinstance(error, ImportError):
+                messagebox.showerror("Бібліотека не встановлена", missing_library)
+            else:
+                report_error(error)
+
+        self.tasks.submit(
+            f"export:{filename}", work,
+            on_success=lambda path: messagebox.showinfo("Успіх", success.format(path=path or filename)),
+            on_error=on_error,
+            description=f"Експорт {os.path.basename(filename)}...",
+        )
+    
     def export_results(self):
-        """Експортує результати розрахунку в Excel"""
+        """Експортує результати розрахунку в Excel (запис файлу - у фоновому потоці)"""
         if not hasattr(self, 'last_calculation_results') or not self.last_calculation_results:
             messagebox.showwarning("Попередження", "Спочатку виконайте розрахунок")
             return
         
-        try:
+        from tkinter import filedialog
+        
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".xlsx",
+            filetypes=[("Excel файли", "*.xlsx"), ("Всі файли", "*.*")],
+            title="Зберегти результати розрахунку"
+        )
+        if not filename:
+            return
+        
+        results = self.last_calculation_results
+        
+        def work(task: Task):
             from balloon.export import export_results_to_excel
-            from tkinter import filedialog
-            
+            task.report(None, "Експорт результатів в Excel...")
+            return export_results_to_excel(results, filename)
+        
+        self._submit_export(
+            filename, work, "Результати збережено:\n{path}", "Не вдалося експортувати результати: ",
+            missing_library="Для експорту в Excel потрібна бібліотека openpyxl. Встановіть: pip install openpyxl",
+        )
+    
+    def export_pattern(self):
+        """
+        Експортує викрійку (Excel, SVG, PDF, DXF, HPGL/G-code або PNG)
+
+        Вибір файлу та питання про формат - у головному потоці, сам запис
+        файлу - завданням TaskRunner з прогресом (PDF - по сторінках).
+        """
+        from tkinter import filedialog
+        
+        if not getattr(self, 'current_pattern', None):
+            messagebox.showwarning("Попередження", "Спочатку згенеруйте викрійку")
+            return
+        pattern = self.current_pattern
+        
+        # Пропонуємо експорт в Excel
+        choice = messagebox.askyesnocancel(
+            "Експорт викрійки",
+            "Оберіть формат експорту:\n\n"
+            "Так - Excel файл\n"
+            "Ні - SVG/PNG файл\n"
+            "Скасувати - вихід"
+        )
+        if choice is None:
+            return
+        if choice:
             filename = filedialog.asksaveasfilename(
                 defaultextension=".xlsx",
                 filetypes=[("Excel файли", "*.xlsx"), ("Всі файли", "*.*")],
-                title="Зберегти результати розрахунку"
+                title="Зберегти викрійку"
             )
-            
             if filename:
-                filepath = export_results_to_excel(self.last_calculation_results, filename)
-                messagebox.showinfo("Успіх", f"Результати збережено:\n{filepath}")
-        except ImportError:
-            messagebox.showerror("Помилка", "Для експорту в Excel потрібна бібліотека pandas. Встановіть: pip install pandas openpyxl")
-        except Exception as e:
-            logging.error(f"Помилка експорту результатів: {e}", exc_info=True)
-            messagebox.showerror("Помилка", f"Не вдалося експортувати результати: {e}")
-    
-    def export_pattern(self):
-        """Експортує викрійку (SVG/PNG)"""
-        # Спробуємо також експортувати в Excel, якщо доступний
-        try:
-            if hasattr(self, 'current_pattern') and self.current_pattern:
-                try:
-                    from balloon.export import export_pattern_to_excel
-                    from tkinter import filedialog
-                    
-                    # Пропонуємо експорт в Excel
-                    result = messagebox.askyesnocancel(
-                        "Експорт викрійки",
-                        "Оберіть формат експорту:\n\n"
-                        "Так - Excel файл\n"
-                        "Ні - SVG/PNG файл\n"
-                        "Скасувати - вихід"
-                    )
-                    
-                    if result is True:  # Excel
-                        filename = filedialog.asksaveasfilename(
-                            defaultextension=".xlsx",
-                            filetypes=[("Excel файли", "*.xlsx"), ("Всі файли", "*.*")],
-                            title="Зберегти викрійку"
-                        )
-                        if filename:
-                            filepath = export_pattern_to_excel(self.current_pattern, filename)
-                            messagebox.showinfo("Успіх", f"Викрійку збережено:\n{filepath}")
-                            return
-                    elif result is False:  # SVG/PNG - продовжуємо старий код
-                        pass
-                    else:  # Cancel
-                        return
-                except ImportError:
-                    pass  # Якщо pandas недоступний, продовжуємо зі старим експортом
-                except Exception as e:
-                    logging.warning(f"Помилка експорту в Excel: {e}")
-                    # Продовжуємо зі старим експортом
-        except Exception:
-            pass  # Якщо щось пішло не так, продовжуємо зі старим експортом
+                self._submit_pattern_export(pattern, 'xlsx', filename, False, "Викрійку збережено:\n{path}")
+            return
         
-        # Експорт SVG/PNG
-        if not hasattr(self, 'current_pattern'):
-            messagebox.showwarning("Попередження", "Спочатку згенеруйте викрійку")
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".svg",
+            filetypes=[
+                ("SVG files", "*.svg"),
+                ("PNG files", "*.png"),
+                ("PDF files", "*.pdf"),
+                ("DXF files", "*.dxf"),
+                ("HPGL files", "*.plt"),
+                ("G-code files", "*.gcode"),
+                ("All files", "*.*")
+            ]
+        )
+        if not filename:
             return
         
-        try:
-            from tkinter import filedialog
-            filename = filedialog.asksaveasfilename(
-                defaultextension=".svg",
-                filetypes=[
-                    ("SVG files", "*.svg"),
-                    ("PNG files", "*.png"),
-                    ("PDF files", "*.pdf"),
-                    ("DXF files", "*.dxf"),
-                    ("All files", "*.*")
-                ]
+        # Визначаємо формат з розширення
+        fmt = PATTERN_EXPORT_EXTENSIONS.get(os.path.splitext(filename)[1].lower())
+        is_gore = 'gore' in pattern.get('pattern_type', '')
+        if fmt == 'svg':
+            full_job = is_gore and messagebox.askyesno(
+                "Експорт SVG",
+                "Експортувати всі gores на одному аркуші?\n\n"
+                "Так - усі gores, розкладені по тканині\n"
+                "Ні - один сегмент"
             )
-            if filename:
-                pattern = self.current_pattern
-                
-                # Визначаємо формат з розширення
-                if filename.lower().endswith('.svg'):
-                    # SVG експорт
-                    try:
-                        from balloon.export import export_pattern_to_svg
-                        filepath = export_pattern_to_svg(pattern, filename, add_notches=True, add_centerline=True)
-                        messagebox.showinfo("Успіх", f"Викрійку збережено в SVG:\n{filepath}\n\nДодано: мітки суміщення, осьова лінія")
-                    except Exception as e:
-                        logging.error(f"Помилка експорту SVG: {e}", exc_info=True)
-                        messagebox.showerror("Помилка", f"Не вдалося експортувати SVG: {e}")
-                elif filename.lower().endswith('.pdf'):
-                    # PDF експорт
-                    try:
-                        from balloon.export import export_pattern_to_pdf
-                        filepath = export_pattern_to_pdf(
-                            pattern, filename,
-                            scale_mm_per_m=1000.0,
-                            page_size='A4',
-                            add_notches=True,
-                            add_centerline=True
-                        )
-                        messagebox.showinfo("Успіх", f"Викрійку збережено в PDF:\n{filepath}\n\nРозбито на сторінки A4 з мітками для склейки")
-                    except ImportError as e:
-                        messagebox.showerror(
-                            "Бібліотека не встановлена",
-                            f"Для експорту в PDF потрібна бібліотека reportlab.\n\n"
-                            f"Встановіть: python -m pip install reportlab"
-                        )
-                    except Exception as e:
-                        logging.error(f"Помилка експорту PDF: {e}", exc_info=True)
-                        messagebox.showerror("Помилка", f"Не вдалося експортувати PDF: {e}")
-                elif filename.lower().endswith('.dxf'):
-                    # DXF експорт
-                    try:
-                        from balloon.export import export_pattern_to_dxf
-                        filepath = export_pattern_to_dxf(
-                            pattern, filename,
-                            scale_mm_per_m=1000.0,
-                            add_notches=True,
-                            add_centerline=True
-                        )
-                        messagebox.showinfo("Успіх", f"Викрійку збережено в DXF:\n{filepath}\n\nГотово для імпорту в CAD системи")
-                    except ImportError as e:
-                        messagebox.showerror(
-                            "Бібліотека не встановлена",
-                            f"Для експорту в DXF потрібна бібліотека ezdxf.\n\n"
-                            f"Встановіть: python -m pip install ezdxf"
-                        )
-                    except Exception as e:
-                        logging.error(f"Помилка експорту DXF: {e}", exc_info=True)
-                        messagebox.showerror("Помилка", f"Не вдалося експортувати DXF: {e}")
-                else:
-                    # PNG експорт (через matplotlib)
-                    plt = get_plt()
-                    fig, ax = plt.subplots(figsize=(10, 12))
-                    ax.set_aspect('equal')
-                    ax.axis('off')
-                    ax.set_facecolor('#1e1e1e')
-                    fig.patch.set_facecolor('#1e1e1e')
-                    
-                    pattern_type = pattern.get('pattern_type')
-                    
-                    if pattern_type in ['sphere_gore', 'pear_gore', 'cigar_gore']:
-                        points = pattern.get('points', [])
-                        if points:
-                            xs = [x for x, y in points]
-                            ys = [y for x, y in points]
-                            # Малюємо лінію викрійки (з припуском)
-                            ax.plot(xs, ys, 'b-', linewidth=2, label='Лінія розкрою')
-                            ax.plot([-x for x in xs], ys, 'b-', linewidth=2)
-                            # Малюємо лінію шва (без припуску), якщо є
-                            if 'seam_allowance_m' in pattern and pattern['seam_allowance_m'] > 0:
-                                allowance = pattern['seam_allowance_m']
-                                seam_xs = [x - allowance for x in xs]
-                                seam_ys = ys
-                                ax.plot(seam_xs, seam_ys, 'r--', linewidth=1, alpha=0.7, label='Лінія шва')
-                                ax.plot([-x for x in seam_xs], seam_ys, 'r--', linewidth=1, alpha=0.7)
-                            ax.axvline(0, color='white', linestyle='--', alpha=0.5)
-                            ax.legend(loc='upper right')
-                    
-                    plt.savefig(filename, dpi=150, bbox_inches='tight', facecolor='#1e1e1e')
-                    plt.close()
-                    messagebox.showinfo("Успіх", f"Викрійку збережено: {filename}")
-        except Exception as e:
-            logging.error(f"Помилка експорту: {e}", exc_info=True)
-            messagebox.showerror("Помилка", f"Не вдалося експортувати: {e}")
+            self._submit_pattern_export(
+                pattern, fmt, filename, full_job,
+                "Викрійку збережено в SVG:\n{path}\n\nДодано: мітки суміщення, осьова лінія")
+        elif fmt == 'pdf':
+            self._submit_pattern_export(
+                pattern, fmt, filename, False,
+                "Викрійку збережено в PDF:\n{path}\n\nРозбито на сторінки A4 з мітками для склейки",
+                missing_library="Для експорту в PDF потрібна бібліотека reportlab.\n\n"
+                                "Встановіть: python -m pip install reportlab")
+        elif fmt == 'dxf':
+            full_job = is_gore and messagebox.askyesno(
+                "Експорт DXF",
+                "Експортувати повне завдання на розкрій?\n\n"
+                "Так - усі gores, розкладені по тканині (шари CUT/SEW/NOTCH/LABEL)\n"
+                "Ні - один сегмент"
+            )
+            self._submit_pattern_export(
+                pattern, fmt, filename, full_job,
+                "Викрійку збережено в DXF:\n{path}\n\nГотово для імпорту в CAD системи",
+                missing_library="Для експорту в DXF потрібна бібліотека ezdxf.\n\n"
+                                "Встановіть: python -m pip install ezdxf")
+        elif fmt in ('hpgl', 'gcode'):
+            # Плотер/різак: усі gores з оптимізованим порядком обходу
+            self._submit_pattern_export(pattern, fmt, filename, True, "Завдання для плотера збережено:\n{path}")
+        else:
+            def work(task: Task):
+                task.report(None, "Експорт PNG...")
+                return render_pattern_png(pattern, filename)
+            
+            self._submit_export(filename, work, "Викрійку збережено: {path}", "Не вдалося експортувати: ")
+    
+    def _submit_pattern_export(self, pattern: Dict[str, Any], fmt: str, filename: str, full_job: bool,
+                               success: str, missing_library: Optional[str] = None):
+        """Експорт викрійки через export_pattern_file у фоновому потоці з прогресом"""
+        def work(task: Task):
+            from balloon.export_core import export_pattern_file
+            task.report(0.0, f"Експорт {fmt.upper()}...")
+            return export_pattern_file(pattern, fmt, filename, full_job, progress=task.report)
+        
+        self._submit_export(filename, work, success, f"Не вдалося експортувати {fmt.upper()}: ",
+                            missing_library=missing_library)
     
     def export_pattern_data(self):
         """Експортує дані викрійки як CSV"""
@@ -3150,11 +2634,9 @@ class BalloonCalculatorGUI:
                 current_pattern=current_pattern
             )
             
-            # Логування для діагностики
-            logging.info(f"3D візуалізація: shape_code={shape_code}, shape_params={shape_params}")
-            
             # Створюємо 3D візуалізацію
-            self._create_3d_visualization(shape_code, shape_params)
+            with perf_log.span('gui.model_3d', shape=shape_code, params=shape_params):
+                self._create_3d_visualization(shape_code, shape_params)
             
         except Exception as e:
             logging.error(f"Помилка 3D візуалізації: {e}", exc_info=True)
@@ -3164,23 +2646,28 @@ class BalloonCalculatorGUI:
         """Створює 3D візуалізацію кулі (спочатку пробує Plotly, потім matplotlib)"""
         # Спробуємо використати Plotly для інтерактивної візуалізації
         try:
-            from balloon.gui.plotly_3d import create_3d_plotly, show_plotly_3d, is_plotly_available
+            from balloon.gui.plotly_3d import open_3d_model, is_plotly_available, gore_overlay_from_pattern
             
             if is_plotly_available():
                 results = None
                 if hasattr(self, 'last_calculation_results'):
                     results = self.last_calculation_results
                 
-                fig = create_3d_plotly(shape_code, shape_params, results)
-                if fig:
-                    # Показуємо в браузері
-                    show_plotly_3d(fig)
+                # Шви, припуск та мітки суміщення - з викрійки тієї самої форми
+                overlay = None
+                current_pattern = getattr(self, 'current_pattern', None)
+                if current_pattern and current_pattern.get('pattern_type') == f"{shape_code}_gore":
+                    overlay = gore_overlay_from_pattern(current_pattern)
+                
+                # Показуємо в браузері (HTML для тих самих параметрів береться з кешу)
+                if open_3d_model(shape_code, shape_params, results, overlay=overlay):
                     return
         except Exception as e:
             import logging
             logging.warning(f"Не вдалося використати Plotly, використовуємо matplotlib: {e}")
         
         # Fallback на matplotlib
+        from balloon.gui.matplotlib_3d_fallback import create_matplotlib_3d_fallback
         last_results = getattr(self, 'last_calculation_results', None)
         fig, ax = create_matplotlib_3d_fallback(shape_code, shape_params, last_results)
         if fig is None:
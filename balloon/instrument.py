@@ -0,0 +1,296 @@
+"""
+Інструментування гарячих шляхів моделі
+
+Етапи (calculate_balloon_state, геометрія реєстру форм, інтегрування
+ShapeProfile, генерація викрійок, експорт) позначені декоратором
+@instrument або контекстним менеджером stage(). Для кожного етапу
+збираються кількість викликів, сумарний та максимальний час, p50/p99
+(за останніми MAX_SAMPLES вимірами). Час етапів включний: вкладені
+етапи входять у час зовнішнього. Функції з @memoize інструментовані під
+кешем: етап рахує лише фактичні розрахунки, влучання - в memo_stats().
+
+Інструментування вимкнене за замовчуванням; у вимкненому стані обгортка
+лише перевіряє прапорець. Увімкнення:
+    - enable_instrumentation() з коду;
+    - змінна середовища BALLOON_INSTRUMENT: '1' - увімкнути, інше значення -
+      шлях JSON-файлу, куди статистика запишеться при завершенні процесу.
+
+Профілювання cProfile: контекстний менеджер profile() або змінна
+середовища BALLOON_PROFILE=шлях.prof для python -m balloon (pstats-файл
+та текстовий звіт у stderr).
+"""
+
+import atexit
+import contextlib
+import functools
+import io
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Iterator, Optional, TextIO
+
+# Змінна середовища для увімкнення інструментування
+INSTRUMENT_ENV = 'BALLOON_INSTRUMENT'
+
+# Змінна середовища для профілювання запуску python -m balloon
+PROFILE_ENV = 'BALLOON_PROFILE'
+
+# Кількість останніх вимірів етапу для перцентилів
+MAX_SAMPLES = 10000
+
+# Кількість рядків текстового звіту pstats
+PROFILE_LIMIT = 30
+
+
+class StageStats:
+    """Потокобезпечна статистика одного етапу"""
+
+    def __init__(self, name: str, max_samples: int = MAX_SAMPLES):
+        self.name = name
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._samples: "deque[float]" = deque(maxlen=max_samples)
+        self._lock = threading.Lock()
+
+    def record(self, elapsed: float, failed: bool = False):
+        with self._lock:
+            self.count += 1
+            self.errors += failed
+            self.total += elapsed
+            if elapsed > self.max:
+                self.max = elapsed
+            self._samples.append(elapsed)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Статистика: count, errors, total, mean, p50, p99, max (секунди)"""
+        with self._lock:
+            samples = sorted(self._samples)
+            count, errors, total, maximum = self.count, self.errors, self.total, self.max
+        return {
+            'count': count,
+            'errors': errors,
+            'total': total,
+            'mean': total / count if count else 0.0,
+            'p50': percentile(samples, 50),
+            'p99': percentile(samples, 99),
+            'max': maximum,
+        }
+
+
+def percentile(sorted_values, q: float) -> float:
+    """Перцентиль q (0-100) відсортованих значень за найближчим рангом (0.0 для порожніх)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * q // 100))
+    return sorted_values[int(rank) - 1]
+
+
+_enabled = os.environ.get(INSTRUMENT_ENV, '').strip().lower() not in ('', '0', 'off', 'false')
+_stages: Dict[str, StageStats] = {}
+_stages_lock = threading.Lock()
+
+
+def _stage_stats(name: str) -> StageStats:
+    stats = _stages.get(name)
+    if stats is None:
+        with _stages_lock:
+            stats = _stages.setdefault(name, StageStats(name))
+    return stats
+
+
+def enable_instrumentation():
+    """Вмикає збір статистики етапів (накопичена статистика зберігається)"""
+    global _enabled
+    _enabled = True
+
+
+def disable_instrumentation():
+    """Вимикає збір статистики етапів"""
+    global _enabled
+    _enabled = False
+
+
+def instrumentation_enabled() -> bool:
+    return _enabled
+
+
+def reset_stats():
+    """Скидає статистику всіх етапів"""
+    with _stages_lock:
+        _stages.clear()
+
+
+def record(name: str, elapsed: float, failed: bool = False):
+    """Додає вимір етапу вручну (якщо інструментування увімкнене)"""
+    if _enabled:
+        _stage_stats(name).record(elapsed, failed)
+
+
+def instrument(name: str) -> Callable:
+    """
+    Декоратор: вимірює кожен виклик функції як етап name
+
+    Атрибути обгортки (напр. cache від @memoize) зберігаються.
+
+    Використання:
+        @instrument('model.balloon_state')
+        def calculate_balloon_state(...): ...
+    """
+    def decorator(func: Callable) -> Callable:
+        stats = None
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            nonlocal stats
+            if not _enabled:
+                return func(*args, **kwargs)
+            if stats is None or _stages.get(name) is not stats:
+                stats = _stage_stats(name)
+            failed = True
+            start = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                stats.record(time.perf_counter() - start, failed)
+
+        wrapper.stage = name
+        return wrapper
+    return decorator
+
+
+_NULL_STAGE = contextlib.nullcontext()
+
+
+@contextlib.contextmanager
+def _measured_stage(name: str) -> Iterator[None]:
+    failed = True
+    start = time.perf_counter()
+    try:
+        yield
+        failed = False
+    finally:
+        _stage_stats(name).record(time.perf_counter() - start, failed)
+
+
+def stage(name: str):
+    """
+    Контекстний менеджер: вимірює блок коду як етап name
+
+    Використання:
+        with stage('patterns.seam_allowance'):
+            ...
+    """
+    if not _enabled:
+        return _NULL_STAGE
+    return _measured_stage(name)
+
+
+def get_stats() -> Dict[str, Dict[str, Any]]:
+    """Статистика етапів {ім'я: snapshot()}, відсортована за сумарним часом"""
+    with _stages_lock:
+        stages = list(_stages.values())
+    snapshots = {s.name: s.snapshot() for s in stages}
+    return dict(sorted(snapshots.items(), key=lambda item: item[1]['total'], reverse=True))
+
+
+def dump_stats(path: Optional[str] = None) -> str:
+    """
+    Статистика етапів (та кешів мемоізації) у JSON
+
+    Args:
+        path: Файл для запису (None - лише повернути рядок)
+
+    Returns:
+        JSON-рядок
+    """
+    from balloon import __version__
+    from balloon.cache import memo_stats
+    data = {
+        'version': __version__,
+        'enabled': _enabled,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'stages': get_stats(),
+        'memo': memo_stats(),
+    }
+    text = json.dumps(data, ensure_ascii=False, indent=2)
+    if path:
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+    return text
+
+
+def format_stats(stats: Optional[Dict[str, Dict[str, Any]]] = None) -> str:
+    """Текстова таблиця статистики етапів (час у мілісекундах)"""
+    stats = get_stats() if stats is None else stats
+    if not stats:
+        return "Немає вимірів" + ("" if _enabled else " (інструментування вимкнене)")
+    width = max(len('Етап'), *(len(name) for name in stats))
+    lines = [f"{'Етап':<{width}} {'Викл.':>8} {'Сума, мс':>11} {'p50, мс':>9} {'p99, мс':>9} {'Макс, мс':>9}"]
+    for name, s in stats.items():
+        lines.append(
+            f"{name:<{width}} {s['count']:>8} {s['total'] * 1e3:>11.1f} "
+            f"{s['p50'] * 1e3:>9.3f} {s['p99'] * 1e3:>9.3f} {s['max'] * 1e3:>9.3f}"
+        )
+    return '\n'.join(lines)
+
+
+# ============================================================================
+# ПРОФІЛЮВАННЯ
+# ============================================================================
+
+@contextlib.contextmanager
+def profile(path: Optional[str] = None, sort: str = 'cumulative', limit: int = PROFILE_LIMIT,
+            stream: Optional[TextIO] = None) -> Iterator["cProfile.Profile"]:
+    """
+    Профілює блок коду через cProfile
+
+    Args:
+        path: Файл pstats (.prof) для snakeviz/pstats (None - не записувати)
+        sort: Ключ сортування звіту pstats
+        limit: Кількість рядків звіту (0 - без текстового звіту)
+        stream: Потік для текстового звіту (None - sys.stderr)
+
+    Yields:
+        cProfile.Profile
+    """
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        if path:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            profiler.dump_stats(path)
+        if limit:
+            out = io.StringIO()
+            pstats.Stats(profiler, stream=out).sort_stats(sort).print_stats(limit)
+            (stream or sys.stderr).write(out.getvalue())
+
+
+def _dump_at_exit(path: str):
+    try:
+        dump_stats(path)
+    except OSError:
+        pass
+
+
+def _configure_from_env():
+    value = os.environ.get(INSTRUMENT_ENV, '').strip()
+    if _enabled and value.lower() not in ('1', 'on', 'true'):
+        atexit.register(_dump_at_exit, value)
+
+
+_configure_from_env()
@@ -0,0 +1,520 @@
+"""
+Асинхронні завдання для довгих експортів, звітів та розрахунків по сітці
+
+Блокуючі функції (export_pattern_to_pdf, export_pattern_to_dxf,
+generate_pdf_report, перебір параметрів) запускаються як завдання
+в пулі потоків, а в asyncio повертається Job, який можна очікувати
+(await job), скасувати (job.cancel()) та відстежувати через колбек
+прогресу. Кілька експортів одного проєкту (PDF + DXF + SVG + звіт)
+виконуються одночасно, тож запис файлів перекривається.
+
+Як і в TaskRunner GUI, скасування кооперативне: функція завдання
+викликає job.report() або job.check() між кроками, і після cancel()
+вони піднімають JobCancelled. Завдання, що ще не почалося, скасовується
+одразу; результат функції, яка не перевіряє скасування, відкидається.
+Файли недоробленого або скасованого експорту видаляються, але лише ті,
+що завдання створило або змінило: наявний файл з тим самим ім'ям
+лишається, якщо завдання впало до запису чи не почалося.
+
+Використання:
+    async with JobManager(on_progress=show) as jobs:
+        pdf = jobs.submit_export('pdf', pattern, 'gores.pdf')
+        dxf = jobs.submit_export('dxf', pattern, 'gores.dxf')
+        report = jobs.submit_report(results, inputs, 'report.pdf')
+        paths = await jobs.gather(pdf, dxf, report)
+
+Колбеки прогресу викликаються в потоці циклу подій: on_progress(job).
+
+export_design() - готовий сценарій для одного проєкту; з командного рядка:
+    python -m balloon export sphere -p radius=1.5 --formats pdf,dxf,svg -o out --solve '{...}'
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+# Потоків за замовчуванням: експорти переважно пишуть файли та звільняють GIL
+DEFAULT_MAX_WORKERS = 4
+
+_job_ids = itertools.count(1)
+
+
+class JobCancelled(Exception):
+    """Завдання скасовано"""
+
+
+def _file_state(path: str) -> Optional[tuple]:
+    """Стан файлу (inode, розмір, час зміни) або None, якщо файлу немає"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+class Job:
+    """
+    Асинхронне завдання
+
+    Методи report() та check() викликаються з робочого потоку,
+    решта - в потоці циклу подій. await job повертає результат або
+    піднімає виняток функції (JobCancelled - якщо завдання скасовано);
+    скасування корутини, що очікує, скасовує і завдання.
+
+    Attributes:
+        id: Номер завдання
+        name: Назва (для прогресу та логів)
+        state: PENDING, RUNNING, DONE, FAILED або CANCELLED
+        progress: Частка виконання 0..1 (None - невідомо)
+        message: Останнє повідомлення прогресу
+    """
+
+    PENDING = 'pending'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+    CANCELLED = 'cancelled'
+
+    def __init__(self, name: str, loop: asyncio.AbstractEventLoop,
+                 on_progress: Optional[Callable[["Job"], None]] = None, outputs: Sequence[str] = ()):
+        self.id = next(_job_ids)
+        self.name = name
+        self.state = Job.PENDING
+        self.progress: Optional[float] = 0.0
+        self.message = name
+        self.outputs = list(outputs)
+        # Стан outputs перед запуском (None - завдання ще не почалося)
+        self._output_states: Optional[Dict[str, Optional[tuple]]] = None
+        self.created = time.perf_counter()
+        self.finished: Optional[float] = None
+        self._loop = loop
+        self._on_progress = on_progress
+        self._cancel_event = threading.Event()
+        self._future: Optional[Future] = None
+        self._result: asyncio.Future = loop.create_future()
+        self._result.add_done_callback(self._awaiter_cancelled)
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    @property
+    def active(self) -> bool:
+        return self.state in (Job.PENDING, Job.RUNNING)
+
+    @property
+    def elapsed(self) -> float:
+        """Час від створення до завершення або до поточного моменту (с)"""
+        return (self.finished or time.perf_counter()) - self.created
+
+    def done(self) -> bool:
+        return self._result.done()
+
+    def result(self) -> Any:
+        """Результат завершеного завдання (як asyncio.Future.result)"""
+        return self._result.result()
+
+    def cancel(self) -> bool:
+        """
+        Скасовує завдання
+
+        Returns:
+            True, якщо завдання ще виконувалося або очікувало
+        """
+        if not self.active:
+            return False
+        self._cancel_event.set()
+        if self._future is not None:
+            self._future.cancel()
+        return True
+
+    def check(self):
+        """
+        Перевірка скасування між кроками (з робочого потоку)
+
+        Raises:
+            JobCancelled: Якщо завдання скасовано
+        """
+        if self._cancel_event.is_set():
+            raise JobCancelled(self.name)
+
+    def report(self, fraction: Optional[float] = None, message: Optional[str] = None):
+        """
+        Повідомляє прогрес (з робочого потоку); сумісна з progress(частка, повідомлення)
+
+        Raises:
+            JobCancelled: Якщо завдання скасовано
+        """
+        self.check()
+        self.progress = fraction
+        if message is not None:
+            self.message = message
+        self._notify()
+
+    def __await__(self):
+        return self._result.__await__()
+
+    def _notify(self):
+        if self._on_progress is None:
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._call_progress)
+        except RuntimeError:
+            # Цикл подій уже закрито
+            pass
+
+    def _call_progress(self):
+        try:
+            self._on_progress(self)
+        except Exception as e:
+            logging.error(f"Помилка колбеку прогресу завдання '{self.name}': {e}", exc_info=True)
+
+    def _run(self, work: Callable[["Job"], Any]) -> Any:
+        # Робочий потік
+        self.check()
+        self._output_states = {path: _file_state(path) for path in self.outputs}
+        self.state = Job.RUNNING
+        self._notify()
+        return work(self)
+
+    def _settle(self, future: Future):
+        # Потік циклу подій
+        self.finished = time.perf_counter()
+        error = None if future.cancelled() else future.exception()
+        if future.cancelled() or self.cancelled or isinstance(error, JobCancelled):
+            self.state = Job.CANCELLED
+            self.message = "Скасовано"
+            outcome = JobCancelled(self.name)
+        elif error is not None:
+            self.state = Job.FAILED
+            self.message = f"{type(error).__name__}: {error}"
+            outcome = error
+        else:
+            self.state = Job.DONE
+            self.progress = 1.0
+            self.message = "Готово"
+            outcome = None
+        if outcome is not None:
+            self._remove_outputs()
+        if not self._result.done():
+            if outcome is None:
+                self._result.set_result(future.result())
+            else:
+                self._result.set_exception(outcome)
+        if self._on_progress is not None:
+            self._call_progress()
+
+    def _awaiter_cancelled(self, result: asyncio.Future):
+        if result.cancelled():
+            self.cancel()
+
+    def _remove_outputs(self):
+        # Лише файли, створені або змінені завданням
+        if self._output_states is None:
+            return
+        for path, before in self._output_states.items():
+            if _file_state(path) in (None, before):
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def __repr__(self) -> str:
+        return f"<Job {self.id} {self.name!r} {self.state}>"
+
+
+class JobManager:
+    """
+    Запуск завдань у виконавці з доставкою прогресу в цикл подій asyncio
+
+    Методи submit*() викликаються з корутин (потрібен запущений цикл подій).
+
+    Args:
+        max_workers: Кількість потоків власного пулу
+        executor: Зовнішній виконавець (тоді він не зупиняється в shutdown())
+        on_progress: Колбек прогресу за замовчуванням для всіх завдань
+
+    Attributes:
+        jobs: Незавершені завдання {id: Job}
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS, executor: Optional[Executor] = None,
+                 on_progress: Optional[Callable[[Job], None]] = None):
+        self._own_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='balloon-job')
+        self.on_progress = on_progress
+        self.jobs: Dict[int, Job] = {}
+
+    def submit(self, name: str, work: Callable[[Job], Any], on_progress: Optional[Callable[[Job], None]] = None,
+               outputs: Sequence[str] = ()) -> Job:
+        """
+        Запускає завдання
+
+        Args:
+            name: Назва завдання
+            work: Функція work(job) -> результат; викликає job.report()/job.check()
+            on_progress: Колбек прогресу (None - on_progress менеджера)
+            outputs: Файли, що видаляються, якщо завдання скасовано або завершилося помилкою
+                (лише якщо завдання їх створило або змінило)
+
+        Returns:
+            Job
+        """
+        loop = asyncio.get_running_loop()
+        job = Job(name, loop, on_progress or self.on_progress, outputs)
+        self.jobs[job.id] = job
+        job._future = self._executor.submit(job._run, work)
+
+        def settle(future: Future):
+            try:
+                loop.call_soon_threadsafe(self._settled, job, future)
+            except RuntimeError:
+                pass
+
+        job._future.add_done_callback(settle)
+        return job
+
+    def submit_call(self, name: str, func: Callable, *args, outputs: Sequence[str] = (), **kwargs) -> Job:
+        """Запускає звичайну блокуючу функцію func(*args, **kwargs) як завдання"""
+        def work(job: Job):
+            job.report(None, name)
+            return func(*args, **kwargs)
+        return self.submit(name, work, outputs=outputs)
+
+    def submit_export(self, fmt: str, pattern: Dict[str, Any], filename: str, full_job: bool = True,
+                      **options) -> Job:
+        """
+        Експорт викрійки у файл (export_pattern_file: svg, dxf, pdf, hpgl, gcode, xlsx)
+
+        Returns:
+            Job з результатом - шляхом до файлу
+        """
+        from balloon.export_core import export_pattern_file
+
+        def work(job: Job):
+            job.report(0.0, f"Експорт {fmt.upper()}...")
+            return export_pattern_file(pattern, fmt, filename, full_job, progress=job.report, **options)
+        return self.submit(f"export.{fmt}", work, outputs=[filename])
+
+    def submit_report(self, results: Dict[str, Any], inputs: Dict[str, Any], filename: str, fmt: str = 'pdf',
+                      **options) -> Job:
+        """
+        Звіт generate_pdf_report (fmt='pdf') або generate_html_report (fmt='html')
+
+        Returns:
+            Job з результатом - шляхом до файлу
+
+        Raises:
+            ValueError: Якщо формат звіту невідомий
+        """
+        if fmt not in ('pdf', 'html'):
+            raise ValueError(f"Невідомий формат звіту: {fmt}")
+
+        def work(job: Job):
+            import balloon.export as export
+
+            generate = export.generate_pdf_report if fmt == 'pdf' else export.generate_html_report
+            if generate is None:
+                raise ImportError("Генерація звітів недоступна: не встановлено reportlab")
+            job.report(0.0, f"Звіт {fmt.upper()}...")
+            return generate(results, inputs, filename=filename, **options)
+        return self.submit(f"report.{fmt}", work, outputs=[filename])
+
+    def submit_sweep(self, func: Callable, parameter: str, values: Iterable[Any], name: Optional[str] = None,
+                     **fixed) -> Job:
+        """
+        Розрахунок func(**fixed, parameter=значення) для кожного значення
+
+        Прогрес і перевірка скасування - після кожної точки.
+
+        Returns:
+            Job з результатом - списком результатів у порядку values
+        """
+        values = list(values)
+
+        def work(job: Job) -> List[Any]:
+            results = []
+            for index, value in enumerate(values):
+                job.report(index / len(values), f"{parameter} = {value}")
+                results.append(func(**fixed, **{parameter: value}))
+            return results
+        return self.submit(name or f"sweep.{parameter}", work)
+
+    def _settled(self, job: Job, future: Future):
+        self.jobs.pop(job.id, None)
+        job._settle(future)
+
+    async def gather(self, *jobs: Job, return_exceptions: bool = False) -> List[Any]:
+        """Очікує на всі завдання (як asyncio.gather); результати в порядку jobs"""
+        return await asyncio.gather(*(job._result for job in jobs), return_exceptions=return_exceptions)
+
+    def active(self) -> List[Job]:
+        """Завдання, що очікують або виконуються"""
+        return list(self.jobs.values())
+
+    def cancel_all(self) -> int:
+        """Скасовує всі активні завдання; повертає їх кількість"""
+        return sum(job.cancel() for job in self.active())
+
+    def shutdown(self, wait: bool = True):
+        """Скасовує активні завдання та зупиняє власний пул потоків"""
+        self.cancel_all()
+        if self._own_executor:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    async def __aenter__(self) -> "JobManager":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        jobs = self.active()
+        self.cancel_all()
+        if jobs:
+            # Дочекатися робочих потоків (і видалення недороблених файлів), не блокуючи цикл подій
+            await asyncio.wait([asyncio.wrap_future(job._future) for job in jobs])
+            await asyncio.sleep(0)
+        if self._own_executor:
+            self._executor.shutdown(wait=False)
+        return False
+
+
+async def export_design(pattern: Dict[str, Any], formats: Sequence[str], output_dir: str,
+                        basename: str = 'pattern', results: Optional[Dict[str, Any]] = None,
+                        inputs: Optional[Dict[str, Any]] = None, report_format: str = 'pdf',
+                        on_progress: Optional[Callable[[Job], None]] = None,
+                        max_workers: int = DEFAULT_MAX_WORKERS, return_exceptions: bool = False) -> Dict[str, Any]:
+    """
+    Одночасний експорт викрійки в кілька форматів та звіт одного проєкту
+
+    Args:
+        pattern: Викрійка
+        formats: Формати з balloon.export_core.EXPORT_FORMATS
+        output_dir: Каталог файлів (створюється)
+        basename: Ім'я файлів без розширення
+        results: Результати розрахунку (None - без звіту)
+        inputs: Вхідні параметри для звіту
+        report_format: 'pdf' або 'html'
+        on_progress: Колбек прогресу завдань
+        max_workers: Кількість потоків
+        return_exceptions: Повертати винятки завдань як значення (інакше - перший виняток)
+
+    Returns:
+        {формат або 'report': шлях до файлу (або виняток)}
+
+    Raises:
+        ValueError: Якщо формат невідомий
+    """
+    from balloon.export_core import EXPORT_FORMATS
+
+    unknown = [fmt for fmt in formats if fmt not in EXPORT_FORMATS]
+    if unknown:
+        raise ValueError(f"Невідомі формати експорту: {', '.join(unknown)}; доступні: {', '.join(EXPORT_FORMATS)}")
+    os.makedirs(output_dir, exist_ok=True)
+    paths = {fmt: os.path.join(output_dir, f"{basename}{EXPORT_FORMATS[fmt]}") for fmt in dict.fromkeys(formats)}
+
+    async with JobManager(max_workers=max_workers, on_progress=on_progress) as manager:
+        jobs = {fmt: manager.submit_export(fmt, pattern, path) for fmt, path in paths.items()}
+        if results is not None:
+            report_path = os.path.join(output_dir, f"{basename}_report.{report_format}")
+            jobs['report'] = manager.submit_report(results, inputs or {}, report_path, report_format,
+                                                   pattern_files=list(paths.values()))
+        done = await manager.gather(*jobs.values(), return_exceptions=return_exceptions)
+    return dict(zip(jobs, done))
+
+
+def _parse_param(text: str):
+    key, separator, value = text.partition('=')
+    if not separator:
+        raise argparse.ArgumentTypeError(f"Очікується ключ=значення: {text}")
+    try:
+        return key.strip(), float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Значення параметра {key} має бути числом: {value}") from None
+
+
+def build_parser(parser: Optional[argparse.ArgumentParser] = None) -> argparse.ArgumentParser:
+    """Аргументи підкоманди export"""
+    parser = parser or argparse.ArgumentParser(prog='balloon-calculator export')
+    parser.description = "Одночасний експорт викрійки в кілька форматів (та звіт)"
+    parser.add_argument('shape', choices=('sphere', 'pillow', 'pear', 'cigar'), help="Форма")
+    parser.add_argument('-p', '--param', dest='params', action='append', type=_parse_param, default=[],
+                        metavar='KEY=VALUE', help="Параметр форми (radius=1.5, pillow_len=3, ...)")
+    parser.add_argument('--formats', default='pdf,dxf,svg', help="Формати через кому (svg, dxf, pdf, hpgl, gcode, xlsx)")
+    parser.add_argument('-o', '--output-dir', default='.', help="Каталог файлів")
+    parser.add_argument('--name', default='pattern', help="Ім'я файлів без розширення")
+    parser.add_argument('--segments', type=int, default=12, help="Кількість gores")
+    parser.add_argument('--seam-allowance', type=float, default=10.0, help="Припуск на шов, мм")
+    parser.add_argument('--solve', metavar='JSON',
+                        help="Аргументи solve_volume_to_payload як JSON - додати звіт з результатами")
+    parser.add_argument('--report', choices=('pdf', 'html'), default='pdf', help="Формат звіту (з --solve)")
+    parser.add_argument('-j', '--workers', type=int, default=DEFAULT_MAX_WORKERS, help="Кількість потоків")
+    parser.add_argument('--no-progress', action='store_true', help="Не показувати прогрес")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Точка входу підкоманди export
+
+    Returns:
+        Код виходу: 0 - успіх, 1 - частина файлів не створена, 2 - помилка запуску
+    """
+    from balloon.patterns import generate_pattern
+    from balloon.utils import create_progress, print_error, print_success, print_warning
+
+    args = build_parser().parse_args(argv)
+    formats = [fmt.strip().lower() for fmt in args.formats.split(',') if fmt.strip()]
+    try:
+        pattern = generate_pattern(args.shape, dict(args.params), args.segments, args.seam_allowance)
+        inputs = results = None
+        if args.solve:
+            from balloon.model.solve import solve_volume_to_payload
+            inputs = json.loads(args.solve)
+            results = solve_volume_to_payload(**inputs)
+    except (ValueError, TypeError) as e:
+        print_error(f"Експорт не виконано: {e}")
+        return 2
+
+    bar = None if args.no_progress else create_progress()
+    tasks: Dict[int, Any] = {}
+
+    def show(job: Job):
+        if job.id not in tasks:
+            tasks[job.id] = bar.add_task(job.name)
+        percent = f" {job.progress:.0%}" if job.progress is not None else ""
+        bar.update(tasks[job.id], description=f"{job.name}: {job.message}{percent}")
+
+    if bar is not None:
+        bar.start()
+    try:
+        done = asyncio.run(export_design(
+            pattern, formats, args.output_dir, args.name, results, inputs, args.report,
+            on_progress=show if bar is not None else None, max_workers=max(1, args.workers),
+            return_exceptions=True,
+        ))
+    except (OSError, ValueError) as e:
+        print_error(f"Експорт не виконано: {e}")
+        return 2
+    finally:
+        if bar is not None:
+            bar.stop()
+
+    failed = {key: value for key, value in done.items() if isinstance(value, BaseException)}
+    for key, value in done.items():
+        if key not in failed:
+            print_success(f"{key}: {value}")
+    for key, error in failed.items():
+        print_warning(f"{key}: {error}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+"""
+Відкладений імпорт важких залежностей
+
+SciPy, plotly, shapely, reportlab та ezdxf потрібні лише окремим
+функціям, а їх імпорт займає сотні мілісекунд. lazy_import повертає
+модуль-заглушку, який імпортує справжній модуль при першому зверненні
+до атрибута; module_available перевіряє наявність пакета без імпорту.
+
+Використання:
+    from balloon.lazy_import import lazy_import, module_available
+
+    SCIPY_AVAILABLE = module_available('scipy')
+    integrate = lazy_import('scipy.integrate')
+
+    def f():
+        return integrate.quad(...)  # scipy імпортується тут
+
+PyInstaller не бачить відкладених імпортів у статичному аналізі: при
+збиранні exe модулі, передані в lazy_import, слід вказати як
+--hidden-import (scipy.integrate, scipy.interpolate, shapely.geometry,
+plotly.graph_objects, plotly.offline).
+"""
+
+import importlib
+import importlib.util
+import sys
+import types
+from functools import lru_cache
+
+
+class LazyModule(types.ModuleType):
+    """
+    Заглушка модуля, що імпортує його при першому зверненні до атрибута
+
+    Після завантаження атрибути модуля копіюються в заглушку, тож
+    подальші звернення не проходять через __getattr__.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__['_lazy_target'] = None
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__['_lazy_target']
+        if module is None:
+            module = importlib.import_module(self.__name__)
+            self.__dict__.update(module.__dict__)
+            self.__dict__['_lazy_target'] = module
+        return module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = 'loaded' if self.__dict__['_lazy_target'] is not None else 'not loaded'
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """
+    Повертає модуль, що буде імпортований при першому використанні
+
+    Якщо модуль уже імпортовано, повертається він сам.
+
+    Args:
+        name: Повна назва модуля ('scipy.integrate')
+
+    Returns:
+        Модуль або LazyModule
+
+    Raises:
+        ImportError: При першому зверненні, якщо модуль не встановлено
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)
+
+
+@lru_cache(maxsize=None)
+def module_available(name: str) -> bool:
+    """
+    Чи встановлено пакет (без його імпорту)
+
+    Перевіряється лише пакет верхнього рівня: 'scipy.integrate' -> 'scipy'.
+    """
+    top_level = name.partition('.')[0]
+    if top_level in sys.modules:
+        return True
+    try:
+        return importlib.util.find_spec(top_level) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def is_loaded(module: types.ModuleType) -> bool:
+    """Чи імпортовано модуль (для LazyModule - чи було звернення до атрибутів)"""
+    if isinstance(module, LazyModule):
+        return module.__dict__['_lazy_target'] is not None
+    return True
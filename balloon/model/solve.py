@@ -20,6 +20,8 @@ from balloon.model.shapes import get_shape_dimensions_from_volume
 from balloon.constants import (
     T0, GAS_CONSTANT, GRAVITY
 )
+from balloon.cache import memoize, persistent_cache
+from balloon.instrument import instrument
 
 
 def required_balloon_volume(
@@ -73,6 +75,8 @@ def calculate_gas_loss(
     return Q
 
 
+@memoize
+@instrument('model.balloon_state')
 def calculate_balloon_state(
     gas_type: Literal["Гелій", "Водень", "Гаряче повітря"],
     gas_volume: float,
@@ -193,6 +197,8 @@ def calculate_balloon_state(
     }
 
 
+@instrument('model.solve_volume_to_payload')
+@persistent_cache
 def solve_volume_to_payload(
     gas_type: Literal["Гелій", "Водень", "Гаряче повітря"],
     gas_volume: float,
@@ -289,6 +295,8 @@ def solve_volume_to_payload(
     return state
 
 
+@instrument('model.solve_payload_to_volume')
+@persistent_cache
 def solve_payload_to_volume(
     gas_type: Literal["Гелій", "Водень", "Гаряче повітря"],
     target_payload: float,
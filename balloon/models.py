@@ -1,12 +1,86 @@
 """
 Pydantic моделі для валідації даних
+
+Обмеження полів (Field gt/ge/lt/le, Literal), множини рядкових полів та
+повідомлення перехресних правил визначені тут один раз і читаються також
+колонковим валідатором пакетного розрахунку (validators.validate_columns)
+через numeric_constraints() та literal_choices().
 """
 
-from typing import Optional, Literal
+from dataclasses import dataclass
+from typing import Dict, Optional, Literal, Tuple, Type, get_args
 from pydantic import BaseModel, Field, field_validator, model_validator
 
 from balloon.constants import MATERIALS, GAS_DENSITY
 
+# Максимальна загальна висота (м) - межа стратосфери
+MAX_TOTAL_HEIGHT = 50000
+
+# Рядкові поля BalloonInputs (не конвертуються в числа)
+STRING_FIELDS = ('gas_type', 'material', 'mode', 'shape_type')
+
+# Числові поля зі значенням за замовчуванням: порожній рядок стає None
+DEFAULTED_FIELDS = ('ground_temp', 'inside_temp', 'duration', 'extra_mass', 'seam_factor')
+
+GAS_VOLUME_REQUIRED_MESSAGE = "В режимі 'Об'єм -> навантаження' потрібно вказати об'єм газу"
+TOTAL_HEIGHT_MESSAGE = "Загальна висота не може перевищувати 50 км"
+
+
+def unsupported_gas_message(value) -> str:
+    return f"Непідтримуваний тип газу: {value}. Доступні: {list(GAS_DENSITY.keys())}"
+
+
+def unsupported_material_message(value) -> str:
+    return f"Непідтримуваний матеріал: {value}. Доступні: {list(MATERIALS.keys())}"
+
+
+def not_a_number_message(field_name: str) -> str:
+    return f"Поле '{field_name}' має містити число"
+
+
+def temperature_difference_message(inside_temp: float, ground_temp: float) -> str:
+    return (
+        f"Температура всередині ({inside_temp}°C) має бути більшою за "
+        f"температуру на землі ({ground_temp}°C)"
+    )
+
+
+@dataclass(frozen=True)
+class NumericBounds:
+    """Межі числового поля з Field(gt=..., ge=..., lt=..., le=...)"""
+    gt: Optional[float] = None
+    ge: Optional[float] = None
+    lt: Optional[float] = None
+    le: Optional[float] = None
+
+
+def numeric_constraints(model: Type[BaseModel]) -> Dict[str, NumericBounds]:
+    """
+    Межі числових полів моделі (лише поля з обмеженнями)
+
+    Args:
+        model: Pydantic модель (BalloonInputs, ShapeParams)
+
+    Returns:
+        {ім'я поля: NumericBounds} у порядку оголошення полів
+    """
+    result = {}
+    for name, info in model.model_fields.items():
+        bounds = {}
+        for item in info.metadata:
+            for key in ('gt', 'ge', 'lt', 'le'):
+                value = getattr(item, key, None)
+                if value is not None:
+                    bounds[key] = value
+        if bounds:
+            result[name] = NumericBounds(**bounds)
+    return result
+
+
+def literal_choices(model: Type[BaseModel], field_name: str) -> Tuple[str, ...]:
+    """Допустимі значення поля Literal[...] моделі"""
+    return get_args(model.model_fields[field_name].annotation)
+
 
 class ShapeParams(BaseModel):
     """Параметри форми кулі"""
@@ -77,7 +151,7 @@ class BalloonInputs(BaseModel):
     def validate_gas_type(cls, v):
         """Валідує тип газу"""
         if v not in GAS_DENSITY:
-            raise ValueError(f"Непідтримуваний тип газу: {v}. Доступні: {list(GAS_DENSITY.keys())}")
+            raise ValueError(unsupported_gas_message(v))
         return v
     
     @field_validator('material')
@@ -85,32 +159,32 @@ class BalloonInputs(BaseModel):
     def validate_material(cls, v):
         """Валідує матеріал"""
         if v not in MATERIALS:
-            raise ValueError(f"Непідтримуваний матеріал: {v}. Доступні: {list(MATERIALS.keys())}")
+            raise ValueError(unsupported_material_message(v))
         return v
     
     @field_validator('*', mode='before')
     @classmethod
     def parse_strings(cls, v, info):
         """Конвертує рядки в числа для числових полів"""
-        if info.field_name in ['gas_type', 'material', 'mode', 'shape_type']:
+        if info.field_name in STRING_FIELDS:
             return v  # Рядкові поля не конвертуємо
         
         if v is None or v == "":
             # Повертаємо значення за замовчуванням для опціональних полів
-            if info.field_name in ['ground_temp', 'inside_temp', 'duration', 'extra_mass', 'seam_factor']:
+            if info.field_name in DEFAULTED_FIELDS:
                 return None
             return v
         
         if isinstance(v, str):
             v = v.strip()
             if not v:
-                if info.field_name in ['ground_temp', 'inside_temp', 'duration', 'extra_mass', 'seam_factor']:
+                if info.field_name in DEFAULTED_FIELDS:
                     return None
                 return v
             try:
                 return float(v)
             except ValueError:
-                raise ValueError(f"Поле '{info.field_name}' має містити число")
+                raise ValueError(not_a_number_message(info.field_name))
         
         return v
     
@@ -119,7 +193,7 @@ class BalloonInputs(BaseModel):
         """Валідує залежність між режимом та об'ємом/навантаженням"""
         # В режимі "payload" gas_volume обов'язковий
         if self.mode == 'payload' and (self.gas_volume is None or self.gas_volume <= 0):
-            raise ValueError("В режимі 'Об'єм -> навантаження' потрібно вказати об'єм газу")
+            raise ValueError(GAS_VOLUME_REQUIRED_MESSAGE)
         
         # В режимі "volume" gas_volume не потрібен (об'єм розраховується з навантаження)
         # Але якщо він переданий, він ігнорується
@@ -130,18 +204,15 @@ class BalloonInputs(BaseModel):
         """Валідує різницю температур для гарячого повітря"""
         if self.gas_type == "Гаряче повітря":
             if self.inside_temp <= self.ground_temp:
-                raise ValueError(
-                    f"Температура всередині ({self.inside_temp}°C) має бути більшою за "
-                    f"температуру на землі ({self.ground_temp}°C)"
-                )
+                raise ValueError(temperature_difference_message(self.inside_temp, self.ground_temp))
         return self
     
     @model_validator(mode='after')
     def validate_height_parameters(self):
         """Валідує параметри висоти"""
         total_height = self.start_height + self.work_height
-        if total_height > 50000:  # Максимальна висота стратосфери
-            raise ValueError("Загальна висота не може перевищувати 50 км")
+        if total_height > MAX_TOTAL_HEIGHT:
+            raise ValueError(TOTAL_HEIGHT_MESSAGE)
         return self
     
     def get_validated_numbers(self) -> dict:
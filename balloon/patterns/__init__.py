@@ -4,6 +4,7 @@
 
 # Основні функції
 from balloon.patterns.base import (
+    generate_pattern,  # Вибір методу за формою
     generate_pattern_from_shape,  # Тільки для pillow
     calculate_seam_length
 )
@@ -15,6 +16,7 @@ from balloon.patterns.profile_based import generate_pattern_from_shape_profile
 from balloon.patterns.pillow_pattern import calculate_pillow_pattern
 
 __all__ = [
+    'generate_pattern',
     'generate_pattern_from_shape',  # Тільки для pillow
     'generate_pattern_from_shape_profile',  # Для sphere/pear/cigar
     'calculate_seam_length',
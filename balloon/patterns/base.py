@@ -7,16 +7,17 @@ from typing import Dict, Any
 
 # Імпорт для pillow (подушка не поверхня обертання)
 from balloon.patterns.pillow_pattern import calculate_pillow_pattern
+from balloon.patterns.profile_based import generate_pattern_from_shape_profile
 
-# Використовуємо shapely для правильного normal offset (seam allowance)
-try:
-    from shapely.geometry import LineString, Polygon
-    from shapely.ops import unary_union
-    SHAPELY_AVAILABLE = True
-except ImportError:
-    SHAPELY_AVAILABLE = False
+from balloon.lazy_import import lazy_import, module_available
+from balloon.instrument import instrument
 
+# Використовуємо shapely для правильного normal offset (seam allowance); імпорт при першому використанні
+SHAPELY_AVAILABLE = module_available('shapely')
+shapely_geometry = lazy_import('shapely.geometry')
 
+
+@instrument('patterns.generate')
 def generate_pattern_from_shape(shape_type: str, shape_params: dict, num_segments: int = 12, seam_allowance_mm: float = 10.0) -> Dict[str, Any]:
     """
     Генерує патерн на основі типу форми та параметрів
@@ -57,6 +58,33 @@ def generate_pattern_from_shape(shape_type: str, shape_params: dict, num_segment
         )
 
 
+# Форми, викрійки яких будуються з профілю обертання (pillow - generate_pattern_from_shape)
+PROFILE_SHAPES = ('sphere', 'pear', 'cigar')
+
+
+def generate_pattern(shape_type: str, shape_params: dict = None, num_segments: int = 12,
+                     seam_allowance_mm: float = 10.0) -> Dict[str, Any]:
+    """
+    Генерує викрійку відповідним методом для форми (як GUI)
+
+    sphere/pear/cigar - generate_pattern_from_shape_profile (узгоджено з 3D
+    та розрахунками), pillow - generate_pattern_from_shape.
+
+    Args:
+        shape_type: Тип форми
+        shape_params: Параметри форми
+        num_segments: Кількість сегментів (gores)
+        seam_allowance_mm: Припуск на шов (мм)
+
+    Returns:
+        Словник з патерном
+    """
+    shape_params = dict(shape_params or {})
+    if shape_type in PROFILE_SHAPES:
+        return generate_pattern_from_shape_profile(shape_type, shape_params, num_segments, seam_allowance_mm)
+    return generate_pattern_from_shape(shape_type, shape_params, num_segments, seam_allowance_mm)
+
+
 def calculate_seam_length(pattern: Dict[str, Any]) -> float:
     """
     Розраховує загальну довжину швів для патерну
@@ -124,6 +152,7 @@ def calculate_seam_length(pattern: Dict[str, Any]) -> float:
     return 0.0
 
 
+@instrument('patterns.seam_allowance')
 def _add_seam_allowance(pattern: Dict[str, Any], allowance_m: float) -> Dict[str, Any]:
     """
     Додає припуск на шов до викрійки (для gores) по нормалі до контуру
@@ -235,7 +264,7 @@ def _add_seam_allowance_with_shapely(pattern: Dict[str, Any], allowance_m: float
     
     try:
         # Створюємо лінію з правої половини
-        line = LineString(right_points)
+        line = shapely_geometry.LineString(right_points)
         
         # Виконуємо buffer (offset) по нормалі
         buffered = line.buffer(allowance_m, cap_style=2, join_style=2)
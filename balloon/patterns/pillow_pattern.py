@@ -5,8 +5,10 @@
 from typing import Dict, Any
 
 from balloon.shapes import pillow_surface_area
+from balloon.instrument import instrument
 
 
+@instrument('patterns.pillow')
 def calculate_pillow_pattern(length: float, width: float, thickness: float = None) -> Dict[str, Any]:
     """
     Розраховує патерн для подушкоподібної оболонки
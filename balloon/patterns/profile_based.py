@@ -8,14 +8,12 @@ import math
 import numpy as np
 from typing import Dict, Any, List, Tuple
 from balloon.shapes.profile import get_shape_profile, ShapeProfile
+from balloon.lazy_import import lazy_import, module_available
+from balloon.instrument import instrument
 
-# Використовуємо scipy для покращення якості розкрою
-try:
-    from scipy import integrate
-    from scipy.interpolate import UnivariateSpline, interp1d
-    SCIPY_AVAILABLE = True
-except ImportError:
-    SCIPY_AVAILABLE = False
+# Використовуємо scipy для покращення якості розкрою (імпорт при першому згладжуванні)
+SCIPY_AVAILABLE = module_available('scipy')
+interpolate = lazy_import('scipy.interpolate')
 
 
 def _adaptive_z_discretization(profile: ShapeProfile, z_min: float, z_max: float, num_points: int) -> List[float]:
@@ -108,7 +106,7 @@ def _smooth_gore_contour(raw_points: List[Tuple[float, float]]) -> List[Tuple[fl
     """
     Згладжує контур gores за допомогою scipy.interpolate
     
-    Використовує UnivariateSpline для згладжування, зберігаючи початкові та кінцеві точки.
+    Використовує scipy.interpolate.UnivariateSpline для згладжування, зберігаючи початкові та кінцеві точки.
     Застосовується до всіх форм (sphere, pear, cigar) для покращення якості розкрою.
     """
     if not SCIPY_AVAILABLE or len(raw_points) < 4:
@@ -134,13 +132,13 @@ def _smooth_gore_contour(raw_points: List[Tuple[float, float]]) -> List[Tuple[fl
             # Параметр згладжування: менший для більш точного згладжування
             # Але адаптуємо до похідної
             s_param = len(raw_points) * 0.03 * (1 + avg_deriv * 0.5)
-            spline_x = UnivariateSpline(y_coords, x_coords, s=s_param, k=3)
+            spline_x = interpolate.UnivariateSpline(y_coords, x_coords, s=s_param, k=3)
             x_smooth = spline_x(y_coords)
         else:
             # Якщо Y не унікальні, використовуємо індекс як параметр
             indices = np.array(range(len(raw_points)))
             s_param = len(raw_points) * 0.05
-            spline_x = UnivariateSpline(indices, x_coords, s=s_param, k=3)
+            spline_x = interpolate.UnivariateSpline(indices, x_coords, s=s_param, k=3)
             x_smooth = spline_x(indices)
         
         # Переконуємося, що X не стає негативним
@@ -161,6 +159,7 @@ def _smooth_gore_contour(raw_points: List[Tuple[float, float]]) -> List[Tuple[fl
         return raw_points
 
 
+@instrument('patterns.gores')
 def generate_gore_pattern_from_profile(
     profile: ShapeProfile,
     num_gores: int = 12,
@@ -289,6 +288,7 @@ def generate_gore_pattern_from_profile(
     }
 
 
+@instrument('patterns.from_profile')
 def generate_pattern_from_shape_profile(
     shape_type: str,
     shape_params: dict,
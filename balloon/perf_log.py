@@ -0,0 +1,256 @@
+"""
+Структуроване логування продуктивності
+
+Події гарячих шляхів GUI (розрахунок, 3D прев'ю, фігури Plotly)
+записуються як структуровані записи логера 'balloon.perf' з полями
+та часом етапів, а не як INFO-повідомлення з відформатованими
+словниками параметрів на кожен виклик.
+
+Записи форматуються ліниво: поки логування вимкнене, span() повертає
+порожній об'єкт-заглушку, а значення полів-функцій (lambda: {...})
+обчислюються лише при записі. Часті події проріджуються параметром
+every: записується кожна N-та подія (поле 'sampled' = N).
+
+Увімкнення - змінна середовища BALLOON_PERF_LOG або enable_perf_log():
+    - шлях до файлу - записи у форматі JSONL (по одному JSON на рядок),
+      без дублювання у звичайний лог;
+    - '1' - текстові записи у звичайний лог (balloon.log).
+Тривалість кожного span також потрапляє в статистику balloon.instrument,
+якщо інструментування увімкнене.
+"""
+
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from balloon import instrument
+
+# Змінна середовища для увімкнення логування продуктивності
+PERF_LOG_ENV = 'BALLOON_PERF_LOG'
+
+LOGGER_NAME = 'balloon.perf'
+
+# Проріджування для подій, що повторюються при кожному редагуванні поля
+HIGH_FREQUENCY_EVERY = 10
+
+logger = logging.getLogger(LOGGER_NAME)
+
+_log_enabled = False
+_handler: Optional[logging.Handler] = None
+_counters: Dict[str, "itertools.count"] = {}
+_counters_lock = threading.Lock()
+
+
+def _resolve(value: Any) -> Any:
+    return value() if callable(value) else value
+
+
+def _json_default(value: Any) -> Any:
+    if hasattr(value, 'item') and getattr(value, 'ndim', None) == 0:
+        return value.item()
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    return str(value)
+
+
+class PerfRecord:
+    """
+    Повідомлення запису: поля обчислюються та форматуються при першому зверненні
+
+    Attributes:
+        event: Ім'я події
+        fields: Поля (значення-функції обчислюються ліниво)
+    """
+
+    def __init__(self, event: str, fields: Dict[str, Any]):
+        self.event = event
+        self.fields = fields
+        self._data: Optional[Dict[str, Any]] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        if self._data is None:
+            self._data = {'event': self.event, **{k: _resolve(v) for k, v in self.fields.items()}}
+        return self._data
+
+    def __str__(self) -> str:
+        data = self.as_dict()
+        parts = [f"{k}={v}" for k, v in data.items() if k != 'event']
+        return f"[perf] {self.event} " + ' '.join(parts)
+
+
+class JsonlFormatter(logging.Formatter):
+    """Форматує PerfRecord як один рядок JSON з часовою міткою"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = record.msg
+        data = message.as_dict() if isinstance(message, PerfRecord) else {'event': 'log', 'message': record.getMessage()}
+        return json.dumps({'ts': round(record.created, 6), **data}, ensure_ascii=False, default=_json_default)
+
+
+def enable_perf_log(path: Optional[str] = None):
+    """
+    Вмикає логування продуктивності
+
+    Args:
+        path: Файл JSONL (None - текстові записи у звичайний лог)
+    """
+    global _log_enabled, _handler
+    disable_perf_log()
+    if path:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        _handler = logging.FileHandler(path, encoding='utf-8', delay=True)
+        _handler.setFormatter(JsonlFormatter())
+        logger.addHandler(_handler)
+        logger.propagate = False
+    logger.setLevel(logging.INFO)
+    _log_enabled = True
+
+
+def disable_perf_log():
+    """Вимикає логування продуктивності (файл JSONL закривається)"""
+    global _log_enabled, _handler
+    _log_enabled = False
+    if _handler is not None:
+        logger.removeHandler(_handler)
+        _handler.close()
+        _handler = None
+    logger.propagate = True
+    logger.setLevel(logging.NOTSET)
+
+
+def perf_log_enabled() -> bool:
+    return _log_enabled
+
+
+def _sampled(event: str, every: int) -> bool:
+    if every <= 1:
+        return True
+    counter = _counters.get(event)
+    if counter is None:
+        with _counters_lock:
+            counter = _counters.setdefault(event, itertools.count())
+    return next(counter) % every == 0
+
+
+def event(name: str, every: int = 1, **fields):
+    """
+    Записує подію без тривалості
+
+    Args:
+        name: Ім'я події
+        every: Записувати кожну N-ту подію
+        **fields: Поля (функції без аргументів обчислюються лише при записі)
+    """
+    if not _log_enabled or not _sampled(name, every):
+        return
+    if every > 1:
+        fields['sampled'] = every
+    logger.info(PerfRecord(name, fields))
+
+
+class Span:
+    """
+    Вимір тривалості події з часом окремих етапів
+
+    Використання:
+        with span('gui.calculate', mode=mode) as s:
+            validate()
+            s.mark('validate')          # поле validate_ms
+            s['rows'] = len(rows)
+    Або без with: s = span(...); ...; s.finish(status='ok').
+    """
+
+    def __init__(self, name: str, every: int, fields: Dict[str, Any]):
+        self.name = name
+        self.every = every
+        self.fields = fields
+        self.start = time.perf_counter()
+        self._last = self.start
+        self._finished = False
+
+    def __setitem__(self, key: str, value: Any):
+        self.fields[key] = value
+
+    def mark(self, stage: str):
+        """Час від попередньої позначки (або початку) як поле '<stage>_ms'"""
+        now = time.perf_counter()
+        self.fields[f"{stage}_ms"] = round((now - self._last) * 1e3, 3)
+        self._last = now
+
+    def finish(self, **fields):
+        """Завершує вимір і записує подію (повторні виклики ігноруються)"""
+        if self._finished:
+            return
+        self._finished = True
+        elapsed = time.perf_counter() - self.start
+        failed = fields.get('status') == 'error'
+        instrument.record(self.name, elapsed, failed)
+        if _log_enabled and _sampled(self.name, self.every):
+            self.fields.update(fields)
+            self.fields['duration_ms'] = round(elapsed * 1e3, 3)
+            if self.every > 1:
+                self.fields['sampled'] = self.every
+            logger.info(PerfRecord(self.name, self.fields))
+
+    def __enter__(self) -> "Span":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.finish()
+        else:
+            self.finish(status='error', error=lambda: f"{exc_type.__name__}: {exc}")
+        return False
+
+
+class _NullSpan:
+    """Заглушка span, коли логування та інструментування вимкнені"""
+
+    def __setitem__(self, key: str, value: Any):
+        pass
+
+    def mark(self, stage: str):
+        pass
+
+    def finish(self, **fields):
+        pass
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+NULL_SPAN = _NullSpan()
+
+
+def span(name: str, every: int = 1, **fields) -> Span:
+    """
+    Починає вимір події (заглушка NULL_SPAN, якщо вимірювати нікуди)
+
+    Args:
+        name: Ім'я події (і етапу balloon.instrument)
+        every: Записувати в лог кожну N-ту подію
+        **fields: Поля (функції без аргументів обчислюються лише при записі)
+    """
+    if not _log_enabled and not instrument.instrumentation_enabled():
+        return NULL_SPAN
+    return Span(name, every, fields)
+
+
+def _configure_from_env():
+    value = os.environ.get(PERF_LOG_ENV, '').strip()
+    if not value or value.lower() in ('0', 'off', 'false'):
+        return
+    try:
+        enable_perf_log(None if value.lower() in ('1', 'on', 'true') else value)
+    except OSError as e:
+        logging.warning(f"Не вдалося відкрити {value} для логування продуктивності: {e}")
+
+
+_configure_from_env()
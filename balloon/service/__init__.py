@@ -0,0 +1,34 @@
+"""
+Локальний HTTP/JSON сервіс розрахунків
+
+Запуск:
+    python -m balloon.service                     # http://127.0.0.1:8765
+    python -m balloon service --port 9000 -j 4 --result-cache
+    python -m balloon.service.loadtest --spawn    # навантажувальний тест
+
+Операції (розв'язувачі, аналіз, викрійки, експорт) - в
+balloon.service.operations; пул процесів, об'єднання однакових запитів
+та кеш результатів - в balloon.service.core; HTTP сервер (stdlib) -
+в balloon.service.server. Сервіс працює лише на локальній адресі.
+"""
+
+from balloon.service.core import CalculationService, ServiceError
+from balloon.service.operations import (
+    OPERATIONS, Operation, RequestError, operation, register_operation, run_operation,
+)
+from balloon.service.server import DEFAULT_HOST, DEFAULT_PORT, make_server, serve
+
+__all__ = [
+    'CalculationService',
+    'ServiceError',
+    'OPERATIONS',
+    'Operation',
+    'RequestError',
+    'operation',
+    'register_operation',
+    'run_operation',
+    'DEFAULT_HOST',
+    'DEFAULT_PORT',
+    'make_server',
+    'serve',
+]
@@ -0,0 +1,54 @@
+"""
+Командний рядок сервісу розрахунків: python -m balloon.service
+
+Код виходу: 0 - сервіс зупинено (Ctrl+C), 2 - помилка запуску.
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from balloon.service.core import DEFAULT_CACHE_SIZE, DEFAULT_TIMEOUT
+from balloon.service.server import DEFAULT_HOST, DEFAULT_PORT
+
+
+def build_parser(parser: Optional[argparse.ArgumentParser] = None) -> argparse.ArgumentParser:
+    """Аргументи командного рядка сервісу"""
+    parser = parser or argparse.ArgumentParser(prog='python -m balloon.service')
+    parser.description = "Локальний HTTP/JSON сервіс розрахунків аеростатів"
+    parser.add_argument('--host', default=DEFAULT_HOST, help=f"Локальна адреса (за замовчуванням {DEFAULT_HOST})")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f"Порт (за замовчуванням {DEFAULT_PORT})")
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                        help="Процесів пулу (за замовчуванням - всі ядра; 0 - потоки без пулу процесів)")
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_CACHE_SIZE,
+                        help="Записів у кеші результатів сервісу (0 - без кешу)")
+    parser.add_argument('--result-cache', nargs='?', const='', metavar='PATH',
+                        help="Постійний кеш результатів для робочих процесів (без шляху - файл за замовчуванням)")
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, help="Тайм-аут одного розрахунку, с")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Точка входу; повертає код виходу"""
+    from balloon.utils import print_error
+    from balloon.service.server import serve
+
+    args = build_parser().parse_args(argv)
+    if args.workers is not None and args.workers < 0:
+        print_error("Кількість процесів не може бути від'ємною")
+        return 2
+    result_cache = args.result_cache
+    if result_cache == '':
+        from balloon.cache import default_cache_path
+        result_cache = default_cache_path()
+    try:
+        serve(args.host, args.port, workers=args.workers, cache_size=args.cache_size,
+              result_cache=result_cache, timeout=args.timeout)
+    except (OSError, ValueError) as e:
+        print_error(f"Сервіс не запущено: {e}")
+        return 2
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,210 @@
+"""
+Сервіс розрахунків: пул процесів, об'єднання запитів, спільний кеш
+
+CalculationService.call(name, params) виконує операцію з
+balloon.service.operations:
+    - результат береться з кешу сервісу (LRU в пам'яті, спільний для всіх
+      клієнтів), якщо такий самий запит уже виконувався;
+    - однакові запити, що надійшли, поки перший ще рахується, не
+      запускаються повторно, а чекають на той самий Future;
+    - решта виконується в пулі процесів (розрахунки CPU-bound, GIL не
+      дає паралелізму в потоках HTTP сервера).
+Робочі процеси можуть також використовувати постійний кеш результатів
+(balloon.cache, SQLite) - один файл для всіх процесів і перезапусків.
+"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Optional, Tuple
+
+from balloon import perf_log
+from balloon.cache import MISSING, MemoCache, input_key
+from balloon.service.operations import OPERATIONS, RequestError, run_operation
+
+# Записів у кеші результатів сервісу
+DEFAULT_CACHE_SIZE = 2048
+
+# Максимальний час очікування результату одного запиту (с)
+DEFAULT_TIMEOUT = 120.0
+
+# Потоків для workers=0 (виконання в поточному процесі)
+THREAD_WORKERS = 4
+
+# Джерело результату запиту
+SOURCE_CACHE = 'cache'
+SOURCE_COALESCED = 'coalesced'
+SOURCE_COMPUTED = 'computed'
+
+
+class ServiceError(Exception):
+    """
+    Помилка виконання запиту з HTTP статусом
+
+    Attributes:
+        status: 400 - некоректний запит, 404 - невідома операція,
+            501 - не встановлено бібліотеку формату, 504 - тайм-аут, 500 - інше
+    """
+
+    def __init__(self, message: str, status: int = 500):
+        super().__init__(message)
+        self.status = status
+
+
+def _init_worker(result_cache: Optional[str]):
+    """Ініціалізація робочого процесу: спільний постійний кеш результатів"""
+    if result_cache:
+        from balloon.cache import enable_result_cache
+        enable_result_cache(result_cache)
+
+
+class CalculationService:
+    """
+    Виконання операцій сервісу з пулом, об'єднанням запитів та кешем
+
+    Потокобезпечний: call() викликається з потоків HTTP сервера.
+
+    Args:
+        workers: Кількість процесів (None - os.cpu_count(); 0 - потоки
+            поточного процесу, без пулу процесів)
+        cache_size: Записів у кеші результатів сервісу (0 - без кешу)
+        result_cache: Файл постійного кешу balloon.cache для робочих процесів
+            (None - як налаштовано змінною BALLOON_RESULT_CACHE)
+        timeout: Максимальний час очікування результату (с)
+    """
+
+    def __init__(self, workers: Optional[int] = None, cache_size: int = DEFAULT_CACHE_SIZE,
+                 result_cache: Optional[str] = None, timeout: float = DEFAULT_TIMEOUT):
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.result_cache = result_cache
+        self.timeout = timeout
+        self._cache = MemoCache('balloon.service', cache_size) if cache_size > 0 else None
+        self._inflight: Dict[str, Future] = {}
+        # RLock: колбек Future, що вже завершився, викликається одразу під блокуванням
+        self._lock = threading.RLock()
+        self._counts = {'requests': 0, 'computed': 0, 'coalesced': 0, 'cached': 0, 'errors': 0}
+        self._started = time.time()
+        self._executor = self._create_executor()
+
+    def _create_executor(self):
+        if self.workers == 0:
+            _init_worker(self.result_cache)
+            return ThreadPoolExecutor(max_workers=THREAD_WORKERS, thread_name_prefix='balloon-service')
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                   initargs=(self.result_cache,))
+
+    def call(self, name: str, params: Optional[Dict[str, Any]] = None) -> Tuple[Any, str]:
+        """
+        Виконує операцію
+
+        Args:
+            name: Ім'я операції (OPERATIONS)
+            params: Параметри (JSON-об'єкт запиту)
+
+        Returns:
+            (результат, джерело: 'cache', 'coalesced' або 'computed');
+            результат спільний з кешем, його не слід змінювати
+
+        Raises:
+            ServiceError: Якщо запит некоректний або виконання не вдалося
+        """
+        params = params or {}
+        op = OPERATIONS.get(name)
+        if op is None:
+            raise ServiceError(f"Невідома операція: {name}", 404)
+        if not isinstance(params, dict):
+            raise ServiceError("Параметри запиту мають бути JSON-об'єктом", 400)
+        try:
+            key = input_key(name, params)
+        except TypeError as e:
+            raise ServiceError(f"Некоректні параметри: {e}", 400) from None
+
+        perf = perf_log.span(f"service.{name}")
+        with self._lock:
+            self._counts['requests'] += 1
+            cached = self._cache.lookup(key) if self._cache is not None and op.cacheable else MISSING
+            if cached is not MISSING:
+                self._counts['cached'] += 1
+                perf.finish(source=SOURCE_CACHE)
+                return cached, SOURCE_CACHE
+            future = self._inflight.get(key)
+            if future is not None:
+                source = SOURCE_COALESCED
+                self._counts['coalesced'] += 1
+            else:
+                source = SOURCE_COMPUTED
+                self._counts['computed'] += 1
+                future = self._submit(name, params)
+                self._inflight[key] = future
+                future.add_done_callback(lambda done: self._finished(key, op.cacheable, done))
+
+        try:
+            result = future.result(timeout=self.timeout)
+        except Exception as e:
+            with self._lock:
+                self._counts['errors'] += 1
+            error = self._service_error(e)
+            perf.finish(source=source, status='error', error=str(error))
+            raise error from e
+        perf.finish(source=source)
+        return result, source
+
+    def _submit(self, name: str, params: Dict[str, Any]) -> Future:
+        try:
+            return self._executor.submit(run_operation, name, params)
+        except BrokenProcessPool:
+            # Робочий процес аварійно завершився - пул створюється заново
+            logging.warning("Пул процесів сервісу пошкоджено, створюється новий")
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = self._create_executor()
+            return self._executor.submit(run_operation, name, params)
+
+    def _finished(self, key: str, cacheable: bool, future: Future):
+        with self._lock:
+            self._inflight.pop(key, None)
+            if cacheable and self._cache is not None and not future.cancelled() and future.exception() is None:
+                self._cache.put(key, future.result())
+
+    def _service_error(self, error: Exception) -> ServiceError:
+        if isinstance(error, ServiceError):
+            return error
+        if isinstance(error, FutureTimeout):
+            return ServiceError(f"Розрахунок не завершився за {self.timeout:g} с", 504)
+        if isinstance(error, (RequestError, ValueError)):
+            return ServiceError(str(error), 400)
+        if isinstance(error, ImportError):
+            return ServiceError(str(error), 501)
+        logging.error(f"Помилка операції сервісу: {error}", exc_info=error)
+        return ServiceError(f"{type(error).__name__}: {error}", 500)
+
+    def stats(self) -> Dict[str, Any]:
+        """Лічильники запитів, стан кешу та пулу"""
+        with self._lock:
+            counts = dict(self._counts)
+            inflight = len(self._inflight)
+        return {
+            **counts,
+            'inflight': inflight,
+            'workers': self.workers,
+            'uptime_s': round(time.time() - self._started, 3),
+            'cache': self._cache.stats() if self._cache is not None else None,
+        }
+
+    def clear_cache(self):
+        """Очищає кеш результатів сервісу"""
+        if self._cache is not None:
+            self._cache.clear()
+
+    def close(self):
+        """Зупиняє пул (запити, що виконуються, завершуються)"""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> "CalculationService":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
@@ -0,0 +1,213 @@
+"""
+Навантажувальний тест сервісу розрахунків: python -m balloon.service.loadtest
+
+Кілька потоків-клієнтів надсилають запити через постійні з'єднання
+(keep-alive) і вимірюють пропускну здатність (запитів/с) та затримки.
+--unique N задає кількість різних наборів параметрів (gas_volume
+змінюється), щоб оцінити окремо розрахунок у пулі (багато унікальних),
+кеш та об'єднання запитів (N=1).
+
+Приклади:
+    python -m balloon.service --port 8765 &
+    python -m balloon.service.loadtest --url http://127.0.0.1:8765 -c 16 -n 5000 --unique 500
+    python -m balloon.service.loadtest --spawn --workers 4 -n 2000   # сервер у цьому ж процесі
+"""
+
+import argparse
+import http.client
+import json
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+from balloon.instrument import percentile
+
+DEFAULT_URL = 'http://127.0.0.1:8765'
+
+# Параметри операції solve за замовчуванням
+DEFAULT_PARAMS = {
+    'gas_type': 'Гелій',
+    'gas_volume': 10.0,
+    'material': 'TPU',
+    'thickness_um': 35.0,
+    'start_height': 0.0,
+    'work_height': 1000.0,
+}
+
+
+def _request_bodies(params: Dict[str, Any], unique: int) -> List[bytes]:
+    """Тіла запитів: unique варіантів з різним gas_volume (або одне тіло)"""
+    if unique <= 1 or 'gas_volume' not in params:
+        return [json.dumps(params).encode('utf-8')]
+    base = float(params['gas_volume'])
+    return [json.dumps({**params, 'gas_volume': base + i * 0.01}).encode('utf-8') for i in range(unique)]
+
+
+def run_load_test(url: str = DEFAULT_URL, operation: str = 'solve', params: Optional[Dict[str, Any]] = None,
+                  requests: int = 1000, concurrency: int = 8, unique: int = 1,
+                  timeout: float = 60.0) -> Dict[str, Any]:
+    """
+    Надсилає requests запитів POST /<operation> з concurrency потоків
+
+    Args:
+        url: Адреса сервісу
+        operation: Операція
+        params: Параметри запиту (None - DEFAULT_PARAMS)
+        requests: Загальна кількість запитів
+        concurrency: Кількість одночасних клієнтів
+        unique: Кількість різних наборів параметрів
+        timeout: Тайм-аут з'єднання (с)
+
+    Returns:
+        {'requests', 'errors', 'duration_s', 'requests_per_s',
+         'latency_ms': {'p50', 'p90', 'p99', 'max'}, 'sources': {...}, 'statuses': {...}}
+    """
+    parts = urlsplit(url)
+    path = f"{parts.path.rstrip('/')}/{operation}"
+    bodies = _request_bodies(DEFAULT_PARAMS if params is None else params, unique)
+    counter = iter(range(requests))
+    lock = threading.Lock()
+    latencies: List[float] = []
+    sources: Counter = Counter()
+    statuses: Counter = Counter()
+
+    def client():
+        connection = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=timeout)
+        local_latencies, local_sources, local_statuses = [], Counter(), Counter()
+        try:
+            while True:
+                with lock:
+                    index = next(counter, None)
+                if index is None:
+                    break
+                start = time.perf_counter()
+                try:
+                    connection.request('POST', path, body=bodies[index % len(bodies)],
+                                       headers={'Content-Type': 'application/json'})
+                    response = connection.getresponse()
+                    response.read()
+                except (OSError, http.client.HTTPException):
+                    connection.close()
+                    local_statuses['connection_error'] += 1
+                    continue
+                local_latencies.append(time.perf_counter() - start)
+                local_statuses[response.status] += 1
+                local_sources[response.getheader('X-Balloon-Source') or 'none'] += 1
+        finally:
+            connection.close()
+            with lock:
+                latencies.extend(local_latencies)
+                sources.update(local_sources)
+                statuses.update(local_statuses)
+
+    threads = [threading.Thread(target=client, daemon=True) for _ in range(max(1, concurrency))]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    duration = time.perf_counter() - start
+
+    latencies.sort()
+    done = sum(statuses.values())
+    return {
+        'operation': operation,
+        'requests': done,
+        'errors': done - statuses.get(200, 0),
+        'concurrency': concurrency,
+        'unique': len(bodies),
+        'duration_s': round(duration, 3),
+        'requests_per_s': round(done / duration, 1) if duration > 0 else 0.0,
+        'latency_ms': {
+            q: round(percentile(latencies, p) * 1e3, 3)
+            for q, p in (('p50', 50), ('p90', 90), ('p99', 99), ('max', 100))
+        },
+        'sources': dict(sources),
+        'statuses': {str(k): v for k, v in statuses.items()},
+    }
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Звіт навантажувального тесту у вигляді тексту"""
+    latency = report['latency_ms']
+    lines = [
+        f"Операція: {report['operation']}  клієнтів: {report['concurrency']}  "
+        f"унікальних запитів: {report['unique']}",
+        f"Запитів: {report['requests']}  помилок: {report['errors']}  за {report['duration_s']:.2f} с",
+        f"Пропускна здатність: {report['requests_per_s']:.1f} запитів/с",
+        f"Затримка, мс: p50 {latency['p50']:.2f}  p90 {latency['p90']:.2f}  "
+        f"p99 {latency['p99']:.2f}  max {latency['max']:.2f}",
+        "Джерела: " + ', '.join(f"{k}={v}" for k, v in sorted(report['sources'].items())),
+    ]
+    return '\n'.join(lines)
+
+
+def build_parser(parser: Optional[argparse.ArgumentParser] = None) -> argparse.ArgumentParser:
+    """Аргументи командного рядка навантажувального тесту"""
+    parser = parser or argparse.ArgumentParser(prog='python -m balloon.service.loadtest')
+    parser.description = "Навантажувальний тест локального сервісу розрахунків"
+    parser.add_argument('--url', default=DEFAULT_URL, help=f"Адреса сервісу (за замовчуванням {DEFAULT_URL})")
+    parser.add_argument('--op', dest='operation', default='solve', help="Операція (за замовчуванням solve)")
+    parser.add_argument('--params', help="Параметри запиту як JSON (за замовчуванням - типовий розрахунок solve)")
+    parser.add_argument('-n', '--requests', type=int, default=1000, help="Загальна кількість запитів")
+    parser.add_argument('-c', '--concurrency', type=int, default=8, help="Кількість одночасних клієнтів")
+    parser.add_argument('--unique', type=int, default=1,
+                        help="Різних наборів параметрів (1 - однакові запити: кеш та об'єднання)")
+    parser.add_argument('--spawn', action='store_true', help="Запустити сервіс у цьому процесі на вільному порту")
+    parser.add_argument('-j', '--workers', type=int, default=None, help="Процесів пулу для --spawn")
+    parser.add_argument('--no-cache', action='store_true', help="Без кешу результатів для --spawn")
+    parser.add_argument('--json', dest='json_path', metavar='PATH', help="Записати звіт у JSON ('-' - stdout)")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Точка входу; повертає код виходу (1 - були помилки запитів, 2 - помилка запуску)"""
+    from balloon.utils import print_error, print_success, print_warning
+
+    args = build_parser().parse_args(argv)
+    try:
+        params = json.loads(args.params) if args.params else None
+    except json.JSONDecodeError as e:
+        print_error(f"Некоректний JSON параметрів: {e}")
+        return 2
+
+    server = service = None
+    url = args.url
+    if args.spawn:
+        from balloon.service.core import CalculationService
+        from balloon.service.server import make_server
+
+        service = CalculationService(workers=args.workers, cache_size=0 if args.no_cache else 2048)
+        server = make_server(service, port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = server.url
+    try:
+        report = run_load_test(url, args.operation, params, requests=args.requests,
+                               concurrency=args.concurrency, unique=args.unique)
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+            service.close()
+
+    if args.json_path:
+        text = json.dumps(report, ensure_ascii=False, indent=2)
+        if args.json_path == '-':
+            print(text)
+        else:
+            with open(args.json_path, 'w', encoding='utf-8') as fh:
+                fh.write(text)
+    if args.json_path != '-':
+        print(format_report(report))
+    if report['errors']:
+        print_warning(f"Помилок: {report['errors']} ({report['statuses']})")
+        return 1
+    print_success(f"{report['requests_per_s']:.1f} запитів/с")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,333 @@
+"""
+Операції сервісу розрахунків
+
+Операція - функція, що приймає параметри запиту як іменовані аргументи;
+результат перетворюється на JSON-сумісне значення. Розв'язувачі та
+аналіз зареєстровані напряму, тож параметри запиту - це аргументи
+функцій balloon.model.solve та balloon.analysis (thickness_um,
+start_height, shape_params, ...). Робочі процеси отримують лише ім'я
+операції та параметри.
+
+Параметри перевіряються до виклику: розв'язувачі та аналіз - через
+validate_all_inputs (ті самі межі й повідомлення, що у формі), параметри
+форми - через Pydantic модель форми з реєстру; помилки стають RequestError
+(HTTP 400), а не збоєм розрахунку.
+
+Нові операції реєструються register_operation() або декоратором @operation.
+"""
+
+import base64
+import inspect
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from pydantic import BaseModel, Field
+from pydantic import ValidationError as PydanticValidationError
+
+from balloon.export_core import EXPORT_FORMATS, export_pattern_file
+from balloon.analysis import calculate_height_profile, calculate_max_flight_time, calculate_optimal_height
+from balloon.model.solve import solve_payload_to_volume, solve_volume_to_payload
+from balloon.models import MAX_TOTAL_HEIGHT
+from balloon.patterns import generate_pattern
+from balloon.shapes.registry import get_shape_entry
+from balloon.validators import ValidationError, field_error_message, validate_all_inputs
+
+
+class RequestError(ValueError):
+    """Некоректні параметри запиту (невідомі або відсутні аргументи)"""
+
+
+@dataclass(frozen=True)
+class Operation:
+    """
+    Операція сервісу
+
+    Attributes:
+        name: Ім'я (шлях запиту POST /<name>)
+        func: Функція операції
+        description: Опис для GET /operations
+        cacheable: Чи зберігати результат у кеші сервісу
+        validate: Перевірка параметрів до виклику: приймає {ім'я: значення}
+            (з типовими значеннями) і повертає перевірені значення
+    """
+    name: str
+    func: Callable[..., Any]
+    description: str
+    cacheable: bool = True
+    validate: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
+
+    def parameters(self) -> Dict[str, Any]:
+        """Параметри: {ім'я: {'required': True} або {'default': значення}}"""
+        return {
+            name: {'required': True} if param.default is inspect.Parameter.empty else {'default': param.default}
+            for name, param in inspect.signature(self.func).parameters.items()
+            if param.kind not in (param.VAR_POSITIONAL, param.VAR_KEYWORD)
+        }
+
+
+OPERATIONS: Dict[str, Operation] = {}
+
+
+def register_operation(name: str, func: Callable, description: str, cacheable: bool = True,
+                       validate: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None) -> Operation:
+    """
+    Реєструє функцію як операцію сервісу
+
+    Параметри запиту перевіряються за сигнатурою func, потім validate
+    (ValueError або помилка Pydantic - RequestError).
+
+    Raises:
+        ValueError: Якщо операцію з таким ім'ям уже зареєстровано
+    """
+    if name in OPERATIONS:
+        raise ValueError(f"Операцію '{name}' уже зареєстровано")
+    OPERATIONS[name] = Operation(name, func, description, cacheable, validate)
+    return OPERATIONS[name]
+
+
+def operation(name: str, description: str, cacheable: bool = True,
+              validate: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None) -> Callable:
+    """Декоратор: register_operation для функції рівня модуля"""
+    def decorator(func: Callable) -> Callable:
+        register_operation(name, func, description, cacheable, validate)
+        return func
+    return decorator
+
+
+def jsonable(value: Any) -> Any:
+    """Перетворює результат (з типами NumPy, кортежами) на JSON-сумісне значення"""
+    if isinstance(value, dict):
+        return {str(k): jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [jsonable(v) for v in value]
+    if hasattr(value, 'item') and getattr(value, 'ndim', None) == 0:
+        return value.item()
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    return value
+
+
+def run_operation(name: str, params: Dict[str, Any]) -> Any:
+    """
+    Виконує операцію (у робочому процесі пулу або в потоці)
+
+    Args:
+        name: Ім'я операції
+        params: Параметри запиту
+
+    Returns:
+        JSON-сумісний результат
+
+    Raises:
+        RequestError: Якщо операція невідома, параметри не відповідають її сигнатурі
+            або не пройшли перевірку
+    """
+    op = OPERATIONS.get(name)
+    if op is None:
+        raise RequestError(f"Невідома операція: {name}")
+    try:
+        bound = inspect.signature(op.func).bind(**params)
+    except TypeError as e:
+        raise RequestError(f"Некоректні параметри операції '{name}': {e}") from None
+    if op.validate is not None:
+        bound.apply_defaults()
+        try:
+            bound.arguments.update(op.validate(dict(bound.arguments)))
+        except PydanticValidationError as e:
+            error = e.errors()[0]
+            raise RequestError(field_error_message(error['loc'], error['msg'])) from None
+        except (ValueError, ValidationError) as e:
+            raise RequestError(str(e)) from None
+    return jsonable(op.func(*bound.args, **bound.kwargs))
+
+
+# ============================================================================
+# ПЕРЕВІРКА ПАРАМЕТРІВ
+# ============================================================================
+
+# Аргументи розв'язувачів та аналізу -> поля validate_all_inputs
+_INPUT_FIELDS = {
+    'gas_type': 'gas_type',
+    'gas_volume': 'gas_volume',
+    'target_payload': 'gas_volume',
+    'material': 'material',
+    'thickness_um': 'thickness',
+    'start_height': 'start_height',
+    'work_height': 'work_height',
+    'ground_temp': 'ground_temp',
+    'inside_temp': 'inside_temp',
+    'duration': 'duration',
+    'shape_type': 'shape_type',
+    'extra_mass': 'extra_mass',
+    'seam_factor': 'seam_factor',
+}
+
+
+class OperationArguments(BaseModel):
+    """Межі аргументів операцій, яких немає у BalloonInputs"""
+    perm_mult: float = Field(1.0, gt=0)
+    min_payload: float = Field(0.0, ge=0)
+    max_height: int = Field(MAX_TOTAL_HEIGHT, gt=0, le=MAX_TOTAL_HEIGHT)
+    num_segments: int = Field(12, ge=1, le=1000)
+    seam_allowance_mm: float = Field(10.0, ge=0)
+    full_job: bool = True
+
+
+# Аргументи export_pattern_file, які не можна передати через options
+_RESERVED_EXPORT_OPTIONS = tuple(
+    name for name, param in inspect.signature(export_pattern_file).parameters.items()
+    if param.kind is not param.VAR_KEYWORD
+)
+
+
+def _check_extra_arguments(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Аргументи з OperationArguments, перетворені на числа"""
+    given = {key: arguments[key] for key in OperationArguments.model_fields if key in arguments}
+    checked = OperationArguments(**given)
+    return {key: getattr(checked, key) for key in given}
+
+
+def _check_shape_params(shape_type: Any, shape_params: Any) -> Optional[Dict[str, Any]]:
+    """
+    Параметри форми через Pydantic модель форми з реєстру
+
+    Returns:
+        Перевірені параметри (числа) або None, якщо параметри не задано
+        (форма будується з типовими розмірами)
+
+    Raises:
+        RequestError: Якщо форма невідома або параметри не є об'єктом
+        ValueError: Якщо параметр відсутній або поза межами ('shape_params.radius: ...')
+    """
+    entry = get_shape_entry(shape_type) if isinstance(shape_type, str) else None
+    if entry is None:
+        raise RequestError(f"Невідома форма: {shape_type}")
+    if not shape_params:
+        return None
+    if not isinstance(shape_params, dict):
+        raise RequestError("shape_params: очікується JSON-об'єкт")
+    try:
+        checked = entry.param_model(**shape_params)
+    except PydanticValidationError as e:
+        error = e.errors()[0]
+        raise ValueError(field_error_message(('shape_params',) + tuple(error['loc']), error['msg'])) from None
+    return {key: value for key, value in checked.model_dump().items() if value is not None}
+
+
+def check_balloon_arguments(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Перевіряє аргументи розв'язувача чи аналізу через validate_all_inputs
+
+    Відсутні у сигнатурі висоти перевіряються як 0; duration=0 (без втрат
+    газу) у розв'язувачах не перевіряється. Для target_payload діють межі
+    навантаження (режим 'volume').
+
+    Args:
+        arguments: {ім'я: значення} аргументів функції
+
+    Returns:
+        Перевірені значення (числа замість рядків JSON)
+
+    Raises:
+        ValidationError: Якщо значення некоректні (повідомлення з назвою аргументу)
+    """
+    checked = _check_extra_arguments(arguments)
+    if 'shape_type' in arguments:
+        checked['shape_params'] = _check_shape_params(arguments['shape_type'], arguments.get('shape_params'))
+    names = {
+        argument: field for argument, field in _INPUT_FIELDS.items()
+        if argument in arguments and not (argument == 'duration' and arguments[argument] in (0, None))
+    }
+    inputs = {field: arguments[argument] for argument, field in names.items()}
+    inputs.setdefault('start_height', 0)
+    inputs.setdefault('work_height', 0)
+    if 'target_payload' in names:
+        inputs['mode'] = 'volume'
+    try:
+        numbers, _ = validate_all_inputs(**inputs)
+    except ValidationError as e:
+        message = str(e)
+        for argument, field in names.items():
+            if argument != field and message.startswith(f"{field}: "):
+                message = f"{argument}: {message[len(field) + 2:]}"
+        raise ValidationError(message) from None
+    checked.update({argument: numbers[field] for argument, field in names.items() if field in numbers})
+    return checked
+
+
+def check_pattern_arguments(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Перевіряє форму, параметри форми, кількість gores і припуск на шов викрійки
+
+    Для export також full_job (bool) та options - об'єкт без аргументів,
+    які export_pattern_file отримує від операції (pattern, fmt, filename, ...).
+
+    Args:
+        arguments: {ім'я: значення} аргументів pattern чи export
+
+    Returns:
+        Перевірені значення
+
+    Raises:
+        RequestError: Якщо options не об'єкт або містить зарезервовані ключі
+    """
+    checked = _check_extra_arguments(arguments)
+    checked['shape_params'] = _check_shape_params(arguments['shape_type'], arguments['shape_params'])
+    options = arguments.get('options')
+    if options is not None:
+        if not isinstance(options, dict):
+            raise RequestError("options: очікується JSON-об'єкт")
+        reserved = sorted(set(options) & set(_RESERVED_EXPORT_OPTIONS))
+        if reserved:
+            raise RequestError(f"options: недопустимі ключі {', '.join(reserved)} (задаються операцією)")
+    return checked
+
+
+# ============================================================================
+# РОЗРАХУНКИ
+# ============================================================================
+
+register_operation('solve', solve_volume_to_payload,
+                   "Навантаження для заданого об'єму газу (solve_volume_to_payload)",
+                   validate=check_balloon_arguments)
+register_operation('inverse', solve_payload_to_volume,
+                   "Об'єм газу для цільового навантаження (solve_payload_to_volume)",
+                   validate=check_balloon_arguments)
+register_operation('height_profile', calculate_height_profile, "Параметри по висоті (calculate_height_profile)",
+                   validate=check_balloon_arguments)
+register_operation('optimal_height', calculate_optimal_height, "Оптимальна висота польоту (calculate_optimal_height)",
+                   validate=check_balloon_arguments)
+register_operation('flight_time', calculate_max_flight_time, "Максимальний час польоту (calculate_max_flight_time)",
+                   validate=check_balloon_arguments)
+
+
+# ============================================================================
+# ВИКРІЙКИ ТА ЕКСПОРТ
+# ============================================================================
+
+@operation('pattern', "Викрійка форми (gores або pillow)", validate=check_pattern_arguments)
+def pattern(shape_type, shape_params=None, num_segments=12, seam_allowance_mm=10.0):
+    return generate_pattern(shape_type, shape_params, num_segments, seam_allowance_mm)
+
+
+@operation('export', "Файл викрійки (svg, dxf, pdf, hpgl, gcode, xlsx) у base64", cacheable=False,
+           validate=check_pattern_arguments)
+def export(format, shape_type, shape_params=None, num_segments=12, seam_allowance_mm=10.0, full_job=True,
+           options=None):
+    fmt = str(format).lower()
+    if fmt not in EXPORT_FORMATS:
+        raise RequestError(f"Невідомий формат експорту: {format}; доступні: {', '.join(EXPORT_FORMATS)}")
+    pattern_data = generate_pattern(shape_type, shape_params, num_segments, seam_allowance_mm)
+    with tempfile.TemporaryDirectory(prefix='balloon-service-') as directory:
+        filename = os.path.join(directory, f"pattern_{shape_type}{EXPORT_FORMATS[fmt]}")
+        path = export_pattern_file(pattern_data, fmt, filename, full_job, **(options or {}))
+        with open(path, 'rb') as fh:
+            content = fh.read()
+    return {
+        'format': fmt,
+        'filename': os.path.basename(path),
+        'size': len(content),
+        'content_base64': base64.b64encode(content).decode('ascii'),
+    }
@@ -0,0 +1,162 @@
+"""
+HTTP/JSON сервер сервісу розрахунків (лише stdlib)
+
+Маршрути:
+    GET  /health              - {'status': 'ok', 'version': ...}
+    GET  /operations          - операції, їх опис та параметри
+    GET  /stats               - лічильники запитів, кешу та пулу
+    POST /<операція>          - тіло: JSON-об'єкт параметрів;
+                                відповідь: {'result': ..., 'source': ...}
+Помилки повертаються як {'error': повідомлення} зі статусом 400, 404,
+413, 501, 504 або 500.
+
+Сервер слухає лише локальну адресу (loopback) і не звертається до мережі.
+"""
+
+import ipaddress
+import json
+import logging
+import socket
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+
+from balloon import __version__
+from balloon.service.core import CalculationService, ServiceError
+from balloon.service.operations import OPERATIONS
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+# Максимальний розмір тіла запиту (байт)
+MAX_BODY_BYTES = 1024 * 1024
+
+
+class ServiceRequestHandler(BaseHTTPRequestHandler):
+    """Обробник запитів; сервіс - атрибут service сервера"""
+
+    server_version = f"balloon-service/{__version__}"
+    # Keep-alive: клієнт може надсилати багато запитів одним з'єднанням
+    protocol_version = 'HTTP/1.1'
+    # Заголовки та тіло пишуться окремо; без TCP_NODELAY кожна відповідь чекає ~40 мс (Nagle)
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        path = self.path.split('?', 1)[0].rstrip('/')
+        if path == '/health':
+            self._send(200, {'status': 'ok', 'version': __version__})
+        elif path == '/operations':
+            self._send(200, {
+                name: {'description': op.description, 'parameters': op.parameters(), 'cacheable': op.cacheable}
+                for name, op in OPERATIONS.items()
+            })
+        elif path == '/stats':
+            self._send(200, self.server.service.stats())
+        else:
+            self._send(404, {'error': f"Невідомий шлях: {self.path}"})
+
+    def do_POST(self):
+        name = self.path.split('?', 1)[0].strip('/')
+        try:
+            params = self._read_json()
+            result, source = self.server.service.call(name, params)
+        except ServiceError as e:
+            self._send(e.status, {'error': str(e)})
+            return
+        self._send(200, {'result': result, 'source': source}, source=source)
+
+    def _read_json(self) -> Any:
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            self.close_connection = True
+            raise ServiceError("Некоректний заголовок Content-Length", 400) from None
+        if length > MAX_BODY_BYTES:
+            # Непрочитане тіло лишилося б у з'єднанні
+            self.close_connection = True
+            raise ServiceError(f"Тіло запиту перевищує {MAX_BODY_BYTES} байт", 413)
+        body = self.rfile.read(length) if length else b''
+        if not body.strip():
+            return {}
+        try:
+            return json.loads(body)
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise ServiceError(f"Некоректний JSON: {e}", 400) from None
+
+    def _send(self, status: int, payload: Any, source: Optional[str] = None):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        if source:
+            self.send_header('X-Balloon-Source', source)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logging.debug(f"service {self.address_string()} {format % args}")
+
+
+class ServiceHTTPServer(ThreadingHTTPServer):
+    """Багатопотоковий HTTP сервер з посиланням на CalculationService"""
+
+    daemon_threads = True
+
+    def __init__(self, address, service: CalculationService):
+        self.service = service
+        super().__init__(address, ServiceRequestHandler)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def _check_loopback(host: str):
+    try:
+        address = ipaddress.ip_address(socket.gethostbyname(host))
+    except (OSError, ValueError):
+        raise ValueError(f"Невідома адреса: {host}") from None
+    if not address.is_loopback:
+        raise ValueError(f"Сервіс слухає лише локальні адреси (127.0.0.1, localhost), а не {host}")
+
+
+def make_server(service: CalculationService, host: str = DEFAULT_HOST,
+                port: int = DEFAULT_PORT) -> ServiceHTTPServer:
+    """
+    Створює HTTP сервер (запуск - serve_forever())
+
+    Args:
+        service: Сервіс розрахунків
+        host: Локальна адреса
+        port: Порт (0 - будь-який вільний)
+
+    Raises:
+        ValueError: Якщо адреса не локальна
+        OSError: Якщо порт зайнятий
+    """
+    _check_loopback(host)
+    return ServiceHTTPServer((host, port), service)
+
+
+def serve(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, workers: Optional[int] = None,
+          **service_options):
+    """
+    Запускає сервіс і обслуговує запити до Ctrl+C
+
+    Args:
+        host: Локальна адреса
+        port: Порт
+        workers: Кількість процесів пулу (None - всі ядра)
+        **service_options: cache_size, result_cache, timeout (CalculationService)
+    """
+    from balloon.utils import print_success
+
+    with CalculationService(workers=workers, **service_options) as service:
+        server = make_server(service, host, port)
+        print_success(f"Сервіс розрахунків: {server.url} (процесів: {service.workers})")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
@@ -16,15 +16,17 @@ import numpy as np
 import warnings
 from typing import Callable, Tuple, Optional
 
-# Використовуємо scipy для точнішого обчислення інтегралів
-# Застосовується до всіх форм (sphere, pear, cigar) для покращення точності меридіанної довжини
-try:
-    from scipy import integrate
-    SCIPY_AVAILABLE = True
-except ImportError:
-    SCIPY_AVAILABLE = False
 from dataclasses import dataclass
 
+from balloon.lazy_import import lazy_import, module_available
+from balloon.instrument import instrument
+
+# Використовуємо scipy для точнішого обчислення інтегралів
+# Застосовується до всіх форм (sphere, pear, cigar) для покращення точності меридіанної довжини.
+# SciPy імпортується при першому інтегруванні, а не разом з моделлю
+SCIPY_AVAILABLE = module_available('scipy')
+integrate = lazy_import('scipy.integrate')
+
 
 @dataclass
 class ShapeProfile:
@@ -42,6 +44,7 @@ class ShapeProfile:
             return 0.0
         return self.r_func(z)
     
+    @instrument('profile.meridian_length')
     def get_meridian_length(self, z: float, num_points: int = 100) -> float:
         """
         Обчислює довжину меридіану від z_min до z
@@ -104,6 +107,7 @@ class ShapeProfile:
         _, z_max = self.z_range
         return self.get_meridian_length(z_max, num_points)
     
+    @instrument('profile.volume')
     def get_volume(self, num_points: int = 100) -> float:
         """
         Обчислює об'єм через обертання профілю
@@ -126,6 +130,7 @@ class ShapeProfile:
         
         return volume
     
+    @instrument('profile.surface_area')
     def get_surface_area(self, num_points: int = 100) -> float:
         """
         Обчислює площу поверхні через обертання профілю
@@ -155,6 +160,7 @@ class ShapeProfile:
         
         return area
     
+    @instrument('profile.mesh')
     def generate_mesh(self, num_theta: int = 50, num_z: int = 50, center_at_origin: bool = True) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
         Генерує 3D mesh з профілю через обертання r(z) навколо осі Z
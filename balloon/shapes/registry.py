@@ -17,6 +17,8 @@ from typing import Dict, Any, Callable, Optional, Type
 from dataclasses import dataclass
 from pydantic import BaseModel, Field
 
+from balloon.instrument import instrument
+
 from balloon.shapes.profile import ShapeProfile, get_shape_profile
 from balloon.shapes.sphere import sphere_volume, sphere_surface_area, sphere_radius_from_volume
 from balloon.shapes.pillow import pillow_volume, pillow_surface_area, pillow_dimensions_from_volume
@@ -282,6 +284,7 @@ def validate_shape_params(shape_code: str, params: Dict[str, Any]) -> Dict[str,
     return validated.model_dump()
 
 
+@instrument('shapes.profile')
 def get_shape_profile_from_registry(shape_code: str, params: Dict[str, Any]) -> Optional[ShapeProfile]:
     """Отримує профіль форми через реєстр"""
     entry = get_shape_entry(shape_code)
@@ -290,6 +293,7 @@ def get_shape_profile_from_registry(shape_code: str, params: Dict[str, Any]) ->
     return entry.profile_func(params)
 
 
+@instrument('shapes.volume')
 def get_shape_volume(shape_code: str, params: Dict[str, Any]) -> float:
     """Отримує об'єм форми через реєстр"""
     entry = get_shape_entry(shape_code)
@@ -298,6 +302,7 @@ def get_shape_volume(shape_code: str, params: Dict[str, Any]) -> float:
     return entry.volume_func(params)
 
 
+@instrument('shapes.area')
 def get_shape_area(shape_code: str, params: Dict[str, Any]) -> float:
     """Отримує площу форми через реєстр"""
     entry = get_shape_entry(shape_code)
@@ -306,6 +311,7 @@ def get_shape_area(shape_code: str, params: Dict[str, Any]) -> float:
     return entry.area_func(params)
 
 
+@instrument('shapes.dimensions_from_volume')
 def get_shape_dimensions_from_volume(shape_code: str, volume: float, params: Dict[str, Any]) -> Dict[str, Any]:
     """Отримує розміри форми з об'єму через реєстр"""
     entry = get_shape_entry(shape_code)
@@ -1,11 +1,22 @@
 """
 Валідація введених даних
+
+validate_all_inputs - один набір полів форми через Pydantic моделі;
+validate_columns - пакет рядків стовпцями (NumPy) за тими самими
+обмеженнями та з тими самими повідомленнями, без моделі на кожен рядок.
 """
 
-from typing import Union, Tuple, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Sequence, Union, Tuple, Optional
+
+import numpy as np
 
 from balloon.constants import MATERIALS, GAS_DENSITY
-from balloon.models import BalloonInputs, ShapeParams
+from balloon.models import (
+    BalloonInputs, ShapeParams, DEFAULTED_FIELDS, GAS_VOLUME_REQUIRED_MESSAGE, MAX_TOTAL_HEIGHT,
+    TOTAL_HEIGHT_MESSAGE, NumericBounds, literal_choices, not_a_number_message, numeric_constraints,
+    temperature_difference_message, unsupported_gas_message, unsupported_material_message,
+)
 
 
 class ValidationError(Exception):
@@ -13,6 +24,17 @@ class ValidationError(Exception):
     pass
 
 
+def field_error_message(loc: Sequence[Any], message: str) -> str:
+    """
+    Повідомлення помилки з назвою поля ('thickness: Input should be ...')
+
+    Args:
+        loc: Розташування помилки Pydantic (порожнє - перехресне правило моделі)
+        message: Текст помилки
+    """
+    return f"{'.'.join(map(str, loc))}: {message}" if loc else message
+
+
 def validate_float(value: str, field_name: str, min_value: Union[float, None] = None, 
                   max_value: Union[float, None] = None) -> float:
     """
@@ -253,8 +275,9 @@ def validate_all_inputs(
             # Якщо Pydantic валідація не вдалася, конвертуємо помилку
             from pydantic import ValidationError as PydanticValidationError
             if isinstance(e, PydanticValidationError):
-                # Беремо першу помилку
-                error_msg = str(e.errors()[0]['msg']) if e.errors() else str(e)
+                # Беремо першу помилку (з назвою поля)
+                errors = e.errors()
+                error_msg = field_error_message(errors[0]['loc'], errors[0]['msg']) if errors else str(e)
                 raise ValidationError(error_msg)
             raise ValidationError(f"Помилка валідації: {e}")
     
@@ -290,4 +313,295 @@ def validate_all_inputs(
     shape_params = shape_params or {}
     validated_numbers.update(validate_shape_params(shape_type, shape_params))
     
-    return validated_numbers, validated_strings 
\ No newline at end of file
+    return validated_numbers, validated_strings 
+
+
+# ============================================================================
+# КОЛОНКОВА ВАЛІДАЦІЯ (пакетний розрахунок)
+# ============================================================================
+
+# Повідомлення Pydantic, які повертає validate_all_inputs (перша помилка)
+FIELD_REQUIRED = "Field required"
+NOT_A_STRING = "Input should be a valid string"
+NOT_A_NUMBER = "Input should be a valid number"
+UNPARSABLE_NUMBER = "Input should be a valid number, unable to parse string as a number"
+VALUE_ERROR_PREFIX = "Value error, "
+
+# Порядок перевірки меж (як у pydantic-core): оператор, повідомлення
+_BOUND_CHECKS = (
+    ('le', np.less_equal, "Input should be less than or equal to {}"),
+    ('lt', np.less, "Input should be less than {}"),
+    ('ge', np.greater_equal, "Input should be greater than or equal to {}"),
+    ('gt', np.greater, "Input should be greater than {}"),
+)
+
+_INPUT_BOUNDS = numeric_constraints(BalloonInputs)
+_SHAPE_BOUNDS = numeric_constraints(ShapeParams)
+SHAPE_PARAM_FIELDS = tuple(ShapeParams.model_fields)
+
+
+@dataclass
+class ColumnValidation:
+    """
+    Результат колонкової валідації
+
+    Attributes:
+        valid: Маска коректних рядків
+        errors: Перша помилка кожного рядка (None - рядок коректний);
+            текст той самий, що в ValidationError від validate_all_inputs
+        numbers: Числові стовпці float (NaN - не задано або рядок некоректний)
+        strings: Рядкові стовпці (gas_type, material, mode, shape_type)
+    """
+    valid: np.ndarray
+    errors: List[Optional[str]]
+    numbers: Dict[str, np.ndarray]
+    strings: Dict[str, List[Any]]
+
+    def __len__(self) -> int:
+        return len(self.valid)
+
+    def error_rows(self) -> np.ndarray:
+        """Індекси некоректних рядків"""
+        return np.flatnonzero(~self.valid)
+
+    def row(self, index: int) -> Tuple[dict, dict]:
+        """
+        Валідовані дані коректного рядка у форматі validate_all_inputs
+
+        Raises:
+            ValidationError: Якщо рядок некоректний
+        """
+        if not self.valid[index]:
+            raise ValidationError(self.errors[index])
+        numbers = {}
+        for key, column in self.numbers.items():
+            value = float(column[index])
+            if key in SHAPE_PARAM_FIELDS:
+                if value == value:
+                    numbers[key] = value
+            else:
+                numbers[key] = value if value == value or key != 'gas_volume' else None
+        return numbers, {key: column[index] for key, column in self.strings.items()}
+
+
+# Заміна нехешованих значень стовпця (не є ні рядком, ні числом)
+_UNHASHABLE = object()
+
+
+def _unique_values(values: Sequence[Any]) -> Tuple[List[Any], Dict[Any, None]]:
+    """
+    Значення стовпця та їх унікальні значення (у CSV їх зазвичай небагато)
+
+    Нехешовані значення замінюються на _UNHASHABLE.
+    """
+    values = list(values)
+    try:
+        return values, dict.fromkeys(values)
+    except TypeError:
+        values = [_UNHASHABLE if not _is_hashable(v) else v for v in values]
+        return values, dict.fromkeys(values)
+
+
+def _is_hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+def _flag_rows(values: List[Any], messages: Dict[Any, str]) -> Dict[int, str]:
+    """{індекс: повідомлення} для рядків, значення яких є в messages"""
+    if not messages:
+        return {}
+    flagged = np.fromiter(map(messages.__contains__, values), dtype=bool, count=len(values))
+    return {i: messages[values[i]] for i in np.flatnonzero(flagged).tolist()}
+
+
+def _parse_number(value: Any, field_name: str, optional: bool, defaulted: bool,
+                  lenient: bool) -> Tuple[float, bool, Optional[str]]:
+    """Одне значення як parse_strings + перевірка типу float: (число, задано, помилка)"""
+    if value is None:
+        return np.nan, False, None if optional or lenient else NOT_A_NUMBER
+    if isinstance(value, str):
+        text = value.strip()
+        if not text:
+            return np.nan, False, None if lenient else (NOT_A_NUMBER if defaulted else UNPARSABLE_NUMBER)
+        try:
+            return float(text), True, None
+        except ValueError:
+            return np.nan, False, None if lenient else VALUE_ERROR_PREFIX + not_a_number_message(field_name)
+    if isinstance(value, (int, float, np.number)):
+        return float(value), True, None
+    return np.nan, False, NOT_A_NUMBER
+
+
+def _parse_numbers(values: Sequence[Any], field_name: str, optional: bool = False,
+                   defaulted: bool = False, lenient: bool = False) -> Tuple[np.ndarray, np.ndarray, Dict[int, str]]:
+    """
+    Перетворює стовпець у float як BalloonInputs/ShapeParams.parse_strings
+
+    Кожне унікальне значення розбирається один раз, а результати
+    розносяться по рядках через map (без циклу Python по рядках).
+
+    Args:
+        values: Значення стовпця (рядки, числа, None)
+        field_name: Ім'я поля (для повідомлення)
+        optional: None допустимий (gas_volume)
+        defaulted: Порожній рядок стає None (поля з DEFAULTED_FIELDS)
+        lenient: Нечислові рядки стають None без помилки (ShapeParams)
+
+    Returns:
+        (значення з NaN для відсутніх, маска заданих чисел, {індекс: повідомлення помилки})
+    """
+    values, unique = _unique_values(values)
+    numbers, given, messages = {}, set(), {}
+    for value in unique:
+        number, present, error = _parse_number(value, field_name, optional, defaulted, lenient)
+        numbers[value] = number
+        if present:
+            given.add(value)
+        if error is not None:
+            messages[value] = error
+    count = len(values)
+    result = np.fromiter(map(numbers.__getitem__, values), dtype=float, count=count)
+    present = np.fromiter(map(given.__contains__, values), dtype=bool, count=count)
+    return result, present, _flag_rows(values, messages)
+
+
+def _format_limit(limit: float) -> Union[int, float]:
+    """Межа в повідомленні як у Pydantic (1.0 -> 1)"""
+    return int(limit) if float(limit).is_integer() else limit
+
+
+def _bound_errors(values: np.ndarray, bounds: NumericBounds, candidates: np.ndarray) -> Dict[int, str]:
+    """Порушення меж серед candidates (NaN порушує будь-яку межу, як у Pydantic)"""
+    errors: Dict[int, str] = {}
+    remaining = candidates.copy()
+    for key, op, template in _BOUND_CHECKS:
+        limit = getattr(bounds, key)
+        if limit is None:
+            continue
+        with np.errstate(invalid='ignore'):
+            failed = remaining & ~op(values, limit)
+        if failed.any():
+            errors.update(dict.fromkeys(np.flatnonzero(failed).tolist(), template.format(_format_limit(limit))))
+            remaining &= ~failed
+    return errors
+
+
+def _literal_message(choices: Sequence[str]) -> str:
+    quoted = [f"'{choice}'" for choice in choices]
+    listed = quoted[0] if len(quoted) == 1 else f"{', '.join(quoted[:-1])} or {quoted[-1]}"
+    return f"Input should be {listed}"
+
+
+def validate_columns(columns: Mapping[str, Sequence[Any]], num_rows: Optional[int] = None) -> ColumnValidation:
+    """
+    Валідує пакет рядків, заданих стовпцями
+
+    Правила - ті самі, що в validate_all_inputs (межі Field та Literal з
+    BalloonInputs/ShapeParams, гази та матеріали з constants, перехресні
+    правила для режиму, температур і висоти), але перевіряються для
+    цілих масивів без створення Pydantic моделі на кожен рядок.
+    Для кожного рядка повертається перша помилка в тому ж порядку,
+    що й у Pydantic: параметри форми, поля моделі, перехресні правила.
+
+    Args:
+        columns: {поле: значення для кожного рядка}; поля як аргументи
+            validate_all_inputs, параметри форми - окремими стовпцями
+            (pillow_len, ...; None - параметр не задано). Відсутні
+            стовпці полів із значенням за замовчуванням заповнюються ним.
+        num_rows: Кількість рядків (None - довжина першого стовпця)
+
+    Returns:
+        ColumnValidation
+
+    Raises:
+        ValueError: Якщо стовпці мають різну довжину
+    """
+    lengths = {len(values) for values in columns.values()}
+    if num_rows is None:
+        num_rows = lengths.pop() if len(lengths) == 1 else (0 if not lengths else -1)
+    if num_rows < 0 or any(length != num_rows for length in lengths):
+        raise ValueError("Стовпці мають різну довжину")
+
+    errors: List[Optional[str]] = [None] * num_rows
+    ok = np.ones(num_rows, dtype=bool)
+
+    def reject(found: Dict[int, str], field: Optional[str] = None):
+        # Помилки полів - з назвою поля, як у validate_all_inputs
+        loc = (field,) if field else ()
+        for index, message in found.items():
+            if ok[index]:
+                ok[index] = False
+                errors[index] = field_error_message(loc, message)
+
+    # Параметри форми (ShapeParams створюється раніше за BalloonInputs)
+    numbers: Dict[str, np.ndarray] = {}
+    for name in SHAPE_PARAM_FIELDS:
+        if name not in columns:
+            continue
+        values, given, found = _parse_numbers(columns[name], name, lenient=True)
+        reject(found, name)
+        reject(_bound_errors(values, _SHAPE_BOUNDS[name], ok & given), name)
+        numbers[name] = values
+
+    # Поля BalloonInputs у порядку оголошення
+    strings: Dict[str, List[Any]] = {}
+    input_numbers: Dict[str, np.ndarray] = {}
+    for name, info in BalloonInputs.model_fields.items():
+        if name == 'shape_params':
+            continue
+        present = name in columns
+        if not present and info.is_required():
+            reject(dict.fromkeys(range(num_rows), FIELD_REQUIRED), name)
+        if name in ('gas_type', 'material'):
+            values, unique = _unique_values(columns[name] if present else [None] * num_rows)
+            allowed = GAS_DENSITY if name == 'gas_type' else MATERIALS
+            message = unsupported_gas_message if name == 'gas_type' else unsupported_material_message
+            messages = {
+                value: NOT_A_STRING if not isinstance(value, str) else VALUE_ERROR_PREFIX + message(value)
+                for value in unique if not isinstance(value, str) or value not in allowed
+            }
+            if present:
+                reject(_flag_rows(values, messages), name)
+            strings[name] = values
+        elif name in ('mode', 'shape_type'):
+            choices = literal_choices(BalloonInputs, name)
+            values, unique = _unique_values(columns[name] if present else [info.default] * num_rows)
+            invalid = _literal_message(choices)
+            reject(_flag_rows(values, {value: invalid for value in unique if value not in choices}), name)
+            strings[name] = values
+        elif present:
+            values, given, found = _parse_numbers(columns[name], name, optional=name == 'gas_volume',
+                                                  defaulted=name in DEFAULTED_FIELDS)
+            reject(found, name)
+            reject(_bound_errors(values, _INPUT_BOUNDS[name], ok & given), name)
+            input_numbers[name] = values
+        else:
+            default = np.nan if info.default is None or info.is_required() else float(info.default)
+            input_numbers[name] = np.full(num_rows, default)
+
+    # Перехресні правила (лише для рядків без помилок полів, як model_validator)
+    gas_volume = input_numbers['gas_volume']
+    mode = np.asarray(strings['mode'], dtype=object)
+    gas_type = np.asarray(strings['gas_type'], dtype=object)
+    with np.errstate(invalid='ignore'):
+        missing_volume = ok & (mode == 'payload') & (np.isnan(gas_volume) | (gas_volume <= 0))
+        reject(dict.fromkeys(np.flatnonzero(missing_volume).tolist(), VALUE_ERROR_PREFIX + GAS_VOLUME_REQUIRED_MESSAGE))
+
+        inside, ground = input_numbers['inside_temp'], input_numbers['ground_temp']
+        too_cold = ok & (gas_type == "Гаряче повітря") & (inside <= ground)
+        reject({
+            i: VALUE_ERROR_PREFIX + temperature_difference_message(float(inside[i]), float(ground[i]))
+            for i in np.flatnonzero(too_cold).tolist()
+        })
+
+        too_high = ok & (input_numbers['start_height'] + input_numbers['work_height'] > MAX_TOTAL_HEIGHT)
+        reject(dict.fromkeys(np.flatnonzero(too_high).tolist(), VALUE_ERROR_PREFIX + TOTAL_HEIGHT_MESSAGE))
+
+    numbers = {**input_numbers, **numbers}
+    for column in numbers.values():
+        column[~ok] = np.nan
+    return ColumnValidation(valid=ok, errors=errors, numbers=numbers, strings=strings)
@@ -0,0 +1,205 @@
+"""
+Тести для пакетного розрахунку (balloon.batch)
+"""
+
+import csv
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from balloon import batch
+from balloon.model.solve import solve_volume_to_payload, solve_payload_to_volume
+
+ROWS = [
+    {'gas_type': 'Гелій', 'gas_volume': '10', 'material': 'TPU', 'thickness': '35',
+     'start_height': '0', 'work_height': '1000'},
+    {'gas_type': 'Гелій', 'material': 'TPU', 'thickness': '35', 'start_height': '0',
+     'work_height': '1000', 'mode': 'volume', 'payload': '1.5'},
+    {'gas_type': 'Гелій', 'gas_volume': 'abc', 'material': 'TPU', 'thickness': '35',
+     'start_height': '0', 'work_height': '1000'},
+    {'gas_type': 'Гаряче повітря', 'gas_volume': '100', 'material': 'TPU', 'thickness': '35',
+     'start_height': '0', 'work_height': '500', 'shape_type': 'pear', 'pear_height': '3',
+     'pear_top_radius': '1.2', 'pear_bottom_radius': '0.6'},
+]
+
+
+def write_csv(path, rows):
+    fields = list(dict.fromkeys(key for row in rows for key in row))
+    with open(path, 'w', newline='', encoding='utf-8') as fh:
+        writer = csv.DictWriter(fh, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+class TestEvaluateRow:
+    """Тести для розрахунку окремого рядка"""
+
+    def test_payload_mode_matches_solver(self):
+        result = batch.evaluate_row(ROWS[0])
+        expected = solve_volume_to_payload('Гелій', 10.0, 'TPU', 35.0, 0.0, 1000.0, duration=24.0)
+
+        assert result['status'] == 'ok'
+        assert result['payload'] == pytest.approx(expected['payload'])
+        assert result['input.gas_volume'] == 10.0
+        assert result['input.pear_height'] is None
+
+    def test_volume_mode_without_gas_volume(self):
+        result = batch.evaluate_row(ROWS[1])
+        expected = solve_payload_to_volume('Гелій', 1.5, 'TPU', 35.0, 0.0, 1000.0, duration=24.0)
+
+        assert result['status'] == 'ok'
+        assert result['gas_volume'] == pytest.approx(expected['gas_volume'])
+        assert result['input.payload'] == 1.5
+
+    def test_errors_are_reported_not_raised(self):
+        assert batch.evaluate_row(ROWS[2])['status'] == 'error'
+        unknown = batch.evaluate_row({**ROWS[0], 'colour': 'red'})
+        assert unknown['status'] == 'error'
+        assert 'colour' in unknown['error']
+
+    def test_shape_params_json_and_columns_equivalent(self):
+        params = {'pear_height': 3, 'pear_top_radius': 1.2, 'pear_bottom_radius': 0.6}
+        from_columns = batch.evaluate_row(ROWS[3])
+        row = {k: v for k, v in ROWS[3].items() if k not in params}
+        from_json = batch.evaluate_row({**row, 'shape_params': json.dumps(params)})
+
+        assert from_columns == from_json
+        assert from_columns['input.pear_height'] == 3.0
+
+
+    def test_missing_required_field(self):
+        result = batch.evaluate_row({k: v for k, v in ROWS[0].items() if k != 'material'})
+        assert result['status'] == 'error'
+        assert 'material' in result['error']
+
+    def test_chunk_matches_rows(self):
+        # Колонкова валідація пакета дає ті самі результати, що й рядок за рядком
+        rows = [
+            ROWS[0], ROWS[1], ROWS[2],
+            {**ROWS[0], 'thickness': '0'},
+            {**ROWS[0], 'colour': 'red'},
+            {k: v for k, v in ROWS[0].items() if k != 'gas_type'},
+            {**ROWS[0], 'shape_type': 'pear', 'pear_height': '-3'},
+            {**ROWS[0], 'gas_type': 'Гаряче повітря', 'inside_temp': '5'},
+            {**ROWS[1], 'payload': ''},
+            {**ROWS[0], 'perm_mult': '0'},
+        ]
+        expected = [batch.evaluate_row(row) for row in rows]
+        assert batch._evaluate_chunk(rows) == expected
+        assert [r['status'] for r in expected] == ['ok', 'ok'] + ['error'] * 8
+
+
+class TestRunBatch:
+    """Тести для читання, пулу процесів та потокового запису"""
+
+    @pytest.mark.parametrize('workers', [1, 2])
+    def test_csv_roundtrip_keeps_order(self, tmp_path, workers):
+        src = tmp_path / 'in.csv'
+        out = tmp_path / 'out.csv'
+        write_csv(src, ROWS * 3)
+
+        counts = batch.run_batch(str(src), str(out), workers=workers, chunk_size=2, progress=False)
+
+        assert counts == {'rows': 12, 'ok': 9, 'errors': 3}
+        with open(out, newline='', encoding='utf-8') as fh:
+            rows = list(csv.DictReader(fh))
+        assert [int(r['row']) for r in rows] == list(range(1, 13))
+        assert [r['status'] for r in rows[:4]] == ['ok', 'ok', 'error', 'ok']
+        assert rows[3]['input.shape_type'] == 'pear'
+        assert rows[3]['input.pear_height'] == '3.0'
+
+    def test_jsonl_input_and_output(self, tmp_path):
+        src = tmp_path / 'in.jsonl'
+        out = tmp_path / 'out.jsonl'
+        src.write_text('\n'.join(json.dumps(r, ensure_ascii=False) for r in ROWS) + '\n', encoding='utf-8')
+
+        batch.run_batch(str(src), str(out), workers=1, progress=False)
+
+        results = [json.loads(line) for line in out.read_text(encoding='utf-8').splitlines()]
+        assert [r['status'] for r in results] == ['ok', 'ok', 'error', 'ok']
+
+    def test_error_rows_before_first_success(self, tmp_path):
+        """Заголовок CSV містить стовпці результатів, навіть якщо перший рядок з помилкою"""
+        src = tmp_path / 'in.json'
+        out = tmp_path / 'out.csv'
+        src.write_text(json.dumps([ROWS[2], ROWS[0]]), encoding='utf-8')
+
+        batch.run_batch(str(src), str(out), workers=1, progress=False)
+
+        with open(out, newline='', encoding='utf-8') as fh:
+            rows = list(csv.DictReader(fh))
+        assert rows[0]['status'] == 'error' and rows[0]['payload'] == ''
+        assert float(rows[1]['payload']) > 0
+
+    def test_parquet_output(self, tmp_path):
+        pytest.importorskip('pyarrow')
+        from balloon.export.result_store import read_results, read_store_metadata
+
+        src = tmp_path / 'in.csv'
+        out = tmp_path / 'out.feather'
+        write_csv(src, [ROWS[2]] + ROWS)
+
+        batch.run_batch(str(src), str(out), workers=1, progress=False)
+
+        table = read_results(str(out))
+        assert table['status'].to_pylist() == ['error', 'ok', 'ok', 'error', 'ok']
+        assert table['payload'].null_count == 2
+        assert read_store_metadata(str(out))['kind'] == 'batch'
+
+    @pytest.mark.parametrize('suffix', ['parquet', 'feather'])
+    def test_store_mixed_shapes_and_errors(self, tmp_path, monkeypatch, suffix):
+        """Чанки лише зі сферами, рядок з помилкою та груша пізніше - одна схема без помилок запису"""
+        arrow = pytest.importorskip('pyarrow')
+        from balloon.export.result_store import read_results
+
+        monkeypatch.setattr(batch, 'STORE_CHUNK_ROWS', 2)
+        src = tmp_path / 'in.json'
+        out = tmp_path / f'out.{suffix}'
+        src.write_text(json.dumps([ROWS[0], ROWS[0], ROWS[0], ROWS[2], ROWS[3]]), encoding='utf-8')
+
+        counts = batch.run_batch(str(src), str(out), workers=1, progress=False)
+
+        assert counts == {'rows': 5, 'ok': 4, 'errors': 1}
+        table = read_results(str(out))
+        assert table['status'].to_pylist() == ['ok', 'ok', 'ok', 'error', 'ok']
+        assert table.schema.field('error').type == arrow.string()
+        assert table['error'].to_pylist()[3]
+        assert table['shape_params.pear_height'].to_pylist() == [None] * 4 + [3.0]
+        assert table['shape_params.radius'].to_pylist()[4] is None
+
+    def test_unknown_extension(self, tmp_path):
+        with pytest.raises(ValueError):
+            batch.open_result_sink(str(tmp_path / 'out.xyz'))
+
+
+class TestCommandLine:
+    """Тести для підкоманди balloon-calculator batch"""
+
+    def test_main_exit_codes(self, tmp_path):
+        from balloon.__main__ import main
+
+        src = tmp_path / 'in.csv'
+        write_csv(src, ROWS)
+        out = str(tmp_path / 'out.jsonl')
+
+        assert main(['batch', str(src), out, '-j', '1', '--no-progress']) == 0
+        assert main(['batch', str(src), out, '-j', '1', '--no-progress', '--strict']) == 1
+        assert main(['batch', str(tmp_path / 'missing.csv'), out, '--no-progress']) == 2
+
+    def test_headless_imports(self, tmp_path):
+        """Пакетний режим не імпортує GUI та графічні бібліотеки"""
+        src = tmp_path / 'in.csv'
+        write_csv(src, ROWS[:1])
+        code = (
+            "import sys\n"
+            "from balloon.__main__ import main\n"
+            f"main(['batch', {str(src)!r}, {str(tmp_path / 'out.csv')!r}, '-j', '1', '--no-progress'])\n"
+            "heavy = {'tkinter', 'ttkbootstrap', 'matplotlib', 'plotly'}\n"
+            "print(sorted(heavy & {name.split('.')[0] for name in sys.modules}))\n"
+        )
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True,
+                                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        assert output.stdout.strip().splitlines()[-1] == '[]'
@@ -0,0 +1,157 @@
+"""
+Тести для бенчмарків (balloon.bench)
+"""
+
+import json
+
+import pytest
+
+from balloon.bench import (
+    BENCHMARKS, Benchmark, BenchmarkResult, benchmark, compare, format_report,
+    load_baseline, measure, run_benchmarks, save_baseline, select_benchmarks,
+)
+from balloon.bench.__main__ import main
+from balloon.bench.core import (
+    STATUS_IMPROVEMENT, STATUS_NEW, STATUS_OK, STATUS_REGRESSION, cold_caches,
+)
+from balloon.cache import memoization_enabled
+
+
+def _allocate(context):
+    return [0] * 10000
+
+
+class TestRegistry:
+    """Тести для реєстру бенчмарків"""
+
+    def test_groups_registered(self):
+        groups = {bench.group for bench in BENCHMARKS.values()}
+        assert {'solve', 'analysis', 'geometry', 'patterns', 'export'} <= groups
+        assert all(bench.description for bench in BENCHMARKS.values())
+
+    def test_select_by_glob_and_group(self):
+        assert [b.name for b in select_benchmarks(['geometry.mesh_*'])] == [
+            'geometry.mesh_50', 'geometry.mesh_100', 'geometry.mesh_200',
+        ]
+        names = [b.name for b in select_benchmarks(['solve'])]
+        assert 'solve.scalar' in names and 'solve.batch' in names
+        assert select_benchmarks(['no_such']) == []
+        assert len(select_benchmarks()) == len(BENCHMARKS)
+
+    def test_duplicate_name_rejected(self):
+        registry = {}
+        benchmark('demo.alloc', registry=registry)(_allocate)
+        with pytest.raises(ValueError):
+            benchmark('demo.alloc', registry=registry)(_allocate)
+
+    def test_missing_requirement(self):
+        bench = Benchmark('demo.missing', _allocate, requires=('no_such_module_xyz',))
+        assert not bench.available
+        result = measure(bench, repeats=1, min_time=0)
+        assert result.skipped and not result.times
+
+
+class TestMeasure:
+    """Тести для вимірювання"""
+
+    def test_measure_times_and_memory(self):
+        calls = []
+
+        def setup(workdir):
+            calls.append(workdir)
+            return 'context'
+
+        bench = Benchmark('demo.alloc', lambda context: _allocate(context), setup=setup)
+        result = measure(bench, warmup=1, repeats=3, min_time=0)
+        assert len(calls) == 1
+        assert len(result.times) == 3 and result.number == 1
+        assert result.best <= result.median
+        assert result.peak_memory >= 10000 * 8
+
+    def test_measure_without_memory(self):
+        result = measure(Benchmark('demo.alloc', _allocate), repeats=1, min_time=0, memory=False)
+        assert result.peak_memory == 0
+
+    def test_cold_caches_restores_state(self):
+        assert memoization_enabled()
+        with cold_caches():
+            assert not memoization_enabled()
+        assert memoization_enabled()
+
+    def test_real_workload(self):
+        results = run_benchmarks(select_benchmarks(['solve.scalar']), warmup=0, repeats=1, min_time=0)
+        assert results[0].name == 'solve.scalar'
+        assert results[0].times[0] > 0
+        assert 'solve.scalar' in format_report(results)
+
+
+class TestBaseline:
+    """Тести для baseline та порівняння"""
+
+    def test_roundtrip(self, tmp_path):
+        path = tmp_path / 'bench' / 'baseline.json'
+        results = [BenchmarkResult('a', [0.1, 0.2], 1, 1000), BenchmarkResult('b', skipped='немає ezdxf')]
+        save_baseline(str(path), results, {'repeats': 2})
+
+        data = json.loads(path.read_text(encoding='utf-8'))
+        assert data['settings'] == {'repeats': 2}
+        assert 'python' in data['environment']
+        loaded = load_baseline(str(path))
+        assert loaded['a'].times == [0.1, 0.2]
+        assert loaded['b'].skipped == 'немає ezdxf'
+
+    def test_wrong_format(self, tmp_path):
+        path = tmp_path / 'baseline.json'
+        path.write_text(json.dumps({'format': 999}), encoding='utf-8')
+        with pytest.raises(ValueError):
+            load_baseline(str(path))
+
+    def test_compare_statuses(self):
+        baseline = {
+            'same': BenchmarkResult('same', [1.0], 1, 1000),
+            'slow': BenchmarkResult('slow', [1.0], 1, 1000),
+            'fast': BenchmarkResult('fast', [1.0], 1, 1000),
+            'fat': BenchmarkResult('fat', [1.0], 1, 1000),
+        }
+        results = [
+            BenchmarkResult('same', [1.1], 1, 1100),
+            BenchmarkResult('slow', [1.5], 1, 1000),
+            BenchmarkResult('fast', [0.5], 1, 1000),
+            BenchmarkResult('fat', [1.0], 1, 2000),
+            BenchmarkResult('new', [1.0], 1, 1000),
+            BenchmarkResult('skipped', skipped='немає reportlab'),
+        ]
+        statuses = {c.name: c.status for c in compare(results, baseline, 0.25, 0.25)}
+        assert statuses == {
+            'same': STATUS_OK, 'slow': STATUS_REGRESSION, 'fast': STATUS_IMPROVEMENT,
+            'fat': STATUS_REGRESSION, 'new': STATUS_NEW,
+        }
+
+
+class TestCommandLine:
+    """Тести для python -m balloon.bench"""
+
+    def test_list(self, capsys):
+        assert main(['--list', '-k', 'export']) == 0
+        out = capsys.readouterr().out
+        assert 'export.svg' in out and 'solve.scalar' not in out
+
+    def test_unknown_pattern(self):
+        assert main(['-k', 'no_such']) == 2
+
+    def test_save_and_compare(self, tmp_path, capsys):
+        path = str(tmp_path / 'baseline.json')
+        args = ['-k', 'solve.scalar', '-r', '1', '-w', '0', '--min-time', '0', '--no-memory']
+        assert main(args + ['--save', path]) == 0
+        assert 'solve.scalar' in load_baseline(path)
+
+        # Штучно швидкий baseline - поточний прогін є регресією
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        data['results']['solve.scalar']['times'] = [1e-9]
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        assert main(args + ['--compare', path]) == 1
+
+    def test_missing_baseline(self, tmp_path):
+        assert main(['-k', 'solve.scalar', '--compare', str(tmp_path / 'none.json')]) == 2
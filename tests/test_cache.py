@@ -0,0 +1,265 @@
+"""
+Тести для кешу результатів (balloon.cache)
+"""
+
+import os
+import tempfile
+
+import numpy as np
+import pytest
+
+from balloon import cache as cache_module
+from balloon.cache import ResultCache, canonicalize, input_key, persistent_cache
+from balloon.model.solve import solve_volume_to_payload
+
+
+@pytest.fixture
+def cache_file():
+    with tempfile.TemporaryDirectory() as tmp:
+        yield os.path.join(tmp, 'results.sqlite')
+
+
+@pytest.fixture
+def enabled_cache(cache_file, monkeypatch):
+    monkeypatch.delenv(cache_module.RESULT_CACHE_ENV, raising=False)
+    cache = cache_module.enable_result_cache(cache_file)
+    yield cache
+    cache_module.disable_result_cache()
+
+
+class TestCanonicalize:
+    """Тести для канонізації вхідних параметрів"""
+    
+    def test_equivalent_inputs_same_key(self):
+        a = {'gas_volume': 10, 'shape_params': {'b': 1, 'a': np.float64(2.0)}}
+        b = {'shape_params': {'a': 2, 'b': 1.0}, 'gas_volume': 10.0}
+        assert canonicalize(a) == canonicalize(b)
+        assert input_key('f', a, 's') == input_key('f', b, 's')
+        assert input_key('f', a, 's') != input_key('f', a, 'other')
+    
+    def test_rejects_unknown_types(self):
+        with pytest.raises(TypeError):
+            canonicalize(object())
+
+
+class TestResultCache:
+    """Тести для ResultCache"""
+    
+    def test_get_put_stats(self, cache_file):
+        cache = ResultCache(cache_file, stamp='v1')
+        with pytest.raises(KeyError):
+            cache.get('k')
+        assert cache.put('k', 'f', {'lift': np.float64(1.5), 'items': [1, 2]})
+        assert cache.get('k') == {'lift': 1.5, 'items': [1, 2]}
+        
+        stats = cache.stats()
+        assert (stats['hits'], stats['misses'], stats['entries']) == (1, 1, 1)
+        assert stats['hit_rate'] == pytest.approx(0.5)
+        cache.close()
+    
+    def test_lru_eviction(self, cache_file):
+        cache = ResultCache(cache_file, max_entries=3, stamp='v1')
+        for key in 'abc':
+            cache.put(key, 'f', key)
+            cache._conn.execute('UPDATE results SET last_access = last_access - 10 WHERE key = ?', (key,))
+        cache.get('a')  # 'a' стає найсвіжішим
+        cache.put('d', 'f', 'd')
+        
+        assert cache.stats()['entries'] == 3
+        with pytest.raises(KeyError):
+            cache.get('b')
+        assert cache.get('a') == 'a'
+        cache.close()
+    
+    def test_stamp_change_invalidates(self, cache_file):
+        cache = ResultCache(cache_file, stamp='constants-v1')
+        cache.put('k', 'f', 1)
+        cache.close()
+        
+        cache = ResultCache(cache_file, stamp='constants-v2')
+        assert cache.stats()['entries'] == 0
+        cache.close()
+    
+    def test_model_stamp_tracks_constants(self, monkeypatch, tmp_path):
+        """Зміна constants.py змінює відбиток моделі"""
+        import balloon.constants
+        constants_copy = tmp_path / 'constants.py'
+        constants_copy.write_text('GRAVITY = 9.80665\n', encoding='utf-8')
+        monkeypatch.setattr(balloon.constants, '__file__', str(constants_copy))
+        
+        cache_module.model_stamp.cache_clear()
+        before = cache_module.model_stamp()
+        constants_copy.write_text('GRAVITY = 9.81\n', encoding='utf-8')
+        cache_module.model_stamp.cache_clear()
+        after = cache_module.model_stamp()
+        cache_module.model_stamp.cache_clear()
+        
+        assert before != after
+
+
+class TestPersistentCache:
+    """Тести для декоратора persistent_cache"""
+    
+    def test_disabled_calls_through(self, monkeypatch):
+        monkeypatch.delenv(cache_module.RESULT_CACHE_ENV, raising=False)
+        cache_module.disable_result_cache()
+        calls = []
+        
+        @persistent_cache
+        def f(x, y=1):
+            calls.append(x)
+            return x + y
+        
+        assert f(1) == 2 and f(1) == 2
+        assert len(calls) == 2
+    
+    def test_positional_and_keyword_share_entry(self, enabled_cache):
+        calls = []
+        
+        @persistent_cache
+        def f(x, y=1):
+            calls.append(x)
+            return {'sum': x + y}
+        
+        assert f(1) == {'sum': 2}
+        assert f(x=1, y=1.0) == {'sum': 2}
+        assert len(calls) == 1
+        assert enabled_cache.stats()['hits'] == 1
+    
+    def test_solver_roundtrip(self, enabled_cache):
+        """Результат із кешу збігається з розрахованим"""
+        args = dict(gas_type='Гелій', gas_volume=10.0, material='TPU', thickness_um=35,
+                    start_height=0, work_height=1000, duration=24)
+        computed = solve_volume_to_payload(**args)
+        cached = solve_volume_to_payload(**args)
+        
+        assert cached == computed
+        assert cached is not computed
+        assert enabled_cache.stats()['hits'] >= 1
+    
+    def test_exceptions_not_cached(self, enabled_cache):
+        with pytest.raises(ValueError):
+            solve_volume_to_payload('Гелій', -1.0, 'TPU', 35, 0, 1000)
+        assert enabled_cache.stats()['entries'] == 0
+
+
+class TestMemoize:
+    """Тести для мемоізації в пам'яті (memoize)"""
+    
+    @pytest.fixture(autouse=True)
+    def memo_enabled(self):
+        cache_module.set_memoization_enabled(True)
+        yield
+        cache_module.set_memoization_enabled(True)
+    
+    def test_shape_params_canonicalized(self):
+        calls = []
+        
+        @cache_module.memoize
+        def f(height, shape_params=None):
+            calls.append(height)
+            return {'height': height}
+        
+        f(100, shape_params={'a': 1, 'b': 2})
+        f(100, shape_params={'b': 2, 'a': 1})
+        f(100, shape_params={'a': 1, 'b': 3})
+        assert len(calls) == 2
+        assert cache_module.freeze({}) is None
+        assert f.cache_info()['hits'] == 1
+        assert f.cache_info()['misses'] == 2
+    
+    def test_returns_independent_copies(self):
+        @cache_module.memoize
+        def f(x):
+            return {'x': x, 'nested': {'values': [1, 2]}}
+        
+        first = f(1)
+        first['x'] = 99
+        first['nested']['values'].append(3)
+        assert f(1) == {'x': 1, 'nested': {'values': [1, 2]}}
+    
+    def test_lru_bound_and_clear(self):
+        @cache_module.memoize(maxsize=2)
+        def f(x):
+            return x * 2
+        
+        for x in (1, 2, 3):
+            f(x)
+        assert f.cache_info()['size'] == 2
+        f(1)
+        assert f.cache_info()['hits'] == 0
+        
+        f.cache_clear()
+        assert f.cache_info() == {'hits': 0, 'misses': 0, 'hit_rate': 0.0, 'size': 0, 'maxsize': 2}
+    
+    def test_disable(self):
+        calls = []
+        
+        @cache_module.memoize
+        def f(x):
+            calls.append(x)
+            return x
+        
+        cache_module.set_memoization_enabled(False)
+        f(1)
+        f(1)
+        assert len(calls) == 2
+        assert not cache_module.memoization_enabled()
+    
+    def test_unhashable_arguments_call_through(self):
+        calls = []
+        
+        @cache_module.memoize
+        def f(values):
+            calls.append(values)
+            return sum(values)
+        
+        # Списки канонізуються в кортежі, множини - викликаються без кешу
+        assert f([1, 2]) == 3 and f([1, 2]) == 3
+        assert len(calls) == 1
+        assert f({1, 2}) == 3 and f({1, 2}) == 3
+        assert len(calls) == 3
+    
+    def test_balloon_state_hits(self):
+        """Повторні виклики calculate_balloon_state беруться з кешу та збігаються з розрахунком"""
+        from balloon.model.solve import calculate_balloon_state
+        
+        args = ('Гелій', 10.0, 'TPU', 35e-6, 1000.0, 15.0, 100.0, 'pear',
+                {'pear_height': 3, 'pear_top_radius': 1.2, 'pear_bottom_radius': 0.6})
+        calculate_balloon_state.cache_clear()
+        first = calculate_balloon_state(*args)
+        second = calculate_balloon_state(*args)
+        
+        assert first == second == calculate_balloon_state.uncached(*args)
+        assert calculate_balloon_state.cache_info()['hits'] == 1
+        assert 'balloon.model.solve.calculate_balloon_state' in cache_module.memo_stats()
+    
+    def test_dict_positional_argument_key(self):
+        """Словник серед позиційних аргументів канонізується (порядок ключів, {} == None)"""
+        calls = []
+        
+        @cache_module.memoize
+        def f(name, params):
+            calls.append(name)
+            return name
+        
+        f('a', {'x': 1, 'y': 2})
+        f('a', {'y': 2, 'x': 1})
+        f('b', {})
+        f('b', None)
+        assert calls == ['a', 'b']
+    
+    def test_thread_safety(self):
+        from concurrent.futures import ThreadPoolExecutor
+        
+        @cache_module.memoize(maxsize=16)
+        def f(x):
+            return {'x': x}
+        
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda i: f(i % 32)['x'], range(4000)))
+        
+        assert results == [i % 32 for i in range(4000)]
+        info = f.cache_info()
+        assert info['hits'] + info['misses'] == 4000
+        assert info['size'] <= 16
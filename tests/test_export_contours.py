@@ -0,0 +1,126 @@
+"""
+Тести для апроксимації контурів (balloon.export.contours)
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from balloon.export.contours import (
+    bezier_to_polyline, contour_deviation, fit_cubic_beziers, gore_outline, simplify_contour,
+    symmetric_deviation
+)
+from balloon.patterns.profile_based import generate_pattern_from_shape_profile
+
+
+@pytest.fixture
+def outline_mm():
+    """Замкнений контур gore сфери r=3 м у мм"""
+    pattern = generate_pattern_from_shape_profile('sphere', {'radius': 3.0}, 12)
+    outline = [(x * 1000, y * 1000) for x, y in gore_outline(pattern['points'])]
+    return outline + outline[:1]
+
+
+class TestGoreOutline:
+    """Тести для функції gore_outline"""
+
+    @pytest.mark.parametrize('shape,params', [
+        ('sphere', {'radius': 1.0}), ('pear', {'pear_height': 3.0, 'pear_top_radius': 1.2, 'pear_bottom_radius': 0.6}),
+    ])
+    def test_seam_line_offset_along_normal(self, shape, params):
+        """Лінія шва на відстані припуску від контуру і не перетинає центральну лінію"""
+        pattern = generate_pattern_from_shape_profile(shape, params, 6, seam_allowance_mm=10.0)
+        points = pattern['points']
+        sew = gore_outline(points, 0.01)[:len(points)]
+
+        assert min(x for x, y in sew) >= 0.0
+        # Далі від полюсів відстань до контуру дорівнює припуску (а не зсуву по X)
+        middle = [p for p in sew if 0.1 < p[0]]
+        distances = [contour_deviation([p], points) for p in middle]
+        assert distances and max(distances) == pytest.approx(0.01, rel=0.05)
+        assert min(distances) == pytest.approx(0.01, rel=0.05)
+
+    def test_without_offset(self):
+        points = [(0.0, 0.0), (1.0, 1.0), (0.0, 2.0)]
+        assert gore_outline(points) == points + [(-0.0, 2.0), (-1.0, 1.0), (-0.0, 0.0)]
+
+
+class TestContourDeviation:
+    """Тести для функції contour_deviation"""
+    
+    def test_point_to_segment(self):
+        assert contour_deviation([(5.0, 3.0)], [(0.0, 0.0), (10.0, 0.0)]) == pytest.approx(3.0)
+        assert contour_deviation([(13.0, 4.0)], [(0.0, 0.0), (10.0, 0.0)]) == pytest.approx(5.0)
+    
+    def test_symmetric(self):
+        """Наближення, що відходить від контуру між точками, враховується"""
+        reference = [(0.0, 0.0), (10.0, 0.0)]
+        bulge = [(0.0, 0.0), (5.0, 2.0), (10.0, 0.0)]
+        assert contour_deviation(reference, bulge) == 0.0
+        assert symmetric_deviation(reference, bulge) == pytest.approx(2.0)
+
+
+class TestFitCubicBeziers:
+    """Тести для функції fit_cubic_beziers"""
+    
+    def test_circle_arc(self):
+        """Дуга кола апроксимується кількома кривими в межах допуску"""
+        angles = np.linspace(0, math.pi, 400)
+        points = np.column_stack([100 * np.cos(angles), 100 * np.sin(angles)])
+        segments = fit_cubic_beziers(points, 0.05)
+        
+        assert 1 < len(segments) < 20
+        assert segments[0][0] == pytest.approx(tuple(points[0]))
+        assert segments[-1][3] == pytest.approx(tuple(points[-1]))
+        for previous, current in zip(segments, segments[1:]):
+            assert previous[3] == current[0]
+        
+        curve = np.array(bezier_to_polyline(segments, 64))
+        radii = np.hypot(curve[:, 0], curve[:, 1])
+        assert np.abs(radii - 100).max() < 0.06
+    
+    def test_corners_preserved(self):
+        """Кути ламаної стають вузлами кривих"""
+        points = [(0, 0), (5, 0), (10, 0), (10, 5), (10, 10)]
+        segments = fit_cubic_beziers(points, 0.01)
+        assert (10.0, 0.0) in [segment[3] for segment in segments]
+        assert contour_deviation(points, bezier_to_polyline(segments, 32)) < 0.01
+
+
+class TestSimplifyContour:
+    """Тести для функції simplify_contour"""
+    
+    @pytest.mark.parametrize('method', ['polyline', 'bezier'])
+    def test_deviation_within_tolerance(self, outline_mm, method):
+        """Звіт про відхилення не перевищує допуск і кількість точок зменшується"""
+        result = simplify_contour(outline_mm, 0.1, method=method)
+        
+        assert result['method'] == method
+        assert result['input_points'] == len(outline_mm)
+        assert result['output_points'] < len(outline_mm)
+        assert result['max_deviation'] <= 0.1 * 1.05
+    
+    @pytest.mark.parametrize('shape,params', [
+        ('sphere', {'radius': 5.0}),
+        ('cigar', {'cigar_length': 6.0, 'cigar_radius': 1.0}),
+        ('pear', {'pear_height': 3.0, 'pear_top_radius': 1.2, 'pear_bottom_radius': 0.6}),
+    ])
+    def test_bezier_curve_stays_near_sparse_contour(self, shape, params):
+        """Криві не відходять від контуру між рідкими точками великих gores"""
+        pattern = generate_pattern_from_shape_profile(shape, params, 12)
+        outline = [(x * 1000, y * 1000) for x, y in gore_outline(pattern['points'])]
+        result = simplify_contour(outline, 0.1, method='bezier')
+        curve = bezier_to_polyline(result['segments'], 64)
+        
+        assert contour_deviation(curve, outline) <= 0.1 * 1.05
+        assert result['max_deviation'] <= 0.1 * 1.05
+    
+    def test_bezier_is_closed(self, outline_mm):
+        segments = simplify_contour(outline_mm, 0.5, method='bezier')['segments']
+        assert segments[0][0] == pytest.approx(outline_mm[0])
+        assert segments[-1][3] == pytest.approx(outline_mm[-1])
+    
+    def test_unknown_method(self, outline_mm):
+        with pytest.raises(ValueError, match="Невідомий метод"):
+            simplify_contour(outline_mm, 0.1, method='arcs')
@@ -14,7 +14,7 @@ except ImportError:
     DXF_AVAILABLE = False
 
 if DXF_AVAILABLE:
-    from balloon.export.dxf_export import export_pattern_to_dxf
+    from balloon.export.dxf_export import export_pattern_to_dxf, export_gores_to_dxf, GORE_LAYERS
 
 
 @pytest.mark.skipif(not DXF_AVAILABLE, reason="ezdxf not available")
@@ -77,3 +77,73 @@ class TestExportPatternToDxf:
             if os.path.exists(filename):
                 os.remove(filename)
 
+
+
+@pytest.mark.skipif(not DXF_AVAILABLE, reason="ezdxf not available")
+class TestExportGoresToDxf:
+    """Тести для функції export_gores_to_dxf"""
+    
+    def _pattern(self):
+        from balloon.patterns.profile_based import generate_pattern_from_shape_profile
+        return generate_pattern_from_shape_profile('sphere', {'radius': 1.0}, 16)
+    
+    def test_blocks_and_inserts(self):
+        """Одна геометрія панелі у блоці, кожен gore - INSERT з номером"""
+        pattern = self._pattern()
+        
+        with tempfile.NamedTemporaryFile(suffix='.dxf', delete=False) as f:
+            filename = f.name
+        
+        try:
+            result = export_gores_to_dxf(pattern, filename)
+            doc = ezdxf.readfile(result)
+            msp = doc.modelspace()
+            
+            inserts = msp.query('INSERT')
+            assert len(inserts) == 16
+            assert {insert.dxf.name for insert in inserts} == {'GORE'}
+            numbers = sorted(int(insert.get_attrib_text('NUM')) for insert in inserts)
+            assert numbers == list(range(1, 17))
+            # Контури не дублюються в modelspace
+            assert len(msp.query('LWPOLYLINE[layer=="CUT"]')) == 0
+        finally:
+            if os.path.exists(filename):
+                os.remove(filename)
+    
+    def test_layers(self):
+        """Шари CUT/SEW/NOTCH/LABEL присутні та заповнені в блоці"""
+        pattern = self._pattern()
+        
+        with tempfile.NamedTemporaryFile(suffix='.dxf', delete=False) as f:
+            filename = f.name
+        
+        try:
+            export_gores_to_dxf(pattern, filename)
+            doc = ezdxf.readfile(filename)
+            for layer_name in GORE_LAYERS:
+                assert doc.layers.has_entry(layer_name)
+            
+            block_layers = {entity.dxf.layer for entity in doc.blocks.get('GORE')}
+            assert {'CUT', 'SEW', 'NOTCH', 'LABEL'} <= block_layers
+        finally:
+            if os.path.exists(filename):
+                os.remove(filename)
+    
+    def test_tolerance_reduces_vertices(self):
+        """Спрощення з допуском зменшує кількість вершин контуру розрізу"""
+        pattern = self._pattern()
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            exact = export_gores_to_dxf(pattern, os.path.join(tmp, 'exact.dxf'))
+            simplified = export_gores_to_dxf(pattern, os.path.join(tmp, 'simplified.dxf'), tolerance_mm=0.2)
+            
+            def cut_vertices(filename):
+                block = ezdxf.readfile(filename).blocks.get('GORE')
+                return len(next(e for e in block if e.dxftype() == 'LWPOLYLINE' and e.dxf.layer == 'CUT'))
+            
+            assert cut_vertices(simplified) < cut_vertices(exact)
+    
+    def test_export_empty_pattern(self):
+        """Перевірка обробки порожнього патерну"""
+        with pytest.raises(ValueError, match="не містить координат"):
+            export_gores_to_dxf({'pattern_type': 'sphere_gore', 'points': []}, 'unused.dxf')
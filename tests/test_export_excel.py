@@ -0,0 +1,122 @@
+"""
+Тести для потокового Excel експорту (balloon.export.excel_export)
+"""
+
+import os
+import tempfile
+
+import numpy as np
+import pytest
+
+openpyxl = pytest.importorskip('openpyxl')
+
+from balloon.export.excel_export import export_tables_to_excel, _column_letter, _sheet_titles
+from balloon.export_core import export_results_to_excel, export_pattern_to_excel
+from balloon.patterns.profile_based import generate_pattern_from_shape_profile
+
+
+@pytest.fixture
+def xlsx_file():
+    with tempfile.TemporaryDirectory() as tmp:
+        yield os.path.join(tmp, 'out.xlsx')
+
+
+class TestHelpers:
+    """Тести для допоміжних функцій"""
+    
+    def test_column_letter(self):
+        assert _column_letter(1) == 'A'
+        assert _column_letter(26) == 'Z'
+        assert _column_letter(27) == 'AA'
+        assert _column_letter(703) == 'AAA'
+    
+    def test_sheet_titles(self):
+        assert _sheet_titles(['a/b', 'A/B', 'x' * 40]) == ['a_b', 'A_B (2)', 'x' * 31]
+
+
+class TestExportTablesToExcel:
+    """Тести для функції export_tables_to_excel"""
+    
+    def test_numeric_columns_stay_numeric(self, xlsx_file):
+        """Числа записуються як числа з форматом, NaN - порожня комірка"""
+        volume = np.linspace(1.0, 2.0, 1000)
+        volume[3] = np.nan
+        export_tables_to_excel(
+            {'Серія': {'Об\'єм (м³)': volume, '№': np.arange(1000), 'Газ': ['Гелій <He>'] * 1000}},
+            xlsx_file,
+            number_formats={'Об\'єм (м³)': '0.00E+00'}
+        )
+        
+        sheet = openpyxl.load_workbook(xlsx_file)['Серія']
+        assert [cell.value for cell in sheet[1]] == ['Об\'єм (м³)', '№', 'Газ']
+        assert sheet[1][0].font.b
+        assert sheet.max_row == 1001
+        
+        first = sheet[2]
+        assert first[0].value == pytest.approx(1.0)
+        assert first[0].number_format == '0.00E+00'
+        assert first[1].value == 0 and first[1].number_format == '0'
+        assert first[2].value == 'Гелій <He>'
+        assert sheet['A5'].value is None
+        assert sheet['A1001'].value == pytest.approx(2.0)
+        assert sheet.freeze_panes == 'A2'
+    
+    def test_sheet_per_table(self, xlsx_file):
+        """Кожна таблиця - окремий аркуш; приймаються записи та DataFrame"""
+        pd = pytest.importorskip('pandas')
+        export_tables_to_excel({
+            'Записи': [{'a': 1, 'b': 'x'}, {'a': 2.5}],
+            'Кадр': pd.DataFrame({'h': [0.0, 1000.0], 'p': [101325.0, 89875.0]}),
+        }, xlsx_file)
+        
+        frames = pd.read_excel(xlsx_file, sheet_name=None)
+        assert list(frames) == ['Записи', 'Кадр']
+        assert frames['Записи']['a'].tolist() == [1.0, 2.5]
+        assert frames['Кадр']['p'].dtype.kind in 'if'
+    
+    def test_mixed_column(self, xlsx_file):
+        """У змішаному стовпці числа залишаються числами"""
+        export_tables_to_excel({'T': {'Значення': ['sphere', None, 12, 0.5]}}, xlsx_file)
+        sheet = openpyxl.load_workbook(xlsx_file)['T']
+        assert [row[0] for row in sheet.iter_rows(min_row=2, values_only=True)] == ['sphere', None, 12, 0.5]
+    
+    def test_control_characters_stripped(self, xlsx_file):
+        """Недопустимі в XML керівні символи не ламають файл (заголовок, текст, змішаний стовпець)"""
+        export_tables_to_excel({'T\x01': {
+            'na\x02me': ['a\x01b', 'c\td\ne'],
+            'Значення': ['x\x1fy', 1.5],
+        }}, xlsx_file)
+        sheet = openpyxl.load_workbook(xlsx_file)['T_']
+        rows = list(sheet.iter_rows(values_only=True))
+        assert rows == [('name', 'Значення'), ('ab', 'xy'), ('c\td\ne', 1.5)]
+
+    def test_no_tables(self, xlsx_file):
+        with pytest.raises(ValueError, match="Немає таблиць"):
+            export_tables_to_excel({}, xlsx_file)
+
+
+class TestCoreExcelExport:
+    """Тести для export_results_to_excel та export_pattern_to_excel"""
+    
+    def test_results_are_numeric(self, xlsx_file):
+        results = {
+            'required_volume': 12.5, 'surface_area': 26.0, 'stress': 1.2e7, 'stress_limit': 3.0e7,
+            'shape_type': 'sphere', 'shape_params': {'radius': 1.44},
+            'height_profile': [{'height': 0, 'lift': 100.0, 'pressure': 101325.0}],
+        }
+        export_results_to_excel(results, xlsx_file)
+        
+        workbook = openpyxl.load_workbook(xlsx_file)
+        assert workbook.sheetnames == ['Результати', 'Інформація', 'Профіль висоти']
+        values = {row[0]: row[1] for row in workbook['Результати'].iter_rows(min_row=2, values_only=True)}
+        assert values['Об\'єм кулі'] == pytest.approx(12.5)
+        assert values['Напруга в оболонці'] == pytest.approx(1.2e7)
+    
+    def test_pattern_coordinates(self, xlsx_file):
+        pattern = generate_pattern_from_shape_profile('sphere', {'radius': 1.0}, 12)
+        export_pattern_to_excel(pattern, xlsx_file)
+        
+        sheet = openpyxl.load_workbook(xlsx_file)['Координати']
+        rows = list(sheet.iter_rows(min_row=2, values_only=True))
+        assert len(rows) == len(pattern['points'])
+        assert rows[0][1] == pytest.approx(pattern['points'][0][0])
@@ -3,7 +3,7 @@
 """
 
 import pytest
-from balloon.export.nesting import estimate_fabric_requirements
+from balloon.export.nesting import estimate_fabric_requirements, calculate_gore_layout
 
 
 class TestEstimateFabricRequirements:
@@ -72,3 +72,30 @@ class TestEstimateFabricRequirements:
         # Широка тканина потребує менше довжини
         assert result_wide['fabric_length_m'] <= result_narrow['fabric_length_m']
 
+
+
+class TestCalculateGoreLayout:
+    """Тести для функції calculate_gore_layout"""
+    
+    def test_placements_fit_fabric(self):
+        """Усі панелі розміщені без перекриття та в межах ширини тканини"""
+        pattern = {
+            'pattern_type': 'sphere_gore',
+            'num_gores': 12,
+            'points': [(0.0, 0.0), (0.25, 1.5), (0.0, 3.14)]
+        }
+        
+        layout = calculate_gore_layout(pattern, fabric_width_mm=1500.0, min_gap_mm=10.0)
+        
+        assert len(layout['placements']) == 12
+        assert layout['panel_width_mm'] == pytest.approx(500.0)
+        assert layout['gores_per_row'] == 2
+        assert layout['num_rows'] == 6
+        for placement in layout['placements']:
+            assert placement['x_mm'] + layout['panel_width_mm'] <= 1500.0
+            assert placement['y_mm'] + layout['panel_height_mm'] <= layout['fabric_length_mm']
+    
+    def test_empty_pattern(self):
+        """Патерн без координат"""
+        with pytest.raises(ValueError):
+            calculate_gore_layout({'pattern_type': 'sphere_gore', 'points': []})
@@ -14,10 +14,19 @@ except ImportError:
     PDF_AVAILABLE = False
 
 if PDF_AVAILABLE:
+    import re
+    import numpy as np
     from balloon.export.pdf_export import (
         _calculate_tiles,
+        _clip_polyline_to_rect,
         export_pattern_to_pdf
     )
+    from balloon.patterns.profile_based import generate_pattern_from_shape_profile
+
+
+def _count_pdf_pages(filename):
+    with open(filename, 'rb') as f:
+        return len(re.findall(rb'/Type /Page\b(?!s)', f.read()))
 
 
 @pytest.mark.skipif(not PDF_AVAILABLE, reason="reportlab not available")
@@ -120,3 +129,49 @@ class TestExportPatternToPdf:
             if os.path.exists(filename):
                 os.remove(filename)
 
+
+
+@pytest.mark.skipif(not PDF_AVAILABLE, reason="reportlab not available")
+class TestClipPolylineToRect:
+    """Тести для функції _clip_polyline_to_rect"""
+    
+    def test_inside(self):
+        """Полілінія всередині прямокутника залишається цілою"""
+        points = np.array([[1.0, 1.0], [2.0, 2.0], [3.0, 1.0]])
+        pieces = _clip_polyline_to_rect(points, 0, 0, 10, 10)
+        assert len(pieces) == 1
+        assert np.allclose(pieces[0], points)
+    
+    def test_crossing(self):
+        """Сегмент, що перетинає межу, обрізається по межі"""
+        points = np.array([[-5.0, 5.0], [15.0, 5.0]])
+        pieces = _clip_polyline_to_rect(points, 0, 0, 10, 10)
+        assert len(pieces) == 1
+        assert np.allclose(pieces[0], [[0.0, 5.0], [10.0, 5.0]])
+    
+    def test_outside(self):
+        """Полілінія поза прямокутником не дає фрагментів"""
+        points = np.array([[20.0, 20.0], [30.0, 25.0]])
+        assert _clip_polyline_to_rect(points, 0, 0, 10, 10) == []
+    
+    def test_reentry_splits(self):
+        """Вихід і повернення в прямокутник дають два фрагменти"""
+        points = np.array([[2.0, 5.0], [20.0, 5.0], [20.0, 8.0], [2.0, 8.0]])
+        pieces = _clip_polyline_to_rect(points, 0, 0, 10, 10)
+        assert len(pieces) == 2
+
+
+@pytest.mark.skipif(not PDF_AVAILABLE, reason="reportlab not available")
+class TestEmptyTiles:
+    """Тести пропуску порожніх сторінок"""
+    
+    def test_skip_empty_tiles(self):
+        """Для лінзоподібного gore частина сторінок порожня і пропускається"""
+        pattern = generate_pattern_from_shape_profile('sphere', {'radius': 5.0}, 8)
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            full = export_pattern_to_pdf(pattern, os.path.join(tmp_dir, 'full.pdf'), skip_empty_tiles=False)
+            skipped = export_pattern_to_pdf(pattern, os.path.join(tmp_dir, 'skipped.pdf'))
+            
+            assert _count_pdf_pages(skipped) < _count_pdf_pages(full)
+            assert _count_pdf_pages(skipped) > 0
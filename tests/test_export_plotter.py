@@ -0,0 +1,105 @@
+"""
+Тести для модуля balloon.export.plotter_export
+"""
+
+import math
+import os
+import tempfile
+
+import pytest
+
+from balloon.export.contours import simplify_polyline
+from balloon.export.plotter_export import (
+    build_cut_paths,
+    optimize_path_order,
+    plan_cut_job,
+    travel_length,
+    export_pattern_to_hpgl,
+    export_pattern_to_gcode,
+)
+from balloon.patterns.profile_based import generate_pattern_from_shape_profile
+
+
+def _segment_distance(p, a, b):
+    """Відстань від точки p до відрізка ab"""
+    ax, ay = a
+    dx, dy = b[0] - ax, b[1] - ay
+    t = max(0.0, min(1.0, ((p[0] - ax) * dx + (p[1] - ay) * dy) / (dx * dx + dy * dy)))
+    return math.hypot(p[0] - ax - t * dx, p[1] - ay - t * dy)
+
+
+@pytest.fixture
+def gore_pattern():
+    return generate_pattern_from_shape_profile('sphere', {'radius': 1.0}, 12)
+
+
+class TestSimplifyPolyline:
+    """Тести для функції simplify_polyline"""
+    
+    def test_straight_line(self):
+        """Точки на прямій зводяться до кінцевих"""
+        points = [(float(i), 2.0 * i) for i in range(100)]
+        assert simplify_polyline(points, 0.01) == [(0.0, 0.0), (99.0, 198.0)]
+    
+    def test_tolerance_respected(self):
+        """Відхилення відкинутих точок не перевищує допуск"""
+        points = [(math.cos(t / 100), math.sin(t / 100)) for t in range(315)]
+        simplified = simplify_polyline(points, 0.001)
+        assert len(simplified) < len(points)
+        assert simplified[0] == points[0] and simplified[-1] == points[-1]
+        # Кожна вихідна точка близька до спрощеної полілінії
+        for point in points:
+            deviation = min(_segment_distance(point, a, b) for a, b in zip(simplified, simplified[1:]))
+            assert deviation <= 0.001 + 1e-9
+    
+    def test_zero_tolerance(self):
+        points = [(0.0, 0.0), (1.0, 0.1), (2.0, 0.0)]
+        assert simplify_polyline(points, 0) == points
+
+
+class TestPathOrder:
+    """Тести для оптимізації порядку обходу"""
+    
+    def test_reduces_travel(self, gore_pattern):
+        """Оптимізований порядок не довший за вихідний"""
+        job = plan_cut_job(gore_pattern, num_gores=12)
+        assert job['travel_mm'] < job['travel_before_mm']
+        assert len(job['ordered']) == job['num_paths']
+    
+    def test_open_paths_reversed(self):
+        """Відкритий шлях проходиться з ближчого кінця"""
+        paths = [
+            {'points': [(10.0, 0.0), (1.0, 0.0)], 'closed': False, 'tool': 1},
+            {'points': [(20.0, 0.0), (30.0, 0.0)], 'closed': False, 'tool': 1},
+        ]
+        ordered = optimize_path_order(paths, start=(0.0, 0.0))
+        assert ordered[0][1] is True
+        assert travel_length(ordered) == pytest.approx(11.0)
+    
+    def test_simplification_reduces_points(self, gore_pattern):
+        dense = build_cut_paths(gore_pattern, tolerance_mm=0)
+        simple = build_cut_paths(gore_pattern, tolerance_mm=0.5)
+        assert sum(len(p['points']) for p in simple) < sum(len(p['points']) for p in dense)
+
+
+class TestPlotterExport:
+    """Тести для HPGL та G-code експорту"""
+    
+    def test_hpgl(self, gore_pattern):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            result = export_pattern_to_hpgl(gore_pattern, os.path.join(tmp_dir, 'job.plt'))
+            content = open(result, encoding='ascii').read()
+            assert content.startswith('IN;')
+            assert content.count('PU') - 1 == len(plan_cut_job(gore_pattern)['ordered'])
+            assert content.rstrip().endswith('PU;SP0;')
+    
+    def test_gcode(self, gore_pattern):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            result = export_pattern_to_gcode(gore_pattern, os.path.join(tmp_dir, 'job.gcode'))
+            lines = open(result, encoding='ascii').read().splitlines()
+            assert 'G21' in lines and 'G90' in lines
+            assert lines[-1] == 'M2'
+    
+    def test_empty_pattern(self):
+        with pytest.raises(ValueError, match="не містить координат"):
+            export_pattern_to_hpgl({'pattern_type': 'sphere_gore', 'points': []}, 'unused.plt')
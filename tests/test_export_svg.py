@@ -0,0 +1,149 @@
+"""
+Тести для модуля balloon.export.svg_export
+"""
+
+import io
+import os
+import tempfile
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from balloon.export.svg_export import SvgWriter, export_gores_to_svg, _format_number
+from balloon.export_core import export_pattern_to_svg
+from balloon.patterns.profile_based import generate_pattern_from_shape_profile
+
+SVG_NS = '{http://www.w3.org/2000/svg}'
+
+
+def _parse_relative_path(d: str):
+    """Відновлює абсолютні точки з шляху 'Mx,y l dx,dy ...'"""
+    d = d.rstrip('z')
+    head, _, tail = d[1:].partition('l')
+    x, y = (float(v) for v in head.split(','))
+    points = [(x, y)]
+    for pair in tail.split():
+        dx, dy = (float(v) for v in pair.split(','))
+        x, y = x + dx, y + dy
+        points.append((x, y))
+    return points
+
+
+class TestFormatNumber:
+    """Тести для компактного форматування чисел"""
+    
+    def test_strips_trailing_zeros(self):
+        assert _format_number(1.50, 2) == '1.5'
+        assert _format_number(2.0, 2) == '2'
+        assert _format_number(-0.001, 2) == '0'
+        assert _format_number(-1.256, 2) == '-1.26'
+
+
+class TestSvgWriter:
+    """Тести для потокового SvgWriter"""
+    
+    def test_relative_path_roundtrip(self):
+        """Відносний шлях відтворює точки з точністю writer-а без накопичення похибки"""
+        points = [(i * 0.333, (i % 7) * 1.111) for i in range(5000)]
+        buffer = io.StringIO()
+        with SvgWriter(buffer, 100, 100, precision=2) as svg:
+            svg.path(points, 'cut-line', closed=True)
+        
+        root = ET.fromstring(buffer.getvalue().encode('utf-8'))
+        path = root.find(f'{SVG_NS}path')
+        decoded = _parse_relative_path(path.get('d'))
+        
+        assert path.get('d').endswith('z')
+        assert len(decoded) == len(points)
+        for (x, y), (ex, ey) in zip(decoded, points):
+            assert x == pytest.approx(ex, abs=0.006)
+            assert y == pytest.approx(ey, abs=0.006)
+    
+    def test_degenerate_paths_skipped(self):
+        """Шлях з однієї (після квантування) точки не записується: d="Ml" - некоректні дані"""
+        buffer = io.StringIO()
+        with SvgWriter(buffer, 10, 10, precision=2) as svg:
+            svg.path([(1.0, 1.0)], 'cut-line')
+            svg.path([(1.0, 1.0), (1.001, 1.0), (1.0, 1.002)], 'cut-line', closed=True)
+            svg.path([(1.0, 1.0), (2.0, 1.0)], 'seam-line')
+        
+        paths = ET.fromstring(buffer.getvalue().encode('utf-8')).findall(f'{SVG_NS}path')
+        assert [path.get('d') for path in paths] == ['M1,1l 1,0']
+    
+    def test_bezier_path(self):
+        """Криві записуються відносними c, кінцева точка кожної - початок наступної"""
+        segments = [
+            ((1.0, 1.0), (2.0, 3.0), (4.0, 3.0), (5.0, 1.0)),
+            ((5.0, 1.0), (6.0, -1.0), (8.0, -1.0), (9.0, 1.0)),
+        ]
+        buffer = io.StringIO()
+        with SvgWriter(buffer, 10, 10) as svg:
+            svg.bezier_path(segments, 'cut-line')
+        
+        root = ET.fromstring(buffer.getvalue().encode('utf-8'))
+        assert root.find(f'{SVG_NS}path').get('d') == 'M1,1c 1,2 3,2 4,0 1,-2 3,-2 4,0'
+    
+    def test_escapes_text(self):
+        buffer = io.StringIO()
+        with SvgWriter(buffer, 10, 10) as svg:
+            svg.text(0, 0, 'a < b & c')
+        root = ET.fromstring(buffer.getvalue().encode('utf-8'))
+        assert root.find(f'{SVG_NS}text').text == 'a < b & c'
+
+
+class TestExportSvg:
+    """Тести для SVG експорту викрійок"""
+    
+    def test_single_gore(self):
+        """Експорт одного сегмента - валідний XML з лініями розрізу, шва та мітками"""
+        pattern = generate_pattern_from_shape_profile('sphere', {'radius': 1.0}, 12)
+        
+        with tempfile.NamedTemporaryFile(suffix='.svg', delete=False) as f:
+            filename = f.name
+        
+        try:
+            export_pattern_to_svg(pattern, filename)
+            root = ET.parse(filename).getroot()
+            classes = [el.get('class') for el in root.iter()]
+            assert 'cut-line' in classes
+            assert 'seam-line' in classes
+            assert classes.count('notch') == 2 * len(pattern['notches'])
+        finally:
+            if os.path.exists(filename):
+                os.remove(filename)
+    
+    def test_gores_sheet_uses_references(self):
+        """Аркуш з усіма gores: геометрія один раз у defs, по одному use на gore"""
+        pattern = generate_pattern_from_shape_profile('sphere', {'radius': 1.0}, 16)
+        
+        with tempfile.NamedTemporaryFile(suffix='.svg', delete=False) as f:
+            filename = f.name
+        
+        try:
+            export_gores_to_svg(pattern, filename)
+            root = ET.parse(filename).getroot()
+            assert len(root.findall(f'{SVG_NS}use')) == 16
+            assert len(list(root.iter(f'{SVG_NS}path'))) == 2  # розріз + шов, лише в defs
+        finally:
+            if os.path.exists(filename):
+                os.remove(filename)
+    
+    def test_bezier_tolerance(self):
+        """З tolerance_mm контури записуються кривими і файл стає меншим"""
+        pattern = generate_pattern_from_shape_profile('sphere', {'radius': 3.0}, 12)
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            exact = os.path.join(tmp, 'exact.svg')
+            fitted = os.path.join(tmp, 'fitted.svg')
+            export_pattern_to_svg(pattern, exact)
+            export_pattern_to_svg(pattern, fitted, tolerance_mm=0.2)
+            
+            root = ET.parse(fitted).getroot()
+            paths = list(root.iter(f'{SVG_NS}path'))
+            assert all('c' in path.get('d') for path in paths)
+            assert any('відхилення' in (el.text or '') for el in root.iter(f'{SVG_NS}text'))
+            assert os.path.getsize(fitted) < os.path.getsize(exact)
+    
+    def test_empty_pattern(self):
+        with pytest.raises(ValueError, match="не містить координат"):
+            export_gores_to_svg({'pattern_type': 'sphere_gore', 'points': []}, 'unused.svg')
@@ -0,0 +1,114 @@
+"""
+Тести для графіків залежності від висоти (balloon.gui.height_graph)
+"""
+
+import numpy as np
+import pytest
+
+pytest.importorskip('matplotlib')
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from balloon.gui.height_graph import HeightGraph, key_points, profile_arrays
+
+
+def make_profile(scale=1.0, points=11):
+    heights = np.arange(points) * 500
+    payload = scale * (20 - heights / 200)
+    return [
+        {'height': int(h), 'payload': float(p), 'lift': float(p + 5), 'net_lift_per_m3': 1.0 - h / 10000,
+         'required_volume': 10 + h / 1000}
+        for h, p in zip(heights, payload)
+    ]
+
+
+class BlitCountingCanvas(FigureCanvasAgg):
+    """Agg canvas, що рахує повні перемальовування та бліти"""
+
+    def __init__(self, figure):
+        super().__init__(figure)
+        self.draws = 0
+        self.blits = 0
+
+    def draw(self):
+        self.draws += 1
+        super().draw()
+
+    def draw_idle(self, *args, **kwargs):
+        self.draw()
+
+    def blit(self, bbox=None):
+        self.blits += 1
+
+
+@pytest.fixture
+def graph():
+    fig = Figure(figsize=(14, 10), dpi=50)
+    BlitCountingCanvas(fig)
+    return HeightGraph(fig)
+
+
+class TestProfileArrays:
+    """Тести для profile_arrays та key_points"""
+
+    def test_columns(self):
+        arrays = profile_arrays(make_profile())
+        assert arrays['height'].dtype == float
+        assert arrays['height'][-1] == 5000
+        np.testing.assert_allclose(arrays['lift'] - arrays['payload'], 5)
+
+    def test_key_points(self):
+        points = key_points(profile_arrays(make_profile()))
+        assert points['payload_max'] == pytest.approx(20)
+        assert points['payload_max_height'] == 0
+        assert points['zero_payload_height'] == 4000
+
+    def test_empty_profile(self):
+        points = key_points(profile_arrays([]))
+        assert points == {'payload_max': None, 'payload_max_height': None, 'zero_payload_height': None}
+
+
+class TestHeightGraph:
+    """Тести для HeightGraph"""
+
+    def test_update_reuses_lines(self, graph):
+        graph.update(make_profile())
+        lines = [list(ax.lines) for ax in graph.axes]
+
+        graph.update(make_profile(scale=3.0))
+        assert [list(ax.lines) for ax in graph.axes] == lines
+        np.testing.assert_allclose(graph.payload_line.get_ydata(), 3.0 * (20 - np.arange(11) * 2.5))
+        assert graph.axes[0].get_ylim()[1] >= 65
+        assert len(graph._annotations) == 2
+
+    def test_cursor_blits_without_full_redraw(self, graph):
+        canvas = graph.canvas
+        graph.update(make_profile())
+        draws = canvas.draws
+
+        graph.cursor.move_to(1320)
+        graph.cursor.move_to(2740)
+        assert canvas.draws == draws
+        assert canvas.blits == 2
+        assert graph.cursor.index == 5
+        assert graph.cursor.vlines[0].get_xdata()[0] == 2500
+        assert "Висота: 2500 м" in graph.cursor.readout.get_text()
+
+        # Та сама точка - без повторного бліта
+        graph.cursor.move_to(2600)
+        assert canvas.blits == 2
+
+    def test_cursor_hidden_on_update(self, graph):
+        graph.update(make_profile())
+        graph.cursor.move_to(1000)
+        graph.update(make_profile(points=5))
+
+        assert not graph.cursor.visible
+        assert not any(artist.get_visible() for artist in graph.cursor.artists)
+        graph.cursor.move_to(5000)
+        assert graph.cursor.index == 4
+
+    def test_twin_axes_share_cursor_line(self, graph):
+        # Чотири графіки - чотири вертикальні лінії (twinx без окремої)
+        assert len(graph.cursor.vlines) == 4
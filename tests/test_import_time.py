@@ -0,0 +1,93 @@
+"""
+Тести часу імпорту та відкладених залежностей (balloon.lazy_import)
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from balloon.lazy_import import LazyModule, is_loaded, lazy_import, module_available
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Бюджет часу імпорту balloon.model (мс); перевизначається змінною оточення
+IMPORT_BUDGET_MS = float(os.environ.get('BALLOON_IMPORT_BUDGET_MS', '500'))
+
+HEAVY_MODULES = ('scipy', 'pandas', 'plotly', 'matplotlib', 'reportlab', 'ezdxf', 'shapely', 'tkinter')
+
+
+def import_in_subprocess(statement: str):
+    """Імпорт у чистому процесі: (час у мс, завантажені важкі пакети)"""
+    code = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "elapsed = (time.perf_counter() - start) * 1000\n"
+        f"heavy = sorted(set({HEAVY_MODULES!r}) & {{name.split('.')[0] for name in sys.modules}})\n"
+        "print(elapsed)\n"
+        "print(','.join(heavy))\n"
+    )
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                            check=True, cwd=REPO_ROOT)
+    elapsed, heavy = output.stdout.splitlines()[-2:]
+    return float(elapsed), [name for name in heavy.split(',') if name]
+
+
+class TestLazyImport:
+    """Тести для lazy_import"""
+
+    def test_module_loaded_on_first_attribute(self):
+        module = LazyModule('json')
+        assert not is_loaded(module)
+        assert module.dumps({'a': 1}) == '{"a": 1}'
+        assert is_loaded(module)
+        assert 'dumps' in module.__dict__
+
+    def test_already_imported_module_returned(self):
+        assert lazy_import('os') is os
+
+    def test_missing_module(self):
+        module = lazy_import('balloon_missing_module_xyz')
+        assert not module_available('balloon_missing_module_xyz')
+        with pytest.raises(ImportError):
+            module.anything
+
+    def test_available_without_import(self):
+        assert module_available('numpy.linalg')
+
+
+class TestImportTime:
+    """Бюджет часу імпорту для бібліотечного використання"""
+
+    def test_model_import_is_light(self):
+        """import balloon.model не завантажує SciPy, графіку та експорт"""
+        _, heavy = import_in_subprocess("import balloon.model")
+        assert heavy == []
+
+    @pytest.mark.parametrize('statement', [
+        "import balloon.analysis",
+        "import balloon.patterns",
+        "import balloon.export",
+        "import balloon.batch",
+        "import balloon.gui.plotly_3d",
+    ])
+    def test_packages_defer_heavy_dependencies(self, statement):
+        _, heavy = import_in_subprocess(statement)
+        assert heavy == []
+
+    def test_model_import_budget(self):
+        elapsed = min(import_in_subprocess("import balloon.model")[0] for _ in range(3))
+        assert elapsed < IMPORT_BUDGET_MS, (
+            f"import balloon.model: {elapsed:.0f} мс > бюджет {IMPORT_BUDGET_MS:.0f} мс"
+        )
+
+    def test_scipy_used_on_demand(self):
+        """Меридіанна довжина з SciPy працює після відкладеного імпорту"""
+        from balloon.shapes import profile
+
+        if not profile.SCIPY_AVAILABLE:
+            pytest.skip("SciPy не встановлено")
+        sphere = profile.get_shape_profile('sphere', {'radius': 1.0})
+        assert sphere.get_total_meridian_length() == pytest.approx(3.14159, rel=1e-3)
@@ -0,0 +1,142 @@
+"""
+Тести для інструментування гарячих шляхів (balloon.instrument)
+"""
+
+import io
+import json
+import pstats
+
+import pytest
+
+from balloon import instrument
+from balloon.instrument import (
+    disable_instrumentation, dump_stats, enable_instrumentation, format_stats, get_stats,
+    percentile, profile, reset_stats, stage,
+)
+
+
+@pytest.fixture
+def enabled():
+    was_enabled = instrument.instrumentation_enabled()
+    reset_stats()
+    enable_instrumentation()
+    yield
+    if not was_enabled:
+        disable_instrumentation()
+    reset_stats()
+
+
+@instrument.instrument('test.square')
+def square(x):
+    return x * x
+
+
+@instrument.instrument('test.fail')
+def fail():
+    raise ValueError("помилка")
+
+
+class TestPercentile:
+    """Тести для percentile"""
+
+    def test_nearest_rank(self):
+        values = list(range(1, 101))
+        assert percentile(values, 50) == 50
+        assert percentile(values, 99) == 99
+        assert percentile(values, 100) == 100
+        assert percentile([7.0], 99) == 7.0
+        assert percentile([], 50) == 0.0
+
+
+class TestInstrument:
+    """Тести для @instrument та stage()"""
+
+    def test_disabled_records_nothing(self):
+        disable_instrumentation()
+        reset_stats()
+        assert square(3) == 9
+        with stage('test.block'):
+            pass
+        assert get_stats() == {}
+
+    def test_counts_and_latencies(self, enabled):
+        for i in range(10):
+            square(i)
+        stats = get_stats()['test.square']
+        assert stats['count'] == 10
+        assert stats['errors'] == 0
+        assert 0 < stats['p50'] <= stats['p99'] <= stats['max'] <= stats['total']
+
+    def test_errors_counted(self, enabled):
+        with pytest.raises(ValueError):
+            fail()
+        assert get_stats()['test.fail']['errors'] == 1
+
+    def test_stage_context(self, enabled):
+        with stage('test.block'):
+            square(2)
+        with pytest.raises(KeyError):
+            with stage('test.block'):
+                raise KeyError('x')
+        stats = get_stats()
+        assert stats['test.block']['count'] == 2
+        assert stats['test.block']['errors'] == 1
+        assert stats['test.square']['count'] == 1
+
+    def test_reset_between_calls(self, enabled):
+        square(1)
+        reset_stats()
+        square(2)
+        assert get_stats()['test.square']['count'] == 1
+
+    def test_memoized_model_keeps_cache_attributes(self, enabled):
+        from balloon.model.solve import calculate_balloon_state
+        assert calculate_balloon_state.cache_info()['maxsize'] > 0
+        calculate_balloon_state.cache_clear()
+        args = dict(gas_type='Гелій', gas_volume=10, material='TPU', thickness_m=35e-6, total_height=1000,
+                    ground_temp=15, inside_temp=100, shape_type='sphere')
+        calculate_balloon_state(**args)
+        calculate_balloon_state(**args)
+        # Влучання в кеш мемоізації не є етапом
+        assert get_stats()['model.balloon_state']['count'] == 1
+
+    def test_pattern_stages(self, enabled):
+        from balloon.patterns.profile_based import generate_pattern_from_shape_profile
+        generate_pattern_from_shape_profile('sphere', {'radius': 1.0}, num_segments=6)
+        stats = get_stats()
+        assert stats['patterns.from_profile']['count'] == 1
+        assert stats['patterns.gores']['count'] == 1
+        assert stats['profile.meridian_length']['count'] > 0
+        # Відсортовано за сумарним часом
+        totals = [s['total'] for s in stats.values()]
+        assert totals == sorted(totals, reverse=True)
+
+
+class TestReport:
+    """Тести для dump_stats, format_stats та profile"""
+
+    def test_dump_json(self, enabled, tmp_path):
+        square(4)
+        path = tmp_path / 'stats' / 'perf.json'
+        text = dump_stats(str(path))
+        data = json.loads(path.read_text(encoding='utf-8'))
+        assert data == json.loads(text)
+        assert data['enabled'] is True
+        assert data['stages']['test.square']['count'] == 1
+        assert 'balloon.model.solve.calculate_balloon_state' in data['memo']
+
+    def test_format(self, enabled):
+        assert format_stats().startswith("Немає вимірів")
+        square(5)
+        table = format_stats()
+        assert 'test.square' in table
+        assert 'p99' in table.splitlines()[0]
+
+    def test_profile(self, tmp_path):
+        path = tmp_path / 'run.prof'
+        out = io.StringIO()
+        with profile(str(path), limit=5, stream=out):
+            square(6)
+        assert 'function calls' in out.getvalue()
+        functions = {func[2] for func in pstats.Stats(str(path)).stats}
+        assert 'square' in functions
@@ -0,0 +1,236 @@
+"""
+Тести для асинхронних завдань експорту та розрахунків (balloon.jobs)
+"""
+
+import asyncio
+import os
+import threading
+
+import pytest
+
+from balloon.export_core import export_pattern_file
+from balloon.jobs import Job, JobCancelled, JobManager, export_design, main
+from balloon.model.solve import solve_volume_to_payload
+from balloon.patterns import generate_pattern
+
+SOLVE = {
+    'gas_type': 'Гелій', 'gas_volume': 10.0, 'material': 'TPU', 'thickness_um': 35.0,
+    'start_height': 0.0, 'work_height': 1000.0,
+}
+
+
+@pytest.fixture(scope='module')
+def pattern():
+    return generate_pattern('sphere', {'radius': 1.0}, num_segments=6)
+
+
+def run(coroutine):
+    return asyncio.run(asyncio.wait_for(coroutine, 60))
+
+
+class TestJobManager:
+    """Тести для JobManager та Job"""
+
+    def test_concurrent_exports_report_progress(self, pattern, tmp_path):
+        updates = []
+
+        async def scenario():
+            async with JobManager(on_progress=lambda job: updates.append((job.name, job.state, job.progress))) as jobs:
+                submitted = [jobs.submit_export(fmt, pattern, str(tmp_path / f"gores.{fmt}"))
+                             for fmt in ('pdf', 'dxf', 'svg')]
+                return submitted, await jobs.gather(*submitted)
+
+        submitted, paths = run(scenario())
+        assert paths == [str(tmp_path / f"gores.{fmt}") for fmt in ('pdf', 'dxf', 'svg')]
+        assert all(os.path.getsize(path) > 0 for path in paths)
+        assert all(job.state == Job.DONE and job.progress == 1.0 for job in submitted)
+        # PDF повідомляє прогрес посторінково
+        pdf_progress = [p for name, state, p in updates if name == 'export.pdf' and state == Job.RUNNING]
+        assert any(p is not None and 0 < p < 1 for p in pdf_progress)
+        assert ('export.svg', Job.DONE, 1.0) in updates
+
+    def test_cancel_running_job_removes_output(self, tmp_path):
+        started = threading.Event()
+        output = tmp_path / 'partial.dat'
+
+        def work(job):
+            output.write_text('partial')
+            started.set()
+            while True:
+                job.report(None, "крок")
+                job._cancel_event.wait(0.01)
+
+        async def scenario():
+            async with JobManager() as jobs:
+                job = jobs.submit('slow', work, outputs=[str(output)])
+                await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+                assert job.cancel()
+                with pytest.raises(JobCancelled):
+                    await job
+                return job, jobs.active()
+
+        job, active = run(scenario())
+        assert job.state == Job.CANCELLED
+        assert active == []
+        assert not output.exists()
+        assert not job.cancel()
+
+    def test_cancel_pending_job(self):
+        release = threading.Event()
+        calls = []
+
+        async def scenario():
+            async with JobManager(max_workers=1) as jobs:
+                blocker = jobs.submit_call('blocker', release.wait, 5)
+                pending = jobs.submit_call('pending', calls.append, 1)
+                assert pending.state == Job.PENDING
+                pending.cancel()
+                release.set()
+                results = await jobs.gather(blocker, pending, return_exceptions=True)
+                return pending, results
+
+        pending, results = run(scenario())
+        assert results[0] is True
+        assert isinstance(results[1], JobCancelled)
+        assert pending.state == Job.CANCELLED
+        assert calls == []
+
+    def test_failed_job_removes_output(self, tmp_path):
+        output = tmp_path / 'broken.dat'
+
+        def work(job):
+            output.write_text('partial')
+            raise RuntimeError("збій")
+
+        async def scenario():
+            async with JobManager() as jobs:
+                job = jobs.submit('broken', work, outputs=[str(output)])
+                with pytest.raises(RuntimeError, match="збій"):
+                    await job
+                return job
+
+        job = run(scenario())
+        assert job.state == Job.FAILED
+        assert 'збій' in job.message
+        assert not output.exists()
+
+    def test_failed_export_keeps_existing_file(self, pattern, tmp_path):
+        """Файл, якого завдання не торкнулося, не видаляється"""
+        output = tmp_path / 'pattern.pdf'
+        output.write_bytes(b'%PDF previous')
+
+        async def scenario():
+            async with JobManager() as jobs:
+                job = jobs.submit_export('pdf', pattern, str(output), bogus=1)
+                with pytest.raises(ValueError):
+                    await job
+                return job
+
+        assert run(scenario()).state == Job.FAILED
+        assert output.read_bytes() == b'%PDF previous'
+
+    def test_cancelled_pending_job_keeps_existing_file(self, tmp_path):
+        release = threading.Event()
+        output = tmp_path / 'kept.dat'
+        output.write_text('previous')
+
+        async def scenario():
+            async with JobManager(max_workers=1) as jobs:
+                blocker = jobs.submit_call('blocker', release.wait, 5)
+                pending = jobs.submit_call('pending', output.write_text, 'new', outputs=[str(output)])
+                pending.cancel()
+                release.set()
+                await jobs.gather(blocker, pending, return_exceptions=True)
+                return pending
+
+        assert run(scenario()).state == Job.CANCELLED
+        assert output.read_text() == 'previous'
+
+    def test_failed_job_removes_overwritten_file(self, tmp_path):
+        output = tmp_path / 'broken.dat'
+        output.write_text('previous')
+
+        def work(job):
+            output.write_text('partial output')
+            raise RuntimeError("збій")
+
+        async def scenario():
+            async with JobManager() as jobs:
+                with pytest.raises(RuntimeError):
+                    await jobs.submit('broken', work, outputs=[str(output)])
+
+        run(scenario())
+        assert not output.exists()
+
+    def test_cancelling_awaiter_cancels_job(self):
+        started = threading.Event()
+
+        def work(job):
+            started.set()
+            while True:
+                job.report(None)
+                job._cancel_event.wait(0.01)
+
+        async def scenario():
+            async with JobManager() as jobs:
+                job = jobs.submit('slow', work)
+                await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+                with pytest.raises(asyncio.TimeoutError):
+                    await asyncio.wait_for(job, 0.05)
+                return job
+
+        job = run(scenario())
+        assert job.cancelled
+        assert job.state == Job.CANCELLED
+
+    def test_sweep(self):
+        updates = []
+
+        async def scenario():
+            async with JobManager(on_progress=lambda job: updates.append(job.message)) as jobs:
+                fixed = {key: value for key, value in SOLVE.items() if key != 'gas_volume'}
+                return await jobs.submit_sweep(solve_volume_to_payload, 'gas_volume', [5.0, 10.0, 20.0], **fixed)
+
+        results = run(scenario())
+        payloads = [result['payload'] for result in results]
+        assert payloads == sorted(payloads)
+        assert payloads[1] == pytest.approx(solve_volume_to_payload(**SOLVE)['payload'])
+        assert 'gas_volume = 20.0' in updates
+
+    def test_unknown_report_format(self):
+        async def scenario():
+            async with JobManager() as jobs:
+                jobs.submit_report({}, {}, 'report.doc', fmt='doc')
+
+        with pytest.raises(ValueError):
+            run(scenario())
+
+
+class TestExportDesign:
+    """Тести для export_design, export_pattern_file та підкоманди export"""
+
+    def test_export_design_with_report(self, pattern, tmp_path):
+        results = solve_volume_to_payload(**SOLVE)
+        done = run(export_design(pattern, ['pdf', 'dxf', 'svg'], str(tmp_path), 'gores',
+                                 results=results, inputs=SOLVE))
+        assert set(done) == {'pdf', 'dxf', 'svg', 'report'}
+        assert done['report'] == str(tmp_path / 'gores_report.pdf')
+        assert all(os.path.getsize(path) > 0 for path in done.values())
+
+    def test_export_design_rejects_unknown_format(self, pattern, tmp_path):
+        with pytest.raises(ValueError, match='bmp'):
+            run(export_design(pattern, ['svg', 'bmp'], str(tmp_path)))
+        assert list(tmp_path.iterdir()) == []
+
+    def test_export_pattern_file_errors(self, pattern, tmp_path):
+        with pytest.raises(ValueError):
+            export_pattern_file(pattern, 'bmp', str(tmp_path / 'gores.bmp'))
+        with pytest.raises(ValueError):
+            export_pattern_file(pattern, 'svg', str(tmp_path / 'gores.svg'), colour='red')
+
+    def test_cli(self, tmp_path):
+        code = main(['sphere', '-p', 'radius=1.0', '--segments', '6', '--formats', 'svg,dxf',
+                     '-o', str(tmp_path), '--no-progress'])
+        assert code == 0
+        assert sorted(path.name for path in tmp_path.iterdir()) == ['pattern.dxf', 'pattern.svg']
+        assert main(['sphere', '--formats', 'bmp', '-o', str(tmp_path), '--no-progress']) == 2
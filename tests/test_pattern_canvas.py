@@ -0,0 +1,137 @@
+"""
+Тести для відображення викрійки на canvas (balloon.gui.pattern_canvas)
+"""
+
+import numpy as np
+import pytest
+
+from balloon.gui.pattern_canvas import OVERLAY_TAG, PatternRenderer, build_pattern_scene
+from balloon.patterns import generate_pattern_from_shape, generate_pattern_from_shape_profile
+
+
+class FakeCanvas:
+    """Замінник tk.Canvas: зберігає координати елементів і підтримує scale/move/coords"""
+
+    def __init__(self):
+        self.items = {}
+        self.created = 0
+
+    def _create(self, kind, coords, tags=(), **options):
+        self.created += 1
+        self.items[self.created] = {'kind': kind, 'coords': list(coords), 'tags': set(tags), 'options': options}
+        return self.created
+
+    def create_line(self, *coords, **options):
+        return self._create('line', coords, **options)
+
+    def create_text(self, *coords, **options):
+        return self._create('text', coords, **options)
+
+    def create_rectangle(self, *coords, **options):
+        return self._create('rectangle', coords, **options)
+
+    def _find(self, tag):
+        if tag == "all":
+            return list(self.items)
+        if isinstance(tag, int):
+            return [tag] if tag in self.items else []
+        return [i for i, item in self.items.items() if tag in item['tags']]
+
+    def delete(self, tag):
+        for item_id in self._find(tag):
+            del self.items[item_id]
+
+    def scale(self, tag, x0, y0, fx, fy):
+        for item_id in self._find(tag):
+            c = self.items[item_id]['coords']
+            self.items[item_id]['coords'] = [
+                x0 + (v - x0) * fx if i % 2 == 0 else y0 + (v - y0) * fy for i, v in enumerate(c)
+            ]
+
+    def move(self, tag, dx, dy):
+        for item_id in self._find(tag):
+            c = self.items[item_id]['coords']
+            self.items[item_id]['coords'] = [v + (dx if i % 2 == 0 else dy) for i, v in enumerate(c)]
+
+    def coords(self, item_id, *coords):
+        self.items[item_id]['coords'] = list(coords)
+
+    def tag_lower(self, tag):
+        pass
+
+    def snapshot(self, exclude_tag=None):
+        return sorted(
+            (item['kind'], item['options'].get('text', ''), tuple(np.round(item['coords'], 6)))
+            for item in self.items.values() if exclude_tag not in item['tags']
+        )
+
+
+PATTERNS = {
+    'sphere': lambda: generate_pattern_from_shape_profile('sphere', {'radius': 2.0}, 32, 10),
+    'pear': lambda: generate_pattern_from_shape_profile(
+        'pear', {'pear_height': 3.0, 'pear_top_radius': 1.2, 'pear_bottom_radius': 0.6}, 12, 10),
+    'cigar': lambda: generate_pattern_from_shape_profile('cigar', {'cigar_length': 5.0, 'cigar_radius': 1.0}, 12, 10),
+    'pillow': lambda: generate_pattern_from_shape('pillow', {'pillow_len': 3.0, 'pillow_wid': 2.0}, 12, 10),
+}
+
+
+@pytest.fixture(params=sorted(PATTERNS))
+def pattern(request):
+    return PATTERNS[request.param]()
+
+
+class TestPatternScene:
+    """Тести для build_pattern_scene"""
+
+    @pytest.mark.parametrize('shape', ['sphere', 'pear', 'cigar'])
+    def test_gore_outline_is_single_closed_line(self, shape):
+        pattern = PATTERNS[shape]()
+        scene = build_pattern_scene(pattern)
+        outline = scene.items[0].coords
+        points = np.asarray(pattern['points'])
+
+        assert len(outline) == 2 * len(points) + 1
+        np.testing.assert_allclose(outline[0], outline[-1])
+        np.testing.assert_allclose(outline[len(points):2 * len(points)], points[::-1] * (-1, 1))
+
+    def test_empty_pattern(self):
+        assert build_pattern_scene({'pattern_type': 'sphere_gore', 'points': []}) is None
+        assert build_pattern_scene({'pattern_type': 'unknown'}) is None
+
+
+class TestPatternRenderer:
+    """Тести для PatternRenderer"""
+
+    def test_outline_drawn_as_one_item(self):
+        canvas = FakeCanvas()
+        pattern = PATTERNS['sphere']()
+        PatternRenderer(canvas).render(pattern, 400, 500)
+
+        outlines = [item for item in canvas.items.values() if item['options'].get('fill') == "#4a90e2"]
+        assert len(outlines) == 1
+        assert len(outlines[0]['coords']) == 2 * (2 * len(pattern['points']) + 1)
+
+    def test_resize_matches_full_redraw(self, pattern):
+        resized = FakeCanvas()
+        renderer = PatternRenderer(resized)
+        renderer.render(pattern, 400, 500)
+        scene_ids = set(resized.items) - set(resized._find(OVERLAY_TAG))
+
+        for size in [(640, 480), (300, 900), (800, 600)]:
+            renderer.render(pattern, *size)
+        # Перемальовується лише оверлей
+        assert set(resized.items) - set(resized._find(OVERLAY_TAG)) == scene_ids
+
+        fresh = FakeCanvas()
+        PatternRenderer(fresh).render(pattern, 800, 600)
+        assert resized.snapshot() == fresh.snapshot()
+
+    def test_new_pattern_redraws(self):
+        canvas = FakeCanvas()
+        renderer = PatternRenderer(canvas)
+        renderer.render(PATTERNS['sphere'](), 400, 500)
+        renderer.render(PATTERNS['cigar'](), 400, 500)
+
+        fresh = FakeCanvas()
+        PatternRenderer(fresh).render(PATTERNS['cigar'](), 400, 500)
+        assert canvas.snapshot() == fresh.snapshot()
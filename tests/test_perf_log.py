@@ -0,0 +1,118 @@
+"""
+Тести для структурованого логування продуктивності (balloon.perf_log)
+"""
+
+import json
+import logging
+
+import pytest
+
+from balloon import instrument, perf_log
+from balloon.perf_log import NULL_SPAN, PerfRecord, disable_perf_log, enable_perf_log, event, span
+
+
+@pytest.fixture
+def jsonl(tmp_path):
+    path = tmp_path / 'logs' / 'perf.jsonl'
+    enable_perf_log(str(path))
+    perf_log._counters.clear()
+
+    def read():
+        perf_log._handler.flush()
+        return [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+
+    yield read
+    disable_perf_log()
+
+
+class TestDisabled:
+    """Тести вимкненого логування"""
+
+    def test_null_span_and_lazy_fields(self):
+        disable_perf_log()
+        instrument.disable_instrumentation()
+        calls = []
+
+        perf = span('test.span', inputs=lambda: calls.append(1))
+        assert perf is NULL_SPAN
+        perf.mark('stage')
+        perf['x'] = 1
+        perf.finish(status='ok')
+        event('test.event', inputs=lambda: calls.append(1))
+        assert calls == []
+
+    def test_span_feeds_instrumentation(self):
+        disable_perf_log()
+        instrument.reset_stats()
+        instrument.enable_instrumentation()
+        try:
+            with span('test.instrumented'):
+                pass
+            assert instrument.get_stats()['test.instrumented']['count'] == 1
+        finally:
+            instrument.disable_instrumentation()
+            instrument.reset_stats()
+
+
+class TestJsonl:
+    """Тести запису JSONL"""
+
+    def test_span_record(self, jsonl):
+        with span('test.span', shape='pear', params=lambda: {'pear_height': 3.0}) as perf:
+            perf.mark('validate')
+            perf['rows'] = 2
+
+        (record,) = jsonl()
+        assert record['event'] == 'test.span'
+        assert record['shape'] == 'pear'
+        assert record['params'] == {'pear_height': 3.0}
+        assert record['rows'] == 2
+        assert record['duration_ms'] >= record['validate_ms'] >= 0
+        assert 'ts' in record
+
+    def test_error_status(self, jsonl):
+        with pytest.raises(RuntimeError):
+            with span('test.fail'):
+                raise RuntimeError("збій")
+        (record,) = jsonl()
+        assert record['status'] == 'error'
+        assert record['error'] == "RuntimeError: збій"
+
+    def test_finish_once(self, jsonl):
+        perf = span('test.once')
+        perf.finish(status='ok')
+        perf.finish(status='error')
+        assert [r['status'] for r in jsonl()] == ['ok']
+
+    def test_sampling(self, jsonl):
+        for i in range(25):
+            event('test.frequent', every=10, index=i)
+        records = jsonl()
+        assert [r['index'] for r in records] == [0, 10, 20]
+        assert all(r['sampled'] == 10 for r in records)
+
+    def test_not_propagated(self, jsonl):
+        # Записи JSONL не дублюються у звичайний лог
+        event('test.quiet')
+        assert perf_log.logger.propagate is False
+        assert len(jsonl()) == 1
+
+    def test_disable_restores_logger(self, jsonl):
+        disable_perf_log()
+        assert perf_log.logger.propagate is True
+        assert not [h for h in perf_log.logger.handlers if isinstance(h, logging.FileHandler)]
+
+
+class TestTextLog:
+    """Тести текстового режиму (звичайний лог)"""
+
+    def test_lazy_message(self, caplog):
+        enable_perf_log()
+        try:
+            with caplog.at_level(logging.INFO, logger=perf_log.LOGGER_NAME):
+                event('test.text', shape='sphere', volume=lambda: 10.5)
+        finally:
+            disable_perf_log()
+        (record,) = [r for r in caplog.records if r.name == perf_log.LOGGER_NAME]
+        assert isinstance(record.msg, PerfRecord)
+        assert record.getMessage() == "[perf] test.text shape=sphere volume=10.5"
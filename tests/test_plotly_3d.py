@@ -0,0 +1,166 @@
+"""
+Тести для кешування та компактного HTML 3D моделей (balloon.gui.plotly_3d)
+"""
+
+import numpy as np
+import pytest
+
+pytest.importorskip('plotly')
+
+from balloon.gui import plotly_3d
+from balloon.gui.plotly_3d import (
+    compact_mesh, create_3d_plotly, gore_overlay_from_pattern, gore_seam_lines, model_html_path,
+    notch_points, open_3d_model, seam_allowance_lines, write_plotly_html,
+)
+from balloon.patterns import generate_pattern_from_shape_profile
+from balloon.shapes.profile import get_shape_profile
+
+PEAR = {'pear_height': 3.0, 'pear_top_radius': 1.2, 'pear_bottom_radius': 0.6}
+
+
+@pytest.fixture
+def opened(tmp_path, monkeypatch):
+    """Каталог HTML у tmp_path; повертає список відкритих у браузері URI"""
+    uris = []
+    monkeypatch.setenv(plotly_3d.HTML_DIR_ENV, str(tmp_path))
+    monkeypatch.setattr(plotly_3d.webbrowser, 'open', uris.append)
+    return uris
+
+
+class TestFigureCache:
+    """Тести кешу фігур"""
+
+    def test_same_parameters_build_once(self, monkeypatch):
+        builds = []
+        build = plotly_3d._build_figure
+        monkeypatch.setattr(plotly_3d, '_build_figure', lambda *args: builds.append(args) or build(*args))
+        params = dict(PEAR, pear_height=3.25)
+        results = {'required_volume': 10.0, 'surface_area': 20.0}
+        first = create_3d_plotly('pear', params, results)
+        # Інші ключі результатів на фігуру не впливають
+        second = create_3d_plotly('Pear ', dict(params), dict(results, payload=1.0))
+        assert len(builds) == 1
+        assert second is not first
+        assert second.to_dict() == first.to_dict()
+
+    def test_returned_figure_is_independent(self):
+        """Зміни повернутої фігури не потрапляють у кеш"""
+        fig = create_3d_plotly('sphere', {'radius': 1.1})
+        traces = len(fig.data)
+        fig.update_layout(title_text='X')
+        fig.add_scatter3d(x=[0], y=[0], z=[0])
+
+        again = create_3d_plotly('sphere', {'radius': 1.1})
+        assert again.layout.title.text != 'X'
+        assert len(again.data) == traces
+
+    def test_changed_parameters_build_new_figure(self):
+        first = create_3d_plotly('sphere', {'radius': 1.0})
+        assert create_3d_plotly('sphere', {'radius': 1.5}).to_dict() != first.to_dict()
+        assert create_3d_plotly('sphere', {'radius': 1.0}, num_segments=80).to_dict() != first.to_dict()
+
+    def test_mesh_is_compact(self):
+        fig = plotly_3d._build_figure('cigar', {'cigar_length': 5.0, 'cigar_radius': 1.0}, None, 50)
+        surface = fig.data[0]
+        assert np.asarray(surface.x).dtype == np.float32
+
+    def test_compact_mesh_rounds(self):
+        values = compact_mesh(np.array([0.123456789, 1.0]))
+        assert values.dtype == np.float32
+        np.testing.assert_allclose(values, [0.1235, 1.0], rtol=1e-6)
+
+
+class TestHtmlOutput:
+    """Тести запису HTML"""
+
+    def test_shared_plotlyjs(self, tmp_path):
+        fig = create_3d_plotly('sphere', {'radius': 1.0})
+        first = write_plotly_html(fig, tmp_path / 'a.html')
+        second = write_plotly_html(fig, tmp_path / 'b.html')
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ['a.html', 'b.html', 'plotly.min.js']
+        html = first.read_text(encoding='utf-8')
+        assert 'src="plotly.min.js"' in html
+        assert second.stat().st_size < 1_000_000 < (tmp_path / 'plotly.min.js').stat().st_size
+
+    def test_open_reuses_written_html(self, opened, monkeypatch):
+        path = open_3d_model('sphere', {'radius': 2.0})
+        assert path.exists()
+        assert opened == [path.resolve().as_uri()]
+
+        def fail(*args, **kwargs):
+            raise AssertionError("Фігура не повинна будуватись повторно")
+
+        monkeypatch.setattr(plotly_3d, 'create_3d_plotly', fail)
+        assert open_3d_model('sphere', {'radius': 2.0}) == path
+        assert len(opened) == 2
+
+    def test_html_path_depends_on_parameters(self, opened):
+        base = model_html_path('sphere', {'radius': 1.0})
+        assert model_html_path('sphere', {'radius': 1}) == base
+        assert model_html_path('sphere', {'radius': 1.1}) != base
+        assert model_html_path('sphere', {'radius': 1.0}, {'required_volume': 4.2, 'surface_area': 12.6}) != base
+
+    def test_cache_pruned(self, tmp_path, opened, monkeypatch):
+        monkeypatch.setattr(plotly_3d, 'MAX_CACHED_HTML', 2)
+        for radius in (1.0, 1.1, 1.2):
+            open_3d_model('sphere', {'radius': radius})
+        assert len(list(tmp_path.glob('model-*.html'))) == 2
+        assert (tmp_path / 'plotly.min.js').exists()
+
+
+@pytest.fixture
+def sphere_mesh():
+    return get_shape_profile('sphere', {'radius': 1.0}).generate_mesh(num_theta=60, num_z=60)
+
+
+class TestGoreOverlay:
+    """Тести для overlay сегментів"""
+
+    def test_seam_lines_nan_separated(self, sphere_mesh):
+        x, y, z = sphere_mesh
+        xs, ys, zs = gore_seam_lines(x, y, z, 8)
+        n_z = z.shape[1]
+
+        assert xs.shape == (8 * (n_z + 1),)
+        assert np.isnan(xs).sum() == 8
+        lines = xs.reshape(8, n_z + 1)[:, :-1], ys.reshape(8, n_z + 1)[:, :-1]
+        # Шов 2 з 8 - на куті pi/2
+        np.testing.assert_allclose(lines[0][2], 0.0, atol=1e-12)
+        np.testing.assert_allclose(lines[1][2], np.hypot(x[0], y[0]))
+
+    def test_seam_allowance_shift(self, sphere_mesh):
+        x, y, z = sphere_mesh
+        xs, ys, _ = seam_allowance_lines(x, y, z, 12, 0.01)
+        seams = np.tile(2 * np.pi * np.arange(12) / 12, 2)[:, None]
+        angles = np.arctan2(ys, xs).reshape(24, -1)[:, :-1]
+        shift = np.angle(np.exp(1j * (angles - seams)))
+        equator = np.argmax(np.hypot(x[0], y[0]))
+        assert shift[0, equator] == pytest.approx(-0.01, rel=1e-3)
+        assert shift[12, equator] == pytest.approx(0.01, rel=1e-3)
+        # Біля полюсів зсув обмежено чвертю кута сегмента (на самих полюсах r = 0)
+        off_pole = np.hypot(x[0], y[0]) > 1e-9
+        assert np.abs(shift[:, off_pole]).max() <= np.pi / 24 + 1e-9
+
+    def test_notches_on_meridian(self, sphere_mesh):
+        x, y, z = sphere_mesh
+        xs, ys, zs = notch_points(x, y, z, 4, [np.pi / 2])
+        # Середина меридіана одиничної сфери - екватор (на хорді між вузлами сітки)
+        np.testing.assert_allclose(np.hypot(xs, ys), 1.0, atol=0.02)
+        np.testing.assert_allclose(zs, 0.0, atol=0.01)
+
+    def test_trace_count_independent_of_gores(self):
+        params = {'pear_height': 3.0, 'pear_top_radius': 1.2, 'pear_bottom_radius': 0.6}
+        counts = []
+        for gores in (8, 32):
+            pattern = generate_pattern_from_shape_profile('pear', params, gores, 10)
+            overlay = gore_overlay_from_pattern(pattern)
+            assert overlay['num_gores'] == gores
+            fig = create_3d_plotly('pear', params, overlay=overlay)
+            counts.append(len(fig.data))
+        assert counts == [4, 4]
+
+    def test_sphere_overlay_only_with_pattern(self):
+        assert len(create_3d_plotly('sphere', {'radius': 1.3}).data) == 1
+        overlay = {'num_gores': 12, 'notches': [], 'seam_allowance_m': 0.0}
+        assert len(create_3d_plotly('sphere', {'radius': 1.3}, overlay=overlay).data) == 2
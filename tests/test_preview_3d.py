@@ -0,0 +1,129 @@
+"""
+Тести для 3D прев'ю на matplotlib (balloon.gui.preview_3d)
+"""
+
+import numpy as np
+import pytest
+
+pytest.importorskip('matplotlib')
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from balloon.gui.preview_3d import (
+    PreviewRenderer, preview_limits, preview_mesh, shade_faces, style_axes_3d, surface_polygons,
+)
+
+SPHERE = {'radius': 2.0}
+PEAR = {'pear_height': 3.0, 'pear_top_radius': 1.2, 'pear_bottom_radius': 0.6}
+
+
+class CountingCanvas(FigureCanvasAgg):
+    """Agg canvas, що рахує запити на перемальовування"""
+
+    def __init__(self, figure):
+        super().__init__(figure)
+        self.idle_draws = 0
+
+    def draw_idle(self, *args, **kwargs):
+        self.idle_draws += 1
+
+
+@pytest.fixture
+def preview():
+    fig = Figure(figsize=(4, 3), dpi=80)
+    canvas = CountingCanvas(fig)
+    ax = fig.add_subplot(111, projection='3d')
+    style_axes_3d(ax)
+    return PreviewRenderer(ax, canvas), canvas
+
+
+def _projected(surface, canvas):
+    canvas.draw()
+    return np.concatenate([path.vertices for path in surface.get_paths()])
+
+
+class TestPreviewRenderer:
+    """Тести для PreviewRenderer"""
+
+    def test_surface_updated_in_place(self, preview):
+        renderer, canvas = preview
+        renderer.render('pear', PEAR)
+        surface = renderer.surface
+        before = _projected(surface, canvas)
+
+        renderer.render('pear', dict(PEAR, pear_bottom_radius=0.9))
+        assert renderer.surface is surface
+        assert list(renderer.ax.collections) == [surface]
+        assert not np.allclose(_projected(surface, canvas), before)
+
+    def test_other_shape_reuses_surface_of_same_grid(self, preview):
+        renderer, canvas = preview
+        renderer.render('sphere', SPHERE)
+        surface = renderer.surface
+        renderer.render('pear', PEAR)
+
+        assert preview_mesh('sphere', SPHERE)[0].shape == preview_mesh('pear', PEAR)[0].shape
+        assert renderer.surface is surface
+        assert renderer.ax.get_zlim() == pytest.approx(preview_limits('pear', PEAR)[2])
+
+    def test_unchanged_parameters_skip_redraw(self, preview):
+        renderer, canvas = preview
+        assert renderer.render('pear', PEAR)
+        assert not renderer.render('pear', dict(reversed(list(PEAR.items()))))
+        assert canvas.idle_draws == 1
+
+    def test_resolution_change_swaps_surfaces(self, preview):
+        renderer, canvas = preview
+        renderer.render('sphere', SPHERE)
+        full = renderer.surface
+        renderer.render('sphere', SPHERE, resolution=8)
+        draft = renderer.surface
+
+        assert draft is not full
+        assert draft.get_visible() and not full.get_visible()
+        renderer.render('sphere', {'radius': 2.5})
+        assert renderer.surface is full
+        assert full.get_visible() and not draft.get_visible()
+        assert len(renderer.ax.collections) == 2
+
+    def test_clear_removes_surfaces(self, preview):
+        renderer, canvas = preview
+        renderer.render('sphere', SPHERE)
+        renderer.clear()
+        assert list(renderer.ax.collections) == []
+        assert renderer.render('sphere', SPHERE)
+
+
+class TestPreviewMesh:
+    """Тести для сітки та затінення прев'ю"""
+
+    def test_shading_matches_plot_surface(self):
+        x, y, z = preview_mesh('pear', PEAR)
+        fig = Figure()
+        ax = fig.add_subplot(111, projection='3d')
+        reference = ax.plot_surface(x, y, z, color='#4a90e2', rstride=1, cstride=1)
+
+        colors = shade_faces(surface_polygons(x, y, z), '#4a90e2')
+        # get_facecolor() повертає грані, відсортовані за глибиною
+        expected = reference.get_facecolor()
+        assert colors.shape == expected.shape
+        np.testing.assert_allclose(np.sort(colors, axis=0), np.sort(expected, axis=0), atol=1e-6)
+
+    def test_pillow_thickness_parameter(self):
+        x, y, z = preview_mesh('pillow', {'pillow_len': 4.0, 'pillow_wid': 2.0, 'thickness': 0.5})
+        assert x.max() == pytest.approx(4.0, abs=0.01)
+        assert z.max() == pytest.approx(0.5)
+        assert z.min() == pytest.approx(0.0)
+
+    def test_unknown_shape(self):
+        with pytest.raises(ValueError):
+            preview_mesh('torus', {})
+
+    @pytest.mark.parametrize('shape,params', [('pear', PEAR), ('pillow', {'pillow_len': 3.0, 'pillow_wid': 2.0})])
+    def test_cached_arrays_are_read_only(self, shape, params):
+        """Кешовані масиви спільні для всіх викликів, тож зміна на місці - помилка"""
+        x, y, z = preview_mesh(shape, params)
+        with pytest.raises(ValueError):
+            z += 1.0
+        assert preview_mesh(shape, params)[2].max() == pytest.approx(z.max())
@@ -0,0 +1,168 @@
+"""
+Тести для колонкового сховища результатів (balloon.export.result_store)
+"""
+
+import os
+import tempfile
+
+import pytest
+
+from balloon.analysis.height_profile import calculate_height_profile
+from balloon.export.result_store import flatten_record, result_rows
+from balloon.model.solve import calculate_balloon_state
+
+INPUTS = {
+    'gas_type': 'Гелій', 'material': 'TPU', 'thickness_um': 35, 'gas_volume': 10.0,
+    'ground_temp': 15, 'inside_temp': 100, 'shape_type': 'sphere', 'shape_params': {},
+}
+
+
+@pytest.fixture
+def store_dir():
+    with tempfile.TemporaryDirectory() as tmp:
+        yield tmp
+
+
+@pytest.fixture
+def arrow():
+    return pytest.importorskip('pyarrow')
+
+
+class TestFlattenRecord:
+    """Тести для розгортання результатів у рядки"""
+    
+    def test_nested_and_types(self):
+        row = flatten_record({'a': 1, 'b': {'c': 2.5, 'd': 'x'}, 'ok': True, 'skip': [1, 2]})
+        assert row == {'a': 1.0, 'b.c': 2.5, 'b.d': 'x', 'ok': True}
+        assert isinstance(row['a'], float)
+    
+    def test_solver_state(self):
+        state = calculate_balloon_state(
+            gas_type='Гелій', gas_volume=10.0, material='TPU', thickness_m=35e-6, total_height=1000,
+            ground_temp=15, inside_temp=15, shape_type='sphere'
+        )
+        rows = result_rows(INPUTS, [state])
+        assert rows[0]['input.gas_volume'] == 10.0
+        assert rows[0]['input.material'] == 'TPU'
+        assert any(key.startswith('mass_budget.') for key in rows[0])
+        assert rows[0]['payload'] == pytest.approx(state['payload'])
+
+
+class TestResultStore:
+    """Тести для запису та читання сховища"""
+    
+    @pytest.mark.parametrize('fmt', ['parquet', 'feather'])
+    def test_append_chunks_and_read(self, arrow, store_dir, fmt):
+        """Чанки дописуються, метадані містять версію моделі та припущення"""
+        from balloon.export.result_store import (
+            ResultStoreWriter, iter_result_batches, read_results, read_store_metadata
+        )
+        if fmt == 'parquet':
+            pytest.importorskip('pyarrow.parquet')
+        path = os.path.join(store_dir, f'sweep.{fmt}')
+        
+        with ResultStoreWriter(path, kind='sweep', fmt=fmt, metadata={'note': {'step': 0.5}}) as store:
+            for volume in (5.0, 10.0, 20.0):
+                profile = calculate_height_profile('Гелій', 'TPU', 35, volume, max_height=5000)
+                store.append(result_rows(dict(INPUTS, gas_volume=volume), profile))
+        
+        table = read_results(path, columns=['input.gas_volume', 'height', 'lift'])
+        assert table.num_rows == 33
+        assert table.schema.field('height').type == arrow.float64()
+        assert sorted(set(table['input.gas_volume'].to_pylist())) == [5.0, 10.0, 20.0]
+        
+        metadata = read_store_metadata(path)
+        assert metadata['kind'] == 'sweep'
+        assert metadata['num_rows'] == 33
+        assert metadata['note'] == '{"step": 0.5}'
+        assert 'atmospheric' in metadata['assumptions']
+        
+        batches = list(iter_result_batches(path, columns=['lift'], batch_size=10))
+        assert sum(batch.num_rows for batch in batches) == 33
+        assert batches[0].schema.names == ['lift']
+    
+    @pytest.mark.parametrize('fmt', ['parquet', 'feather'])
+    def test_missing_and_new_columns(self, arrow, store_dir, fmt):
+        """Відсутні стовпці - null, нові стовпці дописуються (з null у попередніх рядках)"""
+        from balloon.export.result_store import ResultStoreWriter, read_results, read_store_metadata
+        if fmt == 'parquet':
+            pytest.importorskip('pyarrow.parquet')
+        path = os.path.join(store_dir, f'rows.{fmt}')
+        
+        with ResultStoreWriter(path, kind='batch', fmt=fmt) as store:
+            store.append([{'a': 1.0, 'b': 'x'}])
+            store.append([{'a': 2.0}])
+            store.append([{'a': 3.0, 'c': 1.0}])
+        
+        table = read_results(path)
+        assert table['b'].to_pylist() == ['x', None, None]
+        assert table['c'].to_pylist() == [None, None, 1.0]
+        assert read_store_metadata(path)['kind'] == 'batch'
+    
+    @pytest.mark.parametrize('fmt', ['parquet', 'feather'])
+    def test_null_column_promoted(self, arrow, store_dir, fmt):
+        """Стовпець лише з None у першому чанку отримує тип пізніших значень"""
+        from balloon.export.result_store import ResultStoreWriter, read_results
+        if fmt == 'parquet':
+            pytest.importorskip('pyarrow.parquet')
+        path = os.path.join(store_dir, f'rows.{fmt}')
+        
+        with ResultStoreWriter(path, fmt=fmt) as store:
+            store.append({'a': [1.0, 2.0], 'error': [None, None]})
+            store.append({'a': [3.0], 'error': ['збій']})
+            store.append({'a': [4.0], 'error': [None]})
+        
+        table = read_results(path)
+        assert table.schema.field('error').type == arrow.string()
+        assert table['error'].to_pylist() == [None, None, 'збій', None]
+        assert table['a'].to_pylist() == [1.0, 2.0, 3.0, 4.0]
+    
+    def test_explicit_schema(self, arrow, store_dir):
+        """Явна схема: типи стовпців не залежать від першого чанку, файл створюється одразу"""
+        from balloon.export.result_store import ResultStoreWriter, read_results
+        path = os.path.join(store_dir, 'rows.feather')
+        schema = arrow.schema([('a', arrow.float64()), ('error', arrow.string()), ('n', arrow.float64())])
+        
+        with ResultStoreWriter(path, schema=schema) as store:
+            assert os.path.exists(path)
+            store.append([{'a': 1, 'error': None}])
+            store.append([{'a': 2.5, 'error': 'збій', 'n': 3}])
+            with pytest.raises(ValueError, match="'a'"):
+                store.append([{'a': 'не число'}])
+        
+        table = read_results(path)
+        assert table.schema.names == ['a', 'error', 'n']
+        assert table.schema.field('a').type == arrow.float64()
+        assert table['error'].to_pylist() == [None, 'збій']
+        assert table['n'].to_pylist() == [None, 3.0]
+    
+    @pytest.mark.parametrize('fmt', ['parquet', 'feather'])
+    @pytest.mark.parametrize('failing', ['_open', '_conform'])
+    def test_failed_rewrite_keeps_rows(self, arrow, store_dir, fmt, failing):
+        """Збій під час перезапису зі зміною схеми не втрачає вже записані рядки"""
+        from balloon.export.result_store import ResultStoreWriter, read_results
+        if fmt == 'parquet':
+            pytest.importorskip('pyarrow.parquet')
+        path = os.path.join(store_dir, f'rows.{fmt}')
+
+        def fail(*args):
+            raise OSError("No space left on device")
+
+        with ResultStoreWriter(path, fmt=fmt) as store:
+            store.append([{'a': 1.0}, {'a': 2.0}])
+            setattr(store, failing, fail)
+            with pytest.raises(OSError):
+                store.append([{'a': 3.0, 'b': 'x'}])
+            with pytest.raises(ValueError, match="закрито"):
+                store.append([{'a': 4.0}])
+
+        assert read_results(path)['a'].to_pylist() == [1.0, 2.0]
+        assert os.listdir(store_dir) == [f'rows.{fmt}']
+
+    def test_not_a_store(self, arrow, store_dir):
+        from balloon.export.result_store import read_results
+        path = os.path.join(store_dir, 'bad.parquet')
+        with open(path, 'wb') as fh:
+            fh.write(b'not a table')
+        with pytest.raises(ValueError, match="не є сховищем"):
+            read_results(path)
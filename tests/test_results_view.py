@@ -0,0 +1,154 @@
+"""
+Тести для моделі представлення результатів (balloon.gui.results_view)
+"""
+
+import pytest
+
+from balloon.gui.results_view import (
+    STATUS_ERROR, STATUS_OK, STATUS_WARNING,
+    ResultRow, ResultsTable, build_results_view, diff_rows,
+)
+from balloon.model.solve import solve_volume_to_payload
+
+
+class FakeTree:
+    """Замінник ttk.Treeview: впорядкований список iid та лічильник операцій"""
+
+    def __init__(self):
+        self.order = []
+        self.items = {}
+        self.ops = []
+
+    def tag_configure(self, tag, **options):
+        pass
+
+    def insert(self, parent, index, iid, values, tags):
+        self.order.insert(index, iid)
+        self.items[iid] = (values, tags)
+        self.ops.append(('insert', iid))
+
+    def item(self, iid, values, tags):
+        self.items[iid] = (values, tags)
+        self.ops.append(('item', iid))
+
+    def delete(self, *iids):
+        for iid in iids:
+            self.order.remove(iid)
+            del self.items[iid]
+            self.ops.append(('delete', iid))
+
+
+@pytest.fixture
+def helium_results():
+    return solve_volume_to_payload(
+        gas_type="Гелій", gas_volume=10.0, material="TPU", thickness_um=100,
+        start_height=0.0, work_height=1000.0, ground_temp=15.0, inside_temp=15.0,
+        duration=24.0, perm_mult=1.0, shape_type="sphere", shape_params={},
+        extra_mass=0.0, seam_factor=1.0,
+    )
+
+
+def row_keys(view):
+    return [row.key for row in view.rows]
+
+
+class TestBuildResultsView:
+    """Тести для build_results_view"""
+
+    def test_rows_have_unique_keys(self, helium_results):
+        view = build_results_view(helium_results, "volume", "Гелій")
+        keys = row_keys(view)
+        assert len(keys) == len(set(keys))
+        assert 'gas_volume' in keys
+        assert 'section:gas_loss' in keys
+        assert 'section:safety' not in keys
+
+    def test_payload_mode_has_no_gas_volume_row(self, helium_results):
+        view = build_results_view(helium_results, "payload", "Гелій")
+        assert 'gas_volume' not in row_keys(view)
+
+    def test_values_formatted(self, helium_results):
+        view = build_results_view(helium_results, "volume", "Гелій", shape_display="Сфера")
+        rows = {row.key: row for row in view.rows}
+        assert rows['shape_type'].value == "Сфера"
+        assert rows['required_volume'].value == f"{helium_results['required_volume']:.2f}"
+        assert rows['rho_air'].unit == "кг/м³"
+        assert rows['section:main'].bold
+
+    def test_status(self, helium_results):
+        assert build_results_view(helium_results, "volume", "Гелій").status == STATUS_OK
+
+        negative = dict(helium_results, payload=-1.0, payload_end=-2.0)
+        view = build_results_view(negative, "volume", "Гелій")
+        assert view.status == STATUS_ERROR
+        assert len(view.errors) == 2
+        assert {row.style for row in view.rows if row.key.startswith('error:')} == {'error'}
+
+        light = dict(helium_results, payload=0.05, payload_end=0.01)
+        assert build_results_view(light, "volume", "Гелій").status == STATUS_WARNING
+
+
+class TestDiffRows:
+    """Тести для diff_rows"""
+
+    def test_identical(self):
+        rows = [ResultRow('a', "A", "1"), ResultRow('b', "B", "2")]
+        assert diff_rows(rows, list(rows)).empty
+
+    def test_changed_added_removed(self):
+        old = [ResultRow('a', "A", "1"), ResultRow('b', "B", "2"), ResultRow('c', "C", "3")]
+        new = [ResultRow('a', "A", "1"), ResultRow('x', "X", "9"), ResultRow('c', "C", "4")]
+        diff = diff_rows(old, new)
+        assert diff.removed == ['b']
+        assert diff.added == [(1, new[1])]
+        assert diff.changed == [new[2]]
+
+    def test_reorder_reinserts_common_rows(self):
+        old = [ResultRow('a', "A"), ResultRow('b', "B")]
+        new = [ResultRow('b', "B"), ResultRow('a', "A")]
+        diff = diff_rows(old, new)
+        assert diff.removed == ['a', 'b']
+        assert [index for index, _ in diff.added] == [0, 1]
+
+
+class TestResultsTable:
+    """Тести для ResultsTable"""
+
+    def test_update_touches_only_changed_rows(self, helium_results):
+        tree = FakeTree()
+        table = ResultsTable(tree)
+        table.update(build_results_view(helium_results, "volume", "Гелій").rows)
+        tree.ops.clear()
+
+        changed = dict(helium_results, mass_shell=helium_results['mass_shell'] + 1.0)
+        table.update(build_results_view(changed, "volume", "Гелій").rows)
+        assert tree.ops == [('item', 'mass_shell')]
+
+        tree.ops.clear()
+        table.update(build_results_view(changed, "volume", "Гелій").rows)
+        assert tree.ops == []
+
+    def test_update_keeps_order_after_structure_change(self, helium_results):
+        tree = FakeTree()
+        table = ResultsTable(tree)
+        hot_air = dict(helium_results, T_outside_C=15.0, stress=1e6, stress_limit=1.8e6)
+
+        for results, mode, gas in [
+            (helium_results, "volume", "Гелій"),
+            (hot_air, "payload", "Гаряче повітря"),
+            (dict(helium_results, payload=-1.0), "volume", "Гелій"),
+        ]:
+            view = build_results_view(results, mode, gas)
+            table.update(view.rows)
+            assert tree.order == row_keys(view)
+            assert all(tree.items[row.key][0] == row.values for row in view.rows)
+
+    def test_clear_and_text(self, helium_results):
+        tree = FakeTree()
+        table = ResultsTable(tree)
+        table.update(build_results_view(helium_results, "volume", "Гелій").rows)
+        assert "РЕЗУЛЬТАТИ РОЗРАХУНКУ" in table.as_text()
+
+        table.clear()
+        assert tree.order == []
+        assert table.as_text() == ""
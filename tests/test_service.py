@@ -0,0 +1,214 @@
+"""
+Тести для локального сервісу розрахунків (balloon.service)
+"""
+
+import base64
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from balloon.model.solve import solve_volume_to_payload
+from balloon.service import CalculationService, OPERATIONS, ServiceError, make_server, register_operation
+from balloon.service.loadtest import run_load_test
+
+SOLVE = {
+    'gas_type': 'Гелій', 'gas_volume': 10.0, 'material': 'TPU', 'thickness_um': 35.0,
+    'start_height': 0.0, 'work_height': 1000.0,
+}
+
+
+@pytest.fixture
+def service():
+    with CalculationService(workers=0) as svc:
+        yield svc
+
+
+@pytest.fixture
+def blocking_operation():
+    """Операція, що чекає на подію (для перевірки об'єднання запитів)"""
+    release = threading.Event()
+    calls = []
+
+    def wait(value):
+        calls.append(value)
+        release.wait(5)
+        return {'value': value}
+
+    register_operation('test.wait', wait, "Тестова операція")
+    yield release, calls
+    release.set()
+    del OPERATIONS['test.wait']
+
+
+@pytest.fixture
+def server(service):
+    httpd = make_server(service, port=0)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def post(url, body):
+    data = body if isinstance(body, bytes) else json.dumps(body).encode('utf-8')
+    request = urllib.request.Request(url, data=data, headers={'Content-Type': 'application/json'})
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+class TestCalculationService:
+    """Тести для CalculationService"""
+
+    def test_solve_matches_solver_and_caches(self, service):
+        result, source = service.call('solve', SOLVE)
+        assert source == 'computed'
+        assert result['payload'] == pytest.approx(solve_volume_to_payload(**SOLVE)['payload'])
+
+        # Той самий запит (15 і 15.0 - однаковий ключ) береться з кешу
+        again, source = service.call('solve', {**SOLVE, 'gas_volume': 10})
+        assert source == 'cache'
+        assert again == result
+        assert service.stats()['cache']['hits'] == 1
+
+    def test_coalesces_identical_inflight_requests(self, service, blocking_operation):
+        release, calls = blocking_operation
+        results = []
+
+        def client():
+            results.append(service.call('test.wait', {'value': 1}))
+
+        threads = [threading.Thread(target=client) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        # Усі клієнти мають дочекатися того самого Future
+        deadline = time.monotonic() + 5
+        while service.stats()['requests'] < 4 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert calls == [1]
+        assert sorted(source for _, source in results) == ['coalesced'] * 3 + ['computed']
+        assert all(result == {'value': 1} for result, _ in results)
+
+    def test_errors_have_http_status(self, service):
+        with pytest.raises(ServiceError) as unknown:
+            service.call('missing', {})
+        assert unknown.value.status == 404
+        with pytest.raises(ServiceError) as bad_params:
+            service.call('solve', {**SOLVE, 'colour': 'red'})
+        assert bad_params.value.status == 400
+        with pytest.raises(ServiceError) as bad_gas:
+            service.call('solve', {**SOLVE, 'gas_type': 'Ксенон'})
+        assert bad_gas.value.status == 400
+        # Невідома операція відхиляється до черги і не враховується в лічильниках
+        assert service.stats()['errors'] == 2
+
+    @pytest.mark.parametrize('operation,params,message', [
+        ('solve', {**SOLVE, 'gas_volume': 'abc'}, 'gas_volume'),
+        ('solve', {**SOLVE, 'work_height': 1e9}, '50 км'),
+        ('solve', {**SOLVE, 'thickness_um': 0}, 'thickness_um'),
+        ('inverse', {**{k: v for k, v in SOLVE.items() if k != 'gas_volume'}, 'target_payload': -1},
+         'target_payload'),
+        ('flight_time', {**SOLVE, 'perm_mult': 0}, 'perm_mult'),
+        ('pattern', {'shape_type': 'sphere', 'shape_params': {'radius': -1}}, 'shape_params.radius'),
+        ('export', {'format': 'svg', 'shape_type': 'sphere', 'num_segments': 0}, 'num_segments'),
+        ('export', {'format': 'svg', 'shape_type': 'sphere', 'options': [1]}, 'options'),
+        ('export', {'format': 'svg', 'shape_type': 'sphere', 'options': {'filename': '/tmp/x.svg'}}, 'filename'),
+        ('export', {'format': 'svg', 'shape_type': 'sphere', 'full_job': 'maybe'}, 'full_job'),
+    ])
+    def test_invalid_inputs_rejected_before_dispatch(self, service, caplog, operation, params, message):
+        """Некоректні значення - 400 з назвою поля, без трасування помилки сервісу"""
+        with caplog.at_level('ERROR'):
+            with pytest.raises(ServiceError) as error:
+                service.call(operation, params)
+        assert error.value.status == 400
+        assert message in str(error.value)
+        assert not [record for record in caplog.records if record.levelname == 'ERROR']
+
+    def test_string_numbers_are_converted(self, service):
+        result, _ = service.call('solve', {**SOLVE, 'gas_volume': '10', 'thickness_um': '35'})
+        assert result['payload'] == pytest.approx(solve_volume_to_payload(**SOLVE)['payload'])
+
+    def test_export_full_job_is_boolean(self, service):
+        request = {'format': 'svg', 'shape_type': 'sphere', 'shape_params': {'radius': 1.0}, 'num_segments': 6}
+        single, _ = service.call('export', {**request, 'full_job': 'no'})
+        expected, _ = service.call('export', {**request, 'full_job': False})
+        assert single['size'] == expected['size']
+        assert single['size'] < service.call('export', request)[0]['size']
+
+    def test_errors_are_not_cached(self, service):
+        with pytest.raises(ServiceError):
+            service.call('solve', {**SOLVE, 'gas_type': 'Ксенон'})
+        assert service.stats()['cache']['size'] == 0
+
+    def test_pattern_and_export(self, service):
+        pattern, _ = service.call('pattern', {'shape_type': 'sphere', 'shape_params': {'radius': 1.0},
+                                              'num_segments': 6})
+        assert pattern['num_gores'] == 6
+        assert isinstance(pattern['points'][0], list)
+
+        exported, source = service.call('export', {'format': 'svg', 'shape_type': 'sphere',
+                                                   'shape_params': {'radius': 1.0}, 'num_segments': 6})
+        content = base64.b64decode(exported['content_base64'])
+        assert exported['filename'].endswith('.svg')
+        assert exported['size'] == len(content)
+        assert b'<svg' in content
+        # Файли експорту не кешуються
+        assert service.call('export', {'format': 'svg', 'shape_type': 'sphere', 'shape_params': {'radius': 1.0},
+                                       'num_segments': 6})[1] == 'computed'
+
+    def test_process_pool(self):
+        with CalculationService(workers=1) as svc:
+            result, source = svc.call('solve', SOLVE)
+        assert source == 'computed'
+        assert result['payload'] == pytest.approx(solve_volume_to_payload(**SOLVE)['payload'])
+
+
+class TestHttpServer:
+    """Тести для HTTP сервера та навантажувального тесту"""
+
+    def test_routes(self, server):
+        with urllib.request.urlopen(f"{server.url}/health", timeout=10) as response:
+            assert json.loads(response.read())['status'] == 'ok'
+        with urllib.request.urlopen(f"{server.url}/operations", timeout=10) as response:
+            operations = json.loads(response.read())
+        assert {'solve', 'inverse', 'height_profile', 'optimal_height', 'flight_time', 'pattern',
+                'export'} <= set(operations)
+        assert operations['solve']['parameters']['gas_volume'] == {'required': True}
+
+        status, body = post(f"{server.url}/solve", SOLVE)
+        assert status == 200
+        assert body['source'] == 'computed'
+        assert body['result']['payload'] > 0
+
+    def test_error_responses(self, server):
+        assert post(f"{server.url}/missing", {})[0] == 404
+        status, body = post(f"{server.url}/solve", b'{not json')
+        assert status == 400
+        assert 'JSON' in body['error']
+        assert post(f"{server.url}/solve", [1, 2])[0] == 400
+        status, body = post(f"{server.url}/solve", {**SOLVE, 'gas_volume': 'abc'})
+        assert status == 400
+        assert 'gas_volume' in body['error']
+
+    def test_loopback_only(self, service):
+        with pytest.raises(ValueError):
+            make_server(service, host='8.8.8.8', port=0)
+
+    def test_load_test(self, server):
+        report = run_load_test(server.url, requests=40, concurrency=4, unique=5)
+        assert report['requests'] == 40
+        assert report['errors'] == 0
+        assert report['unique'] == 5
+        assert report['requests_per_s'] > 0
+        assert sum(report['sources'].values()) == 40
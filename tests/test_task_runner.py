@@ -0,0 +1,226 @@
+"""
+Тести для фонового виконання завдань GUI (balloon.gui.task_runner)
+"""
+
+import threading
+import time
+
+import pytest
+
+from balloon.gui.task_runner import Debouncer, Task, TaskCancelled, TaskRunner
+
+
+class FakeRoot:
+    """Замінник Tk root: after() лише ставить callback у чергу, pump() виконує її"""
+
+    def __init__(self):
+        self.pending = []
+
+    def after(self, ms, callback):
+        self.pending.append(callback)
+
+    def pump(self, until, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while not until():
+            if time.monotonic() > deadline:
+                raise AssertionError("Час очікування вичерпано")
+            callbacks, self.pending = self.pending, []
+            for callback in callbacks:
+                callback()
+            time.sleep(0.005)
+
+
+@pytest.fixture
+def root():
+    return FakeRoot()
+
+
+@pytest.fixture
+def runner(root):
+    statuses = []
+    runner = TaskRunner(root, on_status=statuses.append, poll_ms=1)
+    runner.statuses = statuses
+    yield runner
+    runner.shutdown()
+
+
+class TestTaskRunner:
+    """Тести для TaskRunner"""
+
+    def test_result_delivered_on_main_thread(self, root, runner):
+        results = []
+        main_thread = threading.current_thread()
+
+        def work(task):
+            return threading.current_thread() is main_thread
+
+        runner.submit('calc', work, on_success=lambda r: results.append((r, threading.current_thread())))
+        root.pump(lambda: results)
+
+        ran_on_main, delivered_on = results[0]
+        assert not ran_on_main
+        assert delivered_on is main_thread
+        assert not runner.busy
+
+    def test_supersede_discards_stale_result(self, root, runner):
+        release = threading.Event()
+        results = []
+
+        def slow(task):
+            release.wait(5)
+            return 'old'
+
+        first = runner.submit('calc', slow, on_success=results.append)
+        runner.submit('calc', lambda task: 'new', on_success=results.append)
+        root.pump(lambda: results)
+        release.set()
+        time.sleep(0.05)
+        root.pump(lambda: not runner.busy)
+
+        assert results == ['new']
+        assert first.state == Task.CANCELLED
+
+    def test_cancel_stops_cooperative_task(self, root, runner):
+        started = threading.Event()
+        finished = []
+
+        def loop(task):
+            started.set()
+            while True:
+                task.check()
+                time.sleep(0.001)
+
+        runner.submit('graph', loop, on_success=finished.append)
+        started.wait(5)
+        runner.cancel('graph')
+
+        assert not runner.busy
+        assert runner.statuses[-1].state == Task.CANCELLED
+        time.sleep(0.05)
+        root.pump(lambda: True)
+        assert finished == []
+
+    def test_errors_routed_to_handler(self, root, runner):
+        errors = []
+
+        def fail(task):
+            raise ValueError("погані дані")
+
+        runner.submit('calc', fail, on_error=errors.append)
+        root.pump(lambda: errors)
+
+        assert isinstance(errors[0], ValueError)
+        assert runner.statuses[-1].state == Task.FAILED
+
+    def test_progress_reported(self, root, runner):
+        done = []
+
+        def work(task):
+            task.report(0.5, "Половина")
+            return 1
+
+        runner.submit('pattern', work, on_success=done.append, description="Генерація")
+        root.pump(lambda: done)
+
+        progress = [(s.progress, s.message) for s in runner.statuses if s.progress is not None]
+        assert (0.5, "Половина") in progress
+
+    def test_independent_keys_run_in_parallel(self, root, runner):
+        barrier = threading.Barrier(2, timeout=5)
+        results = []
+
+        def work(task):
+            barrier.wait()
+            return task.key
+
+        runner.submit('a', work, on_success=results.append)
+        runner.submit('b', work, on_success=results.append)
+        root.pump(lambda: len(results) == 2)
+
+        assert sorted(results) == ['a', 'b']
+
+    def test_check_raises_after_cancel(self, runner):
+        task = Task('x', '', runner)
+        task.cancel()
+        with pytest.raises(TaskCancelled):
+            task.check()
+
+
+class ClockRoot:
+    """Замінник Tk root з ручним годинником для after/after_cancel"""
+
+    def __init__(self):
+        self.now = 0
+        self.timers = {}
+        self._next_id = 0
+
+    def after(self, ms, callback):
+        self._next_id += 1
+        self.timers[self._next_id] = (self.now + ms, callback)
+        return self._next_id
+
+    def after_cancel(self, after_id):
+        self.timers.pop(after_id, None)
+
+    def advance(self, ms):
+        target = self.now + ms
+        while True:
+            due = [(t, i) for i, (t, _) in self.timers.items() if t <= target]
+            if not due:
+                break
+            when, after_id = min(due)
+            self.now = when
+            _, callback = self.timers.pop(after_id)
+            callback()
+        self.now = target
+
+
+class TestDebouncer:
+    """Тести для Debouncer"""
+
+    def test_trailing_coalesces_to_last_event(self):
+        root = ClockRoot()
+        calls = []
+        debouncer = Debouncer(root, 400, calls.append)
+
+        for value in ('1', '10', '100'):
+            debouncer.trigger(value)
+            root.advance(100)
+        assert calls == []
+
+        root.advance(400)
+        assert calls == ['100']
+        assert not debouncer.pending
+
+    def test_leading_runs_first_and_last(self):
+        root = ClockRoot()
+        calls = []
+        debouncer = Debouncer(root, 300, calls.append, leading=True)
+
+        debouncer.trigger('a')
+        debouncer.trigger('b')
+        debouncer.trigger('c')
+        assert calls == ['a']
+
+        root.advance(300)
+        assert calls == ['a', 'c']
+        root.advance(300)
+        assert calls == ['a', 'c']
+
+        debouncer.trigger('d')
+        assert calls == ['a', 'c', 'd']
+
+    def test_cancel_and_flush(self):
+        root = ClockRoot()
+        calls = []
+        debouncer = Debouncer(root, 400, calls.append)
+
+        debouncer.trigger(1)
+        debouncer.cancel()
+        root.advance(1000)
+        assert calls == []
+
+        debouncer.trigger(2)
+        debouncer.flush()
+        assert calls == [2]
+        assert root.timers == {}
@@ -10,7 +10,8 @@ from balloon.validators import (
     validate_gas_type,
     validate_temperature_difference,
     validate_height_parameters,
-    validate_all_inputs
+    validate_all_inputs,
+    validate_columns,
 )
 from balloon.constants import MATERIALS, GAS_DENSITY
 
@@ -410,3 +411,106 @@ class TestValidateAllInputs:
         assert strings2["shape_type"] == "cigar"
         # Параметри не обов'язкові, тому можуть бути відсутні
 
+
+# Рядки з різними помилками (та коректні) для порівняння з validate_all_inputs
+COLUMN_CASES = [
+    dict(gas_volume="10"),
+    dict(gas_volume="10", shape_type="pear", shape_params={"pear_height": "3.0"}),
+    dict(gas_volume="10", shape_type="pillow", shape_params={"pillow_len": "abc"}),
+    dict(gas_volume="10", shape_params={"pillow_len": "-1"}),
+    dict(gas_volume="abc"),
+    dict(gas_volume=""),
+    dict(gas_volume="-5"),
+    dict(gas_volume=None, mode="volume"),
+    dict(gas_volume="10", thickness="0"),
+    dict(gas_volume="10", thickness="5000"),
+    dict(gas_volume="10", ground_temp=""),
+    dict(gas_volume="10", gas_type="Ксенон"),
+    dict(gas_volume="10", material="Папір"),
+    dict(gas_volume="10", mode="bad"),
+    dict(gas_volume="10", shape_type="cube"),
+    dict(gas_volume="10", gas_type="Гаряче повітря", inside_temp="10"),
+    dict(gas_volume="10", work_height="49000", start_height="2000"),
+    dict(gas_volume="10", duration="nan"),
+]
+
+
+def column_case_inputs(case):
+    inputs = dict(gas_type="Гелій", material="TPU", thickness="35", start_height="0", work_height="1000",
+                  ground_temp="15", inside_temp="100", duration="24", mode="payload", shape_type="sphere",
+                  extra_mass="0", seam_factor="1.0")
+    inputs.update(case)
+    return inputs
+
+
+def to_columns(cases):
+    rows = [column_case_inputs(case) for case in cases]
+    columns = {key: [row[key] for row in rows] for key in rows[0] if key != 'shape_params'}
+    for key in ('pillow_len', 'pear_height'):
+        columns[key] = [row.get('shape_params', {}).get(key) for row in rows]
+    return columns
+
+
+class TestValidateColumns:
+    """Тести для колонкової валідації validate_columns"""
+
+    def test_matches_validate_all_inputs(self):
+        """Ті самі помилки та значення, що й у validate_all_inputs для кожного рядка"""
+        result = validate_columns(to_columns(COLUMN_CASES))
+        assert len(result) == len(COLUMN_CASES)
+        for index, case in enumerate(COLUMN_CASES):
+            try:
+                expected = validate_all_inputs(**column_case_inputs(case))
+            except ValidationError as e:
+                assert not result.valid[index]
+                assert result.errors[index] == str(e)
+                with pytest.raises(ValidationError):
+                    result.row(index)
+            else:
+                assert result.valid[index], result.errors[index]
+                assert result.errors[index] is None
+                assert result.row(index) == expected
+
+    def test_errors_name_the_field(self):
+        """Помилки полів починаються з назви поля; перехресні правила - без неї"""
+        cases = [dict(gas_volume="10", thickness="0"), dict(gas_volume="10", shape_params={"pillow_len": "-1"}),
+                 dict(gas_volume="10", work_height="49000", start_height="2000")]
+        result = validate_columns(to_columns(cases))
+        assert result.errors[0] == "thickness: Input should be greater than 1"
+        assert result.errors[1].startswith("pillow_len: ")
+        assert not result.errors[2].startswith("work_height")
+        with pytest.raises(ValidationError, match="^thickness: "):
+            validate_all_inputs(**column_case_inputs(cases[0]))
+
+    def test_error_rows(self):
+        """Маска та індекси некоректних рядків; числа некоректних рядків - NaN"""
+        result = validate_columns(to_columns([dict(gas_volume="10"), dict(gas_volume="abc"), dict(gas_volume="2")]))
+        assert result.valid.tolist() == [True, False, True]
+        assert result.error_rows().tolist() == [1]
+        assert result.numbers['thickness'][1] != result.numbers['thickness'][1]
+        assert result.numbers['gas_volume'][2] == 2.0
+
+    def test_missing_columns_use_defaults(self):
+        """Відсутні стовпці полів зі значеннями за замовчуванням заповнюються ними"""
+        columns = {key: [value] for key, value in column_case_inputs(dict(gas_volume="10")).items()
+                   if key in ('gas_type', 'gas_volume', 'material', 'thickness', 'start_height', 'work_height')}
+        numbers, strings = validate_columns(columns).row(0)
+        assert numbers['ground_temp'] == 15.0
+        assert numbers['seam_factor'] == 1.0
+        assert strings['mode'] == 'payload'
+        assert strings['shape_type'] == 'sphere'
+
+    def test_missing_required_column(self):
+        """Відсутній обов'язковий стовпець - помилка в кожному рядку"""
+        columns = to_columns([dict(gas_volume="10")] * 2)
+        del columns['material']
+        result = validate_columns(columns)
+        assert result.errors == ["material: Field required"] * 2
+
+    def test_different_lengths(self):
+        """Стовпці різної довжини"""
+        columns = to_columns([dict(gas_volume="10")] * 2)
+        columns['thickness'] = ["35"]
+        with pytest.raises(ValueError):
+            validate_columns(columns)
+